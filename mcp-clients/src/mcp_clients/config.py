@@ -11,3 +11,21 @@ load_dotenv()
 # Flag to control whether database operations are performed
 # Set to False to skip all database operations
 USE_PRODUCTION_DB = os.getenv("USE_PRODUCTION_DB", "False").lower() == "true"
+
+# Maximum number of tool calls from one assistant turn that run at the same time
+MAX_CONCURRENT_TOOL_CALLS = int(os.getenv("MAX_CONCURRENT_TOOL_CALLS", "8"))
+
+# Seconds before a single tool call is abandoned (0 disables the timeout)
+TOOL_CALL_TIMEOUT_SECONDS = float(os.getenv("TOOL_CALL_TIMEOUT_SECONDS", "300"))
+
+# Upper bound on resource text kept in each client's resource cache
+RESOURCE_CACHE_MAX_BYTES = int(os.getenv("RESOURCE_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+
+# Seconds before resources are re-listed for servers that send no change notifications
+RESOURCE_CACHE_TTL_SECONDS = float(os.getenv("RESOURCE_CACHE_TTL_SECONDS", "300"))
+
+# Maximum number of resources read at the same time on a cache miss
+MAX_CONCURRENT_RESOURCE_READS = int(os.getenv("MAX_CONCURRENT_RESOURCE_READS", "8"))
+
+# Mark the stable request prefix (tools, system text, history) for Anthropic prompt caching
+PROMPT_CACHE_ENABLED = os.getenv("PROMPT_CACHE_ENABLED", "True").lower() == "true"
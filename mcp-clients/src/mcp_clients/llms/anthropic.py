@@ -15,6 +15,12 @@ from mcp_clients.llms.base import (
     ToolResultContent,
     ContentType,
 )
+from mcp_clients.llms.prompt_cache import (
+    TurnUsage,
+    UsageTracker,
+    build_anthropic_request,
+    build_system_text,
+)
 
 # Configure logging
 logger = logging.getLogger("anthropic_client")
@@ -33,6 +39,18 @@ class Anthropic(BaseLLM):
         self.model = model or "claude-3-5-sonnet-20241022"  # Default model
         self.max_tokens = self.config.max_tokens  # Default max tokens
         self._extracted_system_message = ""  # Store system messages extracted from chat history
+        self.usage = UsageTracker()
+
+    def _get_system_instructions(self) -> str:
+        """System message from the chat history followed by the platform system message."""
+        # Add extracted system message from chat history
+        if not self._extracted_system_message and getattr(Anthropic, '_last_extracted_system_message', None):
+            # Use the system message extracted by from_chat_messages and store it for future use
+            self._extracted_system_message = Anthropic._last_extracted_system_message
+
+        # Add system message if operating in a specific platform context
+        platform_message = self.platform_config.get("system_message") if self.platform else None
+        return build_system_text(self._extracted_system_message, platform_message)
 
     async def create_streaming_generator(
             self, messages: list, available_tools: list, resources: list = None
@@ -49,44 +67,16 @@ class Anthropic(BaseLLM):
         """
         logger.info(f"Creating streaming request to Claude with model: {self.model}")
 
-        # Prepare request parameters
-        system_message = ""
-
-        # Add extracted system message from chat history
-        if self._extracted_system_message:
-            system_message = self._extracted_system_message
-        elif hasattr(Anthropic, '_last_extracted_system_message') and Anthropic._last_extracted_system_message:
-            # Use the system message extracted by from_chat_messages
-            system_message = Anthropic._last_extracted_system_message
-            # Store it in the instance for future use
-            self._extracted_system_message = Anthropic._last_extracted_system_message
-
-        # Add system message if operating in a specific platform context
-        if self.platform and self.platform_config.get("system_message"):
-            if system_message:
-                system_message += "\n\n" + self.platform_config["system_message"]
-            else:
-                system_message = self.platform_config["system_message"]
-        
-        if resources:
-            system_message += (
-                    "\n\nThere are some resources that may be relevant to the conversation. You can use them to answer the user's question.\n\n"
-                    + "\n\n".join(resources)
-            )
-
-        # Create request parameters
+        # Tools, system text and older history form a cached prefix; only the newest messages change
         request_params = {
             "model": self.model,
             "max_tokens": self.max_tokens,
-            "messages": messages,
-            "tools": available_tools,
             "stream": True,
+            **build_anthropic_request(
+                messages, available_tools, self._get_system_instructions(), resources
+            ),
         }
 
-        # Add system message as a separate parameter if defined
-        if system_message:
-            request_params["system"] = system_message
-
         try:
             stream = await self.anthropic_client.messages.create(**request_params)
 
@@ -94,6 +84,7 @@ class Anthropic(BaseLLM):
             message = {"role": "assistant", "content": []}
             current_text = ""
             current_tool_calls = {}  # Store tool calls by index
+            usage = None
 
             # Get the message split token for the current platform
             message_split_token = self.get_message_split_token()
@@ -106,6 +97,8 @@ class Anthropic(BaseLLM):
                     # Reset state for new message
                     current_text = ""
                     current_tool_calls = {}
+                    # Prompt token counts arrive here, output tokens with message_delta
+                    usage = TurnUsage.from_anthropic(chunk.message.usage)
 
                 elif chunk.type == "content_block_start":
                     block = chunk.content_block
@@ -172,9 +165,13 @@ class Anthropic(BaseLLM):
                         logger.info(
                             f"Message delta received with stop_reason: {chunk.delta.stop_reason}"
                         )
+                    if getattr(chunk, "usage", None) and usage is not None:
+                        usage.output_tokens = chunk.usage.output_tokens or 0
 
                 elif chunk.type == "message_stop":
                     logger.info("Message complete")
+                    if usage is not None:
+                        self.usage.record(usage, self.model)
                     # If there's any remaining text, yield it
                     if current_text:
                         yield current_text + "\n"
@@ -200,46 +197,19 @@ class Anthropic(BaseLLM):
         """
         logger.info("Sending non-streaming request to Claude")
 
-        # Prepare request parameters
-        system_message = ""
-        request_messages = (
-            messages.copy()
-        )  # Make a copy to avoid modifying the original
-
-        # Add extracted system message from chat history
-        if self._extracted_system_message:
-            system_message = self._extracted_system_message
-        elif hasattr(Anthropic, '_last_extracted_system_message') and Anthropic._last_extracted_system_message:
-            # Use the system message extracted by from_chat_messages
-            system_message = Anthropic._last_extracted_system_message
-            # Store it in the instance for future use
-            self._extracted_system_message = Anthropic._last_extracted_system_message
-
-        # Add system message if operating in a specific platform context
-        if self.platform and self.platform_config.get("system_message"):
-            if system_message:
-                system_message += "\n\n" + self.platform_config["system_message"]
-            else:
-                system_message = self.platform_config["system_message"]
-
         # Create request parameters
         kwargs = {
             "model": self.config.model,
             "max_tokens": self.config.max_tokens,
-            "messages": request_messages,
+            **build_anthropic_request(
+                messages, available_tools, self._get_system_instructions()
+            ),
         }
 
-        # Add system message as a separate parameter if defined
-        if system_message:
-            kwargs["system"] = system_message
-
-        # Add tools if provided
-        if available_tools:
-            kwargs["tools"] = available_tools
-
         # Make the API call
         try:
             response = await self.anthropic_client.messages.create(**kwargs)
+            self.usage.record(TurnUsage.from_anthropic(response.usage), self.config.model)
             return response
         except Exception as e:
             logger.error(f"Error in non-streaming request: {str(e)}", exc_info=True)
@@ -1,3 +1,4 @@
+import json
 import logging
 import uuid
 from typing import Optional, Dict, Any, AsyncGenerator, List
@@ -14,6 +15,12 @@ from mcp_clients.llms.base import (
     ToolResultContent,
     ContentType,
 )
+from mcp_clients.llms.prompt_cache import (
+    TurnUsage,
+    UsageTracker,
+    build_openai_messages,
+    sort_tools,
+)
 
 # Configure logging
 logger = logging.getLogger("openai_client")
@@ -43,6 +50,7 @@ class OpenAI(BaseLLM):
         self.openai_client = AsyncOpenAI(api_key=api_key, base_url=base_url)
         self.model = model or "gpt-4o-mini"
         self.max_tokens = self.config.max_tokens
+        self.usage = UsageTracker()
 
     async def create_streaming_generator(
             self, messages: list, available_tools: list, resources: list = None
@@ -59,26 +67,26 @@ class OpenAI(BaseLLM):
         """
         logger.info("Creating OpenAI streaming request")
 
+        # Tools and the system message come first and stay byte-identical between turns,
+        # so OpenAI's automatic prompt caching covers everything but the newest messages
+        system_message_content = self.platform_config.get("system_message")
+        request_messages = build_openai_messages(messages, system_message_content, resources)
+        if len(request_messages) > len(messages):
+            messages.insert(0, request_messages[0])
+
         # Prepare request parameters for OpenAI
         request_params = {
             "model": self.model,  # Ensure this is an OpenAI model name (e.g., "gpt-4o")
             "max_tokens": self.max_tokens,
             "messages": messages,
             "stream": True,
+            # The final chunk carries token usage, including cached prompt tokens
+            "stream_options": {"include_usage": True},
         }
 
-        system_message_content = self.platform_config.get("system_message")
-        if resources:
-            system_message_content += "\n\nThere are some resources that may be relevant to the conversation. You can use them to answer the user's question.\n\n" + "\n\n".join(
-                resources)
-        if system_message_content and not messages[0].get("role") == "system":
-            request_params["messages"].insert(
-                0, {"role": "system", "content": system_message_content}
-            )
-
         # Add tools if provided (OpenAI format expects 'tools' and 'tool_choice' potentially)
         if available_tools:
-            request_params["tools"] = available_tools
+            request_params["tools"] = sort_tools(available_tools)
             # request_params["tool_choice"] = "auto"
 
         try:
@@ -92,6 +100,8 @@ class OpenAI(BaseLLM):
 
             start_time = time.time()
             async for chunk in stream:
+                if getattr(chunk, "usage", None):
+                    self.usage.record(TurnUsage.from_openai(chunk.usage), self.model)
                 if not chunk.choices:  # Handle potential empty chunks
                     continue
 
@@ -184,20 +194,9 @@ class OpenAI(BaseLLM):
         """
         logger.info("Sending non-streaming OpenAI request")
 
-        request_messages = messages.copy()
-
         # Handle system message for OpenAI (prepend to messages list)
-        system_message_content = self.platform_config.get("system_message")
-        if self.platform and system_message_content:
-            if not request_messages or request_messages[0].get("role") != "system":
-                request_messages.insert(
-                    0, {"role": "system", "content": system_message_content}
-                )
-                logger.info("Prepended system message for OpenAI request.")
-            else:
-                logger.warning(
-                    "System message provided but message history already starts with one. Using existing."
-                )
+        system_message_content = self.platform_config.get("system_message") if self.platform else None
+        request_messages = build_openai_messages(messages, system_message_content)
 
         # Prepare request parameters for OpenAI
         kwargs = {
@@ -208,12 +207,14 @@ class OpenAI(BaseLLM):
 
         # Add tools if provided
         if available_tools:
-            kwargs["tools"] = available_tools
+            kwargs["tools"] = sort_tools(available_tools)
             # kwargs["tool_choice"] = "auto" # Or specify if needed
 
         # Make the API call
         try:
             response = await self.openai_client.chat.completions.create(**kwargs)
+            if response.usage:
+                self.usage.record(TurnUsage.from_openai(response.usage), self.model)
             # The response object itself is the result (openai.types.chat.ChatCompletion)
             return response
         except Exception as e:
@@ -252,7 +253,6 @@ class OpenAI(BaseLLM):
                         parsed_arguments = {}
 
                         if isinstance(arguments, str):
-                            import json
                             try:
                                 parsed_arguments = json.loads(arguments)
                             except json.JSONDecodeError as e:
@@ -362,7 +362,7 @@ class OpenAI(BaseLLM):
                                 "id": content.tool_id,
                                 "function": {
                                     "name": content.name,
-                                    "arguments": str(content.arguments),
+                                    "arguments": json.dumps(content.arguments),
                                 },
                             }
                         )
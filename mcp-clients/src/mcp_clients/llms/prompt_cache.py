@@ -0,0 +1,201 @@
+"""
+Request assembly that keeps the start of every LLM request identical between turns.
+
+Providers cache the longest request prefix they have seen recently, so each
+request is laid out from the most to the least stable content: tool definitions
+(sorted by name), then the system text (platform instructions before resources),
+then the message history, which only grows at the end. Anthropic needs explicit
+cache_control breakpoints; OpenAI caches byte-identical prefixes automatically.
+"""
+
+import copy
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from mcp_clients.config import PROMPT_CACHE_ENABLED
+
+logger = logging.getLogger("llm_client")
+
+RESOURCES_PREAMBLE = (
+    "There are some resources that may be relevant to the conversation. "
+    "You can use them to answer the user's question."
+)
+
+# Anthropic accepts at most four cache_control breakpoints per request
+MAX_ANTHROPIC_CACHE_BREAKPOINTS = 4
+EPHEMERAL_CACHE_CONTROL = {"type": "ephemeral"}
+
+
+def sort_tools(tools: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Tools in name order, so the prefix does not depend on server connection order."""
+
+    def name(tool: Dict[str, Any]) -> str:
+        return tool.get("name") or tool.get("function", {}).get("name") or ""
+
+    return sorted(tools or [], key=name)
+
+
+def build_system_text(*parts: Optional[str], resources: Optional[List[str]] = None) -> str:
+    """Join the non-empty system parts, followed by the resources section if there is one."""
+    sections = [part for part in parts if part]
+    if resources:
+        sections.append(RESOURCES_PREAMBLE + "\n\n" + "\n\n".join(resources))
+    return "\n\n".join(sections)
+
+
+def build_anthropic_request(
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        instructions: str,
+        resources: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build the tools, system and messages parameters of an Anthropic request.
+
+    Breakpoints go, in order of priority, on the last tool, the last system
+    block, the last message and the previous user message. The previous user
+    message keeps the already-cached history within Anthropic's lookback
+    window when a turn adds many tool results. The given messages and tools
+    are not modified.
+    """
+    request: Dict[str, Any] = {"messages": list(messages)}
+    system_blocks = []
+    if instructions:
+        system_blocks.append({"type": "text", "text": instructions})
+    resources_text = build_system_text(resources=resources)
+    if resources_text:
+        system_blocks.append({"type": "text", "text": resources_text})
+    tools = sort_tools(tools)
+
+    if not PROMPT_CACHE_ENABLED:
+        if tools:
+            request["tools"] = tools
+        if system_blocks:
+            request["system"] = system_blocks
+        return request
+
+    breakpoints = MAX_ANTHROPIC_CACHE_BREAKPOINTS
+    if tools:
+        tools[-1] = {**tools[-1], "cache_control": EPHEMERAL_CACHE_CONTROL}
+        request["tools"] = tools
+        breakpoints -= 1
+    if system_blocks:
+        system_blocks[-1]["cache_control"] = EPHEMERAL_CACHE_CONTROL
+        request["system"] = system_blocks
+        breakpoints -= 1
+
+    history = request["messages"]
+    marked = []
+    if history:
+        marked.append(len(history) - 1)
+        previous_user = next(
+            (i for i in range(len(history) - 2, -1, -1) if history[i].get("role") == "user"),
+            None,
+        )
+        if previous_user is not None:
+            marked.append(previous_user)
+    for index in marked[:breakpoints]:
+        history[index] = _with_cache_breakpoint(history[index])
+    return request
+
+
+def _with_cache_breakpoint(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an Anthropic message whose last content block carries cache_control."""
+    content = message.get("content")
+    if isinstance(content, str):
+        content = [{"type": "text", "text": content}]
+    if not content:
+        return message
+    content = copy.deepcopy(content)
+    content[-1]["cache_control"] = EPHEMERAL_CACHE_CONTROL
+    return {**message, "content": content}
+
+
+def build_openai_messages(
+        messages: List[Dict[str, Any]],
+        instructions: Optional[str],
+        resources: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Messages for an OpenAI request with the system message first.
+
+    A system message already in the history is kept as is. Otherwise the platform
+    instructions and resources are prepended in a fixed order, so the prefix is
+    byte-identical from one turn to the next.
+    """
+    if messages and messages[0].get("role") == "system":
+        return list(messages)
+    system_text = build_system_text(instructions, resources=resources)
+    if not system_text:
+        return list(messages)
+    return [{"role": "system", "content": system_text}, *messages]
+
+
+@dataclass
+class TurnUsage:
+    """Token accounting for one LLM request."""
+    input_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def prompt_tokens(self) -> int:
+        """All prompt tokens, whether they were read from the cache or not."""
+        return self.input_tokens + self.cache_read_tokens + self.cache_write_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        return self.cache_read_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    @classmethod
+    def from_anthropic(cls, usage: Any) -> "TurnUsage":
+        """From an Anthropic Usage, where input_tokens excludes cached tokens."""
+        return cls(
+            input_tokens=getattr(usage, "input_tokens", 0) or 0,
+            cache_read_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+            cache_write_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+            output_tokens=getattr(usage, "output_tokens", 0) or 0,
+        )
+
+    @classmethod
+    def from_openai(cls, usage: Any) -> "TurnUsage":
+        """From an OpenAI CompletionUsage, where prompt_tokens includes cached tokens."""
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+        return cls(
+            input_tokens=(getattr(usage, "prompt_tokens", 0) or 0) - cached,
+            cache_read_tokens=cached,
+            output_tokens=getattr(usage, "completion_tokens", 0) or 0,
+        )
+
+
+@dataclass
+class UsageTracker:
+    """Running token totals of an LLM client, logged after every turn."""
+    turns: int = 0
+    totals: TurnUsage = field(default_factory=TurnUsage)
+
+    def record(self, usage: TurnUsage, model: Optional[str] = None) -> None:
+        self.turns += 1
+        self.totals.input_tokens += usage.input_tokens
+        self.totals.cache_read_tokens += usage.cache_read_tokens
+        self.totals.cache_write_tokens += usage.cache_write_tokens
+        self.totals.output_tokens += usage.output_tokens
+        logger.info(
+            f"LLM turn {self.turns} ({model}): prompt {usage.prompt_tokens} tokens "
+            f"(cache read {usage.cache_read_tokens}, cache write {usage.cache_write_tokens}, "
+            f"uncached {usage.input_tokens}, hit ratio {usage.cache_hit_ratio:.0%}), "
+            f"output {usage.output_tokens} tokens; session hit ratio {self.totals.cache_hit_ratio:.0%}"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "turns": self.turns,
+            "input_tokens": self.totals.input_tokens,
+            "cache_read_tokens": self.totals.cache_read_tokens,
+            "cache_write_tokens": self.totals.cache_write_tokens,
+            "output_tokens": self.totals.output_tokens,
+            "cache_hit_ratio": self.totals.cache_hit_ratio,
+        }
@@ -13,10 +13,12 @@ from dotenv import load_dotenv
 from mcp import ClientSession, StdioServerParameters, stdio_client
 from mcp.client.sse import sse_client
 
+from mcp_clients.config import MAX_CONCURRENT_TOOL_CALLS, TOOL_CALL_TIMEOUT_SECONDS, MAX_CONCURRENT_RESOURCE_READS
 from mcp_clients.llms.anthropic import Anthropic
 from mcp_clients.llms.base import Conversation, BaseLLM, LLMMessageFormat, ContentType, MessageRole, \
     ToolResultContent, ChatMessage
 from mcp_clients.llms.openai import OpenAI
+from mcp_clients.resource_cache import ResourceCache
 
 # Load environment variables
 load_dotenv()
@@ -64,7 +66,12 @@ class MCPClient:
         self.server_info: Dict[str, str] = {}
         # Cache of server_id -> list of tools
         self.tool_cache: Dict[str, List[Dict[str, Any]]] = {}
+        # Resource listings, contents and subscriptions, invalidated by server notifications
+        self.resource_cache = ResourceCache()
         self.conversation = conversation
+        # Caps tool calls running at once for this conversation
+        self.tool_call_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TOOL_CALLS)
+        self.tool_call_timeout = TOOL_CALL_TIMEOUT_SECONDS
         # Initialize LLM client
         self.llm_client = self._initialize_llm_client(api_name, provider)
 
@@ -175,11 +182,14 @@ class MCPClient:
                     stdio_client(server_parameters)
                 )
 
-            session = await exit_stack.enter_async_context(ClientSession(*streams))
+            session = await exit_stack.enter_async_context(
+                ClientSession(*streams, message_handler=self.resource_cache.message_handler(server_id))
+            )
 
             # Initialize the session
             logger.info(f"Initializing session for server {server_id}")
-            await session.initialize()
+            init_result = await session.initialize()
+            self.resource_cache.set_server_capabilities(server_id, init_result.capabilities)
             logger.info(f"Session initialized for server {server_id}")
 
             # Store the session and server info
@@ -357,6 +367,7 @@ class MCPClient:
             yield f"\n[Error: {error_msg}]\n"
             return
 
+        tool_call_task = None
         try:
             message_split_token = self.llm_client.get_message_split_token()
             # Create a task for the actual tool call
@@ -364,14 +375,26 @@ class MCPClient:
 
             # Wait for the tool call to complete with progress updates every 30 seconds
             start_time = asyncio.get_event_loop().time()
+            deadline = start_time + self.tool_call_timeout if self.tool_call_timeout else None
             while not tool_call_task.done():
-                # Wait for either 30 seconds to pass or the task to complete
+                wait = 30.0
+                if deadline is not None:
+                    wait = min(wait, deadline - asyncio.get_event_loop().time())
+                    if wait <= 0:
+                        tool_call_task.cancel()
+                        error_msg = f"Tool {tool_name} timed out after {self.tool_call_timeout:g} seconds"
+                        logger.error(error_msg)
+                        yield f"\n[Error: {error_msg}]\n"
+                        return
+                # Wait for either the progress interval to pass or the task to complete
                 try:
-                    result = await asyncio.wait_for(asyncio.shield(tool_call_task), timeout=30.0)
+                    result = await asyncio.wait_for(asyncio.shield(tool_call_task), timeout=wait)
                     yield str(result)
                     return
                 except asyncio.TimeoutError:
-                    # Tool call is still running after 30 seconds
+                    if deadline is not None and asyncio.get_event_loop().time() >= deadline:
+                        continue
+                    # Tool call is still running after another 30 seconds
                     elapsed = int(asyncio.get_event_loop().time() - start_time)
                     logger.info(f"Tool call {tool_name} still running after {elapsed} seconds")
                     yield f"\n<special>[Tool {tool_name} still running... ({elapsed} seconds elapsed)]{message_split_token}\n"
@@ -384,6 +407,60 @@ class MCPClient:
                 exc_info=True,
             )
             yield f"\n[Error calling tool {tool_name}: {str(e)}]\n"
+        finally:
+            if tool_call_task is not None and not tool_call_task.done():
+                tool_call_task.cancel()
+
+    @staticmethod
+    def _is_progress_update(update: str) -> bool:
+        return "[Tool" in update and "still running" in update
+
+    async def _run_tool_calls(
+            self, tool_calls: List[Any]
+    ) -> AsyncGenerator[Tuple[str, Any], None]:
+        """
+        Run the tool calls of one assistant turn concurrently.
+
+        At most MAX_CONCURRENT_TOOL_CALLS run at once for this conversation.
+        Yields ("progress", text) as updates arrive from any call, then a single
+        ("results", [result_text, ...]) with results in the original call order.
+        """
+        results: List[str] = [""] * len(tool_calls)
+        updates: asyncio.Queue = asyncio.Queue()
+
+        async def run(index: int, content) -> None:
+            try:
+                async with self.tool_call_semaphore:
+                    start_time = time.time()
+                    async for update in self._process_tool_call(content.name, content.arguments):
+                        if self._is_progress_update(update):
+                            await updates.put(update)
+                        else:
+                            # This is the final result
+                            results[index] = update
+                    logger.info(f"Tool {content.name} took {time.time() - start_time} seconds to complete")
+                    logger.info(f"Tool result: {results[index]}")
+            finally:
+                await updates.put(None)
+
+        tasks = [asyncio.create_task(run(index, content)) for index, content in enumerate(tool_calls)]
+        try:
+            pending = len(tasks)
+            while pending:
+                update = await updates.get()
+                if update is None:
+                    pending -= 1
+                else:
+                    yield "progress", update
+            # Surface unexpected failures of the runner itself
+            for task in tasks:
+                task.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        yield "results", results
 
     def is_final_response(self, messages: List[ChatMessage]) -> bool:
         """
@@ -418,11 +495,9 @@ class MCPClient:
         # Get all available tools from all servers
         available_tools = await self.list_all_tools()
         logger.info(f"Found {len(available_tools)} available tools across all servers")
-        resources = await self.list_all_resources()
-        text_resource_contents = []
-        for resource in resources:
-            resource_content = await self.read_resource(resource["server_id"], resource["uri"])
-            text_resource_contents.extend([content["text"] for content in resource_content if content["text"]])
+        start_time = time.time()
+        text_resource_contents = await self.get_text_resource_contents()
+        logger.info(f"Loading resources took {time.time() - start_time} seconds ({self.resource_cache.stats()})")
 
         has_tool_call = True
 
@@ -455,38 +530,33 @@ class MCPClient:
             # Get the platform-specific message split token
             message_split_token = self.llm_client.get_message_split_token()
 
-            # Process tool calls in the message
-            tool_result_content = []
+            # Collect tool calls in the message
+            tool_calls = [
+                content
+                for message in last_chat_messages
+                for content in message.content
+                if content.type == ContentType.TOOL_CALL
+            ]
+
+            for content in tool_calls:
+                # Redact sensitive information from tool arguments before displaying
+                display_args = self._redact_sensitive_args(content.arguments) if content.arguments else None
+                yield f"\n<special>[Calling tool {content.name} with arguments {str(display_args)[:100]}...]{message_split_token}\n"
 
-            for message in last_chat_messages:
-                for content in message.content:
-                    if content.type == ContentType.TOOL_CALL:
-                        tool_name = content.name
-                        tool_args = content.arguments
-
-                        # Redact sensitive information from tool arguments before displaying
-                        display_args = self._redact_sensitive_args(tool_args) if tool_args else None
-                        yield f"\n<special>[Calling tool {tool_name} with arguments {str(display_args)[:100]}...]{message_split_token}\n"
-
-                        # Process tool call with progress updates
-                        result_text = ""
-                        start_time = time.time()
-                        async for update in self._process_tool_call(tool_name, tool_args):
-                            if "[Tool" in update and "still running" in update:
-                                # This is a progress update
-                                yield update
-                            else:
-                                # This is the final result
-                                result_text = update
-                        logger.info(f"Tool {tool_name} took {time.time() - start_time} seconds to complete")
-                        logger.info(f"Tool result: {result_text}")
-
-                        # Add tool result to next user message
-                        tool_result_content.append(
-                            ToolResultContent(
-                                tool_call_id=content.tool_id, result=result_text
-                            )
-                        )
+            # Run independent tool calls concurrently, interleaving their progress updates
+            tool_result_content = []
+            start_time = time.time()
+            async for kind, value in self._run_tool_calls(tool_calls):
+                if kind == "progress":
+                    yield value
+                else:
+                    # Add tool results to next user message, in the order the LLM requested them
+                    tool_result_content = [
+                        ToolResultContent(tool_call_id=content.tool_id, result=result_text)
+                        for content, result_text in zip(tool_calls, value)
+                    ]
+            if len(tool_calls) > 1:
+                logger.info(f"{len(tool_calls)} tool calls took {time.time() - start_time} seconds to complete")
 
             # Add user message with tool results
             if tool_result_content:
@@ -505,6 +575,7 @@ class MCPClient:
 
     async def cleanup(self):
         """Clean up resources for all servers"""
+        self.resource_cache.clear()
         for server_id in list(self.exit_stacks.keys()):
             try:
                 await self.exit_stacks[server_id].aclose()
@@ -522,36 +593,62 @@ class MCPClient:
         """
         return self.llm_client.get_message_split_token()
 
-    async def list_all_resources(self) -> List[Dict[str, Any]]:
+    async def list_server_resources(self, server_id: str, use_cache: bool = True) -> List[Dict[str, Any]]:
         """
-        List all available resources from all connected servers
+        List the resources of one server
+
+        Args:
+            server_id: The ID of the server to list resources from
+            use_cache: Whether to use the cached listing (if still valid)
 
         Returns:
             List of resources provided by the server
         """
+        if use_cache:
+            cached = self.resource_cache.get_listing(server_id)
+            if cached is not None:
+                return cached
+
+        session = self.sessions[server_id]
+        generation = self.resource_cache.generation(server_id)
+        response = await session.list_resources()
+
         resources = []
-        try:
-            for server_id in self.sessions.keys():
-                session = self.sessions[server_id]
-                response = await session.list_resources()
+        # Handle direct resources
+        if hasattr(response, "resources"):
+            resources = [
+                {
+                    "uri": resource.uri,
+                    "name": resource.name,
+                    "description": resource.description if hasattr(resource, "description") else None,
+                    "mimeType": resource.mimeType if hasattr(resource, "mimeType") else None,
+                    "server_id": server_id,
+                }
+                for resource in response.resources
+            ]
+        # TODO: Handle resource templates
+        self.resource_cache.set_listing(server_id, resources, generation)
+        return resources
 
-                # Handle direct resources
-                if hasattr(response, "resources"):
-                    resources.extend([
-                        {
-                            "uri": resource.uri,
-                            "name": resource.name,
-                            "description": resource.description if hasattr(resource, "description") else None,
-                            "mimeType": resource.mimeType if hasattr(resource, "mimeType") else None,
-                            "server_id": server_id,
-                        }
-                        for resource in response.resources
-                    ])
-                # TODO: Handle resource templates
-            return resources
-        except Exception as e:
-            logger.error(f"Error listing resources from server {server_id}: {str(e)}")
-            return []
+    async def list_all_resources(self) -> List[Dict[str, Any]]:
+        """
+        List all available resources from all connected servers, querying servers concurrently
+
+        Returns:
+            List of resources provided by the servers
+        """
+        server_ids = list(self.sessions.keys())
+        listings = await asyncio.gather(
+            *(self.list_server_resources(server_id) for server_id in server_ids),
+            return_exceptions=True,
+        )
+        resources = []
+        for server_id, listing in zip(server_ids, listings):
+            if isinstance(listing, BaseException):
+                logger.error(f"Error listing resources from server {server_id}: {str(listing)}")
+                continue
+            resources.extend(listing)
+        return resources
 
     async def read_resource(self, server_id: str, uri: str) -> List[Dict[str, Any]]:
         """
@@ -569,37 +666,104 @@ class MCPClient:
             return []
 
         try:
-            session = self.sessions[server_id]
-            response = await session.read_resource(uri)
+            contents = await self._read_resource_contents(server_id, uri)
+            logger.info(f"Successfully read resource {uri} from server {server_id}")
+            return contents
 
-            # Process the resource contents
-            contents = []
+        except Exception as e:
+            logger.error(f"Error reading resource {uri} from server {server_id}: {str(e)}")
+            return []
 
-            for content in response.contents:
-                content_data = {
-                    "uri": content.uri,
-                    "mimeType": content.mimeType if hasattr(content, "mimeType") else None,
-                }
+    async def _read_resource_contents(self, server_id: str, uri: str) -> List[Dict[str, Any]]:
+        session = self.sessions[server_id]
+        response = await session.read_resource(uri)
+
+        # Process the resource contents
+        contents = []
+
+        for content in response.contents:
+            content_data = {
+                "uri": content.uri,
+                "mimeType": content.mimeType if hasattr(content, "mimeType") else None,
+            }
+
+            # Handle text or binary content
+            if hasattr(content, "text") and content.text is not None:
+                content_data["text"] = content.text
+            elif hasattr(content, "blob") and content.blob is not None:
+                # Handle binary content
+                if content.mimeType and "application/pdf" in content.mimeType.lower():
+                    # Convert base64 blob to bytes
+                    pdf_bytes = base64.b64decode(content.blob)
+                    # Use markitdown to convert PDF to markdown text
+                    markdown_text = markitdown.markitdown(pdf_bytes)
+                    content_data["text"] = markdown_text
+                else:
+                    pass
 
-                # Handle text or binary content
-                if hasattr(content, "text") and content.text is not None:
-                    content_data["text"] = content.text
-                elif hasattr(content, "blob") and content.blob is not None:
-                    # Handle binary content
-                    if content.mimeType and "application/pdf" in content.mimeType.lower():
-                        # Convert base64 blob to bytes
-                        pdf_bytes = base64.b64decode(content.blob)
-                        # Use markitdown to convert PDF to markdown text
-                        markdown_text = markitdown.markitdown(pdf_bytes)
-                        content_data["text"] = markdown_text
-                    else:
-                        pass
-
-                contents.append(content_data)
+            contents.append(content_data)
 
-            logger.info(f"Successfully read resource {uri} from server {server_id}")
-            return contents
+        return contents
+
+    async def get_resource_contents(self, server_id: str, uri: str) -> List[Dict[str, Any]]:
+        """
+        Read a resource through the resource cache
+
+        On a miss the resource is first subscribed to, if the server supports it,
+        so that updates invalidate the cached copy; then it is read and cached,
+        unless an update or list change arrived while the read was in flight.
+        Read errors are logged and return an empty list without being cached.
+        """
+        cached = self.resource_cache.get_contents(server_id, str(uri))
+        if cached is not None:
+            return cached
+
+        if server_id not in self.sessions:
+            logger.error(f"Cannot read resource: Server {server_id} not found")
+            return []
 
+        # Subscribe before reading, so an update made after the read is not missed
+        await self._subscribe_to_resource(server_id, uri)
+        generation = self.resource_cache.generation(server_id)
+        try:
+            contents = await self._read_resource_contents(server_id, uri)
         except Exception as e:
             logger.error(f"Error reading resource {uri} from server {server_id}: {str(e)}")
             return []
+
+        self.resource_cache.set_contents(server_id, str(uri), contents, generation)
+        return contents
+
+    async def _subscribe_to_resource(self, server_id: str, uri: str) -> None:
+        if self.resource_cache.is_subscribed(server_id, str(uri)):
+            return
+        session = self.sessions[server_id]
+        capabilities = session.get_server_capabilities() if hasattr(session, "get_server_capabilities") else None
+        if not (capabilities and capabilities.resources and capabilities.resources.subscribe):
+            return
+        try:
+            await session.subscribe_resource(uri)
+            self.resource_cache.add_subscription(server_id, str(uri))
+        except Exception as e:
+            logger.warning(f"Could not subscribe to resource {uri} on server {server_id}: {str(e)}")
+
+    async def get_text_resource_contents(self) -> List[str]:
+        """
+        Text of all resources from all connected servers, in listing order
+
+        Cached resources are served from memory; the rest are read concurrently.
+        """
+        resources = await self.list_all_resources()
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RESOURCE_READS)
+
+        async def read(resource: Dict[str, Any]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_resource_contents(resource["server_id"], resource["uri"])
+
+        all_contents = await asyncio.gather(*(read(resource) for resource in resources))
+        return [
+            content["text"]
+            for contents in all_contents
+            for content in contents
+            if content.get("text")
+        ]
@@ -0,0 +1,180 @@
+"""
+Per-session cache of MCP resource listings and contents.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import mcp.types as types
+
+from mcp_clients.config import RESOURCE_CACHE_MAX_BYTES, RESOURCE_CACHE_TTL_SECONDS
+
+logger = logging.getLogger("mcp_client")
+
+ResourceKey = Tuple[str, str]
+
+
+def _contents_size(contents: List[Dict[str, Any]]) -> int:
+    return sum(len((content.get("text") or "").encode("utf-8")) for content in contents)
+
+
+class ResourceCache:
+    """
+    Snapshot of each server's resource list and the contents read from it.
+
+    Entries are dropped when the server sends notifications/resources/list_changed
+    or notifications/resources/updated. Listings of servers without the
+    listChanged capability, and contents of resources that were not subscribed
+    to, expire after RESOURCE_CACHE_TTL_SECONDS instead. Cached contents are evicted least
+    recently used first once they exceed RESOURCE_CACHE_MAX_BYTES. A listing or
+    read that was in flight when a notification arrived is not stored.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int = RESOURCE_CACHE_MAX_BYTES,
+            ttl_seconds: float = RESOURCE_CACHE_TTL_SECONDS,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # server_id -> (listed_at, resources)
+        self._listings: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        # (server_id, uri) -> (size, cached_at, contents), in LRU order
+        self._contents: "OrderedDict[ResourceKey, Tuple[int, float, List[Dict[str, Any]]]]" = OrderedDict()
+        self._total_bytes = 0
+        # server_id -> whether it sends list_changed; such listings never expire by age
+        self._list_changed: Dict[str, bool] = {}
+        # Resources subscribed to for resources/updated; their contents never expire by age
+        self._subscriptions: Set[ResourceKey] = set()
+        # server_id -> counter bumped on every notification, so reads started before one are not stored
+        self._generations: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    # ------------------------------------------------------------------
+    # Notifications
+    # ------------------------------------------------------------------
+
+    def set_server_capabilities(self, server_id: str, capabilities: Optional[types.ServerCapabilities]) -> None:
+        resources = capabilities.resources if capabilities else None
+        self._list_changed[server_id] = bool(resources and resources.listChanged)
+
+    def is_subscribed(self, server_id: str, uri: str) -> bool:
+        return (server_id, uri) in self._subscriptions
+
+    def add_subscription(self, server_id: str, uri: str) -> None:
+        """Record a successful resources/subscribe; the resource's contents then only expire on notification."""
+        self._subscriptions.add((server_id, uri))
+
+    def message_handler(self, server_id: str) -> Callable[[Any], Awaitable[None]]:
+        """Build a ClientSession message_handler that invalidates this server's entries."""
+
+        async def handle(message: Any) -> None:
+            notification = getattr(message, "root", None)
+            if isinstance(notification, types.ResourceListChangedNotification):
+                logger.info(f"Resource list changed on server {server_id}")
+                self.invalidate_server(server_id)
+            elif isinstance(notification, types.ResourceUpdatedNotification):
+                uri = str(notification.params.uri)
+                logger.info(f"Resource {uri} updated on server {server_id}")
+                self.invalidate_resource(server_id, uri)
+
+        return handle
+
+    def generation(self, server_id: str) -> int:
+        """Current generation of a server; pass it to set_listing/set_contents after the read."""
+        return self._generations.get(server_id, 0)
+
+    def _bump(self, server_id: str) -> None:
+        self._generations[server_id] = self.generation(server_id) + 1
+
+    def invalidate_server(self, server_id: str) -> None:
+        """Forget the listing and all contents of a server."""
+        self._bump(server_id)
+        self._listings.pop(server_id, None)
+        for key in [key for key in self._contents if key[0] == server_id]:
+            self._evict(key)
+
+    def invalidate_resource(self, server_id: str, uri: str) -> None:
+        self._bump(server_id)
+        self._evict((server_id, uri))
+
+    def clear(self) -> None:
+        for server_id in list(self._generations):
+            self._bump(server_id)
+        self._listings.clear()
+        self._contents.clear()
+        self._subscriptions.clear()
+        self._total_bytes = 0
+
+    # ------------------------------------------------------------------
+    # Listings
+    # ------------------------------------------------------------------
+
+    def get_listing(self, server_id: str) -> Optional[List[Dict[str, Any]]]:
+        entry = self._listings.get(server_id)
+        if entry is None:
+            return None
+        listed_at, resources = entry
+        if not self._list_changed.get(server_id, False) and self._expired(listed_at):
+            self.invalidate_server(server_id)
+            return None
+        return resources
+
+    def set_listing(self, server_id: str, resources: List[Dict[str, Any]], generation: int) -> None:
+        if generation != self.generation(server_id):
+            # A notification arrived while this listing was in flight
+            return
+        self._listings[server_id] = (time.monotonic(), resources)
+
+    # ------------------------------------------------------------------
+    # Contents
+    # ------------------------------------------------------------------
+
+    def get_contents(self, server_id: str, uri: str) -> Optional[List[Dict[str, Any]]]:
+        key = (server_id, uri)
+        entry = self._contents.get(key)
+        if entry is not None and key not in self._subscriptions and self._expired(entry[1]):
+            self._evict(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._contents.move_to_end(key)
+        return entry[2]
+
+    def set_contents(self, server_id: str, uri: str, contents: List[Dict[str, Any]], generation: int) -> None:
+        if generation != self.generation(server_id):
+            # A notification arrived while this read was in flight
+            return
+        key = (server_id, uri)
+        self._evict(key)
+        size = _contents_size(contents)
+        if size > self.max_bytes:
+            # Larger than the whole budget: serve it, but do not cache it
+            return
+        self._contents[key] = (size, time.monotonic(), contents)
+        self._total_bytes += size
+        while self._total_bytes > self.max_bytes:
+            self._evict(next(iter(self._contents)))
+
+    def _expired(self, cached_at: float) -> bool:
+        return time.monotonic() - cached_at >= self.ttl_seconds
+
+    def _evict(self, key: ResourceKey) -> None:
+        entry = self._contents.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[0]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "servers_listed": len(self._listings),
+            "resources_cached": len(self._contents),
+            "cached_bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -261,7 +261,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_list_records",
-                description="Get all records from a table with optional filtering and formatting",
+                description="Get records from a table with optional filtering and formatting. Returns one page unless auto_paginate is set",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -308,6 +308,18 @@ def main(
                             "type": "boolean",
                             "description": "Return fields keyed by field ID instead of name",
                         },
+                        "offset": {
+                            "type": "string",
+                            "description": "Page token (nextPageToken from a previous call) to continue listing from",
+                        },
+                        "auto_paginate": {
+                            "type": "boolean",
+                            "description": "Follow page tokens and return records from all pages, up to max_total_records (default: false)",
+                        },
+                        "max_total_records": {
+                            "type": "integer",
+                            "description": "Maximum number of records returned when auto_paginate is true (default: 1000). If more remain, nextPageToken is returned",
+                        },
                     },
                     "required": ["base_id", "table_id"],
                 },
@@ -342,7 +354,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_create_records",
-                description="Create multiple records in a table",
+                description="Create multiple records in a table. Large batches are sent 10 records per request and rate limited per base",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -367,6 +379,10 @@ def main(
                             "type": "boolean",
                             "description": "Whether to return fields keyed by field ID instead of name",
                         },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Stop at the first failed batch of 10 records instead of continuing with the rest (default: false)",
+                        },
                     },
                     "required": ["base_id", "table_id", "records"],
                 },
@@ -376,7 +392,7 @@ def main(
             ),
             types.Tool(
                 name="airtable_update_records",
-                description="Update multiple records in a table with optional upsert functionality",
+                description="Update multiple records in a table with optional upsert functionality. Large batches are sent 10 records per request and rate limited per base",
                 inputSchema={
                     "type": "object",
                     "properties": {
@@ -412,6 +428,10 @@ def main(
                                 }
                             },
                         },
+                        "stop_on_error": {
+                            "type": "boolean",
+                            "description": "Stop at the first failed batch of 10 records instead of continuing with the rest (default: false)",
+                        },
                     },
                     "required": ["base_id", "table_id", "records"],
                 },
@@ -589,6 +609,9 @@ def main(
                     return_fields_by_field_id=arguments.get(
                         "return_fields_by_field_id"
                     ),
+                    offset=arguments.get("offset"),
+                    auto_paginate=arguments.get("auto_paginate", False),
+                    max_total_records=arguments.get("max_total_records"),
                 )
                 return [
                     types.TextContent(
@@ -635,6 +658,7 @@ def main(
                     return_fields_by_field_id=arguments.get(
                         "return_fields_by_field_id"
                     ),
+                    stop_on_error=arguments.get("stop_on_error", False),
                 )
                 return [
                     types.TextContent(
@@ -661,6 +685,7 @@ def main(
                         "return_fields_by_field_id"
                     ),
                     perform_upsert=arguments.get("perform_upsert"),
+                    stop_on_error=arguments.get("stop_on_error", False),
                 )
                 return [
                     types.TextContent(
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Callable, Dict, Optional
 from contextvars import ContextVar
 
 import aiohttp
@@ -122,10 +124,24 @@ class AirtableValidationError(Exception):
     pass
 
 
+class AirtableRateLimitError(RuntimeError):
+    """Raised on Airtable 429 responses; retry_after is in seconds when the API sent one."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 load_dotenv()
 
 AIRTABLE_API_BASE = "https://api.airtable.com/v0"
 
+# Airtable allows 5 requests per second per base and at most 10 records per write
+AIRTABLE_REQUESTS_PER_SECOND = float(os.getenv("AIRTABLE_REQUESTS_PER_SECOND", "5"))
+AIRTABLE_MAX_RETRIES = int(os.getenv("AIRTABLE_MAX_RETRIES", "5"))
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
 # Context variable to store the access token for each request
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 
@@ -154,6 +170,14 @@ def _get_airtable_headers() -> dict:
     }
 
 
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After in seconds; HTTP-date values are ignored in favour of backoff."""
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+
 async def make_airtable_request(
     method: str,
     endpoint: str,
@@ -166,6 +190,11 @@ async def make_airtable_request(
     async with aiohttp.ClientSession(headers=headers) as session:
         try:
             async with session.request(method, url, json=json_data) as response:
+                if response.status == 429:
+                    raise AirtableRateLimitError(
+                        f"Airtable API Error (429): rate limit exceeded for {method} {endpoint}",
+                        retry_after=_parse_retry_after(response.headers.get("Retry-After")),
+                    )
                 # Handle 422 validation errors specially
                 if response.status == 422:
                     error_text = await response.text()
@@ -199,8 +228,8 @@ async def make_airtable_request(
                             f"Received non-JSON response for {method} {endpoint}: {text_content[:100]}..."
                         )
                         return {"raw_content": text_content}
-        except AirtableValidationError as e:
-            # Re-raise 422 validation errors with their specific message
+        except (AirtableValidationError, AirtableRateLimitError) as e:
+            # Re-raise 422 validation and 429 rate limit errors with their specific message
             raise e
         except aiohttp.ClientResponseError as e:
             logger.error(
@@ -224,3 +253,55 @@ async def make_airtable_request(
             raise RuntimeError(
                 f"Unexpected error during API call to {method} {url}"
             ) from e
+
+
+# ============================================================
+# Per-base pacing and 429 retries
+# ============================================================
+
+class BaseRateLimiter:
+    """Spaces requests to the same base at least 1 / requests_per_second apart."""
+
+    def __init__(self, requests_per_second: float = AIRTABLE_REQUESTS_PER_SECOND):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: Dict[str, float] = {}
+
+    async def wait(self, base_id: str) -> None:
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(base_id, 0.0))
+        self._next_slot[base_id] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def defer(self, base_id: str, delay: float) -> None:
+        """Hold back every request to a base, e.g. after a 429."""
+        self._next_slot[base_id] = max(self._next_slot.get(base_id, 0.0), time.monotonic() + delay)
+
+
+rate_limiter = BaseRateLimiter()
+
+
+async def make_paced_airtable_request(
+    base_id: str,
+    method: str,
+    endpoint: str,
+    json_data: Optional[dict] = None,
+    max_retries: int = AIRTABLE_MAX_RETRIES,
+    on_retry: Optional[Callable[[float], None]] = None,
+) -> dict | None:
+    """Make a request paced per base, retrying 429 responses with exponential backoff."""
+    attempt = 0
+    while True:
+        await rate_limiter.wait(base_id)
+        try:
+            return await make_airtable_request(method, endpoint, json_data=json_data)
+        except AirtableRateLimitError as e:
+            if attempt >= max_retries:
+                raise
+            delay = e.retry_after or min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY)
+            logger.warning(f"Airtable rate limit hit for base {base_id}, retrying in {delay:.1f}s")
+            rate_limiter.defer(base_id, delay)
+            if on_retry:
+                on_retry(delay)
+            attempt += 1
@@ -1,13 +1,20 @@
 import logging
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict
 
-from .base import make_airtable_request, normalize_record
+from .base import make_airtable_request, make_paced_airtable_request, normalize_record
 
 # Configure logging
 logger = logging.getLogger("airtable_tools")
 
+# Airtable accepts at most 10 records per create/update request
+MAX_RECORDS_PER_WRITE = 10
+# Airtable returns at most 100 records per page
+MAX_PAGE_SIZE = 100
+# Default cap for auto-paginated list_records
+DEFAULT_MAX_TOTAL_RECORDS = 1000
 
-async def list_records(
+
+def _build_list_endpoint(
     base_id: str,
     table_id: str,
     fields: list[str] | None = None,
@@ -16,61 +23,134 @@ async def list_records(
     page_size: int | None = None,
     sort: list[Dict[str, str]] | None = None,
     return_fields_by_field_id: bool | None = None,
-) -> Dict[str, Any]:
-    """Get all records from a table with optional filtering and formatting."""
+    offset: str | None = None,
+) -> str:
+    """Build the list records endpoint with its query string."""
     endpoint = f"{base_id}/{table_id}"
 
     # Build query parameters
-    params = {}
-
-    if fields:
-        for field in fields:
-            params["fields[]"] = field
+    query_parts = []
 
     if filter_by_formula:
-        params["filterByFormula"] = filter_by_formula
+        query_parts.append(f"filterByFormula={filter_by_formula}")
 
     if max_records is not None:
-        params["maxRecords"] = max_records
+        query_parts.append(f"maxRecords={max_records}")
 
     if page_size is not None:
-        params["pageSize"] = page_size
+        query_parts.append(f"pageSize={page_size}")
 
     if sort:
         for i, sort_item in enumerate(sort):
             if "field" in sort_item:
-                params[f"sort[{i}][field]"] = sort_item["field"]
+                query_parts.append(f"sort[{i}][field]={sort_item['field']}")
             if "direction" in sort_item:
-                params[f"sort[{i}][direction]"] = sort_item["direction"]
+                query_parts.append(f"sort[{i}][direction]={sort_item['direction']}")
 
     if return_fields_by_field_id is not None:
-        params["returnFieldsByFieldId"] = str(return_fields_by_field_id).lower()
-
-    # Add query parameters to endpoint if any exist
-    if params:
-        # Convert params to query string
-        query_parts = []
-        for key, value in params.items():
-            if key == "fields[]":
-                # Handle multiple fields specially
-                continue
-            query_parts.append(f"{key}={value}")
-
-        # Handle fields separately to allow multiple values
-        if fields:
-            for field in fields:
-                query_parts.append(f"fields[]={field}")
-
-        if query_parts:
-            endpoint = f"{endpoint}?{'&'.join(query_parts)}"
-
-    logger.info(f"Executing tool: list_records for table {table_id} in base {base_id}")
-    raw_response = await make_airtable_request("GET", endpoint)
-    
-    records = [normalize_record(r) for r in raw_response.get("records", [])]
+        query_parts.append(f"returnFieldsByFieldId={str(return_fields_by_field_id).lower()}")
+
+    if offset:
+        query_parts.append(f"offset={offset}")
+
+    # Handle fields separately to allow multiple values
+    if fields:
+        for field in fields:
+            query_parts.append(f"fields[]={field}")
+
+    if query_parts:
+        endpoint = f"{endpoint}?{'&'.join(query_parts)}"
+    return endpoint
+
+
+async def iter_record_pages(
+    base_id: str,
+    table_id: str,
+    max_total_records: int | None = None,
+    offset: str | None = None,
+    **query,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield pages of normalized records, following Airtable's offset token.
+
+    Each page is {"records": [...], "offset": token or None}. Stops when the
+    table is exhausted or max_total_records have been yielded. Near the cap
+    the page size is reduced, so the returned offset resumes right after the
+    last yielded record.
+    """
+    remaining = max_total_records
+    page_size = query.pop("page_size", None) or MAX_PAGE_SIZE
+    while True:
+        size = min(page_size, remaining) if remaining is not None else page_size
+        endpoint = _build_list_endpoint(base_id, table_id, offset=offset, page_size=size, **query)
+        raw_response = await make_paced_airtable_request(base_id, "GET", endpoint)
+        records = [normalize_record(r) for r in raw_response.get("records", [])]
+        offset = raw_response.get("offset")
+        if remaining is not None:
+            records = records[:remaining]
+            remaining -= len(records)
+        yield {"records": records, "offset": offset}
+        if not offset or remaining == 0:
+            return
+
+
+async def list_records(
+    base_id: str,
+    table_id: str,
+    fields: list[str] | None = None,
+    filter_by_formula: str | None = None,
+    max_records: int | None = None,
+    page_size: int | None = None,
+    sort: list[Dict[str, str]] | None = None,
+    return_fields_by_field_id: bool | None = None,
+    offset: str | None = None,
+    auto_paginate: bool = False,
+    max_total_records: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Get records from a table with optional filtering and formatting.
+
+    Returns one page by default; pass its nextPageToken back as offset for
+    the next one. With auto_paginate, pages are followed until the table is
+    exhausted or max_total_records (default DEFAULT_MAX_TOTAL_RECORDS) is reached.
+    """
+    query = {
+        "fields": fields,
+        "filter_by_formula": filter_by_formula,
+        "max_records": max_records,
+        "page_size": page_size,
+        "sort": sort,
+        "return_fields_by_field_id": return_fields_by_field_id,
+    }
+
+    if not auto_paginate:
+        logger.info(f"Executing tool: list_records for table {table_id} in base {base_id}")
+        endpoint = _build_list_endpoint(base_id, table_id, offset=offset, **query)
+        raw_response = await make_airtable_request("GET", endpoint)
+
+        records = [normalize_record(r) for r in raw_response.get("records", [])]
+        return {
+            "nextPageToken": raw_response.get("offset"),
+            "count": len(records),
+            "records": records,
+        }
+
+    cap = max_total_records or DEFAULT_MAX_TOTAL_RECORDS
+    logger.info(
+        f"Executing tool: list_records for table {table_id} in base {base_id} (auto-paginate, cap {cap})"
+    )
+    records = []
+    pages = 0
+    next_offset = None
+    async for page in iter_record_pages(base_id, table_id, cap, offset, **query):
+        pages += 1
+        records.extend(page["records"])
+        next_offset = page["offset"]
     return {
-        "nextPageToken": raw_response.get("offset"),
+        "nextPageToken": next_offset,
         "count": len(records),
+        "pages": pages,
+        "truncated": bool(next_offset),
         "records": records,
     }
 
@@ -85,32 +165,100 @@ async def get_record(base_id: str, table_id: str, record_id: str) -> Dict[str, A
     return normalize_record(raw_response)
 
 
+def _chunks(items: list, size: int = MAX_RECORDS_PER_WRITE):
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+async def write_records_in_chunks(
+    base_id: str,
+    table_id: str,
+    method: str,
+    records: list[Dict[str, Any]],
+    options: Dict[str, Any] | None = None,
+    stop_on_error: bool = False,
+) -> Dict[str, Any]:
+    """
+    Send records in chunks of MAX_RECORDS_PER_WRITE, paced per base.
+
+    Chunks are written in order; 429 responses are retried with backoff and a
+    chunk that still fails is reported without aborting the rest (unless
+    stop_on_error). Raises the error itself when no chunk succeeds, so a
+    single bad request fails the same way it did before chunking.
+
+    Returns:
+        Normalized records of all successful chunks plus a per-chunk report
+    """
+    endpoint = f"{base_id}/{table_id}"
+    written = []
+    created_ids, updated_ids = [], []
+    chunks = []
+    first_error = None
+
+    for start, chunk in _chunks(records):
+        report = {"index": len(chunks), "firstRecord": start, "recordCount": len(chunk), "retries": 0}
+        chunks.append(report)
+
+        def count_retry(_delay: float, report=report):
+            report["retries"] += 1
+
+        payload = {**(options or {}), "records": chunk}
+        try:
+            raw_response = await make_paced_airtable_request(
+                base_id, method, endpoint, json_data=payload, on_retry=count_retry
+            )
+        except Exception as e:
+            logger.error(f"Chunk {report['index']} of {method} {endpoint} failed: {e}")
+            report.update({"success": False, "error": str(e)})
+            first_error = first_error or e
+            if stop_on_error:
+                break
+            continue
+
+        chunk_records = [normalize_record(r) for r in raw_response.get("records", [])]
+        written.extend(chunk_records)
+        created_ids.extend(raw_response.get("createdRecords") or [])
+        updated_ids.extend(raw_response.get("updatedRecords") or [])
+        report.update({"success": True, "writtenCount": len(chunk_records)})
+
+    failed = [report for report in chunks if not report["success"]]
+    if first_error is not None and len(failed) == len(chunks):
+        raise first_error
+
+    result = {
+        "count": len(written),
+        "records": written,
+    }
+    # Include upsert-specific fields if present
+    if created_ids:
+        result["createdRecordIds"] = created_ids
+    if updated_ids:
+        result["updatedRecordIds"] = updated_ids
+    if len(chunks) > 1 or failed:
+        result["chunks"] = chunks
+        result["failedCount"] = sum(report["recordCount"] for report in failed)
+        result["skippedCount"] = len(records) - sum(report["recordCount"] for report in chunks)
+    return result
+
+
 async def create_records(
     base_id: str,
     table_id: str,
     records: list[Dict[str, Any]],
     typecast: bool | None = None,
     return_fields_by_field_id: bool | None = None,
+    stop_on_error: bool = False,
 ) -> Dict[str, Any]:
-    """Create one or multiple records in a table."""
-    endpoint = f"{base_id}/{table_id}"
-
-    payload = {
+    """Create one or multiple records in a table, 10 per request."""
+    options = {
         "typecast": typecast,
         "returnFieldsByFieldId": return_fields_by_field_id,
-        "records": records,
     }
 
     logger.info(
-        f"Executing tool: create_records for table {table_id} in base {base_id}"
+        f"Executing tool: create_records for {len(records)} records in table {table_id}, base {base_id}"
     )
-    raw_response = await make_airtable_request("POST", endpoint, json_data=payload)
-    
-    records = [normalize_record(r) for r in raw_response.get("records", [])]
-    return {
-        "count": len(records),
-        "records": records,
-    }
+    return await write_records_in_chunks(base_id, table_id, "POST", records, options, stop_on_error)
 
 
 async def update_records(
@@ -120,39 +268,24 @@ async def update_records(
     typecast: bool | None = None,
     return_fields_by_field_id: bool | None = None,
     perform_upsert: Dict[str, Any] | None = None,
+    stop_on_error: bool = False,
 ) -> Dict[str, Any]:
-    """Update one or multiple records in a table, with optional upsert functionality."""
-    endpoint = f"{base_id}/{table_id}"
-
-    payload = {
-        "records": records,
-    }
+    """Update one or multiple records in a table, 10 per request, with optional upsert functionality."""
+    options = {}
 
     if typecast is not None:
-        payload["typecast"] = typecast
+        options["typecast"] = typecast
 
     if return_fields_by_field_id is not None:
-        payload["returnFieldsByFieldId"] = return_fields_by_field_id
+        options["returnFieldsByFieldId"] = return_fields_by_field_id
 
     if perform_upsert is not None:
-        payload["performUpsert"] = perform_upsert
+        options["performUpsert"] = perform_upsert
 
     logger.info(
-        f"Executing tool: update_records for table {table_id} in base {base_id}"
+        f"Executing tool: update_records for {len(records)} records in table {table_id}, base {base_id}"
     )
-    raw_response = await make_airtable_request("PATCH", endpoint, json_data=payload)
-    
-    normalized_records = [normalize_record(r) for r in raw_response.get("records", [])]
-    result = {
-        "count": len(normalized_records),
-        "records": normalized_records,
-    }
-    # Include upsert-specific fields if present
-    if raw_response.get("createdRecords"):
-        result["createdRecordIds"] = raw_response["createdRecords"]
-    if raw_response.get("updatedRecords"):
-        result["updatedRecordIds"] = raw_response["updatedRecords"]
-    return result
+    return await write_records_in_chunks(base_id, table_id, "PATCH", records, options, stop_on_error)
 
 
 async def delete_records(
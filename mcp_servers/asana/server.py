@@ -188,7 +188,7 @@ def main(
                         },
                         "assignee_id": {
                             "type": "string",
-                            "description": "Filter by assignee ID",
+                            "description": "Filter by assignee ID, email, name, or 'me'",
                         },
                         "project": {
                             "type": "string",
@@ -196,7 +196,7 @@ def main(
                         },
                         "team_id": {
                             "type": "string",
-                            "description": "Team ID to filter by",
+                            "description": "Team ID or name to filter by",
                         },
                         "tags": {
                             "type": "array",
@@ -300,10 +300,9 @@ def clean_asana_response(func):
 
 
 async def get_unique_workspace_id_or_raise_error() -> str:
-    client = get_asana_client()
-    
-    response = await client.get("/workspaces")
-    workspaces = response["data"]
+    from .name_index import get_name_index
+
+    workspaces = await get_name_index().workspaces()
 
     if len(workspaces) == 1:
         return workspaces[0]["id"]
@@ -14,6 +14,21 @@ try:
 except ValueError:
     ASANA_MAX_TIMEOUT_SECONDS = 20
 
+try:
+    ASANA_NAME_INDEX_TTL_SECONDS = int(os.getenv("ASANA_NAME_INDEX_TTL_SECONDS", 300))
+except ValueError:
+    ASANA_NAME_INDEX_TTL_SECONDS = 300
+
+try:
+    ASANA_NAME_INDEX_MISS_REFRESH_SECONDS = int(os.getenv("ASANA_NAME_INDEX_MISS_REFRESH_SECONDS", 30))
+except ValueError:
+    ASANA_NAME_INDEX_MISS_REFRESH_SECONDS = 30
+
+try:
+    ASANA_NAME_INDEX_MAX_TOKENS = int(os.getenv("ASANA_NAME_INDEX_MAX_TOKENS", 100))
+except ValueError:
+    ASANA_NAME_INDEX_MAX_TOKENS = 100
+
 MAX_PROJECTS_TO_SCAN_BY_NAME = 1000
 MAX_TAGS_TO_SCAN_BY_NAME = 1000
 
@@ -0,0 +1,281 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+from .constants import (
+    ASANA_NAME_INDEX_MAX_TOKENS,
+    ASANA_NAME_INDEX_MISS_REFRESH_SECONDS,
+    ASANA_NAME_INDEX_TTL_SECONDS,
+    MAX_PROJECTS_TO_SCAN_BY_NAME,
+)
+from .base import (
+    AsanaClient,
+    AsanaToolExecutionError,
+    RetryableToolError,
+    get_asana_client,
+)
+
+logger = logging.getLogger(__name__)
+
+# Kind -> (endpoint for a workspace, opt_fields)
+NAME_INDEX_SOURCES = {
+    "projects": (lambda ws: (f"/workspaces/{ws}/projects", {}), "name"),
+    "tags": (lambda ws: (f"/workspaces/{ws}/tags", {}), "name"),
+    "teams": (lambda ws: (f"/workspaces/{ws}/teams", {}), "name"),
+    "users": (lambda ws: ("/users", {"workspace": ws}), "name,email"),
+}
+
+PAGE_SIZE = 100
+
+
+@dataclass
+class _Listing:
+    """Name -> items for one kind in one workspace."""
+    items: list[dict[str, Any]] = field(default_factory=list)
+    by_name: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+    fetched_at: float = 0.0
+    # Cap the listing was fetched with, and whether it held every item anyway
+    max_items: int | None = None
+    complete: bool = True
+
+    def covers(self, max_items: int | None) -> bool:
+        """Whether this listing answers a request capped at max_items."""
+        if self.complete:
+            return True
+        return max_items is not None and self.max_items is not None and max_items <= self.max_items
+
+    def add(self, item: dict[str, Any]) -> None:
+        self.items.append(item)
+        for key in (item.get("name"), item.get("email")):
+            if key:
+                self.by_name.setdefault(key.lower(), []).append(item)
+
+
+class NameIndex:
+    """
+    Per-token, per-workspace cache of project, tag, team and user names to GIDs.
+
+    Listings for all workspaces are fetched concurrently (each one paged with
+    its offset token) and kept for ASANA_NAME_INDEX_TTL_SECONDS. A lookup that
+    misses refreshes the listing at most once per
+    ASANA_NAME_INDEX_MISS_REFRESH_SECONDS, so after warm-up name lookups make
+    no API calls.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = ASANA_NAME_INDEX_TTL_SECONDS,
+        miss_refresh_seconds: float = ASANA_NAME_INDEX_MISS_REFRESH_SECONDS,
+        max_tokens: int = ASANA_NAME_INDEX_MAX_TOKENS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self.max_tokens = max_tokens
+        # token key -> {"workspaces": (fetched_at, [...]), (kind, workspace_id): _Listing}
+        self._tokens: OrderedDict[str, dict[Any, Any]] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    # ------------------------------------------------------------------
+    # Cache plumbing
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _token_key(client: AsanaClient) -> str:
+        return hashlib.sha256(client.auth_token.encode()).hexdigest()
+
+    def _cache(self, token_key: str) -> dict[Any, Any]:
+        cache = self._tokens.get(token_key)
+        if cache is None:
+            cache = self._tokens[token_key] = {}
+            while len(self._tokens) > self.max_tokens:
+                self._tokens.popitem(last=False)
+        self._tokens.move_to_end(token_key)
+        return cache
+
+    def _expired(self, fetched_at: float, max_age: float | None = None) -> bool:
+        return time.monotonic() - fetched_at >= (self.ttl_seconds if max_age is None else max_age)
+
+    async def _once(self, key: tuple, factory):
+        """Share one in-flight fetch between concurrent callers."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    def add(self, kind: str, workspace_id: str, item: dict[str, Any]) -> None:
+        """Record an item created through this server without refetching the listing."""
+        cache = self._tokens.get(self._token_key(get_asana_client()))
+        listing = cache.get((kind, workspace_id)) if cache else None
+        if listing is not None:
+            listing.add({"id": item["id"], "name": item.get("name"), "workspace": {"id": workspace_id}})
+
+    # ------------------------------------------------------------------
+    # Fetching
+    # ------------------------------------------------------------------
+
+    async def workspaces(self) -> list[dict[str, Any]]:
+        """Workspaces visible to the current token (id and name)."""
+        client = get_asana_client()
+        token_key = self._token_key(client)
+        cached = self._cache(token_key).get("workspaces")
+        if cached and not self._expired(cached[0]):
+            return cached[1]
+
+        async def fetch():
+            items = await self._list_all(client, "/workspaces", {}, "name", max_items=None)
+            workspaces = [{"id": ws["id"], "name": ws["name"]} for ws in items]
+            self._cache(token_key)["workspaces"] = (time.monotonic(), workspaces)
+            return workspaces
+
+        return await self._once((token_key, "workspaces"), fetch)
+
+    @staticmethod
+    async def _list_all(
+        client: AsanaClient,
+        endpoint: str,
+        params: dict[str, Any],
+        opt_fields: str,
+        max_items: int | None,
+    ) -> list[dict[str, Any]]:
+        items: list[dict[str, Any]] = []
+        offset = None
+        while True:
+            page_params = {**params, "limit": PAGE_SIZE, "opt_fields": opt_fields}
+            if offset:
+                page_params["offset"] = offset
+            response = await client.get(endpoint, params=page_params)
+            items.extend(response["data"])
+            offset = (response.get("next_page") or {}).get("offset")
+            if not offset or (max_items is not None and len(items) >= max_items):
+                return items if max_items is None else items[:max_items]
+
+    async def _refresh(
+        self, client: AsanaClient, token_key: str, kind: str, workspace_id: str, max_items: int
+    ) -> _Listing:
+        async def fetch():
+            endpoint_factory, opt_fields = NAME_INDEX_SOURCES[kind]
+            endpoint, params = endpoint_factory(workspace_id)
+            listing = _Listing(fetched_at=time.monotonic(), max_items=max_items)
+            try:
+                items = await self._list_all(client, endpoint, params, opt_fields, max_items)
+            except AsanaToolExecutionError as e:
+                # e.g. teams only exist in organizations, not in plain workspaces
+                logger.debug(f"Could not list {kind} in workspace {workspace_id}: {e}")
+                items = []
+            listing.complete = max_items is None or len(items) < max_items
+            for item in items:
+                listing.add({**item, "workspace": {"id": workspace_id}})
+            self._cache(token_key)[(kind, workspace_id)] = listing
+            return listing
+
+        return await self._once((token_key, kind, workspace_id, max_items), fetch)
+
+    async def _listings(
+        self,
+        kind: str,
+        workspace_ids: list[str] | None,
+        max_items: int,
+        refresh_older_than: float | None = None,
+    ) -> list[_Listing]:
+        if kind not in NAME_INDEX_SOURCES:
+            raise ValueError(f"Unknown name index kind '{kind}'. Supported: {', '.join(NAME_INDEX_SOURCES)}")
+        client = get_asana_client()
+        token_key = self._token_key(client)
+        if not workspace_ids:
+            workspace_ids = [ws["id"] for ws in await self.workspaces()]
+
+        async def listing_for(workspace_id: str) -> _Listing:
+            listing = self._cache(token_key).get((kind, workspace_id))
+            if (
+                listing is None
+                or not listing.covers(max_items)
+                or self._expired(listing.fetched_at, refresh_older_than)
+            ):
+                listing = await self._refresh(client, token_key, kind, workspace_id, max_items)
+            return listing
+
+        return list(await asyncio.gather(*(listing_for(ws) for ws in workspace_ids)))
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    async def lookup(
+        self,
+        kind: str,
+        names: list[str],
+        workspace_ids: list[str] | None = None,
+        max_items: int = MAX_PROJECTS_TO_SCAN_BY_NAME,
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Items matching each name (case-insensitive; users also match by email).
+
+        Returns a dict keyed by the given names; names without matches map to [].
+        """
+        listings = await self._listings(kind, workspace_ids, max_items)
+        found = self._match(listings, names)
+        if any(not items for items in found.values()):
+            # Refresh listings that are older than the miss window and try again
+            stale = [l for l in listings if self._expired(l.fetched_at, self.miss_refresh_seconds)]
+            if stale:
+                listings = await self._listings(kind, workspace_ids, max_items, self.miss_refresh_seconds)
+                found = self._match(listings, names)
+        return found
+
+    @staticmethod
+    def _match(listings: list[_Listing], names: list[str]) -> dict[str, list[dict[str, Any]]]:
+        return {
+            name: [item for listing in listings for item in listing.by_name.get(name.lower(), [])]
+            for name in names
+        }
+
+    async def items(
+        self,
+        kind: str,
+        workspace_ids: list[str] | None = None,
+        max_items: int = MAX_PROJECTS_TO_SCAN_BY_NAME,
+    ) -> list[dict[str, Any]]:
+        """All cached items of a kind across the given (or all) workspaces."""
+        listings = await self._listings(kind, workspace_ids, max_items)
+        return [item for listing in listings for item in listing.items]
+
+    async def resolve_gid_or_raise_error(
+        self, kind: str, value: str, workspace_id: str | None = None
+    ) -> str:
+        """Return value if it already is a GID, else the GID of the single item with that name."""
+        if value.isnumeric():
+            return value
+        workspace_ids = [workspace_id] if workspace_id else None
+        matches = (await self.lookup(kind, [value], workspace_ids))[value]
+        label = kind.rstrip("s")
+        if len(matches) == 1:
+            return matches[0]["id"]
+        if not matches:
+            message = f"No {label} named '{value}' was found. Please provide a {label} ID instead."
+            additional_prompt = ""
+        else:
+            message = f"Multiple {kind} found with the name '{value}'. Please provide a {label} ID instead."
+            additional_prompt = (
+                f"{kind.capitalize()} matching the name '{value}': "
+                f"{json.dumps([{'name': m.get('name'), 'id': m['id']} for m in matches])}"
+            )
+        raise RetryableToolError(
+            message=message,
+            developer_message=f"{message} {additional_prompt}".strip(),
+            additional_prompt_content=additional_prompt,
+        )
+
+
+# Global instance shared by all tools
+name_index = NameIndex()
+
+
+def get_name_index() -> NameIndex:
+    return name_index
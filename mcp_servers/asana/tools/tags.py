@@ -10,6 +10,7 @@ from .base import (
     AsanaToolExecutionError,
     normalize_tag,
 )
+from .name_index import get_name_index
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +54,7 @@ async def create_tag(
 
         client = get_asana_client()
         response = await client.post("/tags", json_data={"data": data})
+        get_name_index().add("tags", workspace_id, response["data"])
         return {"tag": normalize_tag(response["data"])}
 
     except AsanaToolExecutionError as e:
@@ -15,6 +15,7 @@ from .base import (
     normalize_task,
     normalize_attachment,
 )
+from .name_index import get_name_index
 
 logger = logging.getLogger(__name__)
 
@@ -107,6 +108,11 @@ def add_task_search_date_params(
     return query_params
 
 
+def _is_user_reference(value: str) -> bool:
+    """Whether Asana accepts the value as a user as-is: a GID, an email or "me"."""
+    return value.isnumeric() or value == "me" or "@" in value
+
+
 async def handle_new_task_associations(
     parent_task_id: str | None,
     project: str | None,
@@ -209,7 +215,7 @@ async def handle_new_task_tags(
             tag_names.append(tag)
 
     if tag_names:
-        response = await find_tags_by_name(tag_names)
+        response = await find_tags_by_name(tag_names, workspace_id=[workspace_id] if workspace_id else None)
         tag_ids.extend([tag["id"] for tag in response["matches"]["tags"]])
 
         if response["not_found"]["tags"]:
@@ -220,6 +226,7 @@ async def handle_new_task_tags(
                 tag_data = {"name": name, "workspace": workspace_id}
                 create_response = await client.post("/tags", json_data={"data": tag_data})
                 created_tags.append(create_response["data"]["id"])
+                get_name_index().add("tags", workspace_id, create_response["data"])
             
             tag_ids.extend(created_tags)
 
@@ -263,53 +270,38 @@ async def find_projects_by_name(
     max_items_to_scan: int = MAX_PROJECTS_TO_SCAN_BY_NAME,
     return_projects_not_matched: bool = False,
 ) -> dict[str, Any]:
-    """Find projects by name."""
-    client = get_asana_client()
-    
-    # Get all workspaces first
-    workspaces_response = await client.get("/workspaces")
-    workspaces = workspaces_response["data"]
-    
-    all_projects = []
-    
-    # Search through all workspaces
-    for workspace in workspaces:
-        projects_response = await client.get(
-            f"/workspaces/{workspace['id']}/projects",
-            params={"limit": min(response_limit, max_items_to_scan)}
-        )
-        all_projects.extend(projects_response["data"])
-        
-        if len(all_projects) >= max_items_to_scan:
-            break
-    
-    # Match projects by name
+    """Find projects by name using the cached name index."""
+    index = get_name_index()
+    found = await index.lookup("projects", names, max_items=max_items_to_scan)
+
+    # Match projects by name; every project with the name is returned so callers can detect duplicates
     matches = []
     not_matched = []
-    
+    seen = set()
+
     for name in names:
-        found = False
-        for project in all_projects:
-            if project["name"].lower() == name.lower():
-                matches.append(project)
-                found = True
-                break
-        if not found:
+        if not found[name]:
             not_matched.append(name)
-    
+        for project in found[name]:
+            if project["id"] not in seen:
+                seen.add(project["id"])
+                matches.append(project)
+
+    matches = matches[:response_limit]
     result = {
         "matches": {
             "projects": matches,
             "count": len(matches)
         }
     }
-    
+
     if return_projects_not_matched:
+        all_projects = await index.items("projects", max_items=max_items_to_scan)
         result["not_matched"] = {
-            "projects": all_projects,
+            "projects": all_projects[:response_limit],
             "tags": not_matched
         }
-    
+
     return result
 
 
@@ -320,43 +312,20 @@ async def find_tags_by_name(
     max_items_to_scan: int = MAX_TAGS_TO_SCAN_BY_NAME,
     return_tags_not_matched: bool = False,
 ) -> dict[str, Any]:
-    """Find tags by name."""
-    client = get_asana_client()
-    
-    # Get all workspaces first
-    if not workspace_id:
-        workspaces_response = await client.get("/workspaces")
-        workspaces = workspaces_response["data"]
-    else:
-        workspaces = [{"id": wid} for wid in workspace_id]
-    
-    all_tags = []
-    
-    # Search through all workspaces
-    for workspace in workspaces:
-        tags_response = await client.get(
-            f"/workspaces/{workspace['id']}/tags",
-            params={"limit": min(response_limit, max_items_to_scan)}
-        )
-        all_tags.extend(tags_response["data"])
-        
-        if len(all_tags) >= max_items_to_scan:
-            break
-    
+    """Find tags by name using the cached name index."""
+    index = get_name_index()
+    found = await index.lookup("tags", names, workspace_ids=workspace_id, max_items=max_items_to_scan)
+
     # Match tags by name
     matches = []
     not_found = []
-    
+
     for name in names:
-        found = False
-        for tag in all_tags:
-            if tag["name"].lower() == name.lower():
-                matches.append(tag)
-                found = True
-                break
-        if not found:
+        if found[name]:
+            matches.append(found[name][0])
+        else:
             not_found.append(name)
-    
+
     result = {
         "matches": {
             "tags": matches,
@@ -366,12 +335,13 @@ async def find_tags_by_name(
             "tags": not_found
         }
     }
-    
+
     if return_tags_not_matched:
+        all_tags = await index.items("tags", workspace_ids=workspace_id, max_items=max_items_to_scan)
         result["not_matched"] = {
-            "tags": all_tags
+            "tags": all_tags[:response_limit]
         }
-    
+
     return result
 
 async def search_tasks(
@@ -417,6 +387,9 @@ async def search_tasks(
         validate_date_format("start_on_or_after", start_on_or_after)
         validate_date_format("start_on_or_before", start_on_or_before)
 
+        if team_id and not team_id.isnumeric():
+            team_id = await get_name_index().resolve_gid_or_raise_error("teams", team_id, workspace_id)
+
         if not any([workspace_id, project_id, team_id]):
             workspace_id = await get_unique_workspace_id_or_raise_error()
 
@@ -425,6 +398,9 @@ async def search_tasks(
             team = await get_team_by_id(team_id)
             workspace_id = team["organization"]["id"]
 
+        if assignee_id and not _is_user_reference(assignee_id):
+            assignee_id = await get_name_index().resolve_gid_or_raise_error("users", assignee_id, workspace_id)
+
         response = await client.get(
             f"/workspaces/{workspace_id}/tasks/search",
             params=build_task_search_query_params(
@@ -2,8 +2,10 @@ import contextlib
 import base64
 import logging
 import os
+import sys
 import json
 from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any, Dict
 
 import click
@@ -17,6 +19,12 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 
+# Shared server helpers (mcp_servers/shared, copied to ./shared in the Docker image)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from shared.instrumentation import instrument_tool, metrics_endpoint
+from shared.launcher import serve
+from shared.tool_registry import ToolRegistry
+
 from tools.base import CloseToolExecutionError
 
 # Import tools
@@ -97,8 +105,7 @@ def main(
 
     app = Server("close-mcp-server")
 
-    @app.list_tools()
-    async def list_tools() -> list[types.Tool]:
+    def build_tools() -> list[types.Tool]:
         return [
             # Lead Management Tools
             types.Tool(
@@ -2018,7 +2025,12 @@ def main(
             ),
         ]
 
+    # Built and validated once; tools/list requests are served from the cached result
+    tool_registry = ToolRegistry(build_tools())
+    tool_registry.install(app)
+
     @app.call_tool()
+    @instrument_tool
     async def call_tool(
         name: str, arguments: dict
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -2241,7 +2253,6 @@ def main(
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
-        debug=True,
         routes=[
             # SSE routes
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
@@ -2249,6 +2260,7 @@ def main(
             
             # StreamableHTTP route
             Mount("/mcp", app=handle_streamable_http),
+            Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
         ],
         lifespan=lifespan,
     )
@@ -2257,16 +2269,8 @@ def main(
     logger.info(f"  - SSE endpoint: http://localhost:{port}/sse")
     logger.info(f"  - StreamableHTTP endpoint: http://localhost:{port}/mcp")
 
-    import uvicorn
-
     try:
-        uvicorn.run(
-            starlette_app,
-            host="0.0.0.0",
-            port=port,
-            log_level=log_level.lower(),
-        )
-        return 0
+        return serve(starlette_app, host="0.0.0.0", port=port, log_level=log_level)
     except Exception as e:
         logger.exception(f"Failed to start server: {e}")
         return 1
@@ -8,6 +8,8 @@ from functools import wraps
 
 import httpx
 
+from shared.instrumentation import instrument_upstream
+
 from .constants import CLOSE_API_VERSION, CLOSE_BASE_URL, CLOSE_MAX_CONCURRENT_REQUESTS, CLOSE_MAX_TIMEOUT_SECONDS
 
 # Configure logging
@@ -497,6 +499,7 @@ class CloseClient:
         return kwargs
 
     @clean_close_response
+    @instrument_upstream
     async def get(
         self,
         endpoint: str,
@@ -525,6 +528,7 @@ class CloseClient:
         return cast(dict, response.json())
 
     @clean_close_response
+    @instrument_upstream
     async def post(
         self,
         endpoint: str,
@@ -567,6 +571,7 @@ class CloseClient:
         return cast(dict, response.json())
 
     @clean_close_response
+    @instrument_upstream
     async def put(
         self,
         endpoint: str,
@@ -594,6 +599,7 @@ class CloseClient:
         return cast(dict, response.json())
 
     @clean_close_response
+    @instrument_upstream
     async def delete(
         self,
         endpoint: str,
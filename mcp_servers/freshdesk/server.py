@@ -1,8 +1,10 @@
 import contextlib
 import logging
 import os
+import sys
 import json
 from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any, Dict
 from contextvars import ContextVar
 import base64
@@ -18,12 +20,19 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 
+# Shared server helpers (mcp_servers/shared, copied to ./shared in the Docker image)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from shared.instrumentation import instrument_tool, metrics_endpoint
+from shared.launcher import serve
+from shared.tool_registry import ToolRegistry
+
 
 from tools import (
 
     # Context variables
     auth_token_context,
     domain_context,
+    close_freshdesk_clients,
 
     # Ticket tools
     create_ticket,
@@ -183,8 +192,7 @@ def main(port: int, log_level: str, json_response: bool) -> int:
     # Create the MCP server instance
     app = Server("freshdesk-mcp-server")
 
-    @app.list_tools()
-    async def list_tools() -> list[types.Tool]:
+    def build_tools() -> list[types.Tool]:
         return [
         types.Tool(
             name="freshdesk_create_ticket",
@@ -548,6 +556,10 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 "per_page": {
                     "type": "integer",
                     "description": "Number of results per page (max 30). Default is 30."
+                },
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch starting at page; pages are fetched concurrently (at most 10 pages of search results). Default is 1."
                 }
             },
             "required": ["query"]
@@ -739,6 +751,10 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                     "per_page": {
                         "type": "integer", 
                         "description": "Number of results per page (max 100). Default is 30."
+                    },
+                    "max_pages": {
+                        "type": "integer",
+                        "description": "Number of pages to fetch starting at page; pages are fetched concurrently. Default is 1."
                     }
                 }
             },
@@ -898,6 +914,10 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                     "per_page": {
                         "type": "integer", 
                         "description": "Number of results per page (max 100). Default is 30."
+                    },
+                    "max_pages": {
+                        "type": "integer",
+                        "description": "Number of pages to fetch starting at page; pages are fetched concurrently. Default is 1."
                     }
                 }
             },
@@ -1209,6 +1229,10 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                             "maximum": 100,
                             "default": 30,
                             "description": "Number of records per page (max 100)"
+                        },
+                        "max_pages": {
+                            "type": "integer",
+                            "description": "Number of pages to fetch starting at page; pages are fetched concurrently. Default is 1."
                         }
                     }
                 },
@@ -1875,8 +1899,13 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 annotations=types.ToolAnnotations(**{"category": "FRESHDESK_THREAD"})
             ),
         ]
-    
+
+    # Built and validated once; tools/list requests are served from the cached result
+    tool_registry = ToolRegistry(build_tools())
+    tool_registry.install(app)
+
     @app.call_tool()
+    @instrument_tool
     async def call_tool(name: str, arguments: dict) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
         try:
 
@@ -2069,14 +2098,15 @@ def main(port: int, log_level: str, json_response: bool) -> int:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                await close_freshdesk_clients()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
-        debug=True,
         routes=[
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
             Mount("/messages/", app=sse.handle_post_message),
             Mount("/mcp", app=handle_streamable_http),
+            Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
         ],
         lifespan=lifespan,
     )
@@ -2085,9 +2115,7 @@ def main(port: int, log_level: str, json_response: bool) -> int:
     logger.info(f"  - SSE endpoint: http://localhost:{port}/sse")
     logger.info(f"  - StreamableHTTP endpoint: http://localhost:{port}/mcp")
 
-    import uvicorn
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
-    return 0
+    return serve(starlette_app, host="0.0.0.0", port=port, log_level=log_level)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -2,7 +2,7 @@
 # This package contains all the tool implementations organized by object type
 
 
-from .base import  auth_token_context, domain_context
+from .base import  auth_token_context, domain_context, close_freshdesk_clients
 from .tickets import (
     create_ticket,
     get_ticket_by_id,
@@ -81,6 +81,7 @@ __all__ = [
     # Context variables
     'auth_token_context',
     'domain_context',
+    'close_freshdesk_clients',
 
     # Tickets
     'create_ticket',
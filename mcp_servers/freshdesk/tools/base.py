@@ -1,16 +1,31 @@
-import requests
+import asyncio
+import hashlib
+import logging
+import math
+import httpx
 import os
 import random
 import string
-from typing import Any, Dict, Optional, List
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, List, Set, Tuple
 import base64
 from dotenv import load_dotenv
-from util import rate_limiter
+from util import FreshdeskRateLimiter
+from shared.instrumentation import instrument_upstream, record_retry
 from contextvars import ContextVar
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Pooled HTTP clients kept open, one per (domain, API key)
+FRESHDESK_MAX_POOLED_CLIENTS = int(os.getenv("FRESHDESK_MAX_POOLED_CLIENTS", "32"))
+# Times a request is retried after a 429 response
+FRESHDESK_MAX_RETRIES = int(os.getenv("FRESHDESK_MAX_RETRIES", "3"))
+DEFAULT_RETRY_AFTER_SECONDS = 30
+
 auth_token_context: ContextVar[str] = ContextVar('auth_token')
 domain_context: ContextVar[str] = ContextVar('domain')
 
@@ -54,6 +69,67 @@ def gen_random_password(length: int = 10) -> str:
     return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
 
 
+_clients: "OrderedDict[Tuple[str, str], httpx.AsyncClient]" = OrderedDict()
+# Requests running on each client, and evicted clients waiting for theirs to finish
+_in_flight: Dict[httpx.AsyncClient, int] = {}
+_retired: Set[httpx.AsyncClient] = set()
+_rate_limiters: Dict[str, FreshdeskRateLimiter] = {}
+
+
+@asynccontextmanager
+async def freshdesk_client(domain: str, api_key: str) -> AsyncIterator[httpx.AsyncClient]:
+    """Pooled client for a domain and API key, reusing its connections across requests.
+
+    A client evicted from the pool while requests are still running on it is
+    closed when the last of them finishes.
+    """
+    key = (domain, hashlib.sha256(api_key.encode()).hexdigest())
+    client = _clients.get(key)
+    evicted = []
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            base_url=f"https://{domain}.freshdesk.com/api/v2",
+            limits=httpx.Limits(max_connections=get_rate_limiter(domain).max_concurrency),
+        )
+        _clients[key] = client
+        while len(_clients) > FRESHDESK_MAX_POOLED_CLIENTS:
+            evicted.append(_clients.popitem(last=False)[1])
+    _clients.move_to_end(key)
+    _in_flight[client] = _in_flight.get(client, 0) + 1
+
+    try:
+        for old in evicted:
+            if old in _in_flight:
+                _retired.add(old)
+            else:
+                await old.aclose()
+        yield client
+    finally:
+        _in_flight[client] -= 1
+        if not _in_flight[client]:
+            del _in_flight[client]
+            if client in _retired:
+                _retired.discard(client)
+                await client.aclose()
+
+
+def get_rate_limiter(domain: str) -> FreshdeskRateLimiter:
+    """Rate limiter of a Freshdesk account; the budget is shared by all of its API keys."""
+    limiter = _rate_limiters.get(domain)
+    if limiter is None:
+        limiter = _rate_limiters[domain] = FreshdeskRateLimiter()
+    return limiter
+
+
+async def close_freshdesk_clients() -> None:
+    while _clients:
+        _, client = _clients.popitem()
+        await client.aclose()
+    while _retired:
+        await _retired.pop().aclose()
+
+
+@instrument_upstream
 async def make_freshdesk_request(
     method: str, 
     endpoint: str, 
@@ -62,6 +138,9 @@ async def make_freshdesk_request(
 ) -> Any:
     """Make an HTTP request to the Freshdesk API.
     
+    Requests go through a pooled async client per domain and API key and wait for
+    room in the account's rate budget. 429 responses are retried after Retry-After.
+    
     Args:
         method: HTTP method (GET, POST, PUT, DELETE, etc.)
         endpoint: API endpoint (e.g., '/tickets')
@@ -78,7 +157,7 @@ async def make_freshdesk_request(
         
     Raises:
         ValueError: For invalid input parameters
-        requests.exceptions.RequestException: For HTTP and connection errors
+        httpx.HTTPError: For HTTP and connection errors
         json.JSONDecodeError: If response cannot be parsed as JSON
     """
     if not isinstance(method, str) or not method.strip():
@@ -90,12 +169,8 @@ async def make_freshdesk_request(
     if data is not None and not isinstance(data, dict):
         raise ValueError("Data must be a dictionary or None")
 
-    FRESHDESK_API_BASE = f"https://{get_domain()}.freshdesk.com/api/v2"
+    domain = get_domain()
     FRESHDESK_API_KEY = get_auth_token()
-    
-    
-    url = f"{FRESHDESK_API_BASE}{endpoint}"
-
 
     timeout = int(options.get("timeout", 10))
     use_pwd = options.get("use_pwd", True)
@@ -127,30 +202,38 @@ async def make_freshdesk_request(
         request_args["data"] = data
 
     if not use_pwd:
-        api_key = base64.b64encode(f"{FRESHDESK_API_KEY}:{random_password}").decode("utf-8")
-        headers["Authorization"] = f"{api_key}"
+        api_key = base64.b64encode(f"{FRESHDESK_API_KEY}:{random_password}".encode("utf-8")).decode("utf-8")
+        headers["Authorization"] = f"Basic {api_key}"
     else:
         request_args["auth"] = (FRESHDESK_API_KEY, random_password)
 
+    limiter = get_rate_limiter(domain)
+
     try:
-        
-        response = requests.request(
-            method=method.upper(),
-            url=url,
-            headers=headers,
-            timeout=timeout,
-            **request_args,
-        )
-        
-        rate_limiter.update_from_headers(response.headers)
+        async with freshdesk_client(domain, FRESHDESK_API_KEY) as client:
+            for attempt in range(FRESHDESK_MAX_RETRIES + 1):
+                await limiter.acquire()
+                response = None
+                try:
+                    response = await client.request(
+                        method=method.upper(),
+                        url=endpoint,
+                        headers=headers,
+                        timeout=timeout,
+                        **request_args,
+                    )
+                finally:
+                    limiter.release(response.headers if response is not None else None)
+
+                if response.status_code != 429 or attempt == FRESHDESK_MAX_RETRIES:
+                    break
+                if "Retry-After" not in response.headers:
+                    limiter.update_from_headers({"Retry-After": str(DEFAULT_RETRY_AFTER_SECONDS)})
+                record_retry()
+                logger.info(f"Freshdesk rate limit hit for {method.upper()} {endpoint}, retrying ({attempt + 1}/{FRESHDESK_MAX_RETRIES})")
 
-        if response.status_code == 429:
-            retry_after = int(response.headers.get('Retry-After', 30))
-            await asyncio.sleep(retry_after)
-            return await make_freshdesk_request(method, endpoint, data, options)
-        
         # Log response status for debugging
-        print(f"Freshdesk API {method.upper()} {endpoint} - Status: {response.status_code}")
+        logger.debug(f"Freshdesk API {method.upper()} {endpoint} - Status: {response.status_code}")
         
         # Raise HTTPError for 4XX/5XX responses
         response.raise_for_status()
@@ -161,16 +244,69 @@ async def make_freshdesk_request(
             
         return response.json()
         
-    except requests.exceptions.Timeout as e:
-        raise requests.exceptions.Timeout(f"Request to Freshdesk API timed out after {timeout} seconds") from e
+    except httpx.TimeoutException as e:
+        raise httpx.TimeoutException(f"Request to Freshdesk API timed out after {timeout} seconds", request=e.request) from e
         
-    except requests.exceptions.TooManyRedirects as e:
-        raise requests.exceptions.TooManyRedirects("Too many redirects while connecting to Freshdesk API") from e
+    except httpx.TooManyRedirects as e:
+        raise httpx.TooManyRedirects("Too many redirects while connecting to Freshdesk API", request=e.request) from e
         
     except ValueError as e:
         raise ValueError(f"Failed to parse JSON response from Freshdesk API: {str(e)}") from e
 
 
+async def fetch_pages(
+    endpoint: str,
+    query_params: Dict[str, Any],
+    max_pages: int = 1,
+    results_key: Optional[str] = None,
+    max_page_number: Optional[int] = None,
+) -> Any:
+    """Fetch up to max_pages pages of a list or search endpoint, several at a time.
+    
+    query_params carries the first page number and per_page. Search endpoints
+    (results_key="results") report a total, so all remaining pages are requested
+    at once. Plain list endpoints are fetched in waves until a short page shows
+    the end has been reached. Every page request waits for the account's rate
+    budget like any other request.
+    
+    Returns:
+        The combined list for list endpoints, or the first page's response with the
+        combined results for search endpoints.
+    """
+    first_page = int(query_params.get("page", 1))
+    per_page = int(query_params["per_page"])
+    last_page = first_page + max(1, max_pages) - 1
+    if max_page_number is not None:
+        last_page = min(last_page, max_page_number)
+
+    async def get_page(page: int) -> Any:
+        return await make_freshdesk_request(
+            "GET", endpoint, options={"query_params": {**query_params, "page": page}}
+        )
+
+    first = await get_page(first_page)
+
+    if results_key is not None:
+        total = first.get("total", 0) if isinstance(first, dict) else 0
+        last_page = min(last_page, math.ceil(total / per_page))
+        rest = await asyncio.gather(*(get_page(page) for page in range(first_page + 1, last_page + 1)))
+        for response in rest:
+            first[results_key].extend(response.get(results_key, []))
+        return first
+
+    items = list(first)
+    page = first_page
+    wave = get_rate_limiter(get_domain()).max_concurrency
+    while len(items) == (page - first_page + 1) * per_page and page < last_page:
+        pages = range(page + 1, min(page + wave, last_page) + 1)
+        for response in await asyncio.gather(*(get_page(p) for p in pages)):
+            page += 1
+            items.extend(response)
+            if len(response) < per_page:
+                return items
+    return items
+
+
 def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "") -> Dict[str, Any]:
     """Handle Freshdesk errors and return a standardized error response.
     
@@ -201,12 +337,12 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
         }
     }
 
-    # Handle requests.exceptions.RequestException and its subclasses
-    if isinstance(e, requests.exceptions.RequestException):
+    # Handle httpx.HTTPError and its subclasses
+    if isinstance(e, httpx.HTTPError):
         error_response['error']['code'] = 'request_error'
 
         # Handle HTTP errors (4XX, 5XX)
-        if hasattr(e, 'response') and e.response is not None:
+        if isinstance(e, httpx.HTTPStatusError):
             status_code = e.response.status_code
 
             # Map status codes to error codes
@@ -256,12 +392,12 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
                 error_response['error']['message'] = f"Freshdesk API error: {e.response.text}"
         else:
             # Handle connection errors, timeouts, etc.
-            if isinstance(e, requests.exceptions.Timeout):
+            if isinstance(e, httpx.TimeoutException):
                 error_response['error'].update({
                     'code': 'request_timeout',
                     'message': 'The request to Freshdesk API timed out'
                 })
-            elif isinstance(e, requests.exceptions.ConnectionError):
+            elif isinstance(e, (httpx.ConnectError, httpx.NetworkError)):
                 error_response['error'].update({
                     'code': 'connection_error',
                     'message': 'Could not connect to Freshdesk API'
@@ -295,7 +431,7 @@ def handle_freshdesk_error(e: Exception, operation: str, object_type: str = "")
     return error_response
 
 
-def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+async def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Handle attachments for Freshdesk API requests.
     
@@ -307,41 +443,50 @@ def handle_freshdesk_attachments(field_name: str, attachments: List[Dict[str, An
         List of resolved attachments ready to be sent in the API request
     """
     resolved_attachments = []
+    download_client = None
 
-    for attachment in attachments:
-        if attachment["type"] == "local":
-            file_content = open(attachment["content"], "rb")
-            file_name = attachment.get("name", gen_random_password(15))
-
-            resolved_attachments.append((
-                f"{field_name}",
-                (file_name, file_content, attachment.get("media_type", "application/octet-stream"))
-            ))
-        elif attachment["type"] == "file":
-            file_encoding = attachment.get("encoding", "utf-8")
-            file_content_str = attachment["content"]
-            file_content = file_content_str.encode(file_encoding)
-            file_name = attachment.get("name", gen_random_password(15))
-            resolved_attachments.append((
-                f"{field_name}",
-                (file_name, file_content, attachment.get("media_type", "application/octet-stream"))
-            ))
-        elif attachment["type"] == "base64":
-            file_content = base64.b64decode(attachment["content"])
-            file_name = attachment.get("name", gen_random_password(15))
-            resolved_attachments.append((
-                f"{field_name}",
-                (file_name, file_content, attachment.get("media_type", "application/octet-stream")),
-            ))
-        elif attachment["type"] == "url":
-            file_content = requests.get(attachment["content"]).content
-            file_name = attachment.get("name", gen_random_password(15))
-            resolved_attachments.append((
-                f"{field_name}",
-                (file_name, file_content, attachment.get("media_type", "application/octet-stream")),
-            ))
-        else:
-            raise ValueError(f"Invalid attachment type: {attachment['type']}")
+    try:
+        for attachment in attachments:
+            if attachment["type"] == "local":
+                file_content = open(attachment["content"], "rb")
+                file_name = attachment.get("name", gen_random_password(15))
+
+                resolved_attachments.append((
+                    f"{field_name}",
+                    (file_name, file_content, attachment.get("media_type", "application/octet-stream"))
+                ))
+            elif attachment["type"] == "file":
+                file_encoding = attachment.get("encoding", "utf-8")
+                file_content_str = attachment["content"]
+                file_content = file_content_str.encode(file_encoding)
+                file_name = attachment.get("name", gen_random_password(15))
+                resolved_attachments.append((
+                    f"{field_name}",
+                    (file_name, file_content, attachment.get("media_type", "application/octet-stream"))
+                ))
+            elif attachment["type"] == "base64":
+                file_content = base64.b64decode(attachment["content"])
+                file_name = attachment.get("name", gen_random_password(15))
+                resolved_attachments.append((
+                    f"{field_name}",
+                    (file_name, file_content, attachment.get("media_type", "application/octet-stream")),
+                ))
+            elif attachment["type"] == "url":
+                if download_client is None:
+                    download_client = httpx.AsyncClient(follow_redirects=True)
+                response = await download_client.get(attachment["content"])
+                response.raise_for_status()
+                file_content = response.content
+                file_name = attachment.get("name", gen_random_password(15))
+                resolved_attachments.append((
+                    f"{field_name}",
+                    (file_name, file_content, attachment.get("media_type", "application/octet-stream")),
+                ))
+            else:
+                raise ValueError(f"Invalid attachment type: {attachment['type']}")
+    finally:
+        if download_client is not None:
+            await download_client.aclose()
     return resolved_attachments
         
 
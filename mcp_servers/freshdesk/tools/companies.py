@@ -1,5 +1,5 @@
 from typing import Dict, List, Optional, Any
-from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values
+from .base import make_freshdesk_request, fetch_pages, handle_freshdesk_error, remove_none_values
 import logging
 
 logger = logging.getLogger(__name__)
@@ -76,7 +76,8 @@ async def get_company_by_id(company_id: int) -> Dict[str, Any]:
 async def list_companies(
     updated_since: Optional[str] = None,
     page: int = 1,
-    per_page: int = 30
+    per_page: int = 30,
+    max_pages: int = 1
 ) -> Dict[str, Any]:
     """
     List all companies with optional filtering.
@@ -85,6 +86,7 @@ async def list_companies(
         updated_since: Filter companies updated since this date (ISO 8601 format)
         page: Page number (1-based)
         per_page: Number of records per page (max 100)
+        max_pages: Number of pages to fetch, starting at `page` (fetched concurrently)
         
     Returns:
         Dictionary containing list of companies and pagination info
@@ -98,11 +100,7 @@ async def list_companies(
         
         params = remove_none_values(params)
         
-        response = await make_freshdesk_request(
-            "GET",
-            "/companies",
-            options={"query_params": params}
-        )
+        response = await fetch_pages("/companies", params, max_pages)
         return response
         
     except Exception as e:
@@ -2,7 +2,7 @@ import logging
 from typing import Any, Dict, List, Optional
 import mimetypes
 import os
-from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values
+from .base import make_freshdesk_request, fetch_pages, handle_freshdesk_error, remove_none_values, handle_freshdesk_attachments
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -67,7 +67,7 @@ async def create_contact(
     
     try:
         if avatar_path:
-            options["files"] = handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
+            options["files"] = await handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
     
         return await make_freshdesk_request("POST", "/contacts", data=contact_data, options=options)
     except Exception as e:
@@ -96,7 +96,8 @@ async def list_contacts(
     state: Optional[str] = None,
     updated_since: Optional[str] = None,
     page: int = 1,
-    per_page: int = 30
+    per_page: int = 30,
+    max_pages: int = 1
 ) -> Dict[str, Any]:
     """
     List all contacts, optionally filtered by parameters.
@@ -110,6 +111,7 @@ async def list_contacts(
         updated_since: Filter by last updated date (ISO 8601 format)
         page: Page number (1-based)
         per_page: Number of results per page (1-100)
+        max_pages: Number of pages to fetch, starting at `page` (fetched concurrently)
         
     Returns:
         Dict containing the list of contacts and pagination info
@@ -128,7 +130,7 @@ async def list_contacts(
     params = remove_none_values(params)
     
     try:
-        return await make_freshdesk_request("GET", "/contacts", options={"query_params": params})
+        return await fetch_pages("/contacts", params, max_pages)
     except Exception as e:
         return handle_freshdesk_error(e, "list", "contacts")
 
@@ -189,7 +191,7 @@ async def update_contact(
     
     try:
         if avatar_path:
-            options["files"] = handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
+            options["files"] = await handle_freshdesk_attachments("avatar", [{"type": "local", "content": avatar_path, "name": os.path.basename(avatar_path), "media_type": mimetypes.guess_type(avatar_path)[0]}])
            
         return await make_freshdesk_request("PUT", f"/contacts/{contact_id}", data=contact_data, options=options)
         
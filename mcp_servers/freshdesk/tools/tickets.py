@@ -1,7 +1,8 @@
 import logging
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
-from .base import make_freshdesk_request, handle_freshdesk_error, remove_none_values, handle_freshdesk_attachments
+import asyncio
+from .base import make_freshdesk_request, fetch_pages, handle_freshdesk_error, remove_none_values, handle_freshdesk_attachments
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -26,6 +27,11 @@ SOURCE_CHAT = 7
 SOURCE_FEEDBACK = 9
 SOURCE_OUTBOUND_EMAIL = 10
 
+# Tickets per bulk_delete request; larger lists are split and sent concurrently
+BULK_DELETE_BATCH_SIZE = 100
+# Freshdesk search endpoints return at most 10 pages
+MAX_SEARCH_PAGES = 10
+
 
 
 
@@ -95,7 +101,7 @@ async def create_ticket(
 
         # Handle attachments if provided
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
         
         logger.info(f"Creating ticket with data: {ticket_data}")
         response = await make_freshdesk_request("POST", "/tickets", data=ticket_data, options=options)
@@ -218,7 +224,7 @@ async def update_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request("PUT", f"/tickets/{ticket_id}", data=update_data, options=options)
         return response
@@ -252,6 +258,9 @@ async def delete_multiple_tickets(ticket_ids: List[int]) -> Dict[str, Any]:
     """
     Delete multiple tickets.
     
+    IDs are sent in batches of BULK_DELETE_BATCH_SIZE, concurrently within the
+    account's rate budget.
+    
     Args:
         ticket_ids: List of IDs of tickets to delete
         
@@ -265,13 +274,27 @@ async def delete_multiple_tickets(ticket_ids: List[int]) -> Dict[str, Any]:
             return {"success": False, "error": "No ticket IDs provided"}
 
         endpoint = "/tickets/bulk_delete"
-        data = {
-            "bulk_action":{
-                "ids": ticket_ids
-            }
+        batches = [
+            ticket_ids[i:i + BULK_DELETE_BATCH_SIZE]
+            for i in range(0, len(ticket_ids), BULK_DELETE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(make_freshdesk_request("POST", endpoint, data={"bulk_action": {"ids": batch}}) for batch in batches),
+            return_exceptions=True,
+        )
+        errors = [(batch, result) for batch, result in zip(batches, results) if isinstance(result, Exception)]
+        if not errors:
+            return {"success": True, "message": f"Tickets {ticket_ids} deleted successfully"}
+        if len(errors) == len(batches):
+            raise errors[0][1]
+
+        failed_ids = [ticket_id for batch, _ in errors for ticket_id in batch]
+        return {
+            "success": False,
+            "message": f"Deleted {len(ticket_ids) - len(failed_ids)} of {len(ticket_ids)} tickets",
+            "failed_ticket_ids": failed_ids,
+            "errors": [handle_freshdesk_error(error, "delete", "tickets")["error"] for _, error in errors],
         }
-        await make_freshdesk_request("POST", endpoint, data=data)
-        return {"success": True, "message": f"Tickets {ticket_ids} deleted successfully"}
     except Exception as e:
         return handle_freshdesk_error(e, "delete", "tickets")
 
@@ -309,6 +332,7 @@ async def list_tickets(
     due_by: Optional[Union[str, datetime]] = None,
     page: int = 1,
     per_page: int = 30,
+    max_pages: int = 1,
     order_type: Optional[str] = "desc",
     order_by: Optional[str] = "created_at",
     include: Optional[str] = None,
@@ -330,6 +354,7 @@ async def list_tickets(
         due_by: Only return tickets due by this date (ISO format or datetime object)
         page: Page number (for pagination)
         per_page: Number of results per page (max 100)
+        max_pages: Number of pages to fetch, starting at `page` (fetched concurrently)
         order_type: Order type (asc or desc)
         order_by: Order by (created_at, updated_at, priority, status)
         include: Include additional data (stats, requester, description)
@@ -377,11 +402,7 @@ async def list_tickets(
         
         params = remove_none_values(params)
         
-        response = await make_freshdesk_request(
-            "GET", 
-            "/tickets", 
-            options={"query_params": params}
-        )
+        response = await fetch_pages("/tickets", params, max_pages)
         
         return response
         
@@ -428,7 +449,7 @@ async def add_note_to_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "POST",
@@ -480,7 +501,7 @@ async def reply_to_a_ticket(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "POST",
@@ -520,7 +541,7 @@ async def update_note(
         options = {}
 
         if attachments:
-            options["files"] = handle_freshdesk_attachments("attachments[]", attachments)
+            options["files"] = await handle_freshdesk_attachments("attachments[]", attachments)
 
         response = await make_freshdesk_request(
             "PUT",
@@ -560,7 +581,8 @@ async def delete_note(
 async def filter_tickets(
     query: str,
     page: int = 1,
-    per_page: int = 30
+    per_page: int = 30,
+    max_pages: int = 1
 ) -> Dict[str, Any]:
     """
     Filter tickets using a query string.
@@ -569,6 +591,7 @@ async def filter_tickets(
         query: Filter query string (e.g., "priority:3 AND status:2 OR priority:4")
         page: Page number (for pagination)
         per_page: Number of results per page (max 30)
+        max_pages: Number of pages to fetch, starting at `page` (fetched concurrently)
         
     Returns:
         Dictionary containing search results and pagination info
@@ -580,10 +603,12 @@ async def filter_tickets(
             "per_page": min(per_page, 30)
         }
         
-        response = await make_freshdesk_request(
-            "GET",
+        response = await fetch_pages(
             "/search/tickets",
-            options={"query_params": params}
+            params,
+            max_pages,
+            results_key="results",
+            max_page_number=MAX_SEARCH_PAGES,
         )
         
         return response
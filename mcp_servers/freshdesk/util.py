@@ -1,66 +1,92 @@
 import time
-import math
-from typing import Dict
-from datetime import datetime, timedelta
+import os
+from typing import Dict, Mapping, Optional
 import asyncio
 
+# Most requests in flight at once per Freshdesk account
+FRESHDESK_MAX_CONCURRENCY = int(os.getenv("FRESHDESK_MAX_CONCURRENCY", "10"))
+
+RATE_LIMIT_WINDOW_SECONDS = 60
+
+
 class FreshdeskRateLimiter:
-    def __init__(self):
-        self.rate_limit_total = 50 
+    """Request budget of one Freshdesk account, driven by its response headers.
+
+    Freshdesk reports the per-minute budget in X-RateLimit-Total and what is left of
+    it in X-RateLimit-Remaining, and sends Retry-After with 429 responses. Requests
+    wait while the remaining budget is used up by requests already in flight, and
+    everyone waits out a Retry-After. At most FRESHDESK_MAX_CONCURRENCY requests run
+    at the same time.
+    """
+
+    def __init__(self, max_concurrency: int = FRESHDESK_MAX_CONCURRENCY):
+        self.rate_limit_total = 50
         self.rate_limit_remaining = 50
-        self.rate_limit_reset = 60 
-        self.last_request_time = 0
-        self.retry_after = 0
-        self.window_start = time.time()
-        self.requests_in_window = 0
+        self.retry_until = 0.0
+        self.window_start = time.monotonic()
+        self.in_flight = 0
+        self.max_concurrency = max_concurrency
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
 
-    def update_from_headers(self, headers: Dict[str, str]) -> None:
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
         """Update rate limit state from response headers"""
-        now = time.time()
-        
-        # Reset window if we're in a new minute
-        if now - self.window_start >= 60:
-            self.window_start = now
-            self.requests_in_window = 0
+        now = time.monotonic()
 
         if 'X-RateLimit-Total' in headers:
             self.rate_limit_total = int(headers['X-RateLimit-Total'])
         if 'X-RateLimit-Remaining' in headers:
-            self.rate_limit_remaining = int(headers['X-RateLimit-Remaining'])
+            remaining = int(headers['X-RateLimit-Remaining'])
+            if remaining > self.rate_limit_remaining:
+                # The budget was refilled, so a new window has started
+                self.window_start = now
+            self.rate_limit_remaining = remaining
         if 'Retry-After' in headers:
-            self.retry_after = int(headers['Retry-After'])
-        
-        self.requests_in_window += 1
-        self.last_request_time = now
+            self.retry_until = max(self.retry_until, now + float(headers['Retry-After']))
 
     def get_sleep_time(self) -> float:
-        """Calculate how long to sleep before next request"""
-        now = time.time()
-        
+        """Seconds to wait before another request fits in the budget (0 if it fits now)"""
+        now = time.monotonic()
+
         # If we hit rate limit, use Retry-After
-        if self.retry_after > 0:
-            return self.retry_after
-        
-        # Calculate time since last request to enforce minimum delay
-        time_since_last = now - self.last_request_time
-        min_delay = 0.1 
-        sleep_time = max(0, min_delay - time_since_last)
-        
-        # If we're approaching the rate limit, let's slow down
-        if self.rate_limit_remaining < self.rate_limit_total * 0.1:  
-            time_left_in_window = 60 - (now - self.window_start)
-            if time_left_in_window > 0:
-                # Distribute remaining requests over time left
-                sleep_time = max(sleep_time, time_left_in_window / (self.rate_limit_remaining + 1))
-        
-        return sleep_time
+        if self.retry_until > now:
+            return self.retry_until - now
+
+        window_end = self.window_start + RATE_LIMIT_WINDOW_SECONDS
+        if now >= window_end:
+            # Assume the budget has been refilled; the next response tells us for sure
+            self.window_start = now
+            self.rate_limit_remaining = max(self.rate_limit_remaining, self.rate_limit_total)
+            return 0
+
+        if self.rate_limit_remaining - self.in_flight > 0:
+            return 0
+        return window_end - now
 
-    async def wait_for_capacity(self, required_requests: int = 1) -> None:
-        """Wait until we have capacity to make the requested number of API calls"""
-        if self.rate_limit_remaining < required_requests:
-            sleep_time = self.get_sleep_time()
-            if sleep_time > 0:
-                await asyncio.sleep(sleep_time)
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and room in the rate budget"""
+        await self._slots.acquire()
+        try:
+            # One waiter at a time decides, so a refill is not overbooked
+            async with self._lock:
+                while (sleep_time := self.get_sleep_time()) > 0:
+                    await asyncio.sleep(sleep_time)
+                self.in_flight += 1
+        except BaseException:
+            self._slots.release()
+            raise
 
+    def release(self, headers: Optional[Mapping[str, str]] = None) -> None:
+        """Finish a request started with acquire(), recording its rate limit headers"""
+        self.in_flight -= 1
+        if headers is not None:
+            self.update_from_headers(headers)
+        self._slots.release()
 
-rate_limiter = FreshdeskRateLimiter()
\ No newline at end of file
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate_limit_total": self.rate_limit_total,
+            "rate_limit_remaining": self.rate_limit_remaining,
+            "in_flight": self.in_flight,
+            "retry_after_seconds": max(0.0, self.retry_until - time.monotonic()),
+        }
@@ -3,17 +3,47 @@ Google Cloud Logging management module
 Cloud Logging operations wrapper for MCP Server
 """
 
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Callable, Iterator
+from collections import Counter
 from google.cloud import logging_v2
-from google.cloud.logging_v2.services import config_service_v2
-from google.cloud.logging_v2.types import LogBucket, LogSink, LogExclusion
+from google.cloud.logging_v2.services import config_service_v2, logging_service_v2
+from google.cloud.logging_v2.types import LogBucket, LogSink, LogExclusion, ListLogEntriesRequest
+from google.cloud.logging_v2.types import LogEntry as LogEntryPB
 from google.api_core import exceptions
 from google.oauth2 import service_account
+from google.protobuf import json_format
 from datetime import datetime, timedelta
+from urllib.parse import unquote
+import base64
+import json
 import logging as python_logging
 
 logger = python_logging.getLogger(__name__)
 
+# Largest page the Logging API returns
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Encode cursor state as an opaque token for agents"""
+    return base64.urlsafe_b64encode(json.dumps(state, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a token produced by encode_cursor"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def _simple_log_name(log_name: str) -> str:
+    """Extract log name from full path: projects/PROJECT/logs/LOG_NAME"""
+    if '/logs/' in log_name:
+        return unquote(log_name.split('/logs/')[-1])
+    return log_name
+
+
 class CloudLoggingManager:
     """Cloud Logging management class"""
     
@@ -34,6 +64,7 @@ class CloudLoggingManager:
                 credentials=credentials
             )
             self.config_client = config_service_v2.ConfigServiceV2Client(credentials=credentials)
+            self.logging_client = logging_service_v2.LoggingServiceV2Client(credentials=credentials)
         elif service_account_path:
             sa_credentials = service_account.Credentials.from_service_account_file(
                 service_account_path,
@@ -44,10 +75,12 @@ class CloudLoggingManager:
                 credentials=sa_credentials
             )
             self.config_client = config_service_v2.ConfigServiceV2Client(credentials=sa_credentials)
+            self.logging_client = logging_service_v2.LoggingServiceV2Client(credentials=sa_credentials)
         else:
             # Use default credentials
             self.client = logging_v2.Client(project=project_id)
             self.config_client = config_service_v2.ConfigServiceV2Client()
+            self.logging_client = logging_service_v2.LoggingServiceV2Client()
     
     def write_log(
         self,
@@ -105,6 +138,58 @@ class CloudLoggingManager:
             logger.error(f"Failed to write log: {str(e)}")
             raise
     
+    def _build_filter(self, filter_string: Optional[str], time_range_hours: Optional[int]) -> Optional[str]:
+        """Combine a time window and an advanced filter into one filter string"""
+        filters = []
+        
+        if time_range_hours:
+            start_time = datetime.utcnow() - timedelta(hours=time_range_hours)
+            filters.append(f'timestamp >= "{start_time.isoformat()}Z"')
+        
+        if filter_string:
+            filters.append(filter_string)
+        
+        return " AND ".join(filters) if filters else None
+    
+    def _iter_pages(
+        self,
+        final_filter: Optional[str],
+        order_by: str,
+        page_size: int,
+        page_token: Optional[str] = None
+    ) -> Iterator[Any]:
+        """Iterate raw ListLogEntries response pages (entries stay as protobuf messages)"""
+        request = ListLogEntriesRequest(
+            resource_names=[f"projects/{self.project_id}"],
+            filter=final_filter or "",
+            order_by=order_by,
+            page_size=page_size,
+            page_token=page_token or ""
+        )
+        return self.logging_client.list_log_entries(request=request).pages
+    
+    @staticmethod
+    def _entry_to_dict(entry: LogEntryPB) -> Dict[str, Any]:
+        """Convert a LogEntry protobuf message into a plain dict"""
+        raw = json_format.MessageToDict(LogEntryPB.pb(entry))
+        resource = raw.get("resource")
+        return {
+            "log_name": raw.get("logName"),
+            "timestamp": raw.get("timestamp"),
+            "severity": raw.get("severity", "DEFAULT"),
+            "text_payload": raw.get("textPayload"),
+            "json_payload": raw.get("jsonPayload"),
+            "proto_payload": str(raw["protoPayload"]) if raw.get("protoPayload") else None,
+            "labels": raw.get("labels", {}),
+            "trace": raw.get("trace"),
+            "span_id": raw.get("spanId"),
+            "insert_id": raw.get("insertId"),
+            "resource": {
+                "type": resource.get("type", "unknown"),
+                "labels": resource.get("labels", {})
+            } if resource else None
+        }
+    
     def read_logs(
         self,
         filter_string: Optional[str] = None,
@@ -125,70 +210,226 @@ class CloudLoggingManager:
             List of log entries
         """
         try:
-            # Build filter
-            filters = []
-            
-            if time_range_hours:
-                start_time = datetime.utcnow() - timedelta(hours=time_range_hours)
-                filters.append(f'timestamp >= "{start_time.isoformat()}Z"')
+            return self.read_logs_page(
+                filter_string=filter_string,
+                order_by=order_by,
+                max_results=max_results,
+                time_range_hours=time_range_hours
+            )["entries"]
             
-            if filter_string:
-                filters.append(filter_string)
+        except Exception as e:
+            logger.error(f"Failed to read logs: {str(e)}")
+            raise
+    
+    def read_logs_page(
+        self,
+        filter_string: Optional[str] = None,
+        order_by: str = "timestamp desc",
+        max_results: int = 100,
+        time_range_hours: Optional[int] = 24,
+        cursor: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Read one page of log entries, resumable across calls
+        
+        The returned cursor freezes the filter (including the absolute start of the
+        time window), order and page size, so passing it back continues exactly where
+        this call stopped. When a cursor is given, only max_results is taken from the
+        call; the other query arguments are ignored.
+        
+        Args:
+            filter_string: Advanced filter string for logs
+            order_by: Order by clause (default: "timestamp desc")
+            max_results: Maximum number of entries to return
+            time_range_hours: Time range in hours (from now backwards)
+            cursor: Cursor returned by a previous call
             
-            final_filter = " AND ".join(filters) if filters else None
+        Returns:
+            Dict with "entries" and "cursor" (None when there are no more entries)
+        """
+        try:
+            if cursor:
+                state = decode_cursor(cursor)
+                final_filter, order_by = state["filter"], state["order_by"]
+                page_token, skip = state.get("page_token"), state.get("skip", 0)
+                # `skip` counts entries of a page of this size, so it must not change
+                page_size = state.get("page_size", min(max_results, MAX_PAGE_SIZE))
+            else:
+                final_filter = self._build_filter(filter_string, time_range_hours)
+                page_token, skip = None, 0
+                page_size = min(max_results, MAX_PAGE_SIZE)
             
-            # List entries
             entries = []
-            count = 0
-            for entry in self.client.list_entries(
-                filter_=final_filter,
-                order_by=order_by,
-                page_size=min(max_results, 1000)
-            ):
-                if count >= max_results:
-                    break
-                    
-                # Handle severity - can be string or enum
-                try:
-                    severity = entry.severity.name if hasattr(entry.severity, 'name') else str(entry.severity)
-                except AttributeError:
-                    severity = "DEFAULT"
-                
-                # Safely extract labels
-                labels = getattr(entry, 'labels', None)
-                labels_dict = dict(labels) if labels else {}
+            next_state = None
+            
+            for page in self._iter_pages(final_filter, order_by, page_size, page_token):
+                page_entries = list(page.entries)[skip:]
+                remaining = max_results - len(entries)
+                entries.extend(self._entry_to_dict(entry) for entry in page_entries[:remaining])
                 
-                # Safely extract resource information
-                resource_dict = None
-                if entry.resource:
-                    resource_labels = getattr(entry.resource, 'labels', None)
-                    resource_dict = {
-                        "type": getattr(entry.resource, 'type', 'unknown'),
-                        "labels": dict(resource_labels) if resource_labels else {}
-                    }
+                if len(page_entries) > remaining:
+                    # Stopped inside this page: resume from the same page token, skipping what was returned
+                    next_state = {"filter": final_filter, "order_by": order_by, "page_size": page_size,
+                                  "page_token": page_token, "skip": skip + remaining}
+                    break
                 
-                entry_dict = {
-                    "log_name": entry.log_name,
-                    "timestamp": entry.timestamp.isoformat() if entry.timestamp else None,
-                    "severity": severity,
-                    "text_payload": getattr(entry, 'text_payload', None),
-                    "json_payload": dict(getattr(entry, 'json_payload', {})) if getattr(entry, 'json_payload', None) else None,
-                    "proto_payload": str(getattr(entry, 'proto_payload', None)) if getattr(entry, 'proto_payload', None) else None,
-                    "labels": labels_dict,
-                    "trace": getattr(entry, 'trace', None),
-                    "span_id": getattr(entry, 'span_id', None),
-                    "resource": resource_dict
-                }
-                entries.append(entry_dict)
-                count += 1
+                skip = 0
+                page_token = page.next_page_token
+                if not page_token:
+                    break
+                if len(entries) >= max_results:
+                    next_state = {"filter": final_filter, "order_by": order_by, "page_size": page_size,
+                                  "page_token": page_token, "skip": 0}
+                    break
             
             logger.info(f"Successfully read {len(entries)} log entries")
-            return entries
+            return {
+                "entries": entries,
+                "cursor": encode_cursor(next_state) if next_state else None
+            }
             
         except Exception as e:
             logger.error(f"Failed to read logs: {str(e)}")
             raise
     
+    def tail_logs(
+        self,
+        filter_string: Optional[str] = None,
+        cursor: Optional[str] = None,
+        max_results: int = 100,
+        time_range_hours: Optional[int] = 1
+    ) -> Dict[str, Any]:
+        """
+        Return only entries newer than a saved tail cursor
+        
+        Without a cursor, the most recent entries within the time window are
+        returned. Each call returns a cursor marking the newest entry seen; passing
+        it back returns only entries written after that point, oldest first.
+        
+        Args:
+            filter_string: Advanced filter string for logs
+            cursor: Tail cursor returned by a previous call
+            max_results: Maximum number of entries to return
+            time_range_hours: Time window used when no cursor is given
+            
+        Returns:
+            Dict with "entries" (oldest first) and the new "cursor"
+        """
+        try:
+            if cursor:
+                state = decode_cursor(cursor)
+                filter_string = state.get("base_filter")
+                since, seen_ids = state["timestamp"], set(state.get("insert_ids", []))
+                final_filter = self._build_filter(filter_string, None)
+                since_filter = f'timestamp >= "{since}"'
+                final_filter = f"{final_filter} AND {since_filter}" if final_filter else since_filter
+                order_by = "timestamp asc"
+            else:
+                since, seen_ids = None, set()
+                final_filter = self._build_filter(filter_string, time_range_hours)
+                order_by = "timestamp desc"
+            
+            entries = []
+            for page in self._iter_pages(final_filter, order_by, min(max_results + len(seen_ids), MAX_PAGE_SIZE)):
+                for entry in page.entries:
+                    entry_dict = self._entry_to_dict(entry)
+                    # Entries sharing the cursor timestamp may already have been returned
+                    if entry_dict["timestamp"] == since and entry_dict["insert_id"] in seen_ids:
+                        continue
+                    entries.append(entry_dict)
+                    if len(entries) >= max_results:
+                        break
+                if len(entries) >= max_results or not page.next_page_token:
+                    break
+            
+            if not cursor:
+                entries.reverse()
+            
+            if entries:
+                newest = entries[-1]["timestamp"]
+                newest_ids = [e["insert_id"] for e in entries if e["timestamp"] == newest]
+                if newest == since:
+                    newest_ids.extend(seen_ids)
+                state = {"base_filter": filter_string, "timestamp": newest, "insert_ids": newest_ids}
+            elif cursor:
+                state = decode_cursor(cursor)
+            else:
+                state = {"base_filter": filter_string, "timestamp": datetime.utcnow().isoformat() + "Z", "insert_ids": []}
+            
+            logger.info(f"Tail returned {len(entries)} new log entries")
+            return {"entries": entries, "cursor": encode_cursor(state)}
+            
+        except Exception as e:
+            logger.error(f"Failed to tail logs: {str(e)}")
+            raise
+    
+    def summarize_logs(
+        self,
+        filter_string: Optional[str] = None,
+        time_range_hours: Optional[int] = 24,
+        max_entries: int = 100000,
+        top_n: int = 20,
+        log_name_predicate: Optional[Callable[[str], bool]] = None
+    ) -> Dict[str, Any]:
+        """
+        Aggregate log entries over a time window without keeping them in memory
+        
+        Counts by severity, resource type and log name are updated while pages
+        stream in; entries themselves are discarded immediately.
+        
+        Args:
+            filter_string: Advanced filter string for logs
+            time_range_hours: Time range in hours (from now backwards)
+            max_entries: Upper bound on entries scanned
+            top_n: Number of resource types and log names to report
+            log_name_predicate: Optional callable; entries whose log name fails it are skipped
+            
+        Returns:
+            Aggregated counts
+        """
+        try:
+            final_filter = self._build_filter(filter_string, time_range_hours)
+            by_severity: Counter = Counter()
+            by_resource: Counter = Counter()
+            by_log: Counter = Counter()
+            total = 0
+            oldest = newest = None
+            truncated = False
+            
+            for page in self._iter_pages(final_filter, "timestamp desc", MAX_PAGE_SIZE):
+                for entry in page.entries:
+                    log_name = _simple_log_name(entry.log_name)
+                    if log_name_predicate and not log_name_predicate(log_name):
+                        continue
+                    total += 1
+                    by_severity[entry.severity.name if hasattr(entry.severity, 'name') else str(entry.severity)] += 1
+                    by_resource[entry.resource.type or "unknown"] += 1
+                    by_log[log_name] += 1
+                    timestamp = entry.timestamp.isoformat() if entry.timestamp else None
+                    if timestamp:
+                        newest = newest or timestamp
+                        oldest = timestamp
+                    if total >= max_entries:
+                        truncated = True
+                        break
+                if truncated or not page.next_page_token:
+                    break
+            
+            logger.info(f"Summarized {total} log entries")
+            return {
+                "total_entries": total,
+                "truncated": truncated,
+                "newest_timestamp": newest,
+                "oldest_timestamp": oldest,
+                "by_severity": dict(by_severity.most_common()),
+                "by_resource_type": dict(by_resource.most_common(top_n)),
+                "by_log_name": dict(by_log.most_common(top_n))
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to summarize logs: {str(e)}")
+            raise
+    
     def list_logs(self) -> List[str]:
         """
         List all log names in the project
@@ -197,26 +438,13 @@ class CloudLoggingManager:
             List of log names
         """
         try:
-            # Use list_entries to get log names from existing entries
-            # This is the available method in the Cloud Logging client
-            log_names = set()
-            
-            # Get recent log entries to extract log names
-            for entry in self.client.list_entries(
-                page_size=1000,  # Get more entries to find diverse log names
-                order_by="timestamp desc"
-            ):
-                if entry.log_name:
-                    # Extract log name from full path: projects/PROJECT/logs/LOG_NAME
-                    if '/logs/' in entry.log_name:
-                        simple_log_name = entry.log_name.split('/logs/')[-1]
-                        log_names.add(simple_log_name)
-                
-                # Limit to avoid too many API calls
-                if len(log_names) >= 100:
-                    break
+            # The Logging API lists log names directly, no need to scan entries
+            log_names = {
+                _simple_log_name(name)
+                for name in self.logging_client.list_logs(parent=f"projects/{self.project_id}")
+            }
             
-            log_names_list = sorted(list(log_names))
+            log_names_list = sorted(log_names)
             logger.info(f"Found {len(log_names_list)} unique log names")
             return log_names_list
             
@@ -447,25 +675,8 @@ class CloudLoggingManager:
             # This function will delete all logs in the project that would go to this bucket
             # based on the bucket's configuration
             
-            # Get recent log entries to identify logs that would be in this bucket
-            filter_query = f'logName:projects/{self.project_id}/logs/'
-            
-            # List recent entries to identify log names
-            log_names = set()
-            for entry in self.client.list_entries(
-                filter_=filter_query,
-                page_size=1000,
-                order_by="timestamp desc"
-            ):
-                if entry.log_name:
-                    # Extract log name from full path
-                    if '/logs/' in entry.log_name:
-                        simple_log_name = entry.log_name.split('/logs/')[-1]
-                        log_names.add(simple_log_name)
-                
-                # Limit to avoid too many API calls
-                if len(log_names) >= 50:
-                    break
+            # Log names come straight from the Logging API instead of walking entries
+            log_names = self.list_logs()
             
             # Delete each log
             deleted_count = 0
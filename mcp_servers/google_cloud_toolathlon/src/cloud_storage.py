@@ -6,12 +6,18 @@ Cloud Storage operations wrapper for MCP Server
 from typing import List, Dict, Any, Optional, IO, Union
 from google.cloud import storage
 from google.api_core import exceptions
+from google.auth.credentials import AnonymousCredentials
 from datetime import datetime, timedelta
 import os
 import logging
 
+from .transfer import TransferManager, TransferStats
+
 logger = logging.getLogger(__name__)
 
+# Objects larger than this are not loaded into memory by download_data
+DOWNLOAD_DATA_MAX_BYTES = int(os.getenv("GCS_DOWNLOAD_DATA_MAX_BYTES", str(32 * 1024 * 1024)))
+
 class CloudStorageManager:
     """Cloud Storage bucket management class"""
     
@@ -25,7 +31,13 @@ class CloudStorageManager:
             credentials: Pre-built credentials object (e.g. OAuth2 token)
         """
         self.project_id = project_id
-        if credentials:
+        if os.getenv("STORAGE_EMULATOR_HOST"):
+            # Local emulator (e.g. fake-gcs-server); the client picks up the endpoint itself
+            self.client = storage.Client(
+                project=project_id,
+                credentials=AnonymousCredentials()
+            )
+        elif credentials:
             self.client = storage.Client(
                 project=project_id,
                 credentials=credentials
@@ -35,6 +47,7 @@ class CloudStorageManager:
                 json_credentials_path=service_account_json,
                 project=project_id
             )
+        self.transfer = TransferManager(self.client)
     
     def list_buckets(self) -> List[Dict[str, Any]]:
         """
@@ -273,10 +286,8 @@ class CloudStorageManager:
             bucket = self.client.bucket(bucket_name)
             blob = bucket.blob(source_blob_name)
             
-            # Create target directory if it doesn't exist
-            os.makedirs(os.path.dirname(destination_file_path), exist_ok=True)
-            
-            blob.download_to_filename(destination_file_path)
+            # Stream to disk; large objects are fetched as concurrent ranges
+            self.transfer.download_to_file(blob, destination_file_path)
             logger.info(f"Successfully downloaded file: {source_blob_name} -> {destination_file_path}")
             
             return destination_file_path
@@ -302,8 +313,14 @@ class CloudStorageManager:
         try:
             bucket = self.client.bucket(bucket_name)
             blob = bucket.blob(source_blob_name)
-            
-            data = blob.download_as_bytes()
+            blob.reload()
+            if blob.size and blob.size > DOWNLOAD_DATA_MAX_BYTES:
+                raise ValueError(
+                    f"Object {source_blob_name} is {blob.size} bytes, larger than the "
+                    f"{DOWNLOAD_DATA_MAX_BYTES} byte in-memory limit; use download_file to stream it to disk"
+                )
+            
+            data = blob.download_as_bytes(if_generation_match=blob.generation)
             logger.info(f"Successfully downloaded data: {source_blob_name}")
             
             return data
@@ -351,18 +368,19 @@ class CloudStorageManager:
             
         Returns:
             Number of deleted objects
+
+        Raises:
+            TransferError: If any object failed to delete; the others are deleted
         """
         try:
             bucket = self.client.bucket(bucket_name)
-            blobs = bucket.list_blobs(prefix=prefix)
+            names = [blob.name for blob in bucket.list_blobs(prefix=prefix)]
             
-            count = 0
-            for blob in blobs:
-                blob.delete()
-                count += 1
+            stats = self.transfer.delete_blobs(bucket_name, names)
+            stats.raise_for_failures()
             
-            logger.info(f"Successfully deleted {count} objects")
-            return count
+            logger.info(f"Successfully deleted {stats.objects} objects")
+            return stats.objects
             
         except Exception as e:
             logger.error(f"Failed to batch delete objects: {str(e)}")
@@ -476,9 +494,8 @@ class CloudStorageManager:
     
     def _delete_all_objects(self, bucket: storage.Bucket):
         """Delete all objects in bucket"""
-        blobs = bucket.list_blobs()
-        for blob in blobs:
-            blob.delete()
+        names = [blob.name for blob in bucket.list_blobs()]
+        self.transfer.delete_blobs(bucket.name, names)
         logger.info(f"Deleted all objects in bucket {bucket.name}")
     
     def set_bucket_lifecycle(
@@ -627,7 +644,7 @@ class CloudStorageManager:
         recursive: bool = True
     ) -> List[Dict[str, Any]]:
         """
-        Upload entire directory to bucket
+        Upload entire directory to bucket using parallel transfers
         
         Args:
             bucket_name: Bucket name
@@ -637,32 +654,59 @@ class CloudStorageManager:
             
         Returns:
             List of uploaded objects
+
+        Raises:
+            TransferError: If any file failed to upload; the others are uploaded
+        """
+        stats = self.upload_directory_with_stats(bucket_name, source_directory, destination_prefix, recursive)
+        stats.raise_for_failures()
+        return [self._blob_to_dict(blob) for blob in stats.blobs]
+    
+    def upload_directory_with_stats(
+        self,
+        bucket_name: str,
+        source_directory: str,
+        destination_prefix: str = "",
+        recursive: bool = True
+    ) -> TransferStats:
+        """
+        Upload entire directory to bucket and return the transfer statistics
+        
+        Args:
+            bucket_name: Bucket name
+            source_directory: Source directory path
+            destination_prefix: Destination prefix
+            recursive: Whether to recursively upload subdirectories
+            
+        Returns:
+            Transfer statistics, including the uploaded objects and any failures
         """
         try:
-            uploaded_objects = []
+            files = []
             
             if recursive:
                 # Recursively traverse directory
-                for root, dirs, files in os.walk(source_directory):
-                    for file_name in files:
+                for root, dirs, file_names in os.walk(source_directory):
+                    for file_name in file_names:
                         file_path = os.path.join(root, file_name)
                         # Calculate relative path
                         relative_path = os.path.relpath(file_path, source_directory)
                         blob_name = os.path.join(destination_prefix, relative_path).replace("\\", "/")
-                        
-                        obj_info = self.upload_file(bucket_name, file_path, blob_name)
-                        uploaded_objects.append(obj_info)
+                        files.append((file_path, blob_name))
             else:
                 # Only upload files in current directory
                 for file_name in os.listdir(source_directory):
                     file_path = os.path.join(source_directory, file_name)
                     if os.path.isfile(file_path):
                         blob_name = os.path.join(destination_prefix, file_name).replace("\\", "/")
-                        obj_info = self.upload_file(bucket_name, file_path, blob_name)
-                        uploaded_objects.append(obj_info)
+                        files.append((file_path, blob_name))
             
-            logger.info(f"Successfully uploaded {len(uploaded_objects)} files")
-            return uploaded_objects
+            stats = self.transfer.upload_files(bucket_name, files)
+            if stats.failed:
+                logger.warning(f"Failed to upload {len(stats.failed)} files")
+            
+            logger.info(f"Successfully uploaded {stats.objects} files")
+            return stats
             
         except Exception as e:
             logger.error(f"Failed to upload directory: {str(e)}")
@@ -684,25 +728,25 @@ class CloudStorageManager:
             
         Returns:
             List of downloaded file paths
+
+        Raises:
+            TransferError: If any object failed to download; the others are downloaded
         """
         try:
             bucket = self.client.bucket(bucket_name)
             blobs = bucket.list_blobs(prefix=prefix)
             
-            downloaded_files = []
-            
+            targets = []
             for blob in blobs:
+                if blob.name.endswith("/"):
+                    continue  # Directory placeholder objects
                 # Build local file path
                 relative_path = blob.name[len(prefix):].lstrip("/")
-                local_file_path = os.path.join(destination_directory, relative_path)
-                
-                # Create directory
-                os.makedirs(os.path.dirname(local_file_path), exist_ok=True)
-                
-                # Download file
-                blob.download_to_filename(local_file_path)
-                downloaded_files.append(local_file_path)
-                logger.info(f"Downloaded: {blob.name} -> {local_file_path}")
+                targets.append((blob.name, os.path.join(destination_directory, relative_path)))
+            
+            stats = self.transfer.download_blobs(bucket_name, targets)
+            stats.raise_for_failures()
+            downloaded_files = [path for name, path in targets]
             
             logger.info(f"Successfully downloaded {len(downloaded_files)} files")
             return downloaded_files
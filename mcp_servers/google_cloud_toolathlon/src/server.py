@@ -4,6 +4,7 @@ Model Context Protocol server for Google Cloud Platform operations
 """
 
 import os
+import asyncio
 import base64
 import json
 import logging
@@ -743,6 +744,82 @@ async def storage_delete_object(bucket_name: str, blob_name: str) -> str:
     except Exception as e:
         return f"Error deleting object from bucket '{bucket_name}': {str(e)}"
 
+@mcp.tool()
+async def storage_delete_objects(bucket_name: str, prefix: str) -> str:
+    """Delete all objects under a prefix from Cloud Storage bucket using batched requests
+    
+    Args:
+        bucket_name: Name of the bucket
+        prefix: Prefix of the objects to delete
+    
+    Returns:
+        Number of deleted objects or error
+    """
+    if not validate_bucket_access(bucket_name):
+        return f"Access denied: Bucket '{bucket_name}' is not in allowed buckets list"
+    
+    try:
+        count = await asyncio.to_thread(get_storage_manager().delete_objects, bucket_name, prefix)
+        return f"Successfully deleted {count} objects with prefix '{prefix}' from bucket '{bucket_name}'"
+        
+    except Exception as e:
+        return f"Error deleting objects from bucket '{bucket_name}': {str(e)}"
+
+@mcp.tool()
+async def storage_upload_directory(bucket_name: str, source_directory: str, destination_prefix: str = "") -> str:
+    """Upload a local directory to Cloud Storage bucket with parallel transfers
+    
+    Args:
+        bucket_name: Name of the bucket
+        source_directory: Local directory to upload (recursively)
+        destination_prefix: Prefix for the uploaded blob names
+    
+    Returns:
+        Transfer summary or error
+    """
+    if not validate_bucket_access(bucket_name):
+        return f"Access denied: Bucket '{bucket_name}' is not in allowed buckets list"
+    
+    try:
+        result = await asyncio.to_thread(
+            get_storage_manager().upload_directory_with_stats, bucket_name, source_directory, destination_prefix
+        )
+        stats = result.to_dict()
+        summary = (
+            f"Uploaded {stats['objects']} files ({stats['bytes']} bytes) to '{bucket_name}/{destination_prefix}' "
+            f"in {stats['elapsed_seconds']}s ({stats['throughput_mb_per_second']} MB/s)"
+        )
+        if stats["failed"]:
+            summary += "\nFailed:\n" + "\n".join(f"- {item['object']}: {item['error']}" for item in stats["failed"])
+        return summary
+        
+    except Exception as e:
+        return f"Error uploading directory to bucket '{bucket_name}': {str(e)}"
+
+@mcp.tool()
+async def storage_download_directory(bucket_name: str, prefix: str, destination_directory: str) -> str:
+    """Download all objects under a prefix from Cloud Storage bucket with parallel transfers
+    
+    Args:
+        bucket_name: Name of the bucket
+        prefix: Prefix of the objects to download
+        destination_directory: Local directory where to save the files
+    
+    Returns:
+        Transfer summary or error
+    """
+    if not validate_bucket_access(bucket_name):
+        return f"Access denied: Bucket '{bucket_name}' is not in allowed buckets list"
+    
+    try:
+        files = await asyncio.to_thread(
+            get_storage_manager().download_directory, bucket_name, prefix, destination_directory
+        )
+        return f"Downloaded {len(files)} files from '{bucket_name}/{prefix}' to '{destination_directory}'"
+        
+    except Exception as e:
+        return f"Error downloading directory from bucket '{bucket_name}': {str(e)}"
+
 @mcp.tool()
 async def storage_get_bucket_info(bucket_name: str) -> str:
     """Get detailed information about a Cloud Storage bucket
@@ -940,56 +1017,129 @@ async def logging_write_log(log_name: str, message: str, severity: str = "INFO")
     except Exception as e:
         return f"Error writing log: {str(e)}"
 
+def _filter_allowed_log_entries(entries: list) -> list:
+    """Drop entries whose log is not in the allowed log buckets list, if configured"""
+    if not ALLOWED_LOG_BUCKETS:
+        return entries
+    filtered_entries = []
+    for entry in entries:
+        log_name = entry.get('log_name') or ''
+        # Extract log name from full path (projects/PROJECT/logs/LOG_NAME)
+        if '/logs/' in log_name:
+            simple_log_name = log_name.split('/logs/')[-1]
+        else:
+            simple_log_name = log_name
+
+        # Use wildcard-aware validation
+        if validate_log_bucket_access(simple_log_name):
+            filtered_entries.append(entry)
+    return filtered_entries
+
+def _format_log_entries(entries: list, limit: int = 10) -> str:
+    result = ""
+    for entry in entries[:limit]:
+        timestamp = entry.get('timestamp', 'Unknown')
+        severity = entry.get('severity', 'INFO')
+        text_msg = entry.get('text_payload')
+        json_msg = entry.get('json_payload')
+        message = text_msg or str(json_msg) if json_msg else 'No message'
+        result += f"[{timestamp}] {severity}: {message}\n"
+    if len(entries) > limit:
+        result += f"... and {len(entries) - limit} more entries"
+    return result
+
 @mcp.tool()
-async def logging_read_logs(log_filter: str = "", max_entries: int = 50) -> str:
+async def logging_read_logs(log_filter: str = "", max_entries: int = 50, cursor: str = "") -> str:
     """Read recent log entries from Cloud Logging
     
     Args:
         log_filter: Optional filter for log entries
         max_entries: Maximum number of entries to return (default: 50)
+        cursor: Cursor from a previous call to continue reading where it stopped
     
     Returns:
-        Log entries or error message
+        Log entries or error message, with a cursor when more entries are available
     """
     try:
-        entries = get_logging_manager().read_logs(log_filter, max_results=max_entries)
-        
-        # Filter entries based on allowed log buckets if configured
-        if ALLOWED_LOG_BUCKETS:
-            filtered_entries = []
-            for entry in entries:
-                log_name = entry.get('log_name', '')
-                # Extract log name from full path (projects/PROJECT/logs/LOG_NAME)
-                if '/logs/' in log_name:
-                    simple_log_name = log_name.split('/logs/')[-1]
-                else:
-                    simple_log_name = log_name
-
-                # Use wildcard-aware validation
-                if validate_log_bucket_access(simple_log_name):
-                    filtered_entries.append(entry)
-            entries = filtered_entries
+        page = await asyncio.to_thread(
+            get_logging_manager().read_logs_page,
+            log_filter, max_results=max_entries, cursor=cursor or None
+        )
+        entries = _filter_allowed_log_entries(page["entries"])
         
         if not entries:
-            return "No log entries found matching the filter criteria"
-            
-        result = f"Found {len(entries)} log entries:\n"
-        for i, entry in enumerate(entries[:10]):
-            timestamp = entry.get('timestamp', 'Unknown')
-            severity = entry.get('severity', 'INFO')
-            text_msg = entry.get('text_payload')
-            json_msg = entry.get('json_payload')
-            message = text_msg or str(json_msg) if json_msg else 'No message'
-            result += f"[{timestamp}] {severity}: {message}\n"
+            result = "No log entries found matching the filter criteria"
+        else:
+            result = f"Found {len(entries)} log entries:\n" + _format_log_entries(entries)
         
-        if len(entries) > 10:
-            result += f"... and {len(entries) - 10} more entries"
+        if page["cursor"]:
+            result += f"\nMore entries available. Continue with cursor: {page['cursor']}"
             
         return result
         
     except Exception as e:
         return f"Error reading logs: {str(e)}"
 
+@mcp.tool()
+async def logging_tail_logs(log_filter: str = "", cursor: str = "", max_entries: int = 50) -> str:
+    """Return only log entries newer than a saved cursor
+    
+    Call without a cursor to get the latest entries and a cursor; call again with
+    that cursor to receive only entries written since.
+    
+    Args:
+        log_filter: Optional filter for log entries (ignored when a cursor is given)
+        cursor: Tail cursor from a previous call
+        max_entries: Maximum number of entries to return (default: 50)
+    
+    Returns:
+        New log entries (oldest first) and the cursor for the next call
+    """
+    try:
+        page = await asyncio.to_thread(
+            get_logging_manager().tail_logs,
+            log_filter or None, cursor=cursor or None, max_results=max_entries
+        )
+        entries = _filter_allowed_log_entries(page["entries"])
+        
+        if not entries:
+            result = "No new log entries"
+        else:
+            result = f"{len(entries)} new log entries:\n" + _format_log_entries(entries, limit=max_entries)
+        
+        return result + f"\nNext cursor: {page['cursor']}"
+        
+    except Exception as e:
+        return f"Error tailing logs: {str(e)}"
+
+@mcp.tool()
+async def logging_summarize_logs(log_filter: str = "", time_range_hours: int = 24, max_entries: int = 100000) -> str:
+    """Summarize log entries over a time window: counts by severity, resource type and log name
+    
+    Entries are aggregated while streaming, so large windows can be summarized
+    without returning individual entries.
+    
+    Args:
+        log_filter: Optional filter for log entries
+        time_range_hours: Time window in hours (default: 24)
+        max_entries: Maximum number of entries to scan (default: 100000)
+    
+    Returns:
+        Aggregated counts or error message
+    """
+    try:
+        summary = await asyncio.to_thread(
+            get_logging_manager().summarize_logs,
+            log_filter or None,
+            time_range_hours=time_range_hours,
+            max_entries=max_entries,
+            log_name_predicate=validate_log_bucket_access if ALLOWED_LOG_BUCKETS else None
+        )
+        return json.dumps(summary, indent=2)
+        
+    except Exception as e:
+        return f"Error summarizing logs: {str(e)}"
+
 @mcp.tool()
 async def logging_list_logs() -> str:
     """List all log names in the project
@@ -0,0 +1,53 @@
+"""Tests for resumable log reads in the Cloud Logging manager."""
+
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.cloud.logging_v2")
+
+from src.cloud_logging import CloudLoggingManager
+
+
+class FakeLogs:
+    """ListLogEntries stand-in over entries 0..count-1; page tokens are offsets."""
+
+    def __init__(self, count: int):
+        self.entries = list(range(count))
+
+    def iter_pages(self, final_filter, order_by, page_size, page_token=None):
+        offset = int(page_token or 0)
+        while offset < len(self.entries):
+            end = offset + page_size
+            yield SimpleNamespace(
+                entries=self.entries[offset:end],
+                next_page_token=str(end) if end < len(self.entries) else "",
+            )
+            offset = end
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = CloudLoggingManager.__new__(CloudLoggingManager)
+    manager.project_id = "test-project"
+    monkeypatch.setattr(manager, "_iter_pages", FakeLogs(25).iter_pages)
+    monkeypatch.setattr(CloudLoggingManager, "_entry_to_dict", staticmethod(lambda entry: entry))
+    return manager
+
+
+class TestReadLogsPage:
+    """Tests for CloudLoggingManager.read_logs_page."""
+
+    def test_resumes_without_gaps_or_duplicates(self, manager):
+        first = manager.read_logs_page(max_results=7)
+        second = manager.read_logs_page(max_results=7, cursor=first["cursor"])
+        assert first["entries"] + second["entries"] == list(range(14))
+
+    def test_resume_with_different_max_results(self, manager):
+        entries, cursor = [], None
+        for max_results in (7, 3, 10, 20):
+            page = manager.read_logs_page(max_results=max_results, cursor=cursor)
+            entries += page["entries"]
+            cursor = page["cursor"]
+        assert entries == list(range(25))
+        assert cursor is None
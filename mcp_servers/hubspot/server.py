@@ -2,8 +2,10 @@ import contextlib
 import base64
 import logging
 import os
+import sys
 import json
 from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any, Dict
 
 import click
@@ -17,6 +19,12 @@ from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 from dotenv import load_dotenv
 
+# Shared server helpers (mcp_servers/shared, copied to ./shared in the Docker image)
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from shared.instrumentation import instrument_tool, metrics_endpoint
+from shared.launcher import serve
+from shared.tool_registry import ToolRegistry
+
 from tools import (
     auth_token_context,
     # Properties
@@ -125,8 +133,7 @@ def main(
     # Create the MCP server instance
     app = Server("hubspot-mcp-server")
 
-    @app.list_tools()
-    async def list_tools() -> list[types.Tool]:
+    def build_tools() -> list[types.Tool]:
         return [
             types.Tool(
                 name="hubspot_list_properties",
@@ -1005,7 +1012,12 @@ For custom properties or the complete list, call 'hubspot_list_properties' with
             ),
         ]
 
+    # Built and validated once; tools/list requests are served from the cached result
+    tool_registry = ToolRegistry(build_tools())
+    tool_registry.install(app)
+
     @app.call_tool()
+    @instrument_tool
     async def call_tool(
         name: str, arguments: dict
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -1933,7 +1945,6 @@ For custom properties or the complete list, call 'hubspot_list_properties' with
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
-        debug=True,
         routes=[
             # SSE routes
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
@@ -1941,6 +1952,7 @@ For custom properties or the complete list, call 'hubspot_list_properties' with
             
             # StreamableHTTP route
             Mount("/mcp", app=handle_streamable_http),
+            Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
         ],
         lifespan=lifespan,
     )
@@ -1949,11 +1961,7 @@ For custom properties or the complete list, call 'hubspot_list_properties' with
     logger.info(f"  - SSE endpoint: http://localhost:{port}/sse")
     logger.info(f"  - StreamableHTTP endpoint: http://localhost:{port}/mcp")
 
-    import uvicorn
-
-    uvicorn.run(starlette_app, host="0.0.0.0", port=port)
-
-    return 0
+    return serve(starlette_app, host="0.0.0.0", port=port, log_level=log_level)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
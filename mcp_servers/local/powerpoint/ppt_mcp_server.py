@@ -4,6 +4,7 @@ MCP Server for PowerPoint manipulation using python-pptx.
 Consolidated version with 20 tools organized into multiple modules.
 """
 import os
+import atexit
 import argparse
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP
@@ -21,15 +22,18 @@ from tools import (
     register_master_tools,
     register_transition_tools
 )
+from utils.presentation_store import PresentationStore
 
 # Initialize the FastMCP server
 app = FastMCP(
     name="ppt-mcp-server"
 )
 
-# Global state to store presentations in memory
-presentations = {}
+# Global state to store presentations; cold decks spill to disk past the
+# PPT_MEMORY_BUDGET_MB budget and reload on access
+presentations = PresentationStore()
 current_presentation_id = None
+atexit.register(presentations.close_all)
 
 # Template configuration
 def get_template_search_directories():
@@ -334,10 +338,11 @@ def list_presentations() -> Dict:
         "presentations": [
             {
                 "id": pres_id,
-                "slide_count": len(pres.slides),
-                "is_current": pres_id == current_presentation_id
+                "slide_count": presentations.slide_count(pres_id),
+                "is_current": pres_id == current_presentation_id,
+                "resident": presentations.is_resident(pres_id)
             }
-            for pres_id, pres in presentations.items()
+            for pres_id in presentations
         ],
         "current_presentation_id": current_presentation_id,
         "total_presentations": len(presentations)
@@ -361,19 +366,42 @@ def switch_presentation(presentation_id: str) -> Dict:
         "current_presentation_id": current_presentation_id
     }
 
+@app.tool()
+def close_presentation(presentation_id: str) -> Dict:
+    """Close a loaded presentation and free its memory. Unsaved changes are discarded."""
+    if not presentations.close(presentation_id):
+        return {
+            "error": f"Presentation '{presentation_id}' not found. Available presentations: {list(presentations.keys())}"
+        }
+    
+    global current_presentation_id
+    if current_presentation_id == presentation_id:
+        current_presentation_id = None
+    
+    return {
+        "message": f"Closed presentation '{presentation_id}'",
+        "current_presentation_id": current_presentation_id,
+        "total_presentations": len(presentations)
+    }
+
+@app.tool()
+def get_presentation_store_stats() -> Dict:
+    """Get memory budget usage and the resident/spilled state of loaded presentations."""
+    return presentations.stats()
+
 @app.tool()
 def get_server_info() -> Dict:
     """Get information about the MCP server."""
     return {
         "name": "PowerPoint MCP Server - Enhanced Edition",
         "version": "2.1.0",
-        "total_tools": 32,  # Organized into 11 specialized modules
+        "total_tools": 35,  # Organized into 11 specialized modules
         "loaded_presentations": len(presentations),
         "current_presentation": current_presentation_id,
         "features": [
             "Presentation Management (7 tools)",
             "Content Management (6 tools)", 
-            "Template Operations (7 tools)",
+            "Template Operations (8 tools)",
             "Structural Elements (4 tools)",
             "Professional Design (3 tools)",
             "Specialized Features (5 tools)"
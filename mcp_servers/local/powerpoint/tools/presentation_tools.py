@@ -8,6 +8,14 @@ from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
 
 
+def _next_presentation_id(presentations: Dict) -> str:
+    """Generate an unused ID; closed presentations can leave gaps in the numbering."""
+    number = len(presentations) + 1
+    while f"presentation_{number}" in presentations:
+        number += 1
+    return f"presentation_{number}"
+
+
 def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, get_template_search_directories):
     """Register presentation management tools with the FastMCP app"""
     
@@ -19,7 +27,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = _next_presentation_id(presentations)
         
         # Store the presentation
         presentations[id] = pres
@@ -61,7 +69,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = _next_presentation_id(presentations)
         
         # Store the presentation
         presentations[id] = pres
@@ -93,7 +101,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Generate an ID if not provided
         if id is None:
-            id = f"presentation_{len(presentations) + 1}"
+            id = _next_presentation_id(presentations)
         
         # Store the presentation
         presentations[id] = pres
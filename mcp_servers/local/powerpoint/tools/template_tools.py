@@ -440,32 +440,21 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
         
         try:
             optimizations_applied = []
-            manager = template_utils.get_enhanced_template_manager()
+            layout_engine = template_utils.get_layout_engine()
             
             # Analyze each text shape on the slide
             for i, shape in enumerate(slide.shapes):
                 if hasattr(shape, 'text_frame') and shape.text_frame.text:
                     text = shape.text_frame.text
                     
-                    # Calculate container dimensions
                     container_width = shape.width.inches
-                    container_height = shape.height.inches
                     
                     shape_optimizations = []
                     
                     # Apply auto-resize if enabled
                     if auto_resize:
-                        optimal_size = template_utils.calculate_dynamic_font_size(
-                            text, container_width, container_height
-                        )
-                        optimal_size = max(min_font_size, min(max_font_size, optimal_size))
-                        
-                        # Apply the calculated font size
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.size = template_utils.Pt(optimal_size)
-                        
-                        shape_optimizations.append(f"Font resized to {optimal_size}pt")
+                        layout = layout_engine.layout_text_frame(shape, min_font_size, max_font_size)
+                        shape_optimizations.append(f"Font resized to {int(layout.font_size)}pt")
                     
                     # Apply auto-wrap if enabled
                     if auto_wrap:
@@ -518,4 +507,66 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
         except Exception as e:
             return {
                 "error": f"Failed to optimize slide text: {str(e)}"
-            }
\ No newline at end of file
+            }
+    
+    @app.tool()
+    def optimize_presentation_text(
+        min_font_size: int = 8,
+        max_font_size: int = 36,
+        slide_indices: Optional[List[int]] = None,
+        apply: bool = True,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Fit the font size of every text box in a presentation in one pass.
+        
+        Text is measured with the glyph widths of each box's font when the font
+        file is installed, and the largest size whose wrapped text fits the box
+        is chosen.
+        
+        Args:
+            min_font_size: Minimum allowed font size
+            max_font_size: Maximum allowed font size
+            slide_indices: Slides to process (all slides if None)
+            apply: Whether to set the computed sizes (False only reports them)
+            presentation_id: Presentation ID (uses current if None)
+        """
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+        
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+        
+        pres = presentations[pres_id]
+        
+        if slide_indices is not None:
+            invalid = [i for i in slide_indices if i < 0 or i >= len(pres.slides)]
+            if invalid:
+                return {
+                    "error": f"Invalid slide indices: {invalid}. Available slides: 0-{len(pres.slides) - 1}"
+                }
+        
+        if min_font_size > max_font_size:
+            return {
+                "error": f"min_font_size ({min_font_size}) must not exceed max_font_size ({max_font_size})"
+            }
+        
+        try:
+            result = template_utils.get_layout_engine().layout_presentation(
+                pres, min_font_size, max_font_size, apply, slide_indices
+            )
+            action = "Resized" if apply else "Measured"
+            return {
+                "message": f"{action} {result['shapes_laid_out']} text elements; {result['overflowing']} still overflow at {min_font_size}pt",
+                **result,
+                "settings": {
+                    "apply": apply,
+                    "font_size_range": f"{min_font_size}-{max_font_size}pt"
+                }
+            }
+            
+        except Exception as e:
+            return {
+                "error": f"Failed to optimize presentation text: {str(e)}"
+            }
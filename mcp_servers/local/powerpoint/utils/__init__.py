@@ -8,6 +8,8 @@ from .presentation_utils import *
 from .content_utils import *
 from .design_utils import *
 from .validation_utils import *
+from .presentation_store import PresentationStore, estimate_presentation_size
+from .text_layout import FontMetrics, TextLayout, TextLayoutEngine, get_layout_engine
 
 __all__ = [
     # Core utilities
@@ -23,6 +25,8 @@ __all__ = [
     "get_template_info",
     "set_core_properties",
     "get_core_properties",
+    "PresentationStore",
+    "estimate_presentation_size",
     
     # Content utilities
     "add_slide",
@@ -63,6 +67,12 @@ __all__ = [
     "optimize_font_for_presentation",
     "get_font_recommendations",
     
+    # Text layout
+    "FontMetrics",
+    "TextLayout",
+    "TextLayoutEngine",
+    "get_layout_engine",
+    
     # Validation utilities
     "validate_text_fit",
     "validate_and_fix_slide"
@@ -0,0 +1,257 @@
+"""
+Bounded presentation store for the PowerPoint MCP Server.
+
+Keeps open presentations under an LRU memory budget. When the budget is
+exceeded, the least recently used decks are saved to temporary .pptx files
+and dropped from memory; they are reloaded transparently on next access.
+"""
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from pptx import Presentation
+from pptx.opc.package import XmlPart
+
+DEFAULT_MEMORY_BUDGET_MB = 512
+
+
+def _part_sizes(presentation) -> Tuple[int, int]:
+    """Uncompressed size of the XML parts and of the other (media) parts."""
+    xml_size = binary_size = 0
+    for part in presentation.part.package.iter_parts():
+        if isinstance(part, XmlPart):
+            xml_size += len(part.blob)
+        else:
+            binary_size += len(part.blob)
+    return xml_size, binary_size
+
+
+def _binary_size(presentation) -> int:
+    """Size of the non-XML parts; these keep their bytes, so nothing is serialized."""
+    return sum(
+        len(part.blob) for part in presentation.part.package.iter_parts()
+        if not isinstance(part, XmlPart)
+    )
+
+
+def estimate_presentation_size(presentation) -> int:
+    """Approximate footprint of a presentation: the total size of its uncompressed parts."""
+    return sum(_part_sizes(presentation))
+
+
+class _Entry:
+    """Bookkeeping for one stored presentation."""
+
+    def __init__(self, presentation):
+        self.presentation = presentation
+        self.spill_path: Optional[str] = None
+        self.size = 0
+        # XML parts are re-serialized to be measured, so their size is only refreshed
+        # when the budget may be exceeded; `stale` marks decks edited since then
+        self.xml_size = 0
+        self.stale = False
+        self.slide_count = 0
+        self.last_access = time.time()
+        self.spill_count = 0
+
+    @property
+    def resident(self) -> bool:
+        return self.presentation is not None
+
+
+class PresentationStore(MutableMapping):
+    """
+    Dict-like store of presentations by ID with an LRU memory budget.
+
+    Reading an ID returns the presentation, reloading it from its spill file
+    if needed. Membership tests, iteration and len() never load decks.
+    Sizes are estimates (see estimate_presentation_size) taken when a deck
+    is stored or reloaded. When a deck stops being the most recently used
+    one only its media parts are re-measured; its XML parts are re-measured
+    once the resident total exceeds the budget, before anything is spilled.
+    """
+
+    def __init__(self, memory_budget_bytes: Optional[int] = None, spill_dir: Optional[str] = None):
+        if memory_budget_bytes is None:
+            memory_budget_bytes = int(float(os.environ.get("PPT_MEMORY_BUDGET_MB", DEFAULT_MEMORY_BUDGET_MB)) * 1024 * 1024)
+        self.memory_budget_bytes = memory_budget_bytes
+        self._spill_root = spill_dir or os.environ.get("PPT_SPILL_DIR") or None
+        self._spill_dir: Optional[str] = None
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        # Deck handed out last; it may have been modified since it was measured
+        self._active_id: Optional[str] = None
+        self.spills = 0
+        self.reloads = 0
+
+    # ------------------------------------------------------------------
+    # Mapping interface
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, pres_id: str):
+        with self._lock:
+            entry = self._entries[pres_id]
+            if not entry.resident:
+                entry.presentation = Presentation(entry.spill_path)
+                self._remove_spill_file(entry)
+                self._measure(entry)
+                self.reloads += 1
+            self._touch(pres_id)
+            return entry.presentation
+
+    def __setitem__(self, pres_id: str, presentation) -> None:
+        with self._lock:
+            if pres_id in self._entries:
+                self._remove_spill_file(self._entries[pres_id])
+            entry = _Entry(presentation)
+            self._entries[pres_id] = entry
+            self._measure(entry)
+            self._touch(pres_id)
+
+    def __delitem__(self, pres_id: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(pres_id)
+            self._remove_spill_file(entry)
+            entry.presentation = None
+            if self._active_id == pres_id:
+                self._active_id = None
+
+    def __contains__(self, pres_id) -> bool:
+        return pres_id in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Store operations
+    # ------------------------------------------------------------------
+
+    def close(self, pres_id: str) -> bool:
+        """Drop a presentation from memory and disk. Returns False if it was not stored."""
+        with self._lock:
+            if pres_id not in self._entries:
+                return False
+            del self[pres_id]
+            return True
+
+    def close_all(self) -> None:
+        with self._lock:
+            for pres_id in list(self._entries):
+                del self[pres_id]
+            if self._spill_dir:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+
+    def is_resident(self, pres_id: str) -> bool:
+        return self._entries[pres_id].resident
+
+    def slide_count(self, pres_id: str) -> int:
+        """Slide count without reloading a spilled deck."""
+        with self._lock:
+            entry = self._entries[pres_id]
+            return len(entry.presentation.slides) if entry.resident else entry.slide_count
+
+    def stats(self) -> Dict:
+        """Resident and spilled decks with their estimated sizes, in LRU order (oldest first)."""
+        with self._lock:
+            decks: List[Dict] = []
+            resident_bytes = spilled_bytes = 0
+            for pres_id, entry in self._entries.items():
+                if entry.resident:
+                    resident_bytes += entry.size
+                else:
+                    spilled_bytes += os.path.getsize(entry.spill_path) if os.path.exists(entry.spill_path) else 0
+                decks.append({
+                    "id": pres_id,
+                    "resident": entry.resident,
+                    "estimated_bytes": entry.size,
+                    "slide_count": self.slide_count(pres_id),
+                    "last_access": entry.last_access,
+                    "spill_count": entry.spill_count,
+                })
+            return {
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "resident_count": sum(1 for deck in decks if deck["resident"]),
+                "resident_bytes": resident_bytes,
+                "spilled_count": sum(1 for deck in decks if not deck["resident"]),
+                "spilled_file_bytes": spilled_bytes,
+                "spills": self.spills,
+                "reloads": self.reloads,
+                "spill_dir": self._spill_dir,
+                "presentations": decks,
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _measure(self, entry: _Entry) -> None:
+        entry.xml_size, binary_size = _part_sizes(entry.presentation)
+        entry.size = entry.xml_size + binary_size
+        entry.stale = False
+        entry.slide_count = len(entry.presentation.slides)
+
+    def _touch(self, pres_id: str) -> None:
+        previous = self._active_id
+        if previous != pres_id and previous in self._entries and self._entries[previous].resident:
+            # The previously active deck may have grown while it was being edited;
+            # media is cheap to re-measure, XML is deferred to _enforce_budget
+            entry = self._entries[previous]
+            entry.size = entry.xml_size + _binary_size(entry.presentation)
+            entry.stale = True
+        self._active_id = pres_id
+        self._entries[pres_id].last_access = time.time()
+        self._entries.move_to_end(pres_id)
+        self._enforce_budget(keep=pres_id)
+
+    def _enforce_budget(self, keep: str) -> None:
+        resident = sum(entry.size for entry in self._entries.values() if entry.resident)
+        if resident <= self.memory_budget_bytes:
+            return
+        for entry in self._entries.values():
+            if entry.resident and entry.stale:
+                self._measure(entry)
+        resident = sum(entry.size for entry in self._entries.values() if entry.resident)
+        for pres_id, entry in list(self._entries.items()):
+            if resident <= self.memory_budget_bytes:
+                break
+            if pres_id == keep or not entry.resident:
+                continue
+            try:
+                self._spill(pres_id, entry)
+            except Exception:
+                # A deck that cannot be saved stays resident
+                continue
+            resident -= entry.size
+
+    def _spill(self, pres_id: str, entry: _Entry) -> None:
+        if self._spill_dir is None:
+            if self._spill_root:
+                os.makedirs(self._spill_root, exist_ok=True)
+            self._spill_dir = tempfile.mkdtemp(prefix="ppt_mcp_spill_", dir=self._spill_root)
+        fd, path = tempfile.mkstemp(suffix=".pptx", dir=self._spill_dir)
+        os.close(fd)
+        try:
+            entry.presentation.save(path)
+        except Exception:
+            os.remove(path)
+            raise
+        entry.slide_count = len(entry.presentation.slides)
+        entry.spill_path = path
+        entry.presentation = None
+        entry.spill_count += 1
+        self.spills += 1
+
+    @staticmethod
+    def _remove_spill_file(entry: _Entry) -> None:
+        if entry.spill_path and os.path.exists(entry.spill_path):
+            os.remove(entry.spill_path)
+        entry.spill_path = None
@@ -14,87 +14,52 @@ from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 import utils.content_utils as content_utils
 import utils.design_utils as design_utils
+from utils.text_layout import TextLayoutEngine, get_layout_engine
 
 
 class TextSizeCalculator:
-    """Calculate optimal text sizes based on content and container dimensions."""
+    """Calculate optimal text sizes based on content and container dimensions.
+
+    Measurement and wrapping are delegated to the shared TextLayoutEngine, which
+    caches per-font glyph widths; without a font name (or when the font is not
+    installed) the character-class estimate is used.
+    """
     
-    def __init__(self):
-        self.character_widths = {
-            'narrow': 0.6,  # i, l, t
-            'normal': 1.0,  # most characters
-            'wide': 1.3,    # m, w
-            'space': 0.5    # space character
-        }
+    def __init__(self, layout_engine: Optional[TextLayoutEngine] = None):
+        self.layout_engine = layout_engine or get_layout_engine()
     
-    def estimate_text_width(self, text: str, font_size: int) -> float:
-        """Estimate text width in points based on character analysis."""
+    def estimate_text_width(self, text: str, font_size: int, font_name: Optional[str] = None) -> float:
+        """Estimate single-line text width in points."""
         if not text:
             return 0
-        
-        width = 0
-        for char in text:
-            if char in 'iltj':
-                width += self.character_widths['narrow']
-            elif char in 'mwMW':
-                width += self.character_widths['wide']
-            elif char == ' ':
-                width += self.character_widths['space']
-            else:
-                width += self.character_widths['normal']
-        
-        return width * font_size * 0.6  # Approximation factor
+        return self.layout_engine.get_metrics(font_name).text_width(text, font_size)
     
-    def estimate_text_height(self, text: str, font_size: int, line_spacing: float = 1.2) -> float:
+    def estimate_text_height(self, text: str, font_size: int, line_spacing: float = 1.2,
+                             font_name: Optional[str] = None) -> float:
         """Estimate text height based on line count and spacing."""
         lines = len(text.split('\n'))
-        return lines * font_size * line_spacing * 1.3  # Convert to points
+        return lines * font_size * line_spacing * self.layout_engine.get_metrics(font_name).line_height
     
     def calculate_optimal_font_size(self, text: str, container_width: float, 
                                   container_height: float, font_type: str = 'body',
-                                  min_size: int = 8, max_size: int = 36) -> int:
-        """Calculate optimal font size to fit text in container."""
-        container_width_pts = container_width * 72  # Convert inches to points
-        container_height_pts = container_height * 72
-        
-        # Start with a reasonable size and adjust
-        for font_size in range(max_size, min_size - 1, -1):
-            estimated_width = self.estimate_text_width(text, font_size)
-            estimated_height = self.estimate_text_height(text, font_size)
-            
-            if estimated_width <= container_width_pts * 0.9 and estimated_height <= container_height_pts * 0.9:
-                return font_size
-        
-        return min_size
+                                  min_size: int = 8, max_size: int = 36,
+                                  font_name: Optional[str] = None) -> int:
+        """Calculate the largest font size whose wrapped text fits in the container (inches)."""
+        layout = self.layout_engine.fit(
+            text, container_width * 72, container_height * 72, min_size, max_size,
+            self.layout_engine.get_metrics(font_name)
+        )
+        return int(layout.font_size)
     
-    def wrap_text_intelligently(self, text: str, max_width: float, font_size: int) -> str:
-        """Intelligently wrap text to fit within specified width."""
+    def wrap_text_intelligently(self, text: str, max_width: float, font_size: int,
+                                font_name: Optional[str] = None) -> str:
+        """Intelligently wrap text to fit within specified width (inches)."""
         if not text:
             return text
         
-        max_width_pts = max_width * 72
-        words = text.split()
-        wrapped_lines = []
-        current_line = []
-        
-        for word in words:
-            test_line = current_line + [word]
-            test_text = ' '.join(test_line)
-            
-            if self.estimate_text_width(test_text, font_size) <= max_width_pts:
-                current_line.append(word)
-            else:
-                if current_line:
-                    wrapped_lines.append(' '.join(current_line))
-                    current_line = [word]
-                else:
-                    # Single word is too long, force wrap
-                    wrapped_lines.append(word)
-        
-        if current_line:
-            wrapped_lines.append(' '.join(current_line))
-        
-        return '\n'.join(wrapped_lines)
+        lines = self.layout_engine.wrap(text, max_width * 72, font_size,
+                                        self.layout_engine.get_metrics(font_name))
+        return '\n'.join(lines)
 
 
 class VisualEffectsManager:
@@ -0,0 +1,328 @@
+"""
+Text layout engine for PowerPoint MCP Server.
+
+Measures text with per-glyph advance widths read from TrueType/OpenType font
+files. Widths are kept in em units, so a string is measured once per font and
+scaled for every candidate size; the font size that fits a container is found
+by binary search over wrapped layouts. Fonts that cannot be found on disk fall
+back to the character-class estimate used by the original text calculator.
+"""
+import os
+import sys
+import threading
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from fontTools.ttLib import TTFont
+from pptx.util import Pt
+
+FONT_EXTENSIONS = ('.ttf', '.otf')
+MEASURE_CACHE_SIZE = 8192
+DEFAULT_FILL_RATIO = 0.9
+DEFAULT_LINE_SPACING = 1.2
+EMU_PER_POINT = 12700
+
+
+def get_font_directories() -> List[str]:
+    """Directories searched for font files; PPT_FONT_PATH entries come first."""
+    directories = [d for d in os.environ.get('PPT_FONT_PATH', '').split(os.pathsep) if d]
+    home = os.path.expanduser('~')
+    if sys.platform == 'win32':
+        directories.append(os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'))
+        directories.append(os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'))
+    elif sys.platform == 'darwin':
+        directories += ['/System/Library/Fonts', '/Library/Fonts', os.path.join(home, 'Library', 'Fonts')]
+    else:
+        directories += ['/usr/share/fonts', '/usr/local/share/fonts',
+                        os.path.join(home, '.fonts'), os.path.join(home, '.local', 'share', 'fonts')]
+    return directories
+
+
+def _read_font_names(path: str) -> Optional[Tuple[str, bool, bool, int]]:
+    """Family name, bold/italic flags and weight class of a font file, or None if unreadable."""
+    try:
+        font = TTFont(path, lazy=True)
+        try:
+            names = font['name']
+            family = names.getDebugName(16) or names.getDebugName(1)
+            if 'OS/2' in font:
+                os2 = font['OS/2']
+                bold, italic = bool(os2.fsSelection & 0x20), bool(os2.fsSelection & 0x01)
+                weight = os2.usWeightClass
+            else:
+                style = font['head'].macStyle
+                bold, italic = bool(style & 0x1), bool(style & 0x2)
+                weight = 700 if bold else 400
+        finally:
+            font.close()
+    except Exception:
+        return None
+    return (family.strip().lower(), bold, italic, weight) if family else None
+
+
+class FontMetrics:
+    """Advance widths of one font, in em units."""
+
+    def __init__(self, name: str, advances: Dict[int, float], default_advance: float,
+                 line_height: float, path: Optional[str] = None):
+        self.name = name
+        self.advances = advances
+        self.default_advance = default_advance
+        # Ascent + descent + line gap, in em; multiplied by paragraph line spacing
+        self.line_height = line_height
+        self.path = path
+        self.measure = lru_cache(maxsize=MEASURE_CACHE_SIZE)(self._measure)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'FontMetrics':
+        font = TTFont(path, lazy=True)
+        try:
+            units_per_em = font['head'].unitsPerEm
+            hmtx = font['hmtx']
+            cmap = font.getBestCmap() or {}
+            advances = {codepoint: hmtx[glyph][0] / units_per_em
+                        for codepoint, glyph in cmap.items() if glyph in hmtx.metrics}
+            hhea = font['hhea']
+            line_height = (hhea.ascent - hhea.descent + hhea.lineGap) / units_per_em
+            name = font['name'].getDebugName(4) or os.path.basename(path)
+        finally:
+            font.close()
+        default_advance = sum(advances.values()) / len(advances) if advances else 0.5
+        return cls(name, advances, default_advance, line_height, path)
+
+    def _measure(self, text: str) -> float:
+        advances, default = self.advances, self.default_advance
+        return sum(advances.get(ord(char), default) for char in text)
+
+    def text_width(self, text: str, font_size: float) -> float:
+        """Width of a single line of text in points."""
+        return self.measure(text) * font_size
+
+
+class HeuristicMetrics(FontMetrics):
+    """Character-class widths used when no font file is available."""
+
+    NARROW, NORMAL, WIDE, SPACE = 0.36, 0.6, 0.78, 0.3
+
+    def __init__(self):
+        advances = {ord(char): self.NARROW for char in 'iltj'}
+        advances.update({ord(char): self.WIDE for char in 'mwMW'})
+        advances[ord(' ')] = self.SPACE
+        super().__init__('heuristic', advances, self.NORMAL, 1.3)
+
+
+@dataclass
+class TextLayout:
+    """Result of laying out text in a container at one font size."""
+    font_size: float
+    lines: List[str] = field(default_factory=list)
+    width: float = 0.0   # widest line, points
+    height: float = 0.0  # points
+    fits: bool = True
+    font: str = ''
+
+    @property
+    def text(self) -> str:
+        return '\n'.join(self.lines)
+
+
+class TextLayoutEngine:
+    """Wraps and sizes text using cached font metrics."""
+
+    def __init__(self, font_directories: Optional[List[str]] = None):
+        self._font_directories = font_directories
+        self._font_index: Optional[Dict[Tuple[str, bool, bool], str]] = None
+        self._metrics: Dict[Tuple[str, bool, bool], FontMetrics] = {}
+        self._lock = threading.Lock()
+        self.heuristic = HeuristicMetrics()
+
+    # ------------------------------------------------------------------
+    # Fonts
+    # ------------------------------------------------------------------
+
+    def _build_font_index(self) -> Dict[Tuple[str, bool, bool], str]:
+        index, weights = {}, {}
+        for directory in self._font_directories or get_font_directories():
+            if not os.path.isdir(directory):
+                continue
+            for root, _, files in os.walk(directory):
+                for filename in sorted(files):
+                    if not filename.lower().endswith(FONT_EXTENSIONS):
+                        continue
+                    path = os.path.join(root, filename)
+                    names = _read_font_names(path)
+                    if not names:
+                        continue
+                    family, bold, italic, weight = names
+                    # A family may ship Light/Medium/Black files with the same flags;
+                    # keep the one closest to regular (or bold) weight
+                    distance = abs(weight - (700 if bold else 400))
+                    key = (family, bold, italic)
+                    # Strict comparison: earlier directories (PPT_FONT_PATH) win ties
+                    if key not in weights or distance < weights[key]:
+                        index[key], weights[key] = path, distance
+        return index
+
+    def find_font_file(self, family: str, bold: bool = False, italic: bool = False) -> Optional[str]:
+        """Path of the closest style of a font family, or None if it is not installed."""
+        with self._lock:
+            if self._font_index is None:
+                self._font_index = self._build_font_index()
+        family = family.strip().lower()
+        for key in ((family, bold, italic), (family, bold, False), (family, False, italic), (family, False, False)):
+            if key in self._font_index:
+                return self._font_index[key]
+        return None
+
+    def get_metrics(self, font_name: Optional[str] = None, bold: bool = False,
+                    italic: bool = False) -> FontMetrics:
+        """Metrics for a font, loaded once; heuristic metrics if the font is unknown."""
+        if not font_name:
+            return self.heuristic
+        key = (font_name.strip().lower(), bool(bold), bool(italic))
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            path = self.find_font_file(*key)
+            metrics = self.heuristic
+            if path:
+                try:
+                    metrics = FontMetrics.from_file(path)
+                except Exception:
+                    pass
+            self._metrics[key] = metrics
+        return metrics
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    def wrap(self, text: str, max_width: float, font_size: float,
+             metrics: Optional[FontMetrics] = None) -> List[str]:
+        """
+        Greedily wrap text to max_width points. Explicit line breaks are kept;
+        a word wider than the line is placed on a line of its own.
+        """
+        metrics = metrics or self.heuristic
+        max_em = max_width / font_size if font_size else 0
+        space = metrics.measure(' ')
+        lines = []
+        for paragraph in (text or '').split('\n'):
+            current: List[str] = []
+            current_em = 0.0
+            for word in paragraph.split():
+                word_em = metrics.measure(word)
+                candidate = current_em + space + word_em if current else word_em
+                if current and candidate > max_em:
+                    lines.append(' '.join(current))
+                    current, current_em = [word], word_em
+                else:
+                    current.append(word)
+                    current_em = candidate
+            lines.append(' '.join(current))
+        return lines
+
+    def layout(self, text: str, width: float, height: float, font_size: float,
+               metrics: Optional[FontMetrics] = None, line_spacing: float = DEFAULT_LINE_SPACING,
+               fill_ratio: float = DEFAULT_FILL_RATIO, wrap: bool = True) -> TextLayout:
+        """Lay out text at one font size in a width x height (points) container."""
+        metrics = metrics or self.heuristic
+        max_width, max_height = width * fill_ratio, height * fill_ratio
+        lines = self.wrap(text, max_width, font_size, metrics) if wrap else (text or '').split('\n')
+        widest = max((metrics.text_width(line, font_size) for line in lines), default=0.0)
+        total_height = len(lines) * font_size * line_spacing * metrics.line_height
+        return TextLayout(font_size, lines, widest, total_height,
+                          widest <= max_width and total_height <= max_height, metrics.name)
+
+    def fit(self, text: str, width: float, height: float, min_size: int = 8, max_size: int = 36,
+            metrics: Optional[FontMetrics] = None, line_spacing: float = DEFAULT_LINE_SPACING,
+            fill_ratio: float = DEFAULT_FILL_RATIO, wrap: bool = True) -> TextLayout:
+        """
+        Largest whole font size in [min_size, max_size] whose layout fits the
+        container (points). Returns the min_size layout, with fits=False, if none does.
+        """
+        options = dict(metrics=metrics, line_spacing=line_spacing, fill_ratio=fill_ratio, wrap=wrap)
+        best = None
+        low, high = int(min_size), int(max_size)
+        while low <= high:
+            size = (low + high) // 2
+            layout = self.layout(text, width, height, size, **options)
+            if layout.fits:
+                best, low = layout, size + 1
+            else:
+                high = size - 1
+        return best or self.layout(text, width, height, int(min_size), **options)
+
+    # ------------------------------------------------------------------
+    # Presentations
+    # ------------------------------------------------------------------
+
+    def layout_text_frame(self, shape, min_size: int = 8, max_size: int = 36,
+                          apply: bool = True) -> Optional[TextLayout]:
+        """Fit the text of a shape to the shape's box; None if it holds no text."""
+        if not getattr(shape, 'has_text_frame', False) or not shape.text_frame.text:
+            return None
+        frame = shape.text_frame
+        width = (shape.width - (frame.margin_left or 0) - (frame.margin_right or 0)) / EMU_PER_POINT
+        height = (shape.height - (frame.margin_top or 0) - (frame.margin_bottom or 0)) / EMU_PER_POINT
+
+        font_name, bold, italic = None, False, False
+        line_spacing = DEFAULT_LINE_SPACING
+        for paragraph in frame.paragraphs:
+            if isinstance(paragraph.line_spacing, float):
+                line_spacing = paragraph.line_spacing
+            if paragraph.runs:
+                font = paragraph.runs[0].font
+                font_name, bold, italic = font.name, bool(font.bold), bool(font.italic)
+                break
+
+        metrics = self.get_metrics(font_name, bold, italic)
+        layout = self.fit(frame.text, width, height, min_size, max_size, metrics,
+                          line_spacing, wrap=frame.word_wrap is not False)
+        if apply:
+            size = Pt(layout.font_size)
+            for paragraph in frame.paragraphs:
+                for run in paragraph.runs:
+                    run.font.size = size
+        return layout
+
+    def layout_slide(self, slide, min_size: int = 8, max_size: int = 36,
+                     apply: bool = True) -> List[Dict]:
+        """Fit every text box of a slide; one result per shape with text."""
+        results = []
+        for shape_index, shape in enumerate(slide.shapes):
+            layout = self.layout_text_frame(shape, min_size, max_size, apply)
+            if layout is not None:
+                results.append({
+                    'shape_index': shape_index,
+                    'shape_name': shape.name,
+                    'font_size': layout.font_size,
+                    'line_count': len(layout.lines),
+                    'fits': layout.fits,
+                    'font_metrics': layout.font,
+                })
+        return results
+
+    def layout_presentation(self, presentation, min_size: int = 8, max_size: int = 36,
+                            apply: bool = True, slide_indices: Optional[List[int]] = None) -> Dict:
+        """Fit the text boxes of all (or the given) slides in a single pass."""
+        slides = list(presentation.slides)
+        indices = range(len(slides)) if slide_indices is None else slide_indices
+        results = []
+        for slide_index in indices:
+            for result in self.layout_slide(slides[slide_index], min_size, max_size, apply):
+                results.append({'slide_index': slide_index, **result})
+        return {
+            'shapes_laid_out': len(results),
+            'overflowing': sum(1 for result in results if not result['fits']),
+            'results': results,
+        }
+
+
+# Global instance; fonts and measurements are cached for the life of the process
+layout_engine = TextLayoutEngine()
+
+
+def get_layout_engine() -> TextLayoutEngine:
+    """Get the global text layout engine instance."""
+    return layout_engine
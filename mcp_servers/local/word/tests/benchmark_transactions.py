@@ -0,0 +1,68 @@
+"""
+Benchmark: per-call tools vs. a single apply_document_operations transaction.
+
+Builds the same report (N sections of heading, paragraphs and a table) both
+ways and prints the wall time of each. Not collected by pytest; run with
+
+    python tests/benchmark_transactions.py [sections]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from docx import Document
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from word_document_server.tools.content_tools import add_heading, add_paragraph, add_table
+from word_document_server.tools.transaction_tools import apply_document_operations
+
+
+def build_operations(sections: int) -> list:
+    operations = []
+    for i in range(sections):
+        operations.append({"type": "heading", "text": f"Section {i + 1}", "level": 2})
+        operations.append({"type": "paragraph", "text": f"Introduction to section {i + 1}. " * 5})
+        operations.append({"type": "paragraph", "text": "Details follow.", "italic": True})
+        operations.append({"type": "table", "rows": 3, "cols": 3,
+                           "data": [[f"r{r}c{c}" for c in range(3)] for r in range(3)]})
+    return operations
+
+
+async def per_call(filename: str, operations: list) -> None:
+    for op in operations:
+        params = {k: v for k, v in op.items() if k != "type"}
+        if op["type"] == "heading":
+            await add_heading(filename, **params)
+        elif op["type"] == "paragraph":
+            await add_paragraph(filename, **params)
+        elif op["type"] == "table":
+            await add_table(filename, **params)
+
+
+def main(sections: int) -> None:
+    operations = build_operations(sections)
+    with tempfile.TemporaryDirectory() as tmp:
+        single = os.path.join(tmp, "per_call.docx")
+        batch = os.path.join(tmp, "transaction.docx")
+        Document().save(single)
+        Document().save(batch)
+
+        start = time.perf_counter()
+        asyncio.run(per_call(single, operations))
+        per_call_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asyncio.run(apply_document_operations(batch, operations))
+        batch_seconds = time.perf_counter() - start
+
+    print(f"{sections} sections, {len(operations)} operations")
+    print(f"  per-call:    {per_call_seconds:8.3f}s ({len(operations)} load/save cycles)")
+    print(f"  transaction: {batch_seconds:8.3f}s (1 load/save cycle)")
+    print(f"  speedup:     {per_call_seconds / batch_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,75 @@
+import os
+import zipfile
+from pathlib import Path
+
+from docx import Document
+
+from word_document_server.core.footnotes import add_footnote_robust, delete_footnote_robust, validate_document_footnotes
+from word_document_server.utils.package_utils import rewrite_package
+
+
+def _make_media_docx(path: Path) -> bytes:
+    """Create a document plus an incompressible media member; returns the media bytes."""
+    doc = Document()
+    doc.add_paragraph("Paragraph that gets a footnote.")
+    doc.save(path)
+    media = os.urandom(256 * 1024)
+    with zipfile.ZipFile(path, "a", zipfile.ZIP_DEFLATED) as z:
+        z.writestr("word/media/image1.bin", media)
+    return media
+
+
+def _raw_member(path: Path, name: str) -> bytes:
+    """Compressed bytes of a member as stored in the archive."""
+    with zipfile.ZipFile(path) as z:
+        info = z.getinfo(name)
+    with open(path, "rb") as f:
+        f.seek(info.header_offset)
+        header = f.read(30)
+        name_len = int.from_bytes(header[26:28], "little")
+        extra_len = int.from_bytes(header[28:30], "little")
+        f.seek(name_len + extra_len, os.SEEK_CUR)
+        return f.read(info.compress_size)
+
+
+def test_rewrite_copies_unchanged_members_verbatim(tmp_path: Path):
+    src = tmp_path / "media.docx"
+    media = _make_media_docx(src)
+    media_raw = _raw_member(src, "word/media/image1.bin")
+    with zipfile.ZipFile(src) as z:
+        names = z.namelist()
+
+    out = tmp_path / "out.docx"
+    stats = rewrite_package(str(src), {
+        "word/document.xml": [b"<?xml version='1.0'?>", b"<replaced/>"],
+        "customXml/new.xml": b"<new/>",
+        "docProps/app.xml": None,
+    }, output=str(out))
+
+    assert stats == {"copied": len(names) - 2, "written": 2, "removed": 1}
+    assert _raw_member(out, "word/media/image1.bin") == media_raw
+    with zipfile.ZipFile(out) as z:
+        assert z.testzip() is None
+        assert z.read("word/media/image1.bin") == media
+        assert z.read("word/document.xml") == b"<?xml version='1.0'?><replaced/>"
+        assert z.read("customXml/new.xml") == b"<new/>"
+        assert "docProps/app.xml" not in z.namelist()
+    assert not [p for p in os.listdir(tmp_path) if p.endswith(".tmp")]
+
+
+def test_footnote_writers_keep_media_and_validate(tmp_path: Path):
+    doc_path = tmp_path / "report.docx"
+    media = _make_media_docx(doc_path)
+    media_raw = _raw_member(doc_path, "word/media/image1.bin")
+
+    success, message, details = add_footnote_robust(str(doc_path), paragraph_index=0, footnote_text="Source")
+    assert success, message
+    assert _raw_member(doc_path, "word/media/image1.bin") == media_raw
+    assert validate_document_footnotes(str(doc_path))[0]
+
+    success, message, _ = delete_footnote_robust(str(doc_path), footnote_id=details["footnote_id"])
+    assert success, message
+    with zipfile.ZipFile(doc_path) as z:
+        assert z.testzip() is None
+        assert z.read("word/media/image1.bin") == media
+    Document(doc_path)
@@ -0,0 +1,90 @@
+import asyncio
+import json
+from pathlib import Path
+
+from docx import Document
+
+from word_document_server.tools.extended_document_tools import find_text_in_document
+from word_document_server.utils.document_utils import find_and_replace_text, find_paragraph_by_text
+from word_document_server.utils.text_index import DocumentTextIndex
+
+
+def _split_runs_doc() -> Document:
+    """'Total revenue: 1200 USD' with 'rev' bold and 'enue' italic, plus a table."""
+    doc = Document()
+    para = doc.add_paragraph("Total ")
+    para.add_run("rev").bold = True
+    para.add_run("enue").italic = True
+    para.add_run(": 1200 USD")
+    doc.add_paragraph("Plain revenue line")
+    table = doc.add_table(rows=1, cols=2)
+    table.cell(0, 0).text = "Cell revenue 300"
+    merged = table.cell(0, 0).merge(table.cell(0, 1))
+    assert merged.text
+    return doc
+
+
+def test_search_spans_runs_and_tables():
+    index = DocumentTextIndex(_split_runs_doc())
+
+    matches = index.search("revenue")
+    assert [m.entry.location for m in matches] == [
+        {"paragraph_index": 0},
+        {"paragraph_index": 1},
+        {"table_index": 0, "row_index": 0, "col_index": 0, "cell_paragraph_index": 0},
+    ]
+    assert matches[0].start == 6 and matches[0].end == 13
+
+    assert [m.text for m in index.search(r"\d+", regex=True)] == ["1200", "300"]
+    assert index.count("REVENUE", match_case=False) == 3
+    assert index.count("rev", whole_word=True) == 0
+    assert index.find_paragraphs("Plain revenue line") == [1]
+    assert index.find_paragraphs("revenue", partial_match=True) == [0, 1]
+
+
+def test_anchored_regex_matches_per_paragraph():
+    doc = Document()
+    for text in ("Alpha one", "Alpha two", "Alpha three"):
+        doc.add_paragraph(text)
+    index = DocumentTextIndex(doc)
+
+    assert index.count(r"^Alpha", regex=True) == 3
+    assert [m.entry.location for m in index.search(r"one$", regex=True)] == [{"paragraph_index": 0}]
+    assert index.replace(r"^Alpha", "Beta", regex=True) == 3
+    assert [p.text for p in doc.paragraphs] == ["Beta one", "Beta two", "Beta three"]
+
+
+def test_replace_across_runs_keeps_surrounding_formatting():
+    doc = _split_runs_doc()
+    index = DocumentTextIndex(doc)
+
+    assert index.replace("l revenue:", "l income:") == 1
+    para = doc.paragraphs[0]
+    assert para.text == "Total income: 1200 USD"
+    # Replacement takes the first run's formatting; the untouched tail keeps its run
+    assert [(r.text, r.bold, r.italic) for r in para.runs] == [
+        ("Total income:", None, None), ("", True, None), ("", None, True), (" 1200 USD", None, None)
+    ]
+
+    # The same index answers further queries and replacements
+    assert index.search("income")[0].entry.location == {"paragraph_index": 0}
+    assert index.replace(r"(\d+) USD", r"USD \1", regex=True) == 1
+    assert doc.paragraphs[0].text == "Total income: USD 1200"
+    assert find_paragraph_by_text(doc, "Total income: USD 1200", index=index) == [0]
+
+
+def test_find_and_replace_text_counts_split_matches():
+    doc = _split_runs_doc()
+    assert find_and_replace_text(doc, "revenue", "sales") == 3
+    assert doc.paragraphs[0].text == "Total sales: 1200 USD"
+    assert doc.tables[0].cell(0, 0).text.startswith("Cell sales 300")
+
+
+def test_find_text_in_document_regex(tmp_path: Path):
+    path = tmp_path / "search.docx"
+    _split_runs_doc().save(path)
+
+    result = json.loads(asyncio.run(find_text_in_document(str(path), r"\d{3,4}", use_regex=True)))
+    assert result["total_count"] == 2
+    assert result["occurrences"][0]["paragraph_index"] == 0
+    assert result["occurrences"][1]["location"] == "Table 0, Row 0, Column 0"
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import zipfile
+from pathlib import Path
+
+from docx import Document
+
+from word_document_server.core.footnotes import validate_document_footnotes
+from word_document_server.tools.content_tools import add_heading, add_paragraph, add_table
+from word_document_server.tools.transaction_tools import apply_document_operations
+
+
+def _make_docx(path: Path) -> None:
+    doc = Document()
+    doc.add_paragraph("Existing paragraph with a placeholder.")
+    doc.save(path)
+
+
+def test_batch_matches_per_call_tools(tmp_path: Path):
+    """A batch produces the same content as the equivalent single-call tools."""
+    batch_doc = tmp_path / "batch.docx"
+    single_doc = tmp_path / "single.docx"
+    _make_docx(batch_doc)
+    _make_docx(single_doc)
+
+    operations = [
+        {"type": "heading", "text": "Report", "level": 1, "border_bottom": True},
+        {"type": "paragraph", "text": "Body text", "bold": True, "color": "#FF0000"},
+        {"type": "table", "rows": 2, "cols": 2, "data": [["a", "b"], ["c", "d"]]},
+    ]
+    result = json.loads(asyncio.run(apply_document_operations(str(batch_doc), operations)))
+    assert result["saved"] is True
+    assert result["succeeded"] == 3 and result["failed"] == 0
+
+    asyncio.run(add_heading(str(single_doc), "Report", 1, border_bottom=True))
+    asyncio.run(add_paragraph(str(single_doc), "Body text", bold=True, color="#FF0000"))
+    asyncio.run(add_table(str(single_doc), 2, 2, [["a", "b"], ["c", "d"]]))
+
+    batch, single = Document(batch_doc), Document(single_doc)
+    assert [p.text for p in batch.paragraphs] == [p.text for p in single.paragraphs]
+    assert [p.style.name for p in batch.paragraphs] == [p.style.name for p in single.paragraphs]
+    assert batch.paragraphs[2].runs[0].font.color.rgb == single.paragraphs[2].runs[0].font.color.rgb
+    assert [c.text for c in batch.tables[0]._cells] == ["a", "b", "c", "d"]
+
+
+def test_per_operation_results_and_footnotes(tmp_path: Path):
+    doc_path = tmp_path / "report.docx"
+    _make_docx(doc_path)
+
+    operations = [
+        {"type": "search_replace", "find_text": "placeholder", "replace_text": "value"},
+        {"type": "heading", "text": "Bad", "level": 12},
+        {"type": "footnote", "search_text": "Existing", "footnote_text": "First note"},
+        {"type": "paragraph", "text": "Cited paragraph"},
+        {"type": "format_text", "paragraph_index": 1, "start_pos": 0, "end_pos": 5, "italic": True},
+        {"type": "footnote", "paragraph_index": 1, "footnote_text": "Second note"},
+        {"type": "unknown"},
+    ]
+    result = json.loads(asyncio.run(apply_document_operations(str(doc_path), operations)))
+
+    assert [r["success"] for r in result["results"]] == [True, False, True, True, True, True, False]
+    assert "Invalid heading level" in result["results"][1]["error"]
+    assert result["saved"] is True
+
+    doc = Document(doc_path)
+    assert doc.paragraphs[0].text == "Existing paragraph with a value."
+    with zipfile.ZipFile(doc_path) as z:
+        footnotes = z.read("word/footnotes.xml").decode("utf-8")
+    assert "First note" in footnotes and "Second note" in footnotes
+    is_valid, _, _ = validate_document_footnotes(str(doc_path))
+    assert is_valid
+
+
+def test_atomic_batch_leaves_file_unchanged(tmp_path: Path):
+    doc_path = tmp_path / "atomic.docx"
+    _make_docx(doc_path)
+    before = doc_path.read_bytes()
+
+    operations = [
+        {"type": "paragraph", "text": "Added"},
+        {"type": "format_table", "table_index": 3},
+        {"type": "paragraph", "text": "Never reached"},
+    ]
+    result = json.loads(asyncio.run(apply_document_operations(str(doc_path), operations, atomic=True)))
+
+    assert result["saved"] is False
+    assert result["skipped"] == 1
+    assert doc_path.read_bytes() == before
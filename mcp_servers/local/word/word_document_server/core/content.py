@@ -0,0 +1,243 @@
+"""
+In-memory content operations for Word Document Server.
+
+These functions modify an already-loaded Document object and never touch the
+filesystem, so several of them can be applied before a single save.
+Invalid arguments raise ValueError with a user-facing message.
+"""
+from typing import List, Optional
+from docx.shared import Pt, RGBColor
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+from word_document_server.core.styles import ensure_heading_style
+
+
+# Common color names accepted by format_text_in_doc
+COLOR_MAP = {
+    'red': RGBColor(255, 0, 0),
+    'blue': RGBColor(0, 0, 255),
+    'green': RGBColor(0, 128, 0),
+    'yellow': RGBColor(255, 255, 0),
+    'black': RGBColor(0, 0, 0),
+    'gray': RGBColor(128, 128, 128),
+    'white': RGBColor(255, 255, 255),
+    'purple': RGBColor(128, 0, 128),
+    'orange': RGBColor(255, 165, 0)
+}
+
+
+def add_heading_to_doc(doc, text: str, level: int = 1,
+                       font_name: Optional[str] = None, font_size: Optional[int] = None,
+                       bold: Optional[bool] = None, italic: Optional[bool] = None,
+                       border_bottom: bool = False):
+    """
+    Add a heading to a document with optional formatting.
+
+    Args:
+        doc: Document object
+        text: Heading text
+        level: Heading level (1-9)
+        font_name, font_size, bold, italic: Optional run formatting
+        border_bottom: True to add a bottom border
+
+    Returns:
+        The heading paragraph
+    """
+    try:
+        level = int(level)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid parameter: level must be an integer between 1 and 9")
+
+    if level < 1 or level > 9:
+        raise ValueError(f"Invalid heading level: {level}. Level must be between 1 and 9.")
+
+    # Ensure heading styles exist
+    ensure_heading_style(doc)
+
+    # Try to add heading with style
+    try:
+        heading = doc.add_heading(text, level=level)
+    except Exception:
+        # If style-based approach fails, use direct formatting
+        heading = doc.add_paragraph(text)
+        heading.style = doc.styles['Normal']
+        if heading.runs:
+            run = heading.runs[0]
+            run.bold = True
+            # Adjust size based on heading level
+            if level == 1:
+                run.font.size = Pt(16)
+            elif level == 2:
+                run.font.size = Pt(14)
+            else:
+                run.font.size = Pt(12)
+
+    # Apply formatting to all runs in the heading
+    if any([font_name, font_size, bold is not None, italic is not None]):
+        for run in heading.runs:
+            if font_name:
+                run.font.name = font_name
+            if font_size:
+                run.font.size = Pt(font_size)
+            if bold is not None:
+                run.font.bold = bold
+            if italic is not None:
+                run.font.italic = italic
+
+    # Add bottom border if requested
+    if border_bottom:
+        pPr = heading._element.get_or_add_pPr()
+        pBdr = OxmlElement('w:pBdr')
+
+        bottom = OxmlElement('w:bottom')
+        bottom.set(qn('w:val'), 'single')
+        bottom.set(qn('w:sz'), '4')  # 0.5pt border
+        bottom.set(qn('w:space'), '0')
+        bottom.set(qn('w:color'), '000000')
+
+        pBdr.append(bottom)
+        pPr.append(pBdr)
+
+    return heading
+
+
+def add_paragraph_to_doc(doc, text: str, style: Optional[str] = None,
+                         font_name: Optional[str] = None, font_size: Optional[int] = None,
+                         bold: Optional[bool] = None, italic: Optional[bool] = None,
+                         color: Optional[str] = None):
+    """
+    Add a paragraph to a document with optional formatting.
+
+    Returns:
+        Tuple of (paragraph, style_found). When the requested style does not exist
+        the paragraph keeps the Normal style and is left unformatted.
+    """
+    paragraph = doc.add_paragraph(text)
+
+    if style:
+        try:
+            paragraph.style = style
+        except KeyError:
+            # Style doesn't exist, use normal and report it
+            paragraph.style = doc.styles['Normal']
+            return paragraph, False
+
+    # Apply formatting to all runs in the paragraph
+    if any([font_name, font_size, bold is not None, italic is not None, color]):
+        for run in paragraph.runs:
+            if font_name:
+                run.font.name = font_name
+            if font_size:
+                run.font.size = Pt(font_size)
+            if bold is not None:
+                run.font.bold = bold
+            if italic is not None:
+                run.font.italic = italic
+            if color:
+                # Remove any '#' prefix if present
+                color_hex = color.lstrip('#')
+                run.font.color.rgb = RGBColor.from_string(color_hex)
+
+    return paragraph, True
+
+
+def add_table_to_doc(doc, rows: int, cols: int, data: Optional[List[List[str]]] = None):
+    """
+    Add a table to a document, optionally filled with data.
+
+    Returns:
+        The table
+    """
+    table = doc.add_table(rows=rows, cols=cols)
+
+    # Try to set the table style
+    try:
+        table.style = 'Table Grid'
+    except KeyError:
+        # If style doesn't exist, add basic borders
+        pass
+
+    # Fill table with data if provided
+    if data:
+        for i, row_data in enumerate(data):
+            if i >= rows:
+                break
+            for j, cell_text in enumerate(row_data):
+                if j >= cols:
+                    break
+                table.cell(i, j).text = str(cell_text)
+
+    return table
+
+
+def format_text_in_doc(doc, paragraph_index: int, start_pos: int, end_pos: int,
+                       bold: Optional[bool] = None, italic: Optional[bool] = None,
+                       underline: Optional[bool] = None, color: Optional[str] = None,
+                       font_size: Optional[int] = None, font_name: Optional[str] = None) -> str:
+    """
+    Format a range of text within a paragraph.
+
+    Returns:
+        The formatted text
+    """
+    try:
+        paragraph_index = int(paragraph_index)
+        start_pos = int(start_pos)
+        end_pos = int(end_pos)
+        if font_size is not None:
+            font_size = int(font_size)
+    except (ValueError, TypeError):
+        raise ValueError("Invalid parameter: paragraph_index, start_pos, end_pos, and font_size must be integers")
+
+    # Validate paragraph index
+    if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
+        raise ValueError(f"Invalid paragraph index. Document has {len(doc.paragraphs)} paragraphs (0-{len(doc.paragraphs)-1}).")
+
+    paragraph = doc.paragraphs[paragraph_index]
+    text = paragraph.text
+
+    # Validate text positions
+    if start_pos < 0 or end_pos > len(text) or start_pos >= end_pos:
+        raise ValueError(f"Invalid text positions. Paragraph has {len(text)} characters.")
+
+    # Get the text to format
+    target_text = text[start_pos:end_pos]
+
+    # Clear existing runs and create three runs: before, target, after
+    for run in paragraph.runs:
+        run.clear()
+
+    # Add text before target
+    if start_pos > 0:
+        paragraph.add_run(text[:start_pos])
+
+    # Add target text with formatting
+    run_target = paragraph.add_run(target_text)
+    if bold is not None:
+        run_target.bold = bold
+    if italic is not None:
+        run_target.italic = italic
+    if underline is not None:
+        run_target.underline = underline
+    if color:
+        try:
+            if color.lower() in COLOR_MAP:
+                # Use predefined RGB color
+                run_target.font.color.rgb = COLOR_MAP[color.lower()]
+            else:
+                # Try to set color by name
+                run_target.font.color.rgb = RGBColor.from_string(color)
+        except Exception:
+            # If all else fails, default to black
+            run_target.font.color.rgb = RGBColor(0, 0, 0)
+    if font_size:
+        run_target.font.size = Pt(font_size)
+    if font_name:
+        run_target.font.name = font_name
+
+    # Add text after target
+    if end_pos < len(text):
+        paragraph.add_run(text[end_pos:])
+
+    return target_text
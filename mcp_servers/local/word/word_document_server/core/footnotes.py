@@ -9,8 +9,11 @@ import tempfile
 from typing import Optional, Tuple, Dict, Any, List
 from lxml import etree
 from docx import Document
+from docx.oxml import parse_xml
 from docx.oxml.ns import qn
 
+from word_document_server.utils.package_utils import rewrite_package
+
 # Namespace definitions
 W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
 R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
@@ -25,6 +28,12 @@ MAX_RELATIONSHIP_ID_LENGTH = 255
 FOOTNOTE_REF_STYLE_INDEX = 38
 FOOTNOTE_TEXT_STYLE_INDEX = 29
 
+# Compiled queries; unlike element.xpath() these also work on python-docx oxml elements
+_PARAGRAPHS_XPATH = etree.XPath('//w:p', namespaces={'w': W_NS})
+_RUNS_XPATH = etree.XPath('.//w:r', namespaces={'w': W_NS})
+_TEXT_RUNS_XPATH = etree.XPath('.//w:r[w:t]', namespaces={'w': W_NS})
+_TEXT_XPATH = etree.XPath('.//w:t/text()', namespaces={'w': W_NS})
+
 
 # ============================================================================
 # BASIC UTILITIES (from footnotes.py)
@@ -203,6 +212,11 @@ def _ensure_document_rels(document_rels_xml: bytes) -> bytes:
     return etree.tostring(rels_tree, encoding='UTF-8', xml_declaration=True, standalone="yes")
 
 
+def _serialize_part(root) -> bytes:
+    """Serialize a part's XML tree the way Word writes it."""
+    return etree.tostring(root, encoding='UTF-8', xml_declaration=True, standalone="yes")
+
+
 def _create_minimal_footnotes_xml() -> bytes:
     """Create minimal footnotes.xml with separators."""
     xml = f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
@@ -236,7 +250,7 @@ def _ensure_footnote_styles(styles_root):
     nsmap = {'w': W_NS}
     
     # Check for FootnoteReference style
-    ref_style = styles_root.xpath('//w:style[@w:styleId="FootnoteReference"]', namespaces=nsmap)
+    ref_style = etree.XPath('//w:style[@w:styleId="FootnoteReference"]', namespaces=nsmap)(styles_root)
     if not ref_style:
         # Create FootnoteReference character style
         style = etree.Element(f'{{{W_NS}}}style',
@@ -258,7 +272,7 @@ def _ensure_footnote_styles(styles_root):
         styles_root.append(style)
     
     # Check for FootnoteText style
-    text_style = styles_root.xpath('//w:style[@w:styleId="FootnoteText"]', namespaces=nsmap)
+    text_style = etree.XPath('//w:style[@w:styleId="FootnoteText"]', namespaces=nsmap)(styles_root)
     if not text_style:
         # Create FootnoteText paragraph style
         style = etree.Element(f'{{{W_NS}}}style',
@@ -280,6 +294,72 @@ def _ensure_footnote_styles(styles_root):
         styles_root.append(style)
 
 
+def _footnote_insert_position(target_para, position: str) -> int:
+    """Get the child index at which a footnote reference run is inserted."""
+    if position == "after":
+        # Find last run in paragraph or create one
+        runs = _RUNS_XPATH(target_para)
+        if runs:
+            last_run = runs[-1]
+            # Insert after last run
+            return target_para.index(last_run) + 1
+        return len(target_para)
+    # before: find first run with text
+    runs = _TEXT_RUNS_XPATH(target_para)
+    if runs:
+        return target_para.index(runs[0])
+    return 0
+
+
+def _build_footnote_reference_run(footnote_id: int):
+    """Create the superscript run that references a footnote from the body."""
+    ref_run = etree.Element(f'{{{W_NS}}}r')
+    
+    # Add run properties with superscript
+    rPr = etree.SubElement(ref_run, f'{{{W_NS}}}rPr')
+    rStyle = etree.SubElement(rPr, f'{{{W_NS}}}rStyle')
+    rStyle.set(f'{{{W_NS}}}val', 'FootnoteReference')
+    
+    # Add footnote reference
+    fn_ref = etree.SubElement(ref_run, f'{{{W_NS}}}footnoteReference')
+    fn_ref.set(f'{{{W_NS}}}id', str(footnote_id))
+    return ref_run
+
+
+def _build_footnote_element(footnote_id: int, footnote_text: str):
+    """Create a w:footnote element holding the marker and the footnote text."""
+    new_footnote = etree.Element(f'{{{W_NS}}}footnote',
+        attrib={f'{{{W_NS}}}id': str(footnote_id)}
+    )
+    
+    # Add paragraph to footnote
+    fn_para = etree.SubElement(new_footnote, f'{{{W_NS}}}p')
+    
+    # Add paragraph properties
+    pPr = etree.SubElement(fn_para, f'{{{W_NS}}}pPr')
+    pStyle = etree.SubElement(pPr, f'{{{W_NS}}}pStyle')
+    pStyle.set(f'{{{W_NS}}}val', 'FootnoteText')
+    
+    # Add the footnote reference marker
+    marker_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
+    marker_rPr = etree.SubElement(marker_run, f'{{{W_NS}}}rPr')
+    marker_rStyle = etree.SubElement(marker_rPr, f'{{{W_NS}}}rStyle')
+    marker_rStyle.set(f'{{{W_NS}}}val', 'FootnoteReference')
+    etree.SubElement(marker_run, f'{{{W_NS}}}footnoteRef')
+    
+    # Add space after marker
+    space_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
+    space_text = etree.SubElement(space_run, f'{{{W_NS}}}t')
+    space_text.set(f'{{{XML_NS}}}space', 'preserve')
+    space_text.text = ' '
+    
+    # Add footnote text
+    text_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
+    text_elem = etree.SubElement(text_run, f'{{{W_NS}}}t')
+    text_elem.text = footnote_text
+    return new_footnote
+
+
 def add_footnote_robust(
     filename: str,
     search_text: Optional[str] = None,
@@ -373,69 +453,11 @@ def add_footnote_robust(
         footnote_id = _get_safe_footnote_id(footnotes_root)
         
         # Add footnote reference to document
-        if position == "after":
-            # Find last run in paragraph or create one
-            runs = target_para.xpath('.//w:r', namespaces=nsmap)
-            if runs:
-                last_run = runs[-1]
-                # Insert after last run
-                insert_pos = target_para.index(last_run) + 1
-            else:
-                insert_pos = len(target_para)
-        else:  # before
-            # Find first run with text
-            runs = target_para.xpath('.//w:r[w:t]', namespaces=nsmap)
-            if runs:
-                first_run = runs[0]
-                insert_pos = target_para.index(first_run)
-            else:
-                insert_pos = 0
-        
-        # Create footnote reference run
-        ref_run = etree.Element(f'{{{W_NS}}}r')
-        
-        # Add run properties with superscript
-        rPr = etree.SubElement(ref_run, f'{{{W_NS}}}rPr')
-        rStyle = etree.SubElement(rPr, f'{{{W_NS}}}rStyle')
-        rStyle.set(f'{{{W_NS}}}val', 'FootnoteReference')
-        
-        # Add footnote reference
-        fn_ref = etree.SubElement(ref_run, f'{{{W_NS}}}footnoteReference')
-        fn_ref.set(f'{{{W_NS}}}id', str(footnote_id))
-        
-        # Insert the reference run
-        target_para.insert(insert_pos, ref_run)
+        insert_pos = _footnote_insert_position(target_para, position)
+        target_para.insert(insert_pos, _build_footnote_reference_run(footnote_id))
         
         # Add footnote content
-        new_footnote = etree.Element(f'{{{W_NS}}}footnote',
-            attrib={f'{{{W_NS}}}id': str(footnote_id)}
-        )
-        
-        # Add paragraph to footnote
-        fn_para = etree.SubElement(new_footnote, f'{{{W_NS}}}p')
-        
-        # Add paragraph properties
-        pPr = etree.SubElement(fn_para, f'{{{W_NS}}}pPr')
-        pStyle = etree.SubElement(pPr, f'{{{W_NS}}}pStyle')
-        pStyle.set(f'{{{W_NS}}}val', 'FootnoteText')
-        
-        # Add the footnote reference marker
-        marker_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
-        marker_rPr = etree.SubElement(marker_run, f'{{{W_NS}}}rPr')
-        marker_rStyle = etree.SubElement(marker_rPr, f'{{{W_NS}}}rStyle')
-        marker_rStyle.set(f'{{{W_NS}}}val', 'FootnoteReference')
-        marker_ref = etree.SubElement(marker_run, f'{{{W_NS}}}footnoteRef')
-        
-        # Add space after marker
-        space_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
-        space_text = etree.SubElement(space_run, f'{{{W_NS}}}t')
-        space_text.set(f'{{{XML_NS}}}space', 'preserve')
-        space_text.text = ' '
-        
-        # Add footnote text
-        text_run = etree.SubElement(fn_para, f'{{{W_NS}}}r')
-        text_elem = etree.SubElement(text_run, f'{{{W_NS}}}t')
-        text_elem.text = footnote_text
+        new_footnote = _build_footnote_element(footnote_id, footnote_text)
         
         # Append footnote to footnotes.xml
         footnotes_root.append(new_footnote)
@@ -447,30 +469,14 @@ def add_footnote_robust(
         content_types_xml = _ensure_content_types(doc_parts['content_types'])
         document_rels_xml = _ensure_document_rels(doc_parts['document_rels'])
         
-        # Write modified document
-        temp_file = working_file + '.tmp'
-        with zipfile.ZipFile(temp_file, 'w', zipfile.ZIP_DEFLATED) as zout:
-            with zipfile.ZipFile(filename, 'r') as zin:
-                # Copy unchanged files
-                for item in zin.infolist():
-                    if item.filename not in [
-                        'word/document.xml', 'word/footnotes.xml', 'word/styles.xml',
-                        '[Content_Types].xml', 'word/_rels/document.xml.rels'
-                    ]:
-                        zout.writestr(item, zin.read(item.filename))
-            
-            # Write modified files
-            zout.writestr('word/document.xml',
-                etree.tostring(doc_root, encoding='UTF-8', xml_declaration=True, standalone="yes"))
-            zout.writestr('word/footnotes.xml',
-                etree.tostring(footnotes_root, encoding='UTF-8', xml_declaration=True, standalone="yes"))
-            zout.writestr('word/styles.xml',
-                etree.tostring(styles_root, encoding='UTF-8', xml_declaration=True, standalone="yes"))
-            zout.writestr('[Content_Types].xml', content_types_xml)
-            zout.writestr('word/_rels/document.xml.rels', document_rels_xml)
-        
-        # Replace original with temp file
-        os.replace(temp_file, working_file)
+        # Write modified document; unchanged parts are copied without recompression
+        rewrite_package(filename, {
+            'word/document.xml': _serialize_part(doc_root),
+            'word/footnotes.xml': _serialize_part(footnotes_root),
+            'word/styles.xml': _serialize_part(styles_root),
+            '[Content_Types].xml': content_types_xml,
+            'word/_rels/document.xml.rels': document_rels_xml,
+        }, output=working_file)
         
         details = {
             'footnote_id': footnote_id,
@@ -482,13 +488,86 @@ def add_footnote_robust(
         return True, f"Successfully added footnote (ID: {footnote_id}) to {working_file}", details
         
     except Exception as e:
-        # Clean up temp file if exists
-        temp_file = working_file + '.tmp'
-        if os.path.exists(temp_file):
-            os.remove(temp_file)
         return False, f"Error adding footnote: {str(e)}", None
 
 
+def _get_footnotes_root(doc):
+    """Get the footnotes XML of a loaded Document, creating the part if needed.
+
+    python-docx loads footnotes.xml as an opaque part, so it is swapped for an
+    XmlPart whose tree is serialized again when the document is saved.
+    """
+    from docx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+    from docx.opc.packuri import PackURI
+    from docx.opc.part import XmlPart
+
+    doc_part = doc.part
+    for rId, rel in doc_part.rels.items():
+        if rel.reltype != RT.FOOTNOTES or rel.is_external:
+            continue
+        part = rel.target_part
+        if isinstance(part, XmlPart):
+            return part.element
+        xml_part = XmlPart(part.partname, part.content_type, etree.fromstring(part.blob), part.package)
+        for child_rId, child_rel in part.rels.items():
+            target = child_rel.target_ref if child_rel.is_external else child_rel.target_part
+            xml_part.rels.add_relationship(child_rel.reltype, target, child_rId, child_rel.is_external)
+        doc_part.rels.add_relationship(RT.FOOTNOTES, xml_part, rId)
+        return xml_part.element
+
+    xml_part = XmlPart(
+        PackURI('/word/footnotes.xml'), CT.WML_FOOTNOTES,
+        etree.fromstring(_create_minimal_footnotes_xml()), doc_part.package
+    )
+    doc_part.relate_to(xml_part, RT.FOOTNOTES)
+    return xml_part.element
+
+
+def add_footnote_to_doc(
+    doc,
+    footnote_text: str,
+    search_text: Optional[str] = None,
+    paragraph_index: Optional[int] = None,
+    position: str = "after"
+) -> int:
+    """
+    Add a real Word footnote to an already-loaded Document.
+
+    Same placement rules as add_footnote_robust, but the document is modified in
+    memory and written by the caller's doc.save().
+
+    Returns:
+        The new footnote ID
+    """
+    if not search_text and paragraph_index is None:
+        raise ValueError("Must provide either search_text or paragraph_index")
+    if search_text and paragraph_index is not None:
+        raise ValueError("Cannot provide both search_text and paragraph_index")
+
+    paragraphs = _PARAGRAPHS_XPATH(doc.element)
+    if search_text:
+        target_para = next(
+            (para for para in paragraphs if search_text in ''.join(_TEXT_XPATH(para))), None
+        )
+        if target_para is None:
+            raise ValueError(f"Text '{search_text}' not found in document")
+    else:
+        if paragraph_index < 0 or paragraph_index >= len(paragraphs):
+            raise ValueError(f"Paragraph index {paragraph_index} out of range")
+        target_para = paragraphs[paragraph_index]
+
+    footnotes_root = _get_footnotes_root(doc)
+    footnote_id = _get_safe_footnote_id(footnotes_root)
+
+    # Round-trip through python-docx's parser so the run behaves like any other Run
+    ref_run = parse_xml(etree.tostring(_build_footnote_reference_run(footnote_id)))
+    target_para.insert(_footnote_insert_position(target_para, position), ref_run)
+    footnotes_root.append(_build_footnote_element(footnote_id, footnote_text))
+
+    _ensure_footnote_styles(doc.styles.element)
+    return footnote_id
+
+
 def delete_footnote_robust(
     filename: str,
     footnote_id: Optional[int] = None,
@@ -577,21 +656,11 @@ def delete_footnote_robust(
                     footnotes_root.remove(fn)
                     orphans_removed.append(fn_id)
         
-        # Write modified document
-        temp_file = working_file + '.tmp'
-        with zipfile.ZipFile(temp_file, 'w', zipfile.ZIP_DEFLATED) as zout:
-            with zipfile.ZipFile(filename, 'r') as zin:
-                for item in zin.infolist():
-                    if item.filename == 'word/document.xml':
-                        zout.writestr(item,
-                            etree.tostring(doc_root, encoding='UTF-8', xml_declaration=True, standalone="yes"))
-                    elif item.filename == 'word/footnotes.xml':
-                        zout.writestr(item,
-                            etree.tostring(footnotes_root, encoding='UTF-8', xml_declaration=True, standalone="yes"))
-                    else:
-                        zout.writestr(item, zin.read(item.filename))
-        
-        os.replace(temp_file, working_file)
+        # Write modified document; unchanged parts are copied without recompression
+        rewrite_package(filename, {
+            'word/document.xml': _serialize_part(doc_root),
+            'word/footnotes.xml': _serialize_part(footnotes_root),
+        }, output=working_file)
         
         details = {
             'footnote_id': footnote_id,
@@ -707,8 +776,8 @@ def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any
                 styles_xml = zf.read('word/styles.xml')
                 styles_root = etree.fromstring(styles_xml)
                 
-                ref_style = styles_root.xpath('//w:style[@w:styleId="FootnoteReference"]', namespaces=nsmap)
-                text_style = styles_root.xpath('//w:style[@w:styleId="FootnoteText"]', namespaces=nsmap)
+                ref_style = etree.XPath('//w:style[@w:styleId="FootnoteReference"]', namespaces=nsmap)(styles_root)
+                text_style = etree.XPath('//w:style[@w:styleId="FootnoteText"]', namespaces=nsmap)(styles_root)
                 
                 if not ref_style:
                     report['missing_styles'].append('FootnoteReference')
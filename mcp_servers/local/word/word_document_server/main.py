@@ -21,7 +21,8 @@ from word_document_server.tools import (
     protection_tools,
     footnote_tools,
     extended_document_tools,
-    comment_tools
+    comment_tools,
+    transaction_tools
 )
 from word_document_server.tools.content_tools import replace_paragraph_block_below_header_tool
 from word_document_server.tools.content_tools import replace_block_between_manual_anchors_tool
@@ -200,9 +201,25 @@ def register_tools():
         return content_tools.delete_paragraph(filename, paragraph_index)
     
     @mcp.tool()
-    def search_and_replace(filename: str, find_text: str, replace_text: str):
-        """Search for text and replace all occurrences."""
-        return content_tools.search_and_replace(filename, find_text, replace_text)
+    def search_and_replace(filename: str, find_text: str, replace_text: str,
+                           use_regex: bool = False, match_case: bool = True):
+        """Search for text and replace all occurrences, including text split across formatting runs.
+        Set use_regex to treat find_text as a regular expression (replace_text may use \\1 group references)."""
+        return content_tools.search_and_replace(filename, find_text, replace_text, use_regex, match_case)
+    
+    @mcp.tool()
+    def apply_document_operations(filename: str, operations: list, atomic: bool = False):
+        """Apply several edits to a document with a single load and save.
+
+        Args:
+            filename: Path to Word document
+            operations: List of operation dicts applied in order, each with a "type" of
+                heading, paragraph, table, page_break, format_text, format_table, footnote
+                or search_replace plus the parameters of the matching single-call tool,
+                e.g. {"type": "heading", "text": "Intro", "level": 1}
+            atomic: Stop at the first failed operation and leave the file unchanged
+        """
+        return transaction_tools.apply_document_operations(filename, operations, atomic)
     
     # Format tools (styling, text formatting, etc.)
     @mcp.tool()
@@ -378,10 +395,10 @@ def register_tools():
     
     @mcp.tool()
     def find_text_in_document(filename: str, text_to_find: str, match_case: bool = True,
-                             whole_word: bool = False):
-        """Find occurrences of specific text in a Word document."""
+                             whole_word: bool = False, use_regex: bool = False):
+        """Find occurrences of specific text (or a regular expression) in a Word document."""
         return extended_document_tools.find_text_in_document(
-            filename, text_to_find, match_case, whole_word
+            filename, text_to_find, match_case, whole_word, use_regex
         )
     
     @mcp.tool()
@@ -7,11 +7,12 @@ including headings, paragraphs, tables, images, and page breaks.
 import os
 from typing import List, Optional, Dict, Any
 from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Inches
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
 from word_document_server.utils.document_utils import find_and_replace_text, insert_header_near_text, insert_numbered_list_near_text, insert_line_or_paragraph_near_text, replace_paragraph_block_below_header, replace_block_between_manual_anchors
-from word_document_server.core.styles import ensure_heading_style, ensure_table_style
+from word_document_server.core.styles import ensure_table_style
+from word_document_server.core.content import add_heading_to_doc, add_paragraph_to_doc, add_table_to_doc
 
 
 async def add_heading(filename: str, text: str, level: int = 1,
@@ -53,56 +54,8 @@ async def add_heading(filename: str, text: str, level: int = 1,
 
     try:
         doc = Document(filename)
-
-        # Ensure heading styles exist
-        ensure_heading_style(doc)
-
-        # Try to add heading with style
-        try:
-            heading = doc.add_heading(text, level=level)
-        except Exception as style_error:
-            # If style-based approach fails, use direct formatting
-            heading = doc.add_paragraph(text)
-            heading.style = doc.styles['Normal']
-            if heading.runs:
-                run = heading.runs[0]
-                run.bold = True
-                # Adjust size based on heading level
-                if level == 1:
-                    run.font.size = Pt(16)
-                elif level == 2:
-                    run.font.size = Pt(14)
-                else:
-                    run.font.size = Pt(12)
-
-        # Apply formatting to all runs in the heading
-        if any([font_name, font_size, bold is not None, italic is not None]):
-            for run in heading.runs:
-                if font_name:
-                    run.font.name = font_name
-                if font_size:
-                    run.font.size = Pt(font_size)
-                if bold is not None:
-                    run.font.bold = bold
-                if italic is not None:
-                    run.font.italic = italic
-
-        # Add bottom border if requested
-        if border_bottom:
-            from docx.oxml import OxmlElement
-            from docx.oxml.ns import qn
-
-            pPr = heading._element.get_or_add_pPr()
-            pBdr = OxmlElement('w:pBdr')
-
-            bottom = OxmlElement('w:bottom')
-            bottom.set(qn('w:val'), 'single')
-            bottom.set(qn('w:sz'), '4')  # 0.5pt border
-            bottom.set(qn('w:space'), '0')
-            bottom.set(qn('w:color'), '000000')
-
-            pBdr.append(bottom)
-            pPr.append(pBdr)
+        add_heading_to_doc(doc, text, level, font_name=font_name, font_size=font_size,
+                           bold=bold, italic=italic, border_bottom=border_bottom)
 
         doc.save(filename)
         return f"Heading '{text}' (level {level}) added to {filename}"
@@ -139,34 +92,12 @@ async def add_paragraph(filename: str, text: str, style: Optional[str] = None,
 
     try:
         doc = Document(filename)
-        paragraph = doc.add_paragraph(text)
-
-        if style:
-            try:
-                paragraph.style = style
-            except KeyError:
-                # Style doesn't exist, use normal and report it
-                paragraph.style = doc.styles['Normal']
-                doc.save(filename)
-                return f"Style '{style}' not found, paragraph added with default style to {filename}"
-
-        # Apply formatting to all runs in the paragraph
-        if any([font_name, font_size, bold is not None, italic is not None, color]):
-            for run in paragraph.runs:
-                if font_name:
-                    run.font.name = font_name
-                if font_size:
-                    run.font.size = Pt(font_size)
-                if bold is not None:
-                    run.font.bold = bold
-                if italic is not None:
-                    run.font.italic = italic
-                if color:
-                    # Remove any '#' prefix if present
-                    color_hex = color.lstrip('#')
-                    run.font.color.rgb = RGBColor.from_string(color_hex)
-
+        _, style_found = add_paragraph_to_doc(doc, text, style=style, font_name=font_name,
+                                              font_size=font_size, bold=bold, italic=italic,
+                                              color=color)
         doc.save(filename)
+        if not style_found:
+            return f"Style '{style}' not found, paragraph added with default style to {filename}"
         return f"Paragraph added to {filename}"
     except Exception as e:
         return f"Failed to add paragraph: {str(e)}"
@@ -194,24 +125,7 @@ async def add_table(filename: str, rows: int, cols: int, data: Optional[List[Lis
     
     try:
         doc = Document(filename)
-        table = doc.add_table(rows=rows, cols=cols)
-        
-        # Try to set the table style
-        try:
-            table.style = 'Table Grid'
-        except KeyError:
-            # If style doesn't exist, add basic borders
-            pass
-        
-        # Fill table with data if provided
-        if data:
-            for i, row_data in enumerate(data):
-                if i >= rows:
-                    break
-                for j, cell_text in enumerate(row_data):
-                    if j >= cols:
-                        break
-                    table.cell(i, j).text = str(cell_text)
+        add_table_to_doc(doc, rows, cols, data)
         
         doc.save(filename)
         return f"Table ({rows}x{cols}) added to {filename}"
@@ -428,13 +342,16 @@ async def delete_paragraph(filename: str, paragraph_index: int) -> str:
         return f"Failed to delete paragraph: {str(e)}"
 
 
-async def search_and_replace(filename: str, find_text: str, replace_text: str) -> str:
-    """Search for text and replace all occurrences.
+async def search_and_replace(filename: str, find_text: str, replace_text: str,
+                             use_regex: bool = False, match_case: bool = True) -> str:
+    """Search for text and replace all occurrences, including ones spanning formatting runs.
     
     Args:
         filename: Path to the Word document
-        find_text: Text to search for
-        replace_text: Text to replace with
+        find_text: Text (or regular expression) to search for
+        replace_text: Text to replace with; may use group references like \\1 with use_regex
+        use_regex: Treat find_text as a regular expression
+        match_case: Whether to match case
     """
     filename = ensure_docx_extension(filename)
     
@@ -450,7 +367,7 @@ async def search_and_replace(filename: str, find_text: str, replace_text: str) -
         doc = Document(filename)
         
         # Perform find and replace
-        count = find_and_replace_text(doc, find_text, replace_text)
+        count = find_and_replace_text(doc, find_text, replace_text, regex=use_regex, match_case=match_case)
         
         if count > 0:
             doc.save(filename)
@@ -38,7 +38,8 @@ async def get_paragraph_text_from_document(filename: str, paragraph_index: int)
         return f"Failed to get paragraph text: {str(e)}"
 
 
-async def find_text_in_document(filename: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> str:
+async def find_text_in_document(filename: str, text_to_find: str, match_case: bool = True, whole_word: bool = False,
+                                use_regex: bool = False) -> str:
     """Find occurrences of specific text in a Word document.
     
     Args:
@@ -46,6 +47,7 @@ async def find_text_in_document(filename: str, text_to_find: str, match_case: bo
         text_to_find: Text to search for in the document
         match_case: Whether to match case (True) or ignore case (False)
         whole_word: Whether to match whole words only (True) or substrings (False)
+        use_regex: Whether text_to_find is a regular expression
     """
     filename = ensure_docx_extension(filename)
     
@@ -57,7 +59,7 @@ async def find_text_in_document(filename: str, text_to_find: str, match_case: bo
     
     try:
         
-        result = find_text(filename, text_to_find, match_case, whole_word)
+        result = find_text(filename, text_to_find, match_case, whole_word, use_regex)
         return json.dumps(result, indent=2)
     except Exception as e:
         return f"Failed to search for text: {str(e)}"
@@ -7,12 +7,12 @@ including text formatting, table formatting, and custom styles.
 import os
 from typing import List, Optional, Dict, Any
 from docx import Document
-from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_COLOR_INDEX
 from docx.enum.style import WD_STYLE_TYPE
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
 from word_document_server.core.styles import create_style
+from word_document_server.core.content import format_text_in_doc
 from word_document_server.core.tables import (
     apply_table_style, set_cell_shading_by_position, apply_alternating_row_shading,
     highlight_header_row, merge_cells, merge_cells_horizontal, merge_cells_vertical,
@@ -62,69 +62,12 @@ async def format_text(filename: str, paragraph_index: int, start_pos: int, end_p
     
     try:
         doc = Document(filename)
-        
-        # Validate paragraph index
-        if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
-            return f"Invalid paragraph index. Document has {len(doc.paragraphs)} paragraphs (0-{len(doc.paragraphs)-1})."
-        
-        paragraph = doc.paragraphs[paragraph_index]
-        text = paragraph.text
-        
-        # Validate text positions
-        if start_pos < 0 or end_pos > len(text) or start_pos >= end_pos:
-            return f"Invalid text positions. Paragraph has {len(text)} characters."
-        
-        # Get the text to format
-        target_text = text[start_pos:end_pos]
-        
-        # Clear existing runs and create three runs: before, target, after
-        for run in paragraph.runs:
-            run.clear()
-        
-        # Add text before target
-        if start_pos > 0:
-            run_before = paragraph.add_run(text[:start_pos])
-        
-        # Add target text with formatting
-        run_target = paragraph.add_run(target_text)
-        if bold is not None:
-            run_target.bold = bold
-        if italic is not None:
-            run_target.italic = italic
-        if underline is not None:
-            run_target.underline = underline
-        if color:
-            # Define common RGB colors
-            color_map = {
-                'red': RGBColor(255, 0, 0),
-                'blue': RGBColor(0, 0, 255),
-                'green': RGBColor(0, 128, 0),
-                'yellow': RGBColor(255, 255, 0),
-                'black': RGBColor(0, 0, 0),
-                'gray': RGBColor(128, 128, 128),
-                'white': RGBColor(255, 255, 255),
-                'purple': RGBColor(128, 0, 128),
-                'orange': RGBColor(255, 165, 0)
-            }
-            
-            try:
-                if color.lower() in color_map:
-                    # Use predefined RGB color
-                    run_target.font.color.rgb = color_map[color.lower()]
-                else:
-                    # Try to set color by name
-                    run_target.font.color.rgb = RGBColor.from_string(color)
-            except Exception as e:
-                # If all else fails, default to black
-                run_target.font.color.rgb = RGBColor(0, 0, 0)
-        if font_size:
-            run_target.font.size = Pt(font_size)
-        if font_name:
-            run_target.font.name = font_name
-        
-        # Add text after target
-        if end_pos < len(text):
-            run_after = paragraph.add_run(text[end_pos:])
+        try:
+            target_text = format_text_in_doc(doc, paragraph_index, start_pos, end_pos,
+                                             bold=bold, italic=italic, underline=underline,
+                                             color=color, font_size=font_size, font_name=font_name)
+        except ValueError as e:
+            return str(e)
         
         doc.save(filename)
         return f"Text '{target_text}' formatted successfully in paragraph {paragraph_index}."
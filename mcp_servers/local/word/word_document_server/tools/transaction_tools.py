@@ -0,0 +1,174 @@
+"""
+Transaction tools for Word Document Server.
+
+These tools apply a batch of edit operations to a document that is loaded
+and saved only once, instead of once per operation.
+"""
+import os
+import json
+from typing import List, Dict, Any, Callable
+from docx import Document
+
+from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension
+from word_document_server.utils.document_utils import find_and_replace_text
+from word_document_server.utils.text_index import DocumentTextIndex
+from word_document_server.core.content import add_heading_to_doc, add_paragraph_to_doc, add_table_to_doc, format_text_in_doc
+from word_document_server.core.footnotes import add_footnote_to_doc
+from word_document_server.core.tables import apply_table_style
+
+
+def _heading(doc, text: str, level: int = 1, **formatting) -> str:
+    add_heading_to_doc(doc, text, level, **formatting)
+    return f"Heading '{text}' (level {level}) added"
+
+
+def _paragraph(doc, text: str, style: str = None, **formatting) -> str:
+    _, style_found = add_paragraph_to_doc(doc, text, style=style, **formatting)
+    if not style_found:
+        return f"Style '{style}' not found, paragraph added with default style"
+    return "Paragraph added"
+
+
+def _table(doc, rows: int, cols: int, data: List[List[str]] = None) -> str:
+    add_table_to_doc(doc, rows, cols, data)
+    return f"Table ({rows}x{cols}) added"
+
+
+def _page_break(doc) -> str:
+    doc.add_page_break()
+    return "Page break added"
+
+
+def _format_text(doc, paragraph_index: int, start_pos: int, end_pos: int, **formatting) -> str:
+    target_text = format_text_in_doc(doc, paragraph_index, start_pos, end_pos, **formatting)
+    return f"Text '{target_text}' formatted in paragraph {paragraph_index}"
+
+
+def _format_table(doc, table_index: int, has_header_row: bool = None,
+                  border_style: str = None, shading: List[List[str]] = None) -> str:
+    if table_index < 0 or table_index >= len(doc.tables):
+        raise ValueError(f"Invalid table index. Document has {len(doc.tables)} tables (0-{len(doc.tables)-1}).")
+    if not apply_table_style(doc.tables[table_index], has_header_row or False, border_style, shading):
+        raise ValueError(f"Failed to format table at index {table_index}.")
+    return f"Table at index {table_index} formatted"
+
+
+def _footnote(doc, footnote_text: str, paragraph_index: int = None,
+              search_text: str = None, position: str = "after") -> str:
+    footnote_id = add_footnote_to_doc(doc, footnote_text, search_text=search_text,
+                                      paragraph_index=paragraph_index, position=position)
+    return f"Footnote (ID: {footnote_id}) added"
+
+
+def _search_replace(doc, find_text: str, replace_text: str, use_regex: bool = False,
+                    match_case: bool = True, index: DocumentTextIndex = None) -> str:
+    count = find_and_replace_text(doc, find_text, replace_text, regex=use_regex,
+                                  match_case=match_case, index=index)
+    return f"Replaced {count} occurrence(s) of '{find_text}'"
+
+
+# Operation type -> handler taking (doc, **params) and returning a result message
+OPERATIONS: Dict[str, Callable[..., str]] = {
+    "heading": _heading,
+    "paragraph": _paragraph,
+    "table": _table,
+    "page_break": _page_break,
+    "format_text": _format_text,
+    "format_table": _format_table,
+    "footnote": _footnote,
+    "search_replace": _search_replace,
+}
+
+# Operations that can share one text index; any other operation invalidates it
+INDEXED_OPERATIONS = {"search_replace"}
+
+
+def apply_operations_to_doc(doc, operations: List[Dict[str, Any]], atomic: bool = False) -> List[Dict[str, Any]]:
+    """
+    Apply operations to a loaded Document in order.
+
+    Args:
+        doc: Document object
+        operations: List of dicts with a "type" key plus that operation's parameters
+        atomic: Stop at the first failed operation
+
+    Returns:
+        One result dict per attempted operation
+    """
+    results = []
+    text_index = None
+    for index, operation in enumerate(operations):
+        params = dict(operation) if isinstance(operation, dict) else {}
+        op_type = params.pop("type", None)
+        handler = OPERATIONS.get(op_type)
+        if op_type in INDEXED_OPERATIONS:
+            text_index = text_index or DocumentTextIndex(doc)
+            params["index"] = text_index
+        else:
+            text_index = None
+        if handler is None:
+            result = {"index": index, "type": op_type, "success": False,
+                      "error": f"Unknown operation type '{op_type}'. Supported: {', '.join(OPERATIONS)}"}
+        else:
+            try:
+                result = {"index": index, "type": op_type, "success": True, "message": handler(doc, **params)}
+            except TypeError as e:
+                result = {"index": index, "type": op_type, "success": False, "error": f"Invalid parameters: {str(e)}"}
+            except Exception as e:
+                result = {"index": index, "type": op_type, "success": False, "error": str(e)}
+        results.append(result)
+        if atomic and not result["success"]:
+            break
+    return results
+
+
+async def apply_document_operations(filename: str, operations: List[Dict[str, Any]],
+                                    atomic: bool = False) -> str:
+    """Apply a batch of edit operations to a Word document with a single load and save.
+
+    Args:
+        filename: Path to the Word document
+        operations: List of operations applied in order. Each is a dict with a "type" and
+            the parameters of the matching single-call tool:
+            heading (text, level, font_name, font_size, bold, italic, border_bottom),
+            paragraph (text, style, font_name, font_size, bold, italic, color),
+            table (rows, cols, data), page_break (),
+            format_text (paragraph_index, start_pos, end_pos, bold, italic, underline, color, font_size, font_name),
+            format_table (table_index, has_header_row, border_style, shading),
+            footnote (footnote_text, paragraph_index or search_text, position),
+            search_replace (find_text, replace_text, use_regex, match_case)
+        atomic: If True, stop at the first failed operation and leave the file unchanged
+    """
+    filename = ensure_docx_extension(filename)
+
+    if not isinstance(operations, list) or not operations:
+        return "Invalid parameter: operations must be a non-empty list"
+
+    if not os.path.exists(filename):
+        return f"Document {filename} does not exist"
+
+    # Check if file is writeable
+    is_writeable, error_message = check_file_writeable(filename)
+    if not is_writeable:
+        return f"Cannot modify document: {error_message}. Consider creating a copy first."
+
+    try:
+        doc = Document(filename)
+        results = apply_operations_to_doc(doc, operations, atomic)
+
+        succeeded = sum(1 for result in results if result["success"])
+        failed = len(results) - succeeded
+        saved = succeeded > 0 and not (atomic and failed)
+        if saved:
+            doc.save(filename)
+
+        return json.dumps({
+            "filename": filename,
+            "saved": saved,
+            "succeeded": succeeded,
+            "failed": failed,
+            "skipped": len(operations) - len(results),
+            "results": results,
+        }, indent=2)
+    except Exception as e:
+        return f"Failed to apply operations: {str(e)}"
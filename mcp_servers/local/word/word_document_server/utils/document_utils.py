@@ -9,6 +9,8 @@ from docx.oxml.text.paragraph import CT_P
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+from word_document_server.utils.text_index import DocumentTextIndex
+
 
 def get_document_properties(doc_path: str) -> Dict[str, Any]:
     """Get properties of a Word document."""
@@ -112,7 +114,7 @@ def get_document_structure(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Failed to get document structure: {str(e)}"}
 
 
-def find_paragraph_by_text(doc, text, partial_match=False):
+def find_paragraph_by_text(doc, text, partial_match=False, index=None):
     """
     Find paragraphs containing specific text.
     
@@ -120,61 +122,35 @@ def find_paragraph_by_text(doc, text, partial_match=False):
         doc: Document object
         text: Text to search for
         partial_match: If True, matches paragraphs containing the text; if False, matches exact text
+        index: Optional DocumentTextIndex of doc to reuse across queries
         
     Returns:
         List of paragraph indices that match the criteria
     """
-    matching_paragraphs = []
-    
-    for i, para in enumerate(doc.paragraphs):
-        if partial_match and text in para.text:
-            matching_paragraphs.append(i)
-        elif not partial_match and para.text == text:
-            matching_paragraphs.append(i)
-            
-    return matching_paragraphs
+    index = index or DocumentTextIndex(doc)
+    return index.find_paragraphs(text, partial_match)
 
 
-def find_and_replace_text(doc, old_text, new_text):
+def find_and_replace_text(doc, old_text, new_text, regex=False, match_case=True, index=None):
     """
     Find and replace text throughout the document, skipping Table of Contents (TOC) paragraphs.
     
+    Matches that span several formatting runs are replaced too; the replacement
+    takes the formatting of the run where the match starts.
+    
     Args:
         doc: Document object
-        old_text: Text to find
-        new_text: Text to replace with
+        old_text: Text (or regular expression if regex is True) to find
+        new_text: Text to replace with; may use group references when regex is True
+        regex: Treat old_text as a regular expression
+        match_case: Whether to perform case-sensitive matching
+        index: Optional DocumentTextIndex of doc to reuse across queries
         
     Returns:
         Number of replacements made
     """
-    count = 0
-    
-    # Search in paragraphs
-    for para in doc.paragraphs:
-        # Skip TOC paragraphs
-        if para.style and para.style.name.startswith("TOC"):
-            continue
-        if old_text in para.text:
-            for run in para.runs:
-                if old_text in run.text:
-                    run.text = run.text.replace(old_text, new_text)
-                    count += 1
-    
-    # Search in tables
-    for table in doc.tables:
-        for row in table.rows:
-            for cell in row.cells:
-                for para in cell.paragraphs:
-                    # Skip TOC paragraphs in tables
-                    if para.style and para.style.name.startswith("TOC"):
-                        continue
-                    if old_text in para.text:
-                        for run in para.runs:
-                            if old_text in run.text:
-                                run.text = run.text.replace(old_text, new_text)
-                                count += 1
-    
-    return count
+    index = index or DocumentTextIndex(doc)
+    return index.replace(old_text, new_text, regex=regex, match_case=match_case)
 
 
 def get_document_xml(doc_path: str) -> str:
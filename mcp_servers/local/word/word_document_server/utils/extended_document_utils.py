@@ -1,9 +1,12 @@
 """
 Extended document utilities for Word Document Server.
 """
+import re
 from typing import Dict, List, Any, Tuple
 from docx import Document
 
+from word_document_server.utils.text_index import DocumentTextIndex, compile_query
+
 
 def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
     """
@@ -39,7 +42,8 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Failed to get paragraph text: {str(e)}"}
 
 
-def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> Dict[str, Any]:
+def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_word: bool = False,
+              use_regex: bool = False) -> Dict[str, Any]:
     """
     Find all occurrences of specific text in a Word document.
     
@@ -48,6 +52,7 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
         text_to_find: Text to search for
         match_case: Whether to perform case-sensitive search
         whole_word: Whether to match whole words only
+        use_regex: Treat text_to_find as a regular expression
     
     Returns:
         Dictionary with search results
@@ -59,6 +64,11 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
     if not text_to_find:
         return {"error": "Search text cannot be empty"}
     
+    try:
+        pattern = compile_query(text_to_find, use_regex, match_case, whole_word)
+    except re.error as e:
+        return {"error": f"Invalid regular expression: {str(e)}"}
+    
     try:
         doc = Document(doc_path)
         results = {
@@ -69,97 +79,22 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
             "total_count": 0
         }
         
-        # Search in paragraphs
-        for i, para in enumerate(doc.paragraphs):
-            # Prepare text for comparison
-            para_text = para.text
-            search_text = text_to_find
-            
-            if not match_case:
-                para_text = para_text.lower()
-                search_text = search_text.lower()
-            
-            # Find all occurrences (simple implementation)
-            start_pos = 0
-            while True:
-                if whole_word:
-                    # For whole word search, we need to check word boundaries
-                    words = para_text.split()
-                    found = False
-                    for word_idx, word in enumerate(words):
-                        if (word == search_text or 
-                            (not match_case and word.lower() == search_text.lower())):
-                            results["occurrences"].append({
-                                "paragraph_index": i,
-                                "position": word_idx,
-                                "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                            })
-                            results["total_count"] += 1
-                            found = True
-                    
-                    # Break after checking all words
-                    break
-                else:
-                    # For substring search
-                    pos = para_text.find(search_text, start_pos)
-                    if pos == -1:
-                        break
-                    
-                    results["occurrences"].append({
-                        "paragraph_index": i,
-                        "position": pos,
-                        "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                    })
-                    results["total_count"] += 1
-                    start_pos = pos + len(search_text)
-        
-        # Search in tables
-        for table_idx, table in enumerate(doc.tables):
-            for row_idx, row in enumerate(table.rows):
-                for col_idx, cell in enumerate(row.cells):
-                    for para_idx, para in enumerate(cell.paragraphs):
-                        # Prepare text for comparison
-                        para_text = para.text
-                        search_text = text_to_find
-                        
-                        if not match_case:
-                            para_text = para_text.lower()
-                            search_text = search_text.lower()
-                        
-                        # Find all occurrences (simple implementation)
-                        start_pos = 0
-                        while True:
-                            if whole_word:
-                                # For whole word search, check word boundaries
-                                words = para_text.split()
-                                found = False
-                                for word_idx, word in enumerate(words):
-                                    if (word == search_text or 
-                                        (not match_case and word.lower() == search_text.lower())):
-                                        results["occurrences"].append({
-                                            "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                            "position": word_idx,
-                                            "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                                        })
-                                        results["total_count"] += 1
-                                        found = True
-                                
-                                # Break after checking all words
-                                break
-                            else:
-                                # For substring search
-                                pos = para_text.find(search_text, start_pos)
-                                if pos == -1:
-                                    break
-                                
-                                results["occurrences"].append({
-                                    "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                    "position": pos,
-                                    "context": para.text[:100] + ("..." if len(para.text) > 100 else "")
-                                })
-                                results["total_count"] += 1
-                                start_pos = pos + len(search_text)
+        for match in DocumentTextIndex(doc).finditer(pattern):
+            location = match.entry.location
+            text = match.entry.text
+            occurrence = {
+                "position": match.start,
+                "match": match.text,
+                "context": text[:100] + ("..." if len(text) > 100 else "")
+            }
+            if match.entry.in_table:
+                occurrence["location"] = (f"Table {location['table_index']}, Row {location['row_index']}, "
+                                          f"Column {location['col_index']}")
+            else:
+                occurrence["paragraph_index"] = location["paragraph_index"]
+            results["occurrences"].append(occurrence)
         
+        results["total_count"] = len(results["occurrences"])
         return results
     except Exception as e:
         return {"error": f"Failed to search for text: {str(e)}"}
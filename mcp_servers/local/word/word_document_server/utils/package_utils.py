@@ -0,0 +1,235 @@
+"""
+Package (ZIP) utility functions for Word Document Server.
+
+Rewrites a .docx package when only a few parts change. Unchanged members are
+copied as their stored compressed bytes, so images, fonts and other media are
+never decompressed or recompressed; only the replaced parts are deflated.
+"""
+import os
+import struct
+import tempfile
+import zipfile
+import zlib
+from typing import Dict, Iterable, Optional, Union
+
+# ZIP record layouts (APPNOTE.TXT 4.3.7, 4.3.12, 4.3.16)
+_LOCAL_HEADER = struct.Struct('<4s2B4HL2L2H')
+_CENTRAL_HEADER = struct.Struct('<4s4B4HL2L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+_LOCAL_SIGNATURE = b'PK\x03\x04'
+_CENTRAL_SIGNATURE = b'PK\x01\x02'
+_END_SIGNATURE = b'PK\x05\x06'
+
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+_FLAG_UTF8 = 0x800
+_ZIP64_LIMIT = 0xFFFFFFFF
+_MAX_ENTRIES = 0xFFFF
+_VERSION = 20
+_STREAM_CHUNK_SIZE = 1024 * 1024
+
+PartData = Union[bytes, Iterable[bytes]]
+
+
+class _Entry:
+    """Central directory data for one member written to the new package."""
+
+    def __init__(self, name: bytes, flags: int, method: int, dostime: int, dosdate: int,
+                 crc: int, compress_size: int, file_size: int, offset: int,
+                 create_system: int = 0, external_attr: int = 0):
+        self.name = name
+        self.flags = flags
+        self.method = method
+        self.dostime = dostime
+        self.dosdate = dosdate
+        self.crc = crc
+        self.compress_size = compress_size
+        self.file_size = file_size
+        self.offset = offset
+        self.create_system = create_system
+        self.external_attr = external_attr
+
+
+def _encode_name(name: str):
+    try:
+        return name.encode('ascii'), 0
+    except UnicodeEncodeError:
+        return name.encode('utf-8'), _FLAG_UTF8
+
+
+def _dos_datetime(date_time) -> tuple:
+    year, month, day, hour, minute, second = date_time
+    dosdate = (max(year, 1980) - 1980) << 9 | month << 5 | day
+    dostime = hour << 11 | minute << 5 | second // 2
+    return dostime, dosdate
+
+
+def _write_local_header(out, entry: _Entry):
+    out.write(_LOCAL_HEADER.pack(
+        _LOCAL_SIGNATURE, _VERSION, 0, entry.flags, entry.method, entry.dostime, entry.dosdate,
+        entry.crc, entry.compress_size, entry.file_size, len(entry.name), 0
+    ))
+    out.write(entry.name)
+
+
+def _copy_raw(zin: zipfile.ZipFile, src, info: zipfile.ZipInfo, out) -> _Entry:
+    """Copy a member's compressed bytes verbatim from the source archive."""
+    src.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(src.read(_LOCAL_HEADER.size))
+    if header[0] != _LOCAL_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    # Skip the local name and extra field; their lengths may differ from the central directory
+    src.seek(header[10] + header[11], os.SEEK_CUR)
+
+    name, name_flag = _encode_name(info.filename)
+    dostime, dosdate = _dos_datetime(info.date_time)
+    entry = _Entry(
+        name, (info.flag_bits & ~(_FLAG_DATA_DESCRIPTOR | _FLAG_UTF8)) | name_flag,
+        info.compress_type, dostime, dosdate, info.CRC, info.compress_size, info.file_size,
+        out.tell(), info.create_system, info.external_attr
+    )
+    _write_local_header(out, entry)
+
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.read(min(remaining, _STREAM_CHUNK_SIZE))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        out.write(chunk)
+        remaining -= len(chunk)
+    return entry
+
+
+def _chunked(data: bytes):
+    view = memoryview(data)
+    for start in range(0, len(view), _STREAM_CHUNK_SIZE):
+        yield view[start:start + _STREAM_CHUNK_SIZE]
+
+
+def _write_deflated(name: str, data: PartData, out, date_time, compresslevel: int) -> _Entry:
+    """Deflate a new or replaced member, streaming it chunk by chunk."""
+    encoded, name_flag = _encode_name(name)
+    dostime, dosdate = _dos_datetime(date_time)
+    entry = _Entry(encoded, name_flag, zipfile.ZIP_DEFLATED, dostime, dosdate, 0, 0, 0, out.tell(),
+                   external_attr=0o600 << 16)
+    _write_local_header(out, entry)
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = _chunked(data)
+
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    crc = 0
+    for chunk in data:
+        crc = zlib.crc32(chunk, crc)
+        entry.file_size += len(chunk)
+        compressed = compressor.compress(chunk)
+        entry.compress_size += len(compressed)
+        out.write(compressed)
+    compressed = compressor.flush()
+    entry.compress_size += len(compressed)
+    out.write(compressed)
+    entry.crc = crc
+
+    if entry.file_size >= _ZIP64_LIMIT or entry.compress_size >= _ZIP64_LIMIT:
+        raise zipfile.LargeZipFile(f"{name} is too large for a non-ZIP64 package")
+
+    # Patch the header now that sizes and CRC are known
+    end = out.tell()
+    out.seek(entry.offset)
+    _write_local_header(out, entry)
+    out.seek(end)
+    return entry
+
+
+def _write_central_directory(out, entries):
+    start = out.tell()
+    for entry in entries:
+        out.write(_CENTRAL_HEADER.pack(
+            _CENTRAL_SIGNATURE, _VERSION, entry.create_system, _VERSION, 0, entry.flags, entry.method,
+            entry.dostime, entry.dosdate, entry.crc, entry.compress_size, entry.file_size,
+            len(entry.name), 0, 0, 0, 0, entry.external_attr, entry.offset
+        ))
+        out.write(entry.name)
+    size = out.tell() - start
+    if start >= _ZIP64_LIMIT:
+        raise zipfile.LargeZipFile("Package is too large for a non-ZIP64 archive")
+    out.write(_END_RECORD.pack(_END_SIGNATURE, 0, 0, len(entries), len(entries), size, start, 0))
+
+
+def _can_copy_raw(info: zipfile.ZipInfo) -> bool:
+    return (
+        not info.flag_bits & _FLAG_ENCRYPTED
+        and info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        and info.file_size < _ZIP64_LIMIT
+        and info.compress_size < _ZIP64_LIMIT
+        and info.header_offset < _ZIP64_LIMIT
+    )
+
+
+def rewrite_package(source: str, replacements: Dict[str, Optional[PartData]],
+                    output: Optional[str] = None, compresslevel: int = 6) -> Dict[str, int]:
+    """
+    Rewrite a ZIP package, replacing only the given members.
+
+    Unchanged members keep their compressed bytes. The package is written to a
+    temporary file in the destination directory and swapped in atomically.
+
+    Args:
+        source: Path to the existing package
+        replacements: Member name -> new content (bytes or an iterable of byte chunks).
+            None removes the member; names not in the source are appended.
+        output: Destination path (defaults to overwriting source)
+        compresslevel: zlib level used for the replaced members
+
+    Returns:
+        Counts of copied, written and removed members
+    """
+    output = output or source
+    directory = os.path.dirname(os.path.abspath(output))
+    fd, temp_path = tempfile.mkstemp(prefix='.', suffix='.docx.tmp', dir=directory)
+    stats = {'copied': 0, 'written': 0, 'removed': 0}
+
+    try:
+        with os.fdopen(fd, 'w+b') as out, zipfile.ZipFile(source, 'r') as zin, open(source, 'rb') as src:
+            infos = zin.infolist()
+            if len(infos) + len(replacements) > _MAX_ENTRIES:
+                raise zipfile.LargeZipFile("Too many members for a non-ZIP64 package")
+
+            entries = []
+            pending = dict(replacements)
+            for info in infos:
+                if info.filename in pending:
+                    data = pending.pop(info.filename)
+                    if data is None:
+                        stats['removed'] += 1
+                        continue
+                    entries.append(_write_deflated(info.filename, data, out, info.date_time, compresslevel))
+                    stats['written'] += 1
+                elif _can_copy_raw(info):
+                    entries.append(_copy_raw(zin, src, info, out))
+                    stats['copied'] += 1
+                else:
+                    with zin.open(info) as member:
+                        chunks = iter(lambda: member.read(_STREAM_CHUNK_SIZE), b'')
+                        entries.append(_write_deflated(info.filename, chunks, out, info.date_time, compresslevel))
+                    stats['written'] += 1
+
+            # Parts that did not exist yet, e.g. a first word/footnotes.xml
+            for name, data in pending.items():
+                if data is not None:
+                    entries.append(_write_deflated(name, data, out, (1980, 1, 1, 0, 0, 0), compresslevel))
+                    stats['written'] += 1
+
+            _write_central_directory(out, entries)
+            out.flush()
+            os.fsync(out.fileno())
+
+        if os.path.exists(output):
+            os.chmod(temp_path, os.stat(output).st_mode & 0o7777)
+        os.replace(temp_path, output)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+    return stats
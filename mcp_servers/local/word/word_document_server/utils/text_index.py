@@ -0,0 +1,213 @@
+"""
+Text index for Word documents.
+
+Builds, once per loaded document, the text of every body and table paragraph
+together with the character span of each run. Searches then run over plain
+strings instead of re-walking the XML tree, matches may span formatting runs,
+and replacements are written back into the runs they cover.
+"""
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple, Union
+
+
+@dataclass
+class IndexedParagraph:
+    """A paragraph with its location and run spans."""
+    paragraph: Any
+    location: Dict[str, int]
+    style_name: str
+    text: str = ""
+    # (start, end, run) per run, offsets relative to the paragraph text
+    runs: List[Tuple[int, int, Any]] = field(default_factory=list)
+
+    @property
+    def in_table(self) -> bool:
+        return "table_index" in self.location
+
+    @property
+    def is_toc(self) -> bool:
+        return self.style_name.startswith("TOC")
+
+    def refresh(self):
+        """Re-read the runs of this paragraph after it was modified."""
+        self.runs = []
+        offset = 0
+        for item in self.paragraph.iter_inner_content():
+            # Hyperlinks hold their own runs
+            for run in getattr(item, "runs", None) or [item]:
+                text = run.text
+                self.runs.append((offset, offset + len(text), run))
+                offset += len(text)
+        self.text = "".join(run.text for _, _, run in self.runs)
+
+
+@dataclass
+class TextMatch:
+    """A match inside one paragraph; start/end are offsets in the paragraph text."""
+    entry: IndexedParagraph
+    start: int
+    end: int
+    text: str
+    match: Optional[re.Match] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {**self.entry.location, "position": self.start, "text": self.text}
+
+
+def compile_query(query: Union[str, Pattern], regex: bool = False, match_case: bool = True,
+                  whole_word: bool = False) -> Pattern:
+    """Compile a literal or regex query into a pattern.
+
+    Paragraphs are joined with ``"\\n"``, so ``^`` and ``$`` are compiled with
+    ``re.MULTILINE`` to anchor at paragraph boundaries.
+    """
+    if isinstance(query, re.Pattern):
+        return query
+    pattern = query if regex else re.escape(query)
+    if whole_word:
+        pattern = rf"\b(?:{pattern})\b"
+    flags = re.MULTILINE if match_case else re.MULTILINE | re.IGNORECASE
+    return re.compile(pattern, flags)
+
+
+class DocumentTextIndex:
+    """Character-offset index over the paragraphs of a Document."""
+
+    # Joins paragraph texts; matches crossing it are discarded
+    SEPARATOR = "\n"
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.paragraphs: List[IndexedParagraph] = []
+        self._text: Optional[str] = None
+        self._starts: List[int] = []
+
+        for i, para in enumerate(doc.paragraphs):
+            self._add(para, {"paragraph_index": i})
+
+        # Merged cells repeat the same cell object; index each paragraph once
+        seen = set()
+        for table_index, table in enumerate(doc.tables):
+            for row_index, row in enumerate(table.rows):
+                for col_index, cell in enumerate(row.cells):
+                    for cell_paragraph_index, para in enumerate(cell.paragraphs):
+                        if id(para._p) in seen:
+                            continue
+                        seen.add(id(para._p))
+                        self._add(para, {
+                            "table_index": table_index,
+                            "row_index": row_index,
+                            "col_index": col_index,
+                            "cell_paragraph_index": cell_paragraph_index,
+                        })
+
+    def _add(self, para, location: Dict[str, int]):
+        entry = IndexedParagraph(para, location, para.style.name if para.style else "Normal")
+        entry.refresh()
+        self.paragraphs.append(entry)
+
+    def _joined(self) -> str:
+        if self._text is None:
+            self._starts = []
+            offset = 0
+            for entry in self.paragraphs:
+                self._starts.append(offset)
+                offset += len(entry.text) + len(self.SEPARATOR)
+            self._text = self.SEPARATOR.join(entry.text for entry in self.paragraphs)
+        return self._text
+
+    @property
+    def text(self) -> str:
+        """All indexed text, one paragraph per line."""
+        return self._joined()
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def finditer(self, query: Union[str, Pattern], regex: bool = False, match_case: bool = True,
+                 whole_word: bool = False, skip_toc: bool = False) -> Iterator[TextMatch]:
+        """Yield matches in document order; body paragraphs first, then tables."""
+        pattern = compile_query(query, regex, match_case, whole_word)
+        text = self._joined()
+        for m in pattern.finditer(text):
+            if m.start() == m.end():
+                continue
+            index = bisect_right(self._starts, m.start()) - 1
+            entry = self.paragraphs[index]
+            start = m.start() - self._starts[index]
+            end = m.end() - self._starts[index]
+            if end > len(entry.text) or (skip_toc and entry.is_toc):
+                continue
+            yield TextMatch(entry, start, end, m.group(0), m)
+
+    def search(self, query: Union[str, Pattern], **options) -> List[TextMatch]:
+        return list(self.finditer(query, **options))
+
+    def count(self, query: Union[str, Pattern], **options) -> int:
+        return sum(1 for _ in self.finditer(query, **options))
+
+    def find_paragraphs(self, text: str, partial_match: bool = False) -> List[int]:
+        """Indices of body paragraphs containing (or equal to) text."""
+        return [
+            entry.location["paragraph_index"] for entry in self.paragraphs
+            if not entry.in_table and ((text in entry.text) if partial_match else entry.text == text)
+        ]
+
+    # ------------------------------------------------------------------
+    # Replace
+    # ------------------------------------------------------------------
+
+    def replace(self, query: Union[str, Pattern], replacement: str, regex: bool = False,
+                match_case: bool = True, whole_word: bool = False, skip_toc: bool = True,
+                max_count: int = 0) -> int:
+        """
+        Replace matches, including ones spanning several runs.
+
+        The replacement takes the formatting of the run where the match starts;
+        text before and after the match keeps its own runs. With regex=True the
+        replacement may use group references such as \\1.
+
+        Returns:
+            Number of replacements made
+        """
+        matches = self.search(query, regex=regex, match_case=match_case,
+                              whole_word=whole_word, skip_toc=skip_toc)
+        if max_count:
+            matches = matches[:max_count]
+        if not matches:
+            return 0
+
+        expand = regex or isinstance(query, re.Pattern)
+        by_paragraph: Dict[int, List[TextMatch]] = {}
+        for match in matches:
+            by_paragraph.setdefault(id(match.entry), []).append(match)
+
+        for paragraph_matches in by_paragraph.values():
+            entry = paragraph_matches[0].entry
+            # Back to front so earlier offsets stay valid
+            for match in reversed(paragraph_matches):
+                new_text = match.match.expand(replacement) if expand else replacement
+                self._replace_span(entry, match.start, match.end, new_text)
+            entry.refresh()
+
+        self._text = None
+        return len(matches)
+
+    @staticmethod
+    def _replace_span(entry: IndexedParagraph, start: int, end: int, new_text: str):
+        inserted = False
+        for run_start, run_end, run in entry.runs:
+            # Only touch runs holding matched text; empty runs (footnote marks, drawings) stay
+            if run_end <= start or run_start >= end or run_start == run_end:
+                continue
+            text = run.text
+            head = text[:max(start - run_start, 0)]
+            tail = text[min(end - run_start, len(text)):]
+            if not inserted:
+                run.text = head + new_text + tail
+                inserted = True
+            else:
+                run.text = head + tail
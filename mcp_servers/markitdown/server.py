@@ -1,12 +1,20 @@
 import os
+import asyncio
+import hashlib
 import logging
 import contextlib
+import mimetypes
 import tempfile
+import time
+from collections import OrderedDict
 from collections.abc import AsyncIterator
-from typing import Annotated
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Annotated, Optional
+from urllib.parse import urlparse
 
 import click
-import requests
+import httpx
 from markitdown import MarkItDown
 import mcp.types as types
 from mcp.server.lowlevel import Server
@@ -26,6 +34,196 @@ logger = logging.getLogger("markitdown-mcp-server")
 MARKITDOWN_MCP_SERVER_PORT = int(os.getenv("MARKITDOWN_MCP_SERVER_PORT", "5000"))
 
 
+# Download / conversion limits
+MARKITDOWN_MAX_DOWNLOAD_BYTES = int(os.getenv("MARKITDOWN_MAX_DOWNLOAD_BYTES", str(100 * 1024 * 1024)))
+MARKITDOWN_DOWNLOAD_TIMEOUT = float(os.getenv("MARKITDOWN_DOWNLOAD_TIMEOUT", "60"))
+MARKITDOWN_CONVERT_WORKERS = int(os.getenv("MARKITDOWN_CONVERT_WORKERS", str(min(4, os.cpu_count() or 1))))
+MARKITDOWN_CACHE_TTL = int(os.getenv("MARKITDOWN_CACHE_TTL", "3600"))
+MARKITDOWN_CACHE_MAX_ENTRIES = int(os.getenv("MARKITDOWN_CACHE_MAX_ENTRIES", "128"))
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Content types that mimetypes.guess_extension does not map (or maps poorly)
+CONTENT_TYPE_EXTENSIONS = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
+    "application/vnd.ms-excel": ".xls",
+    "application/epub+zip": ".epub",
+    "application/zip": ".zip",
+    "application/json": ".json",
+    "application/xml": ".xml",
+    "text/xml": ".xml",
+    "text/html": ".html",
+    "text/csv": ".csv",
+    "text/plain": ".txt",
+    "text/markdown": ".md",
+}
+
+
+class DownloadError(Exception):
+    """Raised when a resource cannot be downloaded for conversion."""
+
+
+# Content-hash keyed caches: uri -> (sha256, fetched_at) and sha256 -> markdown
+_uri_cache: "OrderedDict[str, tuple[str, float]]" = OrderedDict()
+_markdown_cache: "OrderedDict[str, str]" = OrderedDict()
+
+_converter_pool: Optional[ProcessPoolExecutor] = None
+_worker_converter: Optional[MarkItDown] = None
+
+
+def _cache_put(cache: OrderedDict, key: str, value) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > MARKITDOWN_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def _cached_markdown_for_uri(uri: str) -> Optional[str]:
+    entry = _uri_cache.get(uri)
+    if entry is None:
+        return None
+    digest, fetched_at = entry
+    if time.monotonic() - fetched_at > MARKITDOWN_CACHE_TTL:
+        _uri_cache.pop(uri, None)
+        return None
+    markdown = _markdown_cache.get(digest)
+    if markdown is not None:
+        _uri_cache.move_to_end(uri)
+        _markdown_cache.move_to_end(digest)
+    return markdown
+
+
+def _detect_extension(uri: str, content_type: Optional[str], head: bytes) -> Optional[str]:
+    """Pick a file extension from the Content-Type header, the URL path or the leading bytes."""
+    if content_type:
+        mime = content_type.split(";", 1)[0].strip().lower()
+        if mime in CONTENT_TYPE_EXTENSIONS:
+            return CONTENT_TYPE_EXTENSIONS[mime]
+        if mime and mime != "application/octet-stream":
+            guessed = mimetypes.guess_extension(mime)
+            if guessed:
+                return guessed
+
+    _, ext = os.path.splitext(urlparse(uri).path)
+    if ext:
+        return ext.lower()
+
+    if head.startswith(b"%PDF"):
+        return ".pdf"
+    if head.startswith(b"PK\x03\x04"):
+        return ".zip"
+    if head.lstrip().lower().startswith((b"<!doctype html", b"<html")):
+        return ".html"
+    return None
+
+
+async def _download_to_tempfile(uri: str) -> tuple[str, str, Optional[str]]:
+    """Stream a resource to a temporary file.
+
+    Returns:
+        A tuple of (temp file path, sha256 hex digest, detected extension).
+    """
+    async with httpx.AsyncClient(follow_redirects=True, timeout=MARKITDOWN_DOWNLOAD_TIMEOUT) as client:
+        async with client.stream("GET", uri) as response:
+            if response.status_code != 200:
+                raise DownloadError(
+                    f"Failed to download the resource. Status code: {response.status_code}"
+                )
+
+            content_length = response.headers.get("content-length")
+            if content_length and content_length.isdigit() and int(content_length) > MARKITDOWN_MAX_DOWNLOAD_BYTES:
+                raise DownloadError(
+                    f"Resource is too large ({content_length} bytes). "
+                    f"Maximum supported size is {MARKITDOWN_MAX_DOWNLOAD_BYTES} bytes."
+                )
+
+            hasher = hashlib.sha256()
+            head = b""
+            size = 0
+            temp_file = tempfile.NamedTemporaryFile(delete=False)
+            try:
+                with temp_file:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > MARKITDOWN_MAX_DOWNLOAD_BYTES:
+                            raise DownloadError(
+                                f"Resource exceeds the maximum supported size of {MARKITDOWN_MAX_DOWNLOAD_BYTES} bytes."
+                            )
+                        if len(head) < 512:
+                            head += chunk[: 512 - len(head)]
+                        hasher.update(chunk)
+                        temp_file.write(chunk)
+            except BaseException:
+                os.unlink(temp_file.name)
+                raise
+
+            extension = _detect_extension(uri, response.headers.get("content-type"), head)
+            return temp_file.name, hasher.hexdigest(), extension
+
+
+def _init_converter_worker() -> None:
+    """Process pool initializer: build one MarkItDown instance per worker."""
+    global _worker_converter
+    _worker_converter = MarkItDown()
+
+
+def _convert_in_worker(path: str, extension: Optional[str]) -> str:
+    global _worker_converter
+    if _worker_converter is None:
+        _worker_converter = MarkItDown()
+    return _worker_converter.convert_local(path, file_extension=extension).markdown
+
+
+def _warm_worker() -> None:
+    """No-op task; submitting one per worker makes the pool start them up front."""
+
+
+async def _start_converter_pool() -> None:
+    """Start the conversion workers, so the first request doesn't pay for their startup."""
+    loop = asyncio.get_running_loop()
+    pool = _get_converter_pool()
+    await asyncio.gather(
+        *(loop.run_in_executor(pool, _warm_worker) for _ in range(MARKITDOWN_CONVERT_WORKERS))
+    )
+    logger.info(f"Started {MARKITDOWN_CONVERT_WORKERS} conversion workers")
+
+
+def _get_converter_pool() -> ProcessPoolExecutor:
+    global _converter_pool
+    if _converter_pool is None:
+        _converter_pool = ProcessPoolExecutor(
+            max_workers=MARKITDOWN_CONVERT_WORKERS,
+            initializer=_init_converter_worker,
+        )
+    return _converter_pool
+
+
+def _shutdown_converter_pool() -> None:
+    global _converter_pool
+    if _converter_pool is not None:
+        _converter_pool.shutdown(wait=False, cancel_futures=True)
+        _converter_pool = None
+
+
+async def _convert_with_pool(path: str, extension: Optional[str]) -> str:
+    """Convert in the worker pool, replacing the pool and retrying once if a worker died."""
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _get_converter_pool()
+        try:
+            return await loop.run_in_executor(pool, _convert_in_worker, path, extension)
+        except BrokenProcessPool:
+            logger.warning("Conversion worker died, restarting the converter pool")
+            # Another request may already have replaced the broken pool
+            if _converter_pool is pool:
+                _shutdown_converter_pool()
+            if attempt:
+                raise
+
+
 async def convert_document_to_markdown(uri: str) -> str:
     """Convert a resource described by an http:, https: to markdown.
 
@@ -38,16 +236,32 @@ async def convert_document_to_markdown(uri: str) -> str:
     if not uri.startswith("http") and not uri.startswith("https"):
         return f"Unsupported uri. Only http:, https: are supported."
 
-    response = requests.get(uri)
-    if response.status_code == 200:
-        # Save the PDF to a temporary file
-        with tempfile.NamedTemporaryFile(
-            suffix=".pdf", delete=True, delete_on_close=True
-        ) as temp_file:
-            temp_file.write(response.content)
-            temp_path = temp_file.name
-            return MarkItDown().convert_uri(f"file://{temp_path}").markdown
-    return f"Failed to download the resource. Status code: {response.status_code}"
+    cached = _cached_markdown_for_uri(uri)
+    if cached is not None:
+        logger.info(f"Serving cached conversion for {uri}")
+        return cached
+
+    try:
+        temp_path, digest, extension = await _download_to_tempfile(uri)
+    except DownloadError as e:
+        return str(e)
+    except httpx.HTTPError as e:
+        return f"Failed to download the resource: {type(e).__name__}: {e}"
+
+    try:
+        markdown = _markdown_cache.get(digest)
+        if markdown is None:
+            markdown = await _convert_with_pool(temp_path, extension)
+        else:
+            logger.info(f"Content of {uri} matches a cached conversion, skipping conversion")
+    except BrokenProcessPool:
+        return "Failed to convert the resource: the conversion worker crashed."
+    finally:
+        os.unlink(temp_path)
+
+    _cache_put(_markdown_cache, digest, markdown)
+    _cache_put(_uri_cache, uri, (digest, time.monotonic()))
+    return markdown
 
 
 @click.command()
@@ -174,11 +388,13 @@ def main(
     async def lifespan(app: Starlette) -> AsyncIterator[None]:
         """Context manager for session manager."""
         async with session_manager.run():
+            await _start_converter_pool()
             logger.info("Application started with dual transports!")
             try:
                 yield
             finally:
                 logger.info("Application shutting down...")
+                _shutdown_converter_pool()
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
@@ -0,0 +1,122 @@
+"""
+Benchmark: buffered vs. streaming aggregation of a Raw Data Export.
+
+Serves a synthetic NDJSON export through an in-process httpx transport and
+counts events per name and distinct users both ways:
+
+- buffered: read the whole body, split it into lines and json.loads every
+  event into a list before counting (the previous MixpanelExportClient path)
+- streaming: aggregate_export with an EventCounter and a PropertyHistogram
+
+Each mode runs in its own process so the peak RSS figures do not mix. Run with
+
+    python benchmarks/benchmark_export_stream.py [lines] [--skip-buffered]
+"""
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import resource
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.aggregation import EventCounter, PropertyHistogram, aggregate_export
+
+EVENT_NAMES = [f"Event {i}" for i in range(40)]
+CHUNK_LINES = 512
+
+
+def synthetic_export(lines: int, seed: int = 7):
+    """Yield NDJSON chunks of roughly Mixpanel-shaped events."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(len(EVENT_NAMES))]
+    for start in range(0, lines, CHUNK_LINES):
+        batch = []
+        for i in range(start, min(start + CHUNK_LINES, lines)):
+            event = {
+                "event": rng.choices(EVENT_NAMES, weights)[0],
+                "properties": {
+                    "time": 1_700_000_000 + i,
+                    "distinct_id": f"user-{rng.randrange(250_000)}",
+                    "$insert_id": f"{i:016x}",
+                    "$browser": rng.choice(["Chrome", "Safari", "Firefox", "Edge"]),
+                    "$city": rng.choice(["Berlin", "Austin", "Lagos", "Osaka", "Lima"]),
+                    "mp_lib": "web",
+                    "plan": rng.choice(["free", "pro", "team"]),
+                },
+            }
+            batch.append(json.dumps(event))
+        yield ("\n".join(batch) + "\n").encode()
+
+
+def make_client(lines: int) -> httpx.AsyncClient:
+    async def body():
+        for chunk in synthetic_export(lines):
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"content-type": "text/plain"}, content=body())
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def buffered(lines: int) -> dict:
+    async with make_client(lines) as client:
+        response = await client.get("https://data.mixpanel.com/api/2.0/export")
+        events = [json.loads(line) for line in response.text.strip().split("\n") if line]
+    users = set()
+    counts = {}
+    for event in events:
+        users.add(event["properties"]["distinct_id"])
+        counts[event["event"]] = counts.get(event["event"], 0) + 1
+    return {"total": len(events), "unique_users": len(users), "top": max(counts, key=counts.get)}
+
+
+async def streaming(lines: int) -> dict:
+    counter = EventCounter()
+    histogram = PropertyHistogram("plan")
+    async with make_client(lines) as client:
+        await aggregate_export({}, [counter, histogram], client=client)
+    return {
+        "total": counter.total,
+        "unique_users": counter.users.count(),
+        "top": counter.top_events(1)[0]["event_name"],
+    }
+
+
+def run(mode: str, lines: int, queue) -> None:
+    os.environ.setdefault("MIXPANEL_SERVICE_ACCOUNT_USERNAME", "benchmark")
+    os.environ.setdefault("MIXPANEL_SERVICE_ACCOUNT_SECRET", "benchmark")
+    start = time.perf_counter()
+    result = asyncio.run(buffered(lines) if mode == "buffered" else streaming(lines))
+    seconds = time.perf_counter() - start
+    peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    queue.put((seconds, peak_mb, result))
+
+
+def measure(mode: str, lines: int):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(mode, lines, queue))
+    process.start()
+    outcome = queue.get()
+    process.join()
+    return outcome
+
+
+def main(lines: int, skip_buffered: bool) -> None:
+    print(f"{lines:,} events")
+    modes = ["streaming"] if skip_buffered else ["buffered", "streaming"]
+    for mode in modes:
+        seconds, peak_mb, result = measure(mode, lines)
+        print(f"  {mode:<10} {seconds:8.2f}s  peak RSS {peak_mb:8.1f} MB  "
+              f"{lines / seconds:,.0f} events/s  {result}")
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    main(int(args[0]) if args else 2_000_000, "--skip-buffered" in sys.argv)
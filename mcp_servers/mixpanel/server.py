@@ -26,6 +26,9 @@ from tools import (
     get_events,
     get_event_properties,
     get_event_property_values,
+    query_events,
+    get_event_count,
+    get_top_events,
     run_funnels_query,
     run_frequency_query,
     run_retention_query,
@@ -205,6 +208,115 @@ def main(
                 },
                 annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT_METADATA", "readOnlyHint": True}),
             ),
+            types.Tool(
+                name="mixpanel_query_events",
+                description=(
+                    "Query raw events from the Mixpanel Raw Data Export API for a date range. "
+                    "Reading stops as soon as `limit` events have been returned."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "required": ["project_id", "from_date", "to_date"],
+                    "properties": {
+                        "project_id": {
+                            "type": ["string", "integer"],
+                            "description": "The Mixpanel project ID",
+                        },
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format",
+                        },
+                        "event": {
+                            "type": "string",
+                            "description": "Optional event name to filter by",
+                        },
+                        "where": {
+                            "type": "string",
+                            "description": "Optional Mixpanel expression to filter events by",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Maximum number of events to return",
+                            "default": 1000,
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_EVENT", "readOnlyHint": True}),
+            ),
+            types.Tool(
+                name="mixpanel_get_event_count",
+                description=(
+                    "Count events in a date range, with a per-event breakdown and distinct users. "
+                    "The export is aggregated while it streams, so large ranges do not need to fit in memory."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "required": ["project_id", "from_date", "to_date"],
+                    "properties": {
+                        "project_id": {
+                            "type": ["string", "integer"],
+                            "description": "The Mixpanel project ID",
+                        },
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format",
+                        },
+                        "event": {
+                            "type": "string",
+                            "description": "Optional event name to count",
+                        },
+                        "property_name": {
+                            "type": "string",
+                            "description": "Optional event property to break the count down by (e.g., 'utm_source')",
+                        },
+                        "max_events": {
+                            "type": "integer",
+                            "description": "Stop after this many events; the counts are then lower bounds",
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_ANALYTICS", "readOnlyHint": True}),
+            ),
+            types.Tool(
+                name="mixpanel_get_top_events",
+                description="Get the most common events in a date range, with their counts and share of all events.",
+                inputSchema={
+                    "type": "object",
+                    "required": ["project_id", "from_date", "to_date"],
+                    "properties": {
+                        "project_id": {
+                            "type": ["string", "integer"],
+                            "description": "The Mixpanel project ID",
+                        },
+                        "from_date": {
+                            "type": "string",
+                            "description": "Start date in YYYY-MM-DD format",
+                        },
+                        "to_date": {
+                            "type": "string",
+                            "description": "End date in YYYY-MM-DD format",
+                        },
+                        "limit": {
+                            "type": "integer",
+                            "description": "Number of top events to return",
+                            "default": 10,
+                        },
+                        "max_events": {
+                            "type": "integer",
+                            "description": "Only analyze the first this many events of the export",
+                        },
+                    },
+                },
+                annotations=types.ToolAnnotations(**{"category": "MIXPANEL_ANALYTICS", "readOnlyHint": True}),
+            ),
             types.Tool(
                 name="mixpanel_run_funnels_query",
                 description=(
@@ -636,6 +748,116 @@ def main(
                     )
                 ]
         
+        elif name == "mixpanel_query_events":
+            project_id = arguments.get("project_id")
+            from_date = arguments.get("from_date")
+            to_date = arguments.get("to_date")
+            
+            if not project_id or not from_date or not to_date:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text="Error: project_id, from_date and to_date parameters are required",
+                    )
+                ]
+            
+            try:
+                result = await query_events(
+                    from_date,
+                    to_date,
+                    event=arguments.get("event"),
+                    where=arguments.get("where"),
+                    limit=arguments.get("limit", 1000),
+                    project_id=project_id,
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "mixpanel_get_event_count":
+            project_id = arguments.get("project_id")
+            from_date = arguments.get("from_date")
+            to_date = arguments.get("to_date")
+            
+            if not project_id or not from_date or not to_date:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text="Error: project_id, from_date and to_date parameters are required",
+                    )
+                ]
+            
+            try:
+                result = await get_event_count(
+                    from_date,
+                    to_date,
+                    event=arguments.get("event"),
+                    property_name=arguments.get("property_name"),
+                    max_events=arguments.get("max_events"),
+                    project_id=project_id,
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
+        elif name == "mixpanel_get_top_events":
+            project_id = arguments.get("project_id")
+            from_date = arguments.get("from_date")
+            to_date = arguments.get("to_date")
+            
+            if not project_id or not from_date or not to_date:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text="Error: project_id, from_date and to_date parameters are required",
+                    )
+                ]
+            
+            try:
+                result = await get_top_events(
+                    from_date,
+                    to_date,
+                    limit=arguments.get("limit", 10),
+                    max_events=arguments.get("max_events"),
+                    project_id=project_id,
+                )
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=json.dumps(result, indent=2),
+                    )
+                ]
+            except Exception as e:
+                logger.exception(f"Error executing tool {name}: {e}")
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: {str(e)}",
+                    )
+                ]
+        
         elif name == "mixpanel_run_frequency_query":
             project_id = arguments.get("project_id")
             event = arguments.get("event")
@@ -1,4 +1,12 @@
-from .events import send_events, get_events, get_event_properties, get_event_property_values
+from .events import (
+    send_events,
+    get_events,
+    get_event_properties,
+    get_event_property_values,
+    query_events,
+    get_event_count,
+    get_top_events,
+)
 from .funnels import run_funnels_query
 from .projects import get_projects
 from .base import username_context, secret_context
@@ -12,6 +20,9 @@ __all__ = [
     "get_events",
     "get_event_properties",
     "get_event_property_values",
+    "query_events",
+    "get_event_count",
+    "get_top_events",
     
     # Frequency
     "run_frequency_query",
@@ -0,0 +1,221 @@
+import contextlib
+import hashlib
+import json
+import math
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+import httpx
+
+from .base import MixpanelExportClient
+
+# Distinct values are counted exactly up to this many, then estimated with HyperLogLog
+DISTINCT_EXACT_LIMIT = 100_000
+HYPERLOGLOG_PRECISION = 14  # 16384 one-byte registers, about 0.8% standard error
+
+# Most distinct values a counter tracks before pruning the least frequent ones
+MAX_TRACKED_EVENT_NAMES = 10_000
+MAX_TRACKED_PROPERTY_VALUES = 1_000
+
+
+class DistinctCounter:
+    """Counts distinct values in bounded memory.
+
+    Exact until DISTINCT_EXACT_LIMIT values have been seen, then a HyperLogLog
+    estimate with a fixed number of registers.
+    """
+
+    def __init__(self, exact_limit: int = DISTINCT_EXACT_LIMIT, precision: int = HYPERLOGLOG_PRECISION):
+        self.exact_limit = exact_limit
+        self.precision = precision
+        self._exact: Optional[set] = set()
+        self._registers: Optional[bytearray] = None
+
+    @property
+    def estimated(self) -> bool:
+        return self._exact is None
+
+    def add(self, value: Any) -> None:
+        if self._exact is not None:
+            self._exact.add(value)
+            if len(self._exact) > self.exact_limit:
+                self._registers = bytearray(1 << self.precision)
+                for seen in self._exact:
+                    self._add_hashed(seen)
+                self._exact = None
+        else:
+            self._add_hashed(value)
+
+    def _add_hashed(self, value: Any) -> None:
+        digest = hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        remaining_bits = 64 - self.precision
+        index = hashed >> remaining_bits
+        remainder = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remainder.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def count(self) -> int:
+        if self._exact is not None:
+            return len(self._exact)
+        registers = self._registers
+        m = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in registers)
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction
+            estimate = m * math.log(m / zeros)
+        return int(round(estimate))
+
+
+class BoundedCounter:
+    """Frequency counts of values, keeping at most about 2 * max_items of them.
+
+    When the table doubles past max_items, only the max_items most frequent values
+    are kept and the counts of the rest move to `other`. Counts are exact unless
+    `approximate` is set.
+    """
+
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self.counts: Dict[Any, int] = {}
+        self.other = 0
+        self.approximate = False
+
+    def add(self, value: Any, count: int = 1) -> None:
+        counts = self.counts
+        counts[value] = counts.get(value, 0) + count
+        if len(counts) > 2 * self.max_items:
+            self._prune()
+
+    def _prune(self) -> None:
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        self.counts = dict(ranked[:self.max_items])
+        self.other += sum(count for _, count in ranked[self.max_items:])
+        self.approximate = True
+
+    def most_common(self, limit: Optional[int] = None) -> List[tuple]:
+        ranked = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)
+        return ranked[:limit] if limit else ranked
+
+
+class ExportAggregator(ABC):
+    """Consumes exported events one at a time.
+
+    `done` becomes True once the aggregator has its answer, which lets
+    aggregate_export stop reading the export early.
+    """
+
+    done = False
+
+    @abstractmethod
+    def add(self, event: Dict[str, Any]) -> None:
+        """Consume one exported event."""
+
+    @abstractmethod
+    def result(self) -> Dict[str, Any]:
+        """The aggregate of the events consumed so far."""
+
+
+class EventCounter(ExportAggregator):
+    """Total events, events per name and distinct users."""
+
+    def __init__(self):
+        self.total = 0
+        self.by_event = BoundedCounter(MAX_TRACKED_EVENT_NAMES)
+        self.users = DistinctCounter()
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.total += 1
+        self.by_event.add(event.get("event", "Unknown"))
+        distinct_id = (event.get("properties") or {}).get("distinct_id")
+        if distinct_id is not None:
+            self.users.add(distinct_id)
+
+    def top_events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [
+            {
+                "event_name": name,
+                "count": count,
+                "percentage": round(count / self.total * 100, 2) if self.total else 0,
+            }
+            for name, count in self.by_event.most_common(limit)
+        ]
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "total_events": self.total,
+            "unique_users": self.users.count(),
+            "unique_users_estimated": self.users.estimated,
+            "event_breakdown": dict(self.by_event.most_common()),
+            "counts_approximate": self.by_event.approximate,
+        }
+
+
+class PropertyHistogram(ExportAggregator):
+    """How often each value of one event property occurs."""
+
+    def __init__(self, property_name: str, max_values: int = MAX_TRACKED_PROPERTY_VALUES):
+        self.property_name = property_name
+        self.values = BoundedCounter(max_values)
+        self.missing = 0
+
+    def add(self, event: Dict[str, Any]) -> None:
+        properties = event.get("properties") or {}
+        if self.property_name not in properties:
+            self.missing += 1
+            return
+        value = properties[self.property_name]
+        if isinstance(value, (list, dict)):
+            value = json.dumps(value, sort_keys=True)
+        self.values.add(value)
+
+    def result(self, limit: Optional[int] = None) -> Dict[str, Any]:
+        return {
+            "property": self.property_name,
+            "values": [{"value": value, "count": count} for value, count in self.values.most_common(limit)],
+            "other_values_count": self.values.other,
+            "missing_count": self.missing,
+            "approximate": self.values.approximate,
+        }
+
+
+class EventCollector(ExportAggregator):
+    """Keeps the first `limit` events (all of them when limit is None)."""
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit
+        self.events: List[Dict[str, Any]] = []
+
+    def add(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        if self.limit and len(self.events) >= self.limit:
+            self.done = True
+
+    def result(self) -> Dict[str, Any]:
+        return {"events": self.events, "count": len(self.events)}
+
+
+async def aggregate_export(
+    params: Dict[str, Any],
+    aggregators: Sequence[ExportAggregator],
+    max_events: Optional[int] = None,
+    client: Optional[httpx.AsyncClient] = None
+) -> int:
+    """Stream the Raw Data Export into the given aggregators.
+
+    Reading stops, and the connection is closed, as soon as every aggregator
+    is done or max_events events have been read. Returns the number of events read.
+    """
+    events_read = 0
+    async with contextlib.aclosing(MixpanelExportClient.stream_events(params, client)) as events:
+        async for event in events:
+            events_read += 1
+            for aggregator in aggregators:
+                if not aggregator.done:
+                    aggregator.add(event)
+            if events_read == max_events or all(aggregator.done for aggregator in aggregators):
+                break
+    return events_read
@@ -2,7 +2,7 @@ import logging
 import json
 import base64
 import os
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
 from contextvars import ContextVar
 import httpx
 
@@ -47,6 +47,35 @@ def get_service_account_credentials() -> Tuple[str, str]:
     
     return username, secret
 
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[Dict[str, Any]]:
+    """Parse newline-delimited JSON from a stream of byte chunks.
+    
+    Blank lines and lines that are not valid JSON objects are skipped.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            event = _parse_ndjson_line(line)
+            if event is not None:
+                yield event
+    event = _parse_ndjson_line(buffer)
+    if event is not None:
+        yield event
+
+def _parse_ndjson_line(line: bytes) -> Optional[Dict[str, Any]]:
+    if not line.strip():
+        return None
+    try:
+        value = json.loads(line)
+    except ValueError:
+        return None
+    return value if isinstance(value, dict) else None
+
 class MixpanelIngestionClient:
     """Client for Mixpanel Ingestion API using Service Account authentication.
     
@@ -126,61 +155,38 @@ class MixpanelExportClient:
     """
     
     @staticmethod
-    async def make_request(
-        method: str, 
-        endpoint: str = "", 
-        data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Make an HTTP request to Mixpanel Export API using Service Account authentication.
+    async def stream_events(
+        params: Dict[str, Any],
+        client: Optional[httpx.AsyncClient] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream events from the Raw Data Export API one at a time.
+        
+        The newline-delimited JSON body is parsed as it arrives, so memory use does
+        not grow with the size of the export. Closing the generator early closes
+        the connection and stops the download.
         
         Args:
-            method: HTTP method
-            endpoint: API endpoint (usually empty as the full path is in MIXPANEL_EXPORT_ENDPOINT)
-            data: Request body data
-            params: Query parameters
+            params: Query parameters (from_date, to_date, event, where, limit)
+            client: Optional httpx client to use instead of a new one
         """
         # Get service account credentials
         username, secret = get_service_account_credentials()
-        
-        # Use Basic Auth with service account credentials
         auth = httpx.BasicAuth(username, secret)
         
-        headers = {
-            "Content-Type": "application/json"
-        }
-        
-        # MIXPANEL_EXPORT_ENDPOINT already includes the full path /api/2.0/export
-        url = MIXPANEL_EXPORT_ENDPOINT
-        
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if method.upper() == "GET":
-                response = await client.get(url, auth=auth, headers=headers, params=params)
-            elif method.upper() == "POST":
-                response = await client.post(url, auth=auth, headers=headers, json=data)
-            else:
-                raise ValueError(f"Unsupported HTTP method for export: {method}")
-            
-            response.raise_for_status()
-            
-            # Handle different response types
-            content_type = response.headers.get("content-type", "")
-            
-            if "application/json" in content_type:
-                return response.json()
-            elif response.text:
-                # The export endpoint returns newline-delimited JSON
-                lines = response.text.strip().split('\n')
-                events = []
-                for line in lines:
-                    if line:
-                        try:
-                            events.append(json.loads(line))
-                        except ValueError:
-                            continue
-                return {"events": events}
-            else:
-                return {"success": True}
+        owns_client = client is None
+        if owns_client:
+            client = httpx.AsyncClient(timeout=30.0)
+        try:
+            async with client.stream("GET", MIXPANEL_EXPORT_ENDPOINT, auth=auth, params=params) as response:
+                if response.is_error:
+                    # Read the (small) error body so it shows up in the exception
+                    await response.aread()
+                response.raise_for_status()
+                async for event in iter_ndjson(response.aiter_bytes()):
+                    yield event
+        finally:
+            if owns_client:
+                await client.aclose()
 
 class MixpanelQueryClient:
     """Client for Mixpanel Query API using Service Account authentication.
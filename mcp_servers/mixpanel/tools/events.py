@@ -6,9 +6,14 @@ import uuid
 
 from .base import (
     MixpanelIngestionClient,
-    MixpanelExportClient,
     MixpanelQueryClient
 )
+from .aggregation import (
+    EventCollector,
+    EventCounter,
+    PropertyHistogram,
+    aggregate_export
+)
 
 logger = logging.getLogger(__name__)
 
@@ -96,17 +101,12 @@ async def query_events(
     to_date: str,
     event: Optional[str] = None,
     where: Optional[str] = None,
-    limit: Optional[int] = 1000
+    limit: Optional[int] = 1000,
+    project_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """Query raw event data from Mixpanel."""
     try:
-        params = {
-            "from_date": from_date,
-            "to_date": to_date
-        }
-        
-        if event:
-            params["event"] = f'["{event}"]'
+        params = _export_params(from_date, to_date, event, project_id)
         
         if where:
             params["where"] = where
@@ -114,22 +114,16 @@ async def query_events(
         if limit:
             params["limit"] = str(limit)
         
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
+        # Stop reading the export as soon as `limit` events have arrived
+        collector = EventCollector(limit)
+        await aggregate_export(params, [collector])
         
-        if isinstance(result, dict) and "events" in result:
-            return {
-                "success": True,
-                "events": result["events"],
-                "count": len(result["events"]),
-                "message": f"Retrieved {len(result['events'])} events from {from_date} to {to_date}"
-            }
-        else:
-            return {
-                "success": False,
-                "events": [],
-                "error": f"Unexpected response format: {result}"
-            }
+        return {
+            "success": True,
+            "events": collector.events,
+            "count": len(collector.events),
+            "message": f"Retrieved {len(collector.events)} events from {from_date} to {to_date}"
+        }
             
     except Exception as e:
         return {
@@ -141,57 +135,49 @@ async def query_events(
 async def get_event_count(
     from_date: str,
     to_date: str,
-    event: Optional[str] = None
+    event: Optional[str] = None,
+    property_name: Optional[str] = None,
+    max_events: Optional[int] = None,
+    project_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Get total event count for a date range from Mixpanel."""
+    """Get total event count for a date range from Mixpanel.
+    
+    The export is streamed and aggregated as it arrives, so memory use does not
+    depend on the number of events.
+    
+    Args:
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        event: Optional event name to count
+        property_name: Optional event property to break the count down by
+        max_events: Stop after this many events; counts are then lower bounds
+        project_id: Mixpanel project ID, required with service account credentials
+    """
     try:
-        params = {
-            "from_date": from_date,
-            "to_date": to_date
-        }
+        params = _export_params(from_date, to_date, event, project_id)
         
-        # If specific event is provided, filter by it
-        if event:
-            params["event"] = f'["{event}"]'
+        counter = EventCounter()
+        aggregators = [counter]
+        if property_name:
+            histogram = PropertyHistogram(property_name)
+            aggregators.append(histogram)
+        events_read = await aggregate_export(params, aggregators, max_events=max_events)
+        truncated = bool(max_events) and events_read >= max_events
         
-        # Query events and count them
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
-        
-        if isinstance(result, dict) and "events" in result:
-            event_count = len(result["events"])
-            
-            # Calculate additional stats
-            unique_users = set()
-            event_types = {}
-            
-            for event_data in result["events"]:
-                # Count unique users
-                if "properties" in event_data and "distinct_id" in event_data["properties"]:
-                    unique_users.add(event_data["properties"]["distinct_id"])
-                
-                # Count event types
-                event_name = event_data.get("event", "Unknown")
-                event_types[event_name] = event_types.get(event_name, 0) + 1
-            
-            return {
-                "success": True,
-                "total_events": event_count,
-                "unique_users": len(unique_users),
-                "date_range": {
-                    "from": from_date,
-                    "to": to_date
-                },
-                "event_breakdown": event_types,
-                "filtered_event": event if event else "All events",
-                "message": f"Found {event_count} events from {from_date} to {to_date}"
-            }
-        else:
-            return {
-                "success": False,
-                "total_events": 0,
-                "error": f"Unexpected response format: {result}"
-            }
+        result = {
+            "success": True,
+            **counter.result(),
+            "date_range": {
+                "from": from_date,
+                "to": to_date
+            },
+            "filtered_event": event if event else "All events",
+            "truncated": truncated,
+            "message": f"Found {'at least ' if truncated else ''}{counter.total} events from {from_date} to {to_date}"
+        }
+        if property_name:
+            result["property_breakdown"] = histogram.result()
+        return result
             
     except Exception as e:
         return {
@@ -203,69 +189,42 @@ async def get_event_count(
 async def get_top_events(
     from_date: str,
     to_date: str,
-    limit: Optional[int] = 10
+    limit: Optional[int] = 10,
+    max_events: Optional[int] = None,
+    project_id: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Get the most common events over a time period from Mixpanel."""
+    """Get the most common events over a time period from Mixpanel.
+    
+    Args:
+        from_date: Start date (YYYY-MM-DD)
+        to_date: End date (YYYY-MM-DD)
+        limit: Number of top events to return
+        max_events: Only analyze the first this many events of the export
+        project_id: Mixpanel project ID, required with service account credentials
+    """
     try:
-        params = {
-            "from_date": from_date,
-            "to_date": to_date
-        }
+        params = _export_params(from_date, to_date, project_id=project_id)
         
-        # Query all events for the time period
-        # The export endpoint is already included in MIXPANEL_EXPORT_ENDPOINT
-        result = await MixpanelExportClient.make_request("GET", "", params=params)
+        counter = EventCounter()
+        events_read = await aggregate_export(params, [counter], max_events=max_events)
+        top_events_with_stats = counter.top_events(limit)
         
-        if isinstance(result, dict) and "events" in result:
-            events = result["events"]
-            
-            # Count events by type
-            event_counts = {}
-            total_events = len(events)
-            unique_users = set()
-            
-            for event_data in events:
-                # Count events by name
-                event_name = event_data.get("event", "Unknown")
-                event_counts[event_name] = event_counts.get(event_name, 0) + 1
-                
-                # Track unique users
-                if "properties" in event_data and "distinct_id" in event_data["properties"]:
-                    unique_users.add(event_data["properties"]["distinct_id"])
-            
-            # Sort events by count (descending) and get top N
-            sorted_events = sorted(event_counts.items(), key=lambda x: x[1], reverse=True)
-            top_events = sorted_events[:limit] if limit else sorted_events
-            
-            # Calculate percentages
-            top_events_with_stats = []
-            for event_name, count in top_events:
-                percentage = (count / total_events * 100) if total_events > 0 else 0
-                top_events_with_stats.append({
-                    "event_name": event_name,
-                    "count": count,
-                    "percentage": round(percentage, 2)
-                })
-            
-            return {
-                "success": True,
-                "top_events": top_events_with_stats,
-                "total_events_analyzed": total_events,
-                "unique_users": len(unique_users),
-                "date_range": {
-                    "from": from_date,
-                    "to": to_date
-                },
-                "limit_requested": limit,
-                "events_returned": len(top_events_with_stats),
-                "message": f"Found top {len(top_events_with_stats)} events from {from_date} to {to_date}"
-            }
-        else:
-            return {
-                "success": False,
-                "top_events": [],
-                "error": f"Unexpected response format: {result}"
-            }
+        return {
+            "success": True,
+            "top_events": top_events_with_stats,
+            "total_events_analyzed": counter.total,
+            "unique_users": counter.users.count(),
+            "unique_users_estimated": counter.users.estimated,
+            "counts_approximate": counter.by_event.approximate,
+            "truncated": bool(max_events) and events_read >= max_events,
+            "date_range": {
+                "from": from_date,
+                "to": to_date
+            },
+            "limit_requested": limit,
+            "events_returned": len(top_events_with_stats),
+            "message": f"Found top {len(top_events_with_stats)} events from {from_date} to {to_date}"
+        }
             
     except Exception as e:
         return {
@@ -274,6 +233,23 @@ async def get_top_events(
             "error": f"Failed to get top events: {str(e)}"
         }
 
+def _export_params(
+    from_date: str,
+    to_date: str,
+    event: Optional[str] = None,
+    project_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Raw Data Export query parameters for a date range, optionally filtered by event."""
+    params = {
+        "from_date": from_date,
+        "to_date": to_date
+    }
+    if event:
+        params["event"] = json.dumps([event])
+    if project_id:
+        params["project_id"] = str(project_id)
+    return params
+
 async def get_todays_top_events(
     limit: Optional[int] = 10
 ) -> Dict[str, Any]:
@@ -11,6 +11,7 @@ from urllib.parse import urlparse, urlunparse
 from collections.abc import AsyncIterator
 from contextvars import ContextVar
 from enum import Enum
+from pathlib import Path
 from typing import Any
 from typing import List
 from typing import Literal
@@ -26,6 +27,12 @@ from starlette.responses import Response
 from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 
+# Shared server helpers (mcp_servers/shared, copied to src/shared in the Docker image)
+sys.path.append(str(Path(__file__).resolve().parents[3]))
+from shared.instrumentation import instrument_tool
+from shared.instrumentation import metrics_endpoint
+from shared.launcher import serve
+
 from postgres_mcp.index.dta_calc import DatabaseTuningAdvisor
 
 from .artifacts import ErrorResult
@@ -730,6 +737,7 @@ def create_server(access_mode: AccessMode) -> Server:
         return tools
 
     @app.call_tool()
+    @instrument_tool
     async def call_tool(
         name: str, arguments: dict
     ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
@@ -913,7 +921,6 @@ def main():
 
     # Create an ASGI application with routes for both transports
     starlette_app = Starlette(
-        debug=True,
         routes=[
             # SSE routes
             Route("/sse", endpoint=handle_sse, methods=["GET"]),
@@ -921,6 +928,7 @@ def main():
 
             # StreamableHTTP route
             Mount("/mcp", app=handle_streamable_http),
+            Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
         ],
         lifespan=lifespan,
     )
@@ -929,8 +937,7 @@ def main():
     logger.info(f"  - SSE endpoint: http://{args.host}:{args.port}/sse")
     logger.info(f"  - StreamableHTTP endpoint: http://{args.host}:{args.port}/mcp")
 
-    import uvicorn
-    uvicorn.run(starlette_app, host=args.host, port=args.port)
+    sys.exit(serve(starlette_app, host=args.host, port=args.port))
 
 
 async def shutdown(sig=None):
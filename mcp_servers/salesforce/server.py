@@ -502,12 +502,14 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             # Query and Metadata Tools
             types.Tool(
                 name="salesforce_query",
-                description="Execute a SOQL query on Salesforce",
+                description="Execute a SOQL query on Salesforce. Large results are returned page by page: when the response contains nextRecordsUrl, pass it back to fetch the following pages.",
                 inputSchema={
                     "type": "object",
-                    "required": ["query"],
                     "properties": {
-                        "query": {"type": "string", "description": "SOQL query to execute"}
+                        "query": {"type": "string", "description": "SOQL query to execute. Required unless next_records_url is provided."},
+                        "max_records": {"type": "integer", "description": "Follow further pages until exactly this many records have been returned. Only the first page (up to 2000 records) is returned when omitted."},
+                        "next_records_url": {"type": "string", "description": "nextRecordsUrl from a previous response, to continue that query"},
+                        "use_bulk_api": {"type": "boolean", "description": "Run the query through the Bulk API 2.0. Use for large extracts (tens of thousands of records or more).", "default": False}
                     }
                 },
                 annotations=types.ToolAnnotations(**{"category": "SALESFORCE_QUERY", "readOnlyHint": True})
@@ -681,7 +683,12 @@ def main(port: int, log_level: str, json_response: bool) -> int:
             
             # Query and metadata tools  
             elif name == "salesforce_query":
-                result = await execute_soql_query(arguments["query"])
+                result = await execute_soql_query(
+                    query=arguments.get("query"),
+                    max_records=arguments.get("max_records"),
+                    next_records_url=arguments.get("next_records_url"),
+                    use_bulk_api=arguments.get("use_bulk_api", False),
+                )
             elif name == "salesforce_describe_object":
                 result = await describe_object(arguments["object_name"], arguments.get("detailed", False))
             
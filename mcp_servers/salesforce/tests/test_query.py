@@ -0,0 +1,70 @@
+"""Unit tests for the Salesforce query helpers."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from tools.query import _object_from_query, query_paged
+
+
+class TestObjectFromQuery:
+    """Tests for the _object_from_query function."""
+
+    def test_simple_query(self):
+        assert _object_from_query("SELECT Id, Name FROM Account") == "Account"
+
+    def test_lowercase_from(self):
+        assert _object_from_query("select Id from Contact where Name != null") == "Contact"
+
+    def test_relationship_subquery_before_from(self):
+        """A child subquery in the SELECT list must not be taken as the sObject."""
+        query = "SELECT Id, (SELECT Id FROM Contacts) FROM Account"
+        assert _object_from_query(query) == "Account"
+
+    def test_semi_join_in_where(self):
+        query = "SELECT Id FROM Account WHERE Id IN (SELECT AccountId FROM Opportunity)"
+        assert _object_from_query(query) == "Account"
+
+    def test_from_inside_string_literal(self):
+        query = "SELECT Id, (SELECT Id FROM Cases WHERE Subject = 'x) FROM Lead') FROM Account"
+        assert _object_from_query(query) == "Account"
+
+    def test_missing_from(self):
+        with pytest.raises(ValueError):
+            _object_from_query("SELECT Id")
+
+
+def _page(ids, next_url=None):
+    page = {"totalSize": 5, "done": next_url is None, "records": [{"attributes": {}, "Id": i} for i in ids]}
+    if next_url:
+        page["nextRecordsUrl"] = next_url
+    return page
+
+
+class TestQueryPaged:
+    """Tests for the query_paged function."""
+
+    @pytest.fixture
+    def sf(self):
+        sf = MagicMock()
+        sf.query.return_value = _page(["a", "b"], "/query/01g-2")
+        sf.query_more.side_effect = [_page(["c", "d"], "/query/01g-4"), _page(["e"])]
+        return sf
+
+    def test_one_page_without_max_records(self, sf):
+        result = asyncio.run(query_paged(sf, "SELECT Id FROM Account"))
+        assert [r["Id"] for r in result["records"]] == ["a", "b"]
+        assert result["nextRecordsUrl"] == "/query/01g-2"
+        sf.query_more.assert_not_called()
+
+    def test_max_records_truncates_exactly_and_resumes(self, sf):
+        result = asyncio.run(query_paged(sf, "SELECT Id FROM Account", max_records=3))
+        assert [r["Id"] for r in result["records"]] == ["a", "b", "c"]
+        assert result["done"] is False
+        assert result["nextRecordsUrl"] == "/query/01g-3"
+
+    def test_max_records_within_first_page(self, sf):
+        result = asyncio.run(query_paged(sf, "SELECT Id FROM Account", max_records=1))
+        assert [r["Id"] for r in result["records"]] == ["a"]
+        assert result["nextRecordsUrl"] == "/query/01g-1"
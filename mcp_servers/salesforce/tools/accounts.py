@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .query import query_all
 from .normalization import normalize_accounts_result
 
 # Configure logging
@@ -54,7 +55,7 @@ async def get_accounts(limit: int = 50, fields: Optional[List[str]] = None, name
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Account{where_clause} ORDER BY Name LIMIT {limit}"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_accounts_result(dict(result))
         
     except Exception as e:
@@ -78,7 +79,7 @@ async def get_account_by_id(account_id: str, fields: Optional[List[str]] = None)
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Account WHERE Id = '{account_id}'"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_accounts_result(dict(result))
         
     except Exception as e:
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from typing import Any, Dict
 from datetime import datetime, timedelta
 from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
 from .normalization import normalize_content_document_link, normalize_attachment
+from .query import query_all
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -37,7 +39,7 @@ async def get_attachments_for_record(
             LIMIT {limit}
         """
         
-        content_result = sf.query(content_query)
+        content_result = await query_all(sf, content_query)
         files = [normalize_content_document_link(record) for record in content_result.get('records', [])]
         
         return {
@@ -77,7 +79,7 @@ async def get_attachment_temporary_download_url(
             WHERE Id = '{attachment_id}'
         """
         
-        doc_result = sf.query(doc_query)
+        doc_result = await query_all(sf, doc_query)
         
         if doc_result.get('totalSize', 0) == 0:
             return {
@@ -104,7 +106,7 @@ async def get_attachment_temporary_download_url(
             'PreferencesExpires': True,
             'ExpiryDate': expiry_date
         }
-        distribution = sf.ContentDistribution.create(distribution_data)
+        distribution = await asyncio.to_thread(sf.ContentDistribution.create, distribution_data)
         
         # Query the created distribution to get the download URL
         dist_query = f"""
@@ -112,7 +114,7 @@ async def get_attachment_temporary_download_url(
             FROM ContentDistribution 
             WHERE Id = '{distribution['id']}'
         """
-        dist_result = sf.query(dist_query)
+        dist_result = await query_all(sf, dist_query)
         
         if dist_result.get('totalSize', 0) == 0:
             return {
@@ -172,7 +174,7 @@ async def search_attachments(
                 LIMIT {limit}
             """
             
-            content_result = sf.query(content_query)
+            content_result = await query_all(sf, content_query)
             files = [normalize_attachment(record) for record in content_result.get('records', [])]
         
         return {
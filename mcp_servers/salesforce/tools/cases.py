@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .query import query_all
 from .normalization import normalize_cases_result
 
 # Configure logging
@@ -65,7 +66,7 @@ async def get_cases(account_id: Optional[str] = None, status: Optional[str] = No
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Case{where_clause} ORDER BY CreatedDate DESC LIMIT {limit}"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_cases_result(dict(result))
         
     except Exception as e:
@@ -89,7 +90,7 @@ async def get_case_by_id(case_id: str, fields: Optional[List[str]] = None) -> Di
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Case WHERE Id = '{case_id}'"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_cases_result(dict(result))
         
     except Exception as e:
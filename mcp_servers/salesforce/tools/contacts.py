@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .query import query_all
 from .normalization import normalize_contacts_result
 
 # Configure logging
@@ -74,7 +75,7 @@ async def get_contacts(account_id: Optional[str] = None, limit: int = 50, fields
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Contact{where_clause} ORDER BY LastName, FirstName LIMIT {limit}"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_contacts_result(dict(result))
         
     except Exception as e:
@@ -97,7 +98,7 @@ async def get_contact_by_id(contact_id: str, fields: Optional[List[str]] = None)
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Contact WHERE Id = '{contact_id}'"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_contacts_result(dict(result))
         
     except Exception as e:
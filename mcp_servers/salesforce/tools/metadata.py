@@ -1,23 +1,49 @@
+import asyncio
+import hashlib
 import logging
-from typing import Any, Dict, List
-from .base import get_salesforce_conn
+import os
+import time
+from typing import Any, Dict, List, Optional, Tuple
+from .base import get_salesforce_conn, access_token_context, instance_url_context
 from .normalization import (
-    normalize_soql_result,
     normalize_tooling_result,
     normalize_object_description,
     normalize_component_source_result,
 )
+from .query import bulk_query, query_paged
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
-async def execute_soql_query(query: str) -> Dict[str, Any]:
-    """Execute a SOQL query on Salesforce."""
-    logger.info(f"Executing tool: execute_soql_query with query: {query}")
+# Describe results change rarely; cache them per user and org for schema discovery
+DESCRIBE_CACHE_TTL = int(os.getenv("SALESFORCE_DESCRIBE_CACHE_TTL", "600"))
+_describe_cache: Dict[Tuple[str, str, str, bool], Tuple[float, Any]] = {}
+
+def _describe_cache_key(object_name: str, detailed: bool) -> Tuple[str, str, str, bool]:
+    token_hash = hashlib.sha256(access_token_context.get("").encode()).hexdigest()
+    return (instance_url_context.get(""), token_hash, object_name.lower(), detailed)
+
+async def execute_soql_query(
+    query: Optional[str] = None,
+    max_records: Optional[int] = None,
+    next_records_url: Optional[str] = None,
+    use_bulk_api: bool = False,
+) -> Dict[str, Any]:
+    """Execute a SOQL query on Salesforce.
+
+    Returns one page of records, or follows nextRecordsUrl until exactly
+    max_records records are returned when it is set. Pass a returned
+    nextRecordsUrl to continue a previous query, or set use_bulk_api to run
+    large extracts through the Bulk API 2.0.
+    """
+    logger.info(f"Executing tool: execute_soql_query with query: {query}, next_records_url: {next_records_url}, use_bulk_api: {use_bulk_api}")
     try:
         sf = get_salesforce_conn()
-        result = sf.query(query)
-        return normalize_soql_result(dict(result))
+        if use_bulk_api:
+            if not query:
+                raise ValueError("A query is required when use_bulk_api is set")
+            return await bulk_query(sf, query, max_records)
+        return await query_paged(sf, query, next_records_url, max_records)
     except Exception as e:
         logger.exception(f"Error executing SOQL query: {e}")
         raise e
@@ -37,19 +63,28 @@ async def describe_object(object_name: str, detailed: bool = False) -> Dict[str,
     """Get detailed metadata about a Salesforce object."""
     logger.info(f"Executing tool: describe_object with object_name: {object_name}")
     try:
+        cache_key = _describe_cache_key(object_name, detailed)
+        cached = _describe_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            logger.info(f"Serving cached describe for {object_name}")
+            return cached[1]
+
         sf = get_salesforce_conn()
         sobject = getattr(sf, object_name)
-        result = sobject.describe()
+        result = await asyncio.to_thread(sobject.describe)
         
         if detailed and object_name.endswith('__c'):
             # For custom objects, get additional metadata if requested
-            metadata_result = sf.restful(f"sobjects/{object_name}/describe/")
-            return {
+            metadata_result = await asyncio.to_thread(sf.restful, f"sobjects/{object_name}/describe/")
+            normalized = {
                 "describe": normalize_object_description(dict(result)),
                 "metadata": normalize_object_description(metadata_result) if metadata_result else None
             }
-        
-        return normalize_object_description(dict(result))
+        else:
+            normalized = normalize_object_description(dict(result))
+
+        _describe_cache[cache_key] = (time.monotonic() + DESCRIBE_CACHE_TTL, normalized)
+        return normalized
     except Exception as e:
         logger.exception(f"Error describing object: {e}")
         raise e
@@ -534,34 +534,23 @@ def normalize_metadata_component(raw_component: dict) -> dict:
     return normalize(raw_component, METADATA_COMPONENT_RULES)
 
 
-def normalize_soql_result(raw_result: dict) -> dict:
-    """
-    Normalize a SOQL query result.
-    Since SOQL can return any object type, we clean up common Salesforce artifacts
-    but preserve the original field names.
-    """
-    records = raw_result.get('records', [])
-    
-    def clean_record(record: dict) -> dict:
-        """Remove Salesforce internal attributes from a record."""
-        cleaned = {}
-        for key, value in record.items():
-            if key == 'attributes':
-                continue  # Skip Salesforce metadata attributes
-            if isinstance(value, dict) and 'attributes' in value:
-                # Nested related record - clean it recursively
-                cleaned[key] = clean_record(value)
-            elif value is not None:
-                cleaned[key] = value
-        return cleaned
-    
-    normalized_records = [clean_record(record) for record in records]
-    
-    return {
-        "totalSize": raw_result.get('totalSize', len(normalized_records)),
-        "done": raw_result.get('done', True),
-        "records": normalized_records,
-    }
+def clean_soql_record(record: dict) -> dict:
+    """Remove Salesforce internal attributes from a record."""
+    cleaned = {}
+    for key, value in record.items():
+        if key == 'attributes':
+            continue  # Skip Salesforce metadata attributes
+        if isinstance(value, dict) and 'attributes' in value:
+            # Nested related record - clean it recursively
+            cleaned[key] = clean_soql_record(value)
+        elif value is not None:
+            cleaned[key] = value
+    return cleaned
+
+
+def clean_bulk_row(row: dict) -> dict:
+    """Clean a Bulk API 2.0 CSV row; empty columns are Salesforce nulls."""
+    return {key: value for key, value in row.items() if value != ''}
 
 
 def normalize_tooling_result(raw_result: dict) -> dict:
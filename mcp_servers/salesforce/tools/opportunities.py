@@ -1,6 +1,7 @@
 import logging
 from typing import Any, Dict, List, Optional
 from .base import get_salesforce_conn, handle_salesforce_error, format_success_response
+from .query import query_all
 from .normalization import normalize_opportunities_result
 
 # Configure logging
@@ -83,7 +84,7 @@ async def get_opportunities(
         where_clause = " WHERE " + " AND ".join(where_clauses) if where_clauses else ""
         query = f"SELECT {field_list} FROM Opportunity{where_clause} ORDER BY CloseDate ASC LIMIT {limit}"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_opportunities_result(dict(result))
         
     except Exception as e:
@@ -107,7 +108,7 @@ async def get_opportunity_by_id(opportunity_id: str, fields: Optional[List[str]]
         field_list = ', '.join(fields)
         query = f"SELECT {field_list} FROM Opportunity WHERE Id = '{opportunity_id}'"
         
-        result = sf.query(query)
+        result = await query_all(sf, query)
         return normalize_opportunities_result(dict(result))
         
     except Exception as e:
@@ -0,0 +1,166 @@
+import asyncio
+import csv
+import io
+import logging
+import re
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from simple_salesforce import Salesforce
+
+from .normalization import clean_bulk_row, clean_soql_record
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Records requested per Bulk API 2.0 results page
+BULK_PAGE_SIZE = 50000
+
+_FROM_PATTERN = re.compile(r"\bFROM\s+([A-Za-z0-9_]+)", re.IGNORECASE)
+# Single-quoted SOQL string literals, with backslash escapes
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'")
+# nextRecordsUrl ends in "<query locator>-<records already returned>"
+_LOCATOR_OFFSET = re.compile(r"^(.*-)(\d+)$")
+
+
+class SOQLCursor:
+    """Paged SOQL cursor that follows nextRecordsUrl on demand.
+
+    Each page is fetched off the event loop. While a page is being handled,
+    `page_url` is the nextRecordsUrl it was fetched from (None for the first
+    page of a query). After iteration stops, `done` and `next_records_url`
+    describe where the query can be resumed.
+    """
+
+    def __init__(self, sf: Salesforce, query: Optional[str] = None, next_records_url: Optional[str] = None):
+        if not query and not next_records_url:
+            raise ValueError("Either a query or a next_records_url is required")
+        self.sf = sf
+        self.query = query
+        self.next_records_url = next_records_url
+        self.page_url: Optional[str] = None
+        self.total_size: Optional[int] = None
+        self.done = False
+
+    async def pages(self) -> AsyncIterator[Dict[str, Any]]:
+        if self.query and not self.next_records_url:
+            page = await asyncio.to_thread(self.sf.query, self.query)
+        else:
+            self.page_url = self.next_records_url
+            page = await asyncio.to_thread(self.sf.query_more, self.next_records_url, True)
+
+        while True:
+            page = dict(page)
+            self.total_size = page.get('totalSize', self.total_size)
+            self.done = page.get('done', True)
+            self.next_records_url = None if self.done else page.get('nextRecordsUrl')
+            yield page
+            if not self.next_records_url:
+                return
+            self.page_url = self.next_records_url
+            page = await asyncio.to_thread(self.sf.query_more, self.next_records_url, True)
+
+
+async def query_all(sf: Salesforce, query: str) -> Dict[str, Any]:
+    """Run a SOQL query and follow every continuation page.
+
+    Returns a raw query result with the records of all pages, suitable for the
+    normalize_*_result helpers.
+    """
+    cursor = SOQLCursor(sf, query)
+    records: List[Dict[str, Any]] = []
+    async for page in cursor.pages():
+        records.extend(page.get('records', []))
+    return {
+        "totalSize": cursor.total_size if cursor.total_size is not None else len(records),
+        "done": True,
+        "records": records,
+    }
+
+
+def _resume_url(page_url: Optional[str], next_records_url: Optional[str], kept: int) -> Optional[str]:
+    """nextRecordsUrl that continues right after the first `kept` records of a page."""
+    if page_url:
+        match = _LOCATOR_OFFSET.match(page_url)
+        if match:
+            return f"{match.group(1)}{int(match.group(2)) + kept}"
+    elif next_records_url:
+        match = _LOCATOR_OFFSET.match(next_records_url)
+        if match:
+            return f"{match.group(1)}{kept}"
+    return None
+
+
+async def query_paged(
+    sf: Salesforce,
+    query: Optional[str] = None,
+    next_records_url: Optional[str] = None,
+    max_records: Optional[int] = None,
+    record_normalizer: Callable[[dict], dict] = clean_soql_record,
+) -> Dict[str, Any]:
+    """Fetch a SOQL query page by page, normalizing each page as it arrives.
+
+    Without max_records only one page is fetched. Otherwise pages are followed
+    until exactly max_records records are returned. The returned nextRecordsUrl
+    can be passed back to continue from there.
+    """
+    cursor = SOQLCursor(sf, query, next_records_url)
+    records: List[Dict[str, Any]] = []
+    truncated = False
+    resume_url = None
+    async for page in cursor.pages():
+        page_records = page.get('records', [])
+        if max_records and len(records) + len(page_records) > max_records:
+            kept = max_records - len(records)
+            page_records = page_records[:kept]
+            truncated = True
+            resume_url = _resume_url(cursor.page_url, cursor.next_records_url, kept)
+        records.extend(record_normalizer(record) for record in page_records)
+        if not max_records or len(records) >= max_records:
+            break
+
+    result = {
+        "totalSize": cursor.total_size if cursor.total_size is not None else len(records),
+        "done": cursor.done and not truncated,
+        "records": records,
+    }
+    next_url = resume_url if truncated else cursor.next_records_url
+    if next_url:
+        result["nextRecordsUrl"] = next_url
+    return result
+
+
+def _object_from_query(query: str) -> str:
+    """sObject of the top-level FROM clause, skipping relationship subqueries."""
+    # Blank out string literals so parentheses or "FROM" inside them are ignored
+    masked = _STRING_LITERAL.sub(lambda m: " " * len(m.group(0)), query)
+    for match in _FROM_PATTERN.finditer(masked):
+        prefix = masked[: match.start()]
+        if prefix.count("(") == prefix.count(")"):
+            return match.group(1)
+    raise ValueError("Could not determine the sObject from the query's FROM clause")
+
+
+async def bulk_query(sf: Salesforce, query: str, max_records: Optional[int] = None) -> Dict[str, Any]:
+    """Run a query through the Bulk API 2.0 for large result sets.
+
+    Result pages are downloaded as CSV and normalized chunk by chunk, so only
+    the cleaned records are kept in memory.
+    """
+    object_name = _object_from_query(query)
+
+    def run() -> tuple[List[Dict[str, Any]], bool]:
+        records: List[Dict[str, Any]] = []
+        page_size = min(BULK_PAGE_SIZE, max_records) if max_records else BULK_PAGE_SIZE
+        for chunk in getattr(sf.bulk2, object_name).query(query, max_records=page_size):
+            records.extend(clean_bulk_row(row) for row in csv.DictReader(io.StringIO(chunk)))
+            logger.debug(f"Bulk query on {object_name}: {len(records)} records so far")
+            if max_records and len(records) >= max_records:
+                return records[:max_records], False
+        return records, True
+
+    records, done = await asyncio.to_thread(run)
+    return {
+        "totalSize": len(records),
+        "done": done,
+        "records": records,
+    }
@@ -0,0 +1,6 @@
+"""Helpers shared by the Python MCP servers.
+
+Servers import this package as `shared`: in Docker it is copied next to
+server.py (COPY mcp_servers/shared/ ./shared/), and when run from a checkout
+the server adds mcp_servers/ to sys.path.
+"""
@@ -0,0 +1,121 @@
+"""
+Benchmark: tools/list served by @app.list_tools() vs. a ToolRegistry.
+
+Builds a synthetic server with N tools shaped like the freshdesk/close tool
+lists (a dozen typed properties, enums, nested objects) and times the
+tools/list request handler both ways:
+
+- decorator: @app.list_tools() rebuilding the types.Tool list per request
+- registry:  ToolRegistry.install(app), built and validated once
+
+"handler" is the request handler alone; "+ dump" adds the model_dump the
+session performs before writing the response. Memory is the peak that
+tracemalloc sees allocated on top of the baseline during one request. Run with
+
+    python shared/benchmarks/benchmark_tool_list.py [tools] [requests]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+import mcp.types as types
+from mcp.server.lowlevel import Server
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.tool_registry import ToolRegistry
+
+
+def build_tools(count: int) -> list[types.Tool]:
+    tools = []
+    for i in range(count):
+        properties = {
+            f"field_{j}": {
+                "type": ["string", "integer", "boolean", "number"][j % 4],
+                "description": f"Field {j} of the resource, used to filter or update records of kind {i}.",
+            }
+            for j in range(12)
+        }
+        properties["status"] = {
+            "type": "integer",
+            "enum": [2, 3, 4, 5],
+            "description": "Status of the record (2=Open, 3=Pending, 4=Resolved, 5=Closed)",
+        }
+        properties["custom_fields"] = {
+            "type": "object",
+            "description": "Key value pairs of custom fields",
+            "additionalProperties": True,
+        }
+        properties["tags"] = {"type": "array", "items": {"type": "string"}, "description": "Tags"}
+        tools.append(
+            types.Tool(
+                name=f"service_action_{i}",
+                description=f"Perform action {i} on the service. " * 3,
+                inputSchema={"type": "object", "required": ["field_0"], "properties": properties},
+                annotations=types.ToolAnnotations(**{"category": "SERVICE_RESOURCE", "readOnlyHint": i % 2 == 0}),
+            )
+        )
+    return tools
+
+
+def decorator_app(count: int) -> Server:
+    app = Server("benchmark-decorator")
+
+    @app.list_tools()
+    async def list_tools() -> list[types.Tool]:
+        return build_tools(count)
+
+    return app
+
+
+def registry_app(count: int) -> Server:
+    app = Server("benchmark-registry")
+    ToolRegistry(build_tools(count)).install(app)
+    return app
+
+
+async def measure(app: Server, requests: int, dump: bool):
+    handler = app.request_handlers[types.ListToolsRequest]
+    await handler(None)  # warm up
+
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        result = await handler(None)
+        if dump:
+            result.model_dump(by_alias=True, mode="json", exclude_none=True)
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    peaks = []
+    for _ in range(20):
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        result = await handler(None)
+        if dump:
+            result.model_dump(by_alias=True, mode="json", exclude_none=True)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+        del result
+    tracemalloc.stop()
+    return statistics.median(latencies), statistics.median(peaks)
+
+
+async def main(count: int, requests: int) -> None:
+    registry = ToolRegistry(build_tools(count))
+    registry.freeze()
+    print(f"{count} tools, {registry.payload_bytes / 1024:.1f} KiB tools/list payload, {requests} requests")
+    for dump in (False, True):
+        label = "handler + dump" if dump else "handler"
+        for name, app in (("decorator", decorator_app(count)), ("registry", registry_app(count))):
+            median, peak = await measure(app, requests, dump)
+            print(f"  {label:<15} {name:<10} p50 {median * 1000:8.3f} ms   peak {peak / 1024:8.1f} KiB/request")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 60,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+    ))
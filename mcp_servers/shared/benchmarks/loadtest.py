@@ -0,0 +1,271 @@
+"""
+Load test: an MCP server under the shared launcher, with one or more workers.
+
+Starts a mock upstream API and a server built like the real ones: a
+ToolRegistry, SSE on /sse and /messages/, stateless StreamableHTTP on /mcp and
+/metrics, served by shared.launcher.serve. Each tool call fetches a JSON page
+from the upstream and normalizes it the way the tools/ modules do. The script
+then opens --concurrency client sessions that share --requests tools/call
+requests, and reports throughput and p50/p99 latency for each worker count:
+
+    python shared/benchmarks/loadtest.py --workers 1 4 --concurrency 64 --requests 4000
+    python shared/benchmarks/loadtest.py --transport sse --workers 4
+
+To drive an already running server instead, pass its URL and a tool to call:
+
+    python shared/benchmarks/loadtest.py --url http://localhost:5000 --tool hubspot_list_contacts
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+import httpx
+import mcp.types as types
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+TOOL_NAME = "loadtest_list_records"
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_upstream(port: int, latency_ms: float, payload_kb: int) -> None:
+    """Mock upstream API: GET /records returns a page of records after a fixed delay."""
+    import uvicorn
+    from starlette.applications import Starlette
+    from starlette.responses import Response
+    from starlette.routing import Route
+
+    record = {
+        "id": "rec_0",
+        "properties": {"name": "Example record", "email": "user@example.com", "stage": "open"},
+        "createdAt": "2024-01-01T00:00:00Z",
+        "archived": False,
+        "notes": "x" * 200,
+    }
+    count = max(1, payload_kb * 1024 // len(json.dumps(record)))
+    body = json.dumps({"results": [dict(record, id=f"rec_{i}") for i in range(count)]}).encode()
+
+    async def records(request):
+        await asyncio.sleep(latency_ms / 1000)
+        return Response(body, media_type="application/json")
+
+    app = Starlette(routes=[Route("/records", records)])
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def run_server(port: int, workers: int, upstream_url: str) -> int:
+    """An MCP server shaped like the real ones, served by shared.launcher.serve."""
+    import contextlib
+
+    from mcp.server.lowlevel import Server
+    from mcp.server.sse import SseServerTransport
+    from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+    from starlette.applications import Starlette
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    from shared.instrumentation import instrument_tool, instrument_upstream, metrics_endpoint
+    from shared.launcher import serve
+    from shared.tool_registry import ToolRegistry
+
+    app = Server("loadtest-mcp-server")
+    ToolRegistry([
+        types.Tool(
+            name=TOOL_NAME,
+            description="List records from the mock upstream.",
+            inputSchema={"type": "object", "properties": {"limit": {"type": "integer"}}},
+            annotations=types.ToolAnnotations(readOnlyHint=True),
+        )
+    ]).install(app)
+    clients = {}
+
+    @instrument_upstream
+    async def fetch_records() -> dict:
+        # One client per worker process, created in that worker's event loop
+        client = clients.get("upstream")
+        if client is None:
+            client = clients["upstream"] = httpx.AsyncClient(base_url=upstream_url)
+        response = await client.get("/records")
+        response.raise_for_status()
+        return response.json()
+
+    @app.call_tool()
+    @instrument_tool
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        records = (await fetch_records())["results"][: arguments.get("limit", 100)]
+        normalized = [
+            {"id": r["id"], "name": r["properties"]["name"], "email": r["properties"]["email"], "created": r["createdAt"]}
+            for r in records
+        ]
+        return [types.TextContent(type="text", text=json.dumps({"count": len(normalized), "records": normalized}))]
+
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request):
+        async with sse.connect_sse(request.scope, request.receive, request._send) as streams:
+            await app.run(streams[0], streams[1], app.create_initialization_options())
+        return Response()
+
+    session_manager = StreamableHTTPSessionManager(app=app, event_store=None, json_response=False, stateless=True)
+
+    async def handle_streamable_http(scope, receive, send):
+        await session_manager.handle_request(scope, receive, send)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(starlette_app):
+        async with session_manager.run():
+            yield
+
+    starlette_app = Starlette(
+        routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+            Mount("/mcp", app=handle_streamable_http),
+            Route("/metrics", endpoint=metrics_endpoint, methods=["GET"]),
+        ],
+        lifespan=lifespan,
+    )
+    return serve(starlette_app, host="127.0.0.1", port=port, log_level="warning", workers=workers)
+
+
+def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Nothing is listening on port {port} after {timeout}s")
+
+
+def start(*args: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, os.path.abspath(__file__), *args])
+
+
+def stop(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+async def drive(url: str, transport: str, tool: str, arguments: dict, concurrency: int, requests: int):
+    """Run requests tool calls over concurrency sessions; returns (latencies, errors, elapsed)."""
+    latencies: List[float] = []
+    errors = 0
+    remaining = requests
+
+    async def user() -> None:
+        nonlocal errors, remaining
+        connect = sse_client(f"{url}/sse") if transport == "sse" else streamablehttp_client(f"{url}/mcp/")
+        async with connect as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                while remaining > 0:
+                    remaining -= 1
+                    started = time.perf_counter()
+                    try:
+                        result = await session.call_tool(tool, arguments)
+                        if result.isError:
+                            errors += 1
+                    except Exception:
+                        errors += 1
+                    latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - started
+
+
+def report(label: str, latencies: List[float], errors: int, elapsed: float) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(
+        f"  {label:<12} {len(ordered):6d} calls  {len(ordered) / elapsed:8.1f} calls/s  "
+        f"p50 {statistics.median(ordered) * 1000:8.1f} ms  p99 {p99 * 1000:8.1f} ms  errors {errors}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1}))
+    parser.add_argument("--transport", choices=["streamable-http", "sse"], default="streamable-http")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--upstream-latency", type=float, default=20, help="mock upstream delay in ms")
+    parser.add_argument("--payload-kb", type=int, default=32, help="size of the mock upstream response")
+    parser.add_argument("--url", help="drive an already running server instead")
+    parser.add_argument("--tool", default=TOOL_NAME)
+    parser.add_argument("--arguments", default="{}", help="tool arguments as JSON")
+    # Internal: the subprocesses started by this script
+    parser.add_argument("--role", choices=["upstream", "server"], help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--upstream-url", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.role == "upstream":
+        run_upstream(args.port, args.upstream_latency, args.payload_kb)
+        return
+    if args.role == "server":
+        sys.exit(run_server(args.port, args.workers[0], args.upstream_url))
+
+    arguments = json.loads(args.arguments)
+    if args.url:
+        print(f"{args.url}, {args.transport}, {args.concurrency} sessions")
+        report("server", *asyncio.run(
+            drive(args.url, args.transport, args.tool, arguments, args.concurrency, args.requests)
+        ))
+        return
+
+    upstream_port = free_port()
+    upstream = start(
+        "--role", "upstream", "--port", str(upstream_port),
+        "--upstream-latency", str(args.upstream_latency), "--payload-kb", str(args.payload_kb),
+    )
+    try:
+        wait_for_port(upstream_port)
+        print(
+            f"{args.transport}, {args.concurrency} sessions, {args.requests} calls, "
+            f"upstream {args.upstream_latency:g} ms / {args.payload_kb} KiB"
+        )
+        for workers in args.workers:
+            port = free_port()
+            server = start(
+                "--role", "server", "--port", str(port), "--workers", str(workers),
+                "--upstream-url", f"http://127.0.0.1:{upstream_port}",
+            )
+            try:
+                wait_for_port(port)
+                url = f"http://127.0.0.1:{port}"
+                # Warm up every worker before measuring
+                asyncio.run(drive(url, args.transport, args.tool, arguments, args.concurrency, args.concurrency * 2))
+                report(f"{workers} worker" + ("s" if workers > 1 else ""), *asyncio.run(
+                    drive(url, args.transport, args.tool, arguments, args.concurrency, args.requests)
+                ))
+            finally:
+                stop(server)
+    finally:
+        stop(upstream)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""Per-tool latency, upstream and payload metrics for the Python MCP servers.
+
+Wrap the call_tool handler and the server's HTTP helpers, and serve /metrics:
+
+    @app.call_tool()
+    @instrument_tool
+    async def call_tool(name: str, arguments: dict) -> list[types.TextContent]:
+        ...
+
+    @instrument_upstream          # in tools/base.py, around make_request-style helpers
+    async def make_request(method, endpoint, ...):
+        for attempt in ...:
+            ...
+            record_retry()        # before each retry
+
+    Route("/metrics", endpoint=metrics_endpoint, methods=["GET"])
+
+Each tool call records its latency, how many upstream requests and retries it
+made and how long they took, and the size of its response. These feed the
+Prometheus histograms and counters on /metrics, and one structured
+"tool_call" log line per call. With several workers (shared.launcher), the
+worker that answers /metrics gathers the others' metrics over their Unix
+sockets and adds them up.
+
+    MCP_TOOL_CALL_LOGS  "false" to turn off the per-call log lines (default on)
+"""
+
+import asyncio
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+import httpx
+import mcp.types as types
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+
+from shared.launcher import peer_workers
+
+logger = logging.getLogger(__name__)
+
+TOOL_CALL_LOGS = os.getenv("MCP_TOOL_CALL_LOGS", "true").lower() not in ("0", "false", "no")
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# Tool names come from clients; beyond this many, new names are counted as "other"
+MAX_TOOL_LABELS = 256
+# Time /metrics waits for each of the other workers
+PEER_TIMEOUT = 5.0
+
+_DESCRIPTIONS = {
+    "mcp_tool_calls_total": ("counter", "Tool calls by tool and status"),
+    "mcp_tool_duration_seconds": ("histogram", "Tool call latency"),
+    "mcp_tool_upstream_duration_seconds": ("histogram", "Time one tool call spent in upstream requests"),
+    "mcp_tool_response_bytes": ("histogram", "Size of tool call responses"),
+    "mcp_tool_upstream_requests_total": ("counter", "Upstream requests by tool and outcome"),
+    "mcp_tool_upstream_retries_total": ("counter", "Upstream request retries by tool"),
+}
+_BUCKETS = {
+    "mcp_tool_duration_seconds": DURATION_BUCKETS,
+    "mcp_tool_upstream_duration_seconds": DURATION_BUCKETS,
+    "mcp_tool_response_bytes": BYTES_BUCKETS,
+}
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+Labels = Tuple[Tuple[str, str], ...]
+
+
+@dataclass
+class CallStats:
+    """What one tool call did upstream, filled in by instrument_upstream and record_retry."""
+
+    tool: str
+    upstream_requests: int = 0
+    upstream_errors: int = 0
+    upstream_seconds: float = 0.0
+    retries: int = 0
+
+
+_current_call: ContextVar[Optional[CallStats]] = ContextVar("mcp_tool_call", default=None)
+
+
+class ToolMetrics:
+    """Counters and histograms of one process, with labels."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        # (name, labels) -> [per-bucket counts, sum, count]; the last bucket is +Inf
+        self._histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+        self._tools: set = set()
+
+    def tool_label(self, name: str) -> str:
+        with self._lock:
+            if name in self._tools:
+                return name
+            if len(self._tools) >= MAX_TOOL_LABELS:
+                return "other"
+            self._tools.add(name)
+            return name
+
+    def inc(self, name: str, labels: Dict[str, str], amount: float = 1) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name: str, labels: Dict[str, str], value: float) -> None:
+        buckets = _BUCKETS[name]
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = [[0] * (len(buckets) + 1), 0.0, 0]
+            index = next((i for i, bound in enumerate(buckets) if value <= bound), len(buckets))
+            histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    def record_call(self, stats: CallStats, status: str, seconds: float, response_bytes: int) -> None:
+        tool = {"tool": stats.tool}
+        self.inc("mcp_tool_calls_total", {**tool, "status": status})
+        self.observe("mcp_tool_duration_seconds", tool, seconds)
+        self.observe("mcp_tool_response_bytes", tool, response_bytes)
+        if stats.upstream_requests:
+            self.observe("mcp_tool_upstream_duration_seconds", tool, stats.upstream_seconds)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the metrics, which merge() can add up across workers."""
+        with self._lock:
+            return {
+                "counters": [[name, list(map(list, labels)), value] for (name, labels), value in self._counters.items()],
+                "histograms": [
+                    [name, list(map(list, labels)), list(counts), total, count]
+                    for (name, labels), (counts, total, count) in self._histograms.items()
+                ],
+            }
+
+    @staticmethod
+    def merge(snapshots: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        counters: Dict[Tuple[str, Labels], float] = {}
+        histograms: Dict[Tuple[str, Labels], List[Any]] = {}
+        for snapshot in snapshots:
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                counters[key] = counters.get(key, 0) + value
+            for name, labels, counts, total, count in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                merged = histograms.setdefault(key, [[0] * len(counts), 0.0, 0])
+                merged[0] = [a + b for a, b in zip(merged[0], counts)]
+                merged[1] += total
+                merged[2] += count
+        return {
+            "counters": [[name, list(map(list, labels)), value] for (name, labels), value in counters.items()],
+            "histograms": [
+                [name, list(map(list, labels)), counts, total, count]
+                for (name, labels), (counts, total, count) in histograms.items()
+            ],
+        }
+
+    @staticmethod
+    def render(snapshot: Dict[str, Any]) -> str:
+        """Prometheus text exposition of a snapshot."""
+        series: Dict[str, List[str]] = {name: [] for name in _DESCRIPTIONS}
+        for name, labels, value in sorted(snapshot["counters"]):
+            series[name].append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        for name, labels, counts, total, count in sorted(snapshot["histograms"]):
+            cumulative = 0
+            for bound, bucket_count in zip((*_BUCKETS[name], "+Inf"), counts):
+                cumulative += bucket_count
+                series[name].append(f"{name}_bucket{_format_labels([*labels, ['le', str(bound)]])} {cumulative}")
+            series[name].append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+            series[name].append(f"{name}_count{_format_labels(labels)} {count}")
+
+        lines = []
+        for name, (kind, description) in _DESCRIPTIONS.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(series[name])
+        return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: Sequence[Sequence[str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+metrics = ToolMetrics()
+
+
+def instrument_tool(func: F) -> F:
+    """Record latency, upstream work and response size of a call_tool(name, arguments) handler."""
+
+    @functools.wraps(func)
+    async def wrapper(name: str, arguments: dict, *args: Any, **kwargs: Any) -> Any:
+        stats = CallStats(tool=metrics.tool_label(name))
+        token = _current_call.set(stats)
+        started = time.perf_counter()
+        status, response_bytes = "error", 0
+        try:
+            result = await func(name, arguments, *args, **kwargs)
+            if isinstance(result, types.CallToolResult):
+                response_bytes = _response_bytes(result.content)
+                status = "error" if result.isError or _is_error_result(result.content) else "ok"
+                return result
+            if not isinstance(result, (list, tuple, dict)):
+                result = list(result)
+            response_bytes = _response_bytes(result)
+            status = "error" if _is_error_result(result) else "ok"
+            return result
+        finally:
+            _current_call.reset(token)
+            seconds = time.perf_counter() - started
+            metrics.record_call(stats, status, seconds, response_bytes)
+            if TOOL_CALL_LOGS:
+                record = {
+                    "event": "tool_call",
+                    "tool": name,
+                    "status": status,
+                    "duration_ms": round(seconds * 1000, 1),
+                    "upstream_ms": round(stats.upstream_seconds * 1000, 1),
+                    "upstream_requests": stats.upstream_requests,
+                    "upstream_errors": stats.upstream_errors,
+                    "retries": stats.retries,
+                    "response_bytes": response_bytes,
+                }
+                logger.info(json.dumps(record), extra={"tool_call": record})
+
+    return wrapper  # type: ignore[return-value]
+
+
+def instrument_upstream(func: F) -> F:
+    """Count and time an async upstream request helper, attributed to the running tool call."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        stats = _current_call.get()
+        tool = stats.tool if stats is not None else "none"
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            result = await func(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            seconds = time.perf_counter() - started
+            metrics.inc("mcp_tool_upstream_requests_total", {"tool": tool, "outcome": outcome})
+            if stats is not None:
+                stats.upstream_requests += 1
+                stats.upstream_seconds += seconds
+                if outcome == "error":
+                    stats.upstream_errors += 1
+
+    return wrapper  # type: ignore[return-value]
+
+
+def record_retry() -> None:
+    """Count one retry of an upstream request (e.g. after a 429) for the running tool call."""
+    stats = _current_call.get()
+    metrics.inc("mcp_tool_upstream_retries_total", {"tool": stats.tool if stats is not None else "none"})
+    if stats is not None:
+        stats.retries += 1
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """GET /metrics: Prometheus text for all workers, or ?scope=worker for this worker's JSON snapshot."""
+    if request.query_params.get("scope") == "worker":
+        return JSONResponse(metrics.snapshot())
+
+    snapshots = [metrics.snapshot()]
+    peers = peer_workers()
+    if peers:
+        snapshots.extend(
+            snapshot
+            for snapshot in await asyncio.gather(*(_peer_snapshot(path) for path in peers))
+            if snapshot is not None
+        )
+    return Response(
+        ToolMetrics.render(ToolMetrics.merge(snapshots)),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+async def _peer_snapshot(socket_path: str) -> Optional[Dict[str, Any]]:
+    try:
+        async with httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=socket_path), timeout=PEER_TIMEOUT
+        ) as client:
+            response = await client.get("http://worker/metrics", params={"scope": "worker"})
+            response.raise_for_status()
+            return response.json()
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning(f"Could not collect metrics from worker at {socket_path}: {e!r}")
+        return None
+
+
+def _response_bytes(result: Any) -> int:
+    if isinstance(result, dict):
+        return len(json.dumps(result, default=str).encode())
+    if isinstance(result, tuple) and len(result) == 2 and isinstance(result[1], dict):
+        return _response_bytes(list(result[0])) + _response_bytes(result[1])
+    total = 0
+    for item in result:
+        if getattr(item, "text", None) is not None:
+            total += len(item.text.encode())
+        elif getattr(item, "data", None) is not None:
+            total += len(item.data)
+        elif getattr(item, "resource", None) is not None:
+            resource = item.resource
+            total += len((getattr(resource, "text", None) or getattr(resource, "blob", None) or "").encode())
+    return total
+
+
+def _is_error_result(result: Any) -> bool:
+    # The servers report failures as a text block starting with "Error"
+    if isinstance(result, list) and result:
+        text = getattr(result[0], "text", None)
+        return isinstance(text, str) and text.startswith("Error")
+    return False
@@ -0,0 +1,353 @@
+"""Production launcher for the Starlette apps of the Python MCP servers.
+
+uvicorn.run(starlette_app, ...) serves every client from one process, and
+uvicorn's own --workers needs an import string, which the servers do not have
+because they build their app inside main(). serve() takes the app object that
+main() built instead. It binds the port, then forks the workers, so each
+worker has a copy of the app and runs its own event loop and lifespan:
+
+    from shared.launcher import serve
+    return serve(starlette_app, host="0.0.0.0", port=port, log_level=log_level)
+
+Settings come from the arguments or the environment:
+
+    MCP_WORKERS                    worker processes, or "auto" for one per CPU (default 1)
+    MCP_GRACEFUL_SHUTDOWN_TIMEOUT  seconds open connections get to finish on shutdown (default 10)
+    MCP_DEBUG                      "true" to return Starlette debug tracebacks (default off)
+
+The /mcp endpoint runs StreamableHTTPSessionManager(stateless=True), so any
+worker can answer any request. SSE sessions are different: they live in the
+memory of the worker that accepted GET /sse, and the kernel hands the client's
+POST /messages/ connections to arbitrary workers. With several workers, every
+worker also listens on a private Unix socket. The SSE endpoint event then
+tells the client to post to /workers/<n>/messages/, and a worker that
+receives a post for another worker forwards it over that worker's socket.
+"""
+
+import logging
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import uvicorn
+from starlette.applications import Starlette
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRACEFUL_SHUTDOWN_TIMEOUT = 10.0
+
+# Path prefix that routes SSE message posts to the worker holding the session
+WORKER_PREFIX = "/workers/"
+# Time a worker gets to forward one SSE message post to its owner
+FORWARD_TIMEOUT = 30.0
+# A worker that dies sooner than this after starting is restarted with a delay
+MIN_WORKER_UPTIME = 5.0
+
+# Set in each worker process: (worker index, Unix socket paths of all workers)
+_worker: Optional[Tuple[int, List[str]]] = None
+
+# Hop-by-hop headers that are not copied onto forwarded requests or responses
+_HOP_BY_HOP = {"connection", "keep-alive", "transfer-encoding", "te", "upgrade", "content-length"}
+
+
+def peer_workers() -> List[str]:
+    """Unix sockets of the other workers of this server; empty when it runs one worker."""
+    if _worker is None:
+        return []
+    index, paths = _worker
+    return [path for other, path in enumerate(paths) if other != index]
+
+
+def resolve_workers(workers: Optional[int | str] = None) -> int:
+    """Number of worker processes from the argument or MCP_WORKERS ("auto" = CPU count)."""
+    value = workers if workers is not None else os.getenv("MCP_WORKERS", "1")
+    if isinstance(value, str):
+        value = value.strip().lower()
+        if value == "auto":
+            return os.cpu_count() or 1
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError(f"MCP_WORKERS must be a positive integer or 'auto', got {value!r}") from None
+    if value < 1:
+        raise ValueError(f"The number of workers must be at least 1, got {value}")
+    return value
+
+
+class StickySseMiddleware:
+    """Route SSE message posts to the worker that holds the SSE session.
+
+    GET /sse gets "/workers/<n>" appended to its root_path, which
+    SseServerTransport puts in front of the messages endpoint it announces.
+    A post to /workers/<n>/messages/ is served locally when n is this worker,
+    and otherwise forwarded to worker n over its Unix socket.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        worker: int,
+        peer_sockets: List[str],
+        sse_path: str = "/sse",
+    ):
+        self.app = app
+        self.worker = worker
+        self.peer_sockets = peer_sockets
+        self.sse_path = sse_path
+        self._peers: Dict[int, httpx.AsyncClient] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path == self.sse_path:
+            root_path = scope.get("root_path", "").rstrip("/")
+            scope = dict(scope, root_path=f"{root_path}{WORKER_PREFIX}{self.worker}")
+        elif path.startswith(WORKER_PREFIX):
+            index, _, rest = path[len(WORKER_PREFIX):].partition("/")
+            if not index.isdigit() or int(index) >= len(self.peer_sockets):
+                await _send_text(send, 404, "Unknown worker")
+                return
+            rest = "/" + rest
+            if int(index) != self.worker:
+                await self._forward(int(index), rest, scope, receive, send)
+                return
+            scope = dict(scope, path=rest, raw_path=rest.encode())
+        await self.app(scope, receive, send)
+
+    async def _forward(self, worker: int, path: str, scope: Scope, receive: Receive, send: Send) -> None:
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.extend(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        client = self._peers.get(worker)
+        if client is None:
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=self.peer_sockets[worker]),
+                timeout=FORWARD_TIMEOUT,
+            )
+            self._peers[worker] = client
+
+        query = scope.get("query_string", b"").decode("latin-1")
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in scope["headers"]
+            if name.decode("latin-1").lower() not in _HOP_BY_HOP
+        ]
+        try:
+            response = await client.request(
+                scope["method"],
+                f"http://worker{path}" + (f"?{query}" if query else ""),
+                headers=headers,
+                content=bytes(body),
+            )
+        except httpx.HTTPError as e:
+            logger.warning(f"Forwarding SSE message to worker {worker} failed: {e!r}")
+            await _send_text(send, 502, "Worker unavailable")
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": response.status_code,
+            "headers": [
+                (name.encode("latin-1"), value.encode("latin-1"))
+                for name, value in response.headers.multi_items()
+                if name.lower() not in _HOP_BY_HOP
+            ],
+        })
+        await send({"type": "http.response.body", "body": response.content})
+
+
+async def _send_text(send: Send, status: int, text: str) -> None:
+    body = text.encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [(b"content-type", b"text/plain; charset=utf-8"), (b"content-length", str(len(body)).encode())],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def serve(
+    app: Starlette,
+    host: str = "0.0.0.0",
+    port: int = 5000,
+    log_level: str = "info",
+    workers: Optional[int | str] = None,
+    graceful_shutdown_timeout: Optional[float] = None,
+    debug: Optional[bool] = None,
+) -> int:
+    """Serve a server's Starlette app with one or more worker processes.
+
+    Uses uvloop and httptools when they are installed (uvicorn[standard]).
+
+    Returns:
+        The process exit code: 0 after a clean shutdown, non-zero if a worker failed to start
+    """
+    workers = resolve_workers(workers)
+    if graceful_shutdown_timeout is None:
+        graceful_shutdown_timeout = float(
+            os.getenv("MCP_GRACEFUL_SHUTDOWN_TIMEOUT", str(DEFAULT_GRACEFUL_SHUTDOWN_TIMEOUT))
+        )
+    if debug is None:
+        debug = os.getenv("MCP_DEBUG", "").lower() in ("1", "true", "yes")
+    # Tracebacks in error responses leak internals to clients
+    app.debug = debug
+
+    if workers > 1 and not hasattr(os, "fork"):
+        logger.warning("Multiple workers need os.fork, which this platform lacks; using one worker")
+        workers = 1
+
+    config = uvicorn.Config(
+        app,
+        host=host,
+        port=port,
+        log_level=log_level.lower(),
+        loop="auto",
+        http="auto",
+        timeout_graceful_shutdown=graceful_shutdown_timeout,
+    )
+    if workers == 1:
+        server = uvicorn.Server(config)
+        server.run()
+        return 0 if server.started else 1
+
+    return _Supervisor(config, workers).run()
+
+
+class _Supervisor:
+    """Parent process: binds the sockets, forks the workers and restarts any that die."""
+
+    def __init__(self, config: uvicorn.Config, workers: int):
+        self.config = config
+        self.workers = workers
+        self.children: Dict[int, int] = {}  # pid -> worker index
+        self.started_at: Dict[int, float] = {}
+        self.stopping = False
+        self.exit_code = 0
+
+    def run(self) -> int:
+        config = self.config
+        sock = config.bind_socket()
+        socket_dir = tempfile.mkdtemp(prefix="mcp-workers-")
+        peer_paths = [os.path.join(socket_dir, f"worker-{index}.sock") for index in range(self.workers)]
+        peer_sockets = []
+        for path in peer_paths:
+            peer = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            peer.bind(path)
+            peer_sockets.append(peer)
+
+        logger.info(
+            f"Starting {self.workers} workers (loop={config.loop}, http={config.http}, "
+            f"graceful shutdown {config.timeout_graceful_shutdown}s)"
+        )
+        try:
+            signal.signal(signal.SIGTERM, self._handle_stop)
+            signal.signal(signal.SIGINT, self._handle_stop)
+            for index in range(self.workers):
+                self._spawn(index, sock, peer_sockets, peer_paths)
+            self._wait(sock, peer_sockets, peer_paths)
+        finally:
+            for child in self.children:
+                _kill(child, signal.SIGKILL)
+            sock.close()
+            for peer in peer_sockets:
+                peer.close()
+            shutil.rmtree(socket_dir, ignore_errors=True)
+        return self.exit_code
+
+    def _spawn(self, index: int, sock: socket.socket, peer_sockets: List[socket.socket], peer_paths: List[str]) -> None:
+        pid = os.fork()
+        if pid:
+            self.children[pid] = index
+            self.started_at[pid] = time.monotonic()
+            return
+
+        # Worker process: never returns into the caller's code
+        code = 1
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            for other, peer in enumerate(peer_sockets):
+                if other != index:
+                    peer.close()
+            global _worker
+            _worker = (index, peer_paths)
+            self.config.app = StickySseMiddleware(self.config.app, index, peer_paths)
+            server = uvicorn.Server(self.config)
+            server.run(sockets=[sock, peer_sockets[index]])
+            code = 0 if server.started else 3
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else 1
+        except BaseException:
+            logger.exception(f"Worker {index} crashed")
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+    def _handle_stop(self, signum: int, frame) -> None:
+        if not self.stopping:
+            logger.info(f"Received {signal.Signals(signum).name}, stopping {len(self.children)} workers")
+        self.stopping = True
+        for pid in self.children:
+            _kill(pid, signal.SIGTERM)
+
+    def _wait(self, sock: socket.socket, peer_sockets: List[socket.socket], peer_paths: List[str]) -> None:
+        deadline = None
+        while self.children:
+            if self.stopping and deadline is None:
+                # Workers get the graceful budget, then are killed
+                deadline = time.monotonic() + (self.config.timeout_graceful_shutdown or 0) + 5
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning(f"Killing {len(self.children)} workers that did not stop in time")
+                for pid in self.children:
+                    _kill(pid, signal.SIGKILL)
+                deadline = float("inf")
+
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(0.2)
+                continue
+
+            index = self.children.pop(pid, None)
+            started_at = self.started_at.pop(pid, time.monotonic())
+            if index is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                continue
+            if code == 3:
+                # uvicorn's startup failure code: restarting will not help
+                logger.error(f"Worker {index} failed to start, stopping")
+                self.exit_code = 3
+                self._handle_stop(signal.SIGTERM, None)
+                continue
+            logger.warning(f"Worker {index} (pid {pid}) exited with code {code}, restarting")
+            if time.monotonic() - started_at < MIN_WORKER_UPTIME:
+                time.sleep(1)
+            self._spawn(index, sock, peer_sockets, peer_paths)
+
+
+def _kill(pid: int, sig: int) -> None:
+    try:
+        os.kill(pid, sig)
+    except ProcessLookupError:
+        pass
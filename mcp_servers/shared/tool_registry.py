@@ -0,0 +1,148 @@
+"""Tool lists that are built and validated once per process.
+
+The @app.list_tools() decorator calls its function for every tools/list
+request, which rebuilds and revalidates dozens of types.Tool models with
+large JSON schemas each time. With StreamableHTTPSessionManager(stateless=True)
+every client request is a new session that lists tools again, so that work
+repeats constantly. A ToolRegistry does it once, and also serializes the
+result once instead of on every response:
+
+    tool_registry = ToolRegistry()
+    tool_registry.add(name="get_ticket", description="...", inputSchema={...})
+    tool_registry.extend([types.Tool(...), ...])
+    tool_registry.install(app)  # validates, freezes and serves the cached result
+
+Serving the prebuilt result relies on mcp internals (Server.request_handlers,
+Server._tool_cache and ServerResult being a pydantic model). Where they are
+missing, install() falls back to the public @app.list_tools() decorator with
+the prebuilt tools, and results are not preserialized.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import mcp.types as types
+from jsonschema.validators import Draft202012Validator, validator_for
+from mcp.server.lowlevel import Server
+from pydantic import BaseModel, PrivateAttr
+
+logger = logging.getLogger(__name__)
+
+# How the MCP session dumps a result before writing the JSON-RPC response
+_SESSION_DUMP_ARGS = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+
+# ServerResult is a RootModel in mcp 1.x; later versions may make it a plain Union
+_SERVER_RESULT_IS_MODEL = isinstance(types.ServerResult, type) and issubclass(types.ServerResult, BaseModel)
+
+if _SERVER_RESULT_IS_MODEL:
+
+    class _PreserializedResult(types.ServerResult):
+        """ServerResult whose session-style dump is computed once and reused for every response."""
+
+        _dumped: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+        def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+            if kwargs != _SESSION_DUMP_ARGS:
+                return super().model_dump(**kwargs)
+            if self._dumped is None:
+                self._dumped = super().model_dump(**kwargs)
+            # A shallow copy, so a caller adding keys cannot change later responses
+            return dict(self._dumped)
+
+else:
+    _PreserializedResult = None
+
+
+def _server_result(result: types.ListToolsResult) -> Any:
+    """Wrap a result the way a request handler returns it, preserialized where supported."""
+    if _PreserializedResult is None:
+        return result
+    try:
+        return _PreserializedResult(result)
+    except TypeError:
+        logger.debug("Cannot preserialize ServerResult with this mcp version", exc_info=True)
+        return types.ServerResult(result)
+
+
+class ToolRegistry:
+    """Tools of one server, served from a prebuilt tools/list result."""
+
+    def __init__(self, tools: Iterable[types.Tool] = ()):
+        self._tools: Dict[str, types.Tool] = {}
+        self._result: Optional[Any] = None
+        self.payload_bytes = 0
+        self.extend(tools)
+
+    @property
+    def tools(self) -> List[types.Tool]:
+        return list(self._tools.values())
+
+    def add(self, tool: Optional[types.Tool] = None, **fields: Any) -> types.Tool:
+        """Register a tool, given as a types.Tool or as its fields (name, description, inputSchema, ...)."""
+        if self._result is not None:
+            raise RuntimeError("Tools must be registered before the registry is installed")
+        if tool is None:
+            tool = types.Tool(**fields)
+        if tool.name in self._tools:
+            raise ValueError(f"Tool '{tool.name}' is registered twice")
+        self._tools[tool.name] = tool
+        return tool
+
+    def extend(self, tools: Iterable[types.Tool]) -> None:
+        for tool in tools:
+            self.add(tool)
+
+    def freeze(self) -> Any:
+        """Validate every tool's schemas and build the tools/list result once."""
+        if self._result is not None:
+            return self._result
+
+        for tool in self._tools.values():
+            for schema_name in ("inputSchema", "outputSchema"):
+                schema = getattr(tool, schema_name, None)
+                if schema is None:
+                    continue
+                if schema.get("type") != "object":
+                    raise ValueError(f"{schema_name} of tool '{tool.name}' must be an object schema")
+                try:
+                    validator_for(schema, default=Draft202012Validator).check_schema(schema)
+                except Exception as e:
+                    raise ValueError(f"Invalid {schema_name} for tool '{tool.name}': {e}") from e
+
+        self._result = _server_result(types.ListToolsResult(tools=self.tools))
+        self._result.model_dump(**_SESSION_DUMP_ARGS)
+        self.payload_bytes = len(
+            self._result.model_dump_json(by_alias=True, exclude_none=True).encode()
+        )
+        logger.info(
+            f"Registered {len(self._tools)} tools "
+            f"({self.payload_bytes / 1024:.1f} KiB tools/list payload)"
+        )
+        return self._result
+
+    def install(self, app: Server) -> None:
+        """Serve tools/list for `app` from the frozen registry.
+
+        Also fills the server's tool cache, which call_tool uses for input
+        validation, so calls never trigger a tool list rebuild either.
+        """
+        result = self.freeze()
+        request_handlers = getattr(app, "request_handlers", None)
+        if not _SERVER_RESULT_IS_MODEL or not isinstance(request_handlers, dict):
+            tools = self.tools
+
+            @app.list_tools()
+            async def list_tools() -> List[types.Tool]:
+                return tools
+
+            return
+
+        async def handle_list_tools(_: Any) -> Any:
+            return result
+
+        request_handlers[types.ListToolsRequest] = handle_list_tools
+        tool_cache = getattr(app, "_tool_cache", None)
+        if isinstance(tool_cache, dict):
+            tool_cache.clear()
+            tool_cache.update(self._tools)
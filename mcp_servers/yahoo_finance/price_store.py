@@ -0,0 +1,348 @@
+"""Local SQLite store for Yahoo Finance price history.
+
+Bars are stored per (ticker, interval, auto_adjust) together with the date
+ranges that have already been fetched, so a request only downloads the parts
+of its range that are not on disk yet. Only daily bars are stored: a weekly or
+monthly bar is dated at the start of its period and keeps changing until the
+period ends, and intraday bars are fetched directly every time.
+
+A range only counts as fetched when Yahoo returned bars for it, or when it has
+no weekdays at all. yfinance returns an empty frame on rate limits and
+transient errors, so an empty answer is never cached as "no data".
+
+The bar for the current day at the exchange is still forming: it is returned
+from the download that fetched it but never persisted, and the current day is
+never marked as covered.
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+import threading
+from typing import Iterable, Optional
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+import yfinance as yf
+
+CACHEABLE_INTERVALS = {"1d"}
+
+# Used when a ticker's exchange timezone is unknown: the earliest calendar date
+# anywhere, so a bar that may still be forming is never persisted.
+_FALLBACK_TIMEZONE = "Etc/GMT+12"
+
+PRICE_COLUMNS = {
+    "Open": "open",
+    "High": "high",
+    "Low": "low",
+    "Close": "close",
+    "Adj Close": "adj_close",
+    "Volume": "volume",
+    "Dividends": "dividends",
+    "Stock Splits": "stock_splits",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS prices (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    auto_adjust INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    adj_close REAL,
+    volume REAL,
+    dividends REAL,
+    stock_splits REAL,
+    PRIMARY KEY (ticker, interval, auto_adjust, day)
+);
+CREATE TABLE IF NOT EXISTS coverage (
+    ticker TEXT NOT NULL,
+    interval TEXT NOT NULL,
+    auto_adjust INTEGER NOT NULL,
+    start_day TEXT NOT NULL,
+    end_day TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS coverage_key ON coverage (ticker, interval, auto_adjust);
+CREATE TABLE IF NOT EXISTS ticker_meta (
+    ticker TEXT PRIMARY KEY,
+    timezone TEXT
+);
+"""
+
+
+def _default_path() -> str:
+    cache_dir = os.environ.get("YFINANCE_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "yfinance_mcp_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "prices.sqlite")
+
+
+def _day(value) -> datetime.date:
+    return pd.Timestamp(value).date()
+
+
+def exchange_today(timezone: Optional[str]) -> datetime.date:
+    """Today's date in the exchange's timezone."""
+    return datetime.datetime.now(ZoneInfo(timezone or _FALLBACK_TIMEZONE)).date()
+
+
+def normalize_ticker(ticker: str) -> str:
+    return ticker.strip().upper()
+
+
+def _has_weekday(start: datetime.date, end: datetime.date) -> bool:
+    """Whether the half-open range [start, end) contains a Monday-Friday."""
+    days = (end - start).days
+    return days >= 7 or any((start + datetime.timedelta(days=i)).weekday() < 5 for i in range(days))
+
+
+def fetched_ranges(
+    frame: pd.DataFrame, requested: Iterable[tuple[datetime.date, datetime.date]]
+) -> list[tuple[datetime.date, datetime.date]]:
+    """The requested ranges that the frame answered: those with bars, or without weekdays."""
+    days = {_day(ts) for ts in _bars(frame).index}
+    return [
+        (start, end)
+        for start, end in requested
+        if not _has_weekday(start, end) or any(start <= day < end for day in days)
+    ]
+
+
+def _bars(frame: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a close; a multi-ticker download pads failed tickers with all-NaN rows."""
+    if frame.empty or "Close" not in frame.columns:
+        return frame.iloc[0:0]
+    return frame[frame["Close"].notna()]
+
+
+def subtract_ranges(
+    start: datetime.date, end: datetime.date, covered: Iterable[tuple[datetime.date, datetime.date]]
+) -> list[tuple[datetime.date, datetime.date]]:
+    """Return the parts of the half-open range [start, end) not inside any covered range."""
+    missing = []
+    cursor = start
+    for cov_start, cov_end in sorted(covered):
+        if cov_end <= cursor:
+            continue
+        if cov_start >= end:
+            break
+        if cov_start > cursor:
+            missing.append((cursor, min(cov_start, end)))
+        cursor = max(cursor, cov_end)
+        if cursor >= end:
+            break
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
+
+
+def _merge_ranges(ranges: Iterable[tuple[datetime.date, datetime.date]]) -> list[tuple[datetime.date, datetime.date]]:
+    merged: list[list[datetime.date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class PriceStore:
+    """On-disk price history with incremental range fill."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or _default_path()
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Coverage bookkeeping
+    # ------------------------------------------------------------------
+
+    def _covered(self, conn, ticker: str, interval: str, auto_adjust: bool) -> list[tuple[datetime.date, datetime.date]]:
+        rows = conn.execute(
+            "SELECT start_day, end_day FROM coverage WHERE ticker = ? AND interval = ? AND auto_adjust = ?",
+            (ticker, interval, int(auto_adjust)),
+        ).fetchall()
+        return [(datetime.date.fromisoformat(s), datetime.date.fromisoformat(e)) for s, e in rows]
+
+    def missing_ranges(
+        self, ticker: str, interval: str, start: datetime.date, end: datetime.date, auto_adjust: bool
+    ) -> list[tuple[datetime.date, datetime.date]]:
+        with self._connect() as conn:
+            return subtract_ranges(start, end, self._covered(conn, ticker, interval, auto_adjust))
+
+    def _store(
+        self,
+        ticker: str,
+        interval: str,
+        auto_adjust: bool,
+        frame: pd.DataFrame,
+        requested: Iterable[tuple[datetime.date, datetime.date]],
+    ) -> pd.DataFrame:
+        """Persist the completed bars of a download and return the ones still forming."""
+        frame = _bars(frame)
+        timezone = None
+        if not frame.empty and isinstance(frame.index, pd.DatetimeIndex) and frame.index.tz is not None:
+            timezone = str(frame.index.tz)
+
+        # Today's bar is still forming, so it is neither stored nor counted as covered.
+        today = exchange_today(timezone or self._timezone(ticker))
+        fetched = [
+            (start, min(end, today)) for start, end in fetched_ranges(frame, requested) if start < today
+        ]
+
+        rows = []
+        forming = []
+        for position, (ts, bar) in enumerate(frame.iterrows()):
+            values = [None if pd.isna(bar.get(col)) else float(bar.get(col)) for col in PRICE_COLUMNS]
+            day = _day(ts)
+            if day >= today:
+                forming.append(position)
+                continue
+            rows.append((ticker, interval, int(auto_adjust), day.isoformat(), *values))
+
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO prices (ticker, interval, auto_adjust, day, open, high, low, close, "
+                "adj_close, volume, dividends, stock_splits) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if timezone:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ticker_meta (ticker, timezone) VALUES (?, ?)", (ticker, timezone)
+                )
+            merged = _merge_ranges(self._covered(conn, ticker, interval, auto_adjust) + fetched)
+            conn.execute(
+                "DELETE FROM coverage WHERE ticker = ? AND interval = ? AND auto_adjust = ?",
+                (ticker, interval, int(auto_adjust)),
+            )
+            conn.executemany(
+                "INSERT INTO coverage (ticker, interval, auto_adjust, start_day, end_day) VALUES (?, ?, ?, ?, ?)",
+                [(ticker, interval, int(auto_adjust), s.isoformat(), e.isoformat()) for s, e in merged],
+            )
+        return frame.iloc[forming]
+
+    def _timezone(self, ticker: str) -> Optional[str]:
+        with self._connect() as conn:
+            meta = conn.execute("SELECT timezone FROM ticker_meta WHERE ticker = ?", (ticker,)).fetchone()
+        return meta[0] if meta else None
+
+    def _read(
+        self, ticker: str, interval: str, start: datetime.date, end: datetime.date, auto_adjust: bool
+    ) -> pd.DataFrame:
+        with self._connect() as conn:
+            frame = pd.read_sql_query(
+                "SELECT day, open, high, low, close, adj_close, volume, dividends, stock_splits FROM prices "
+                "WHERE ticker = ? AND interval = ? AND auto_adjust = ? AND day >= ? AND day < ? ORDER BY day",
+                conn,
+                params=(ticker, interval, int(auto_adjust), start.isoformat(), end.isoformat()),
+            )
+            meta = conn.execute("SELECT timezone FROM ticker_meta WHERE ticker = ?", (ticker,)).fetchone()
+
+        index = pd.DatetimeIndex(pd.to_datetime(frame.pop("day")), name="Date")
+        if meta and meta[0]:
+            index = index.tz_localize(meta[0])
+        frame.index = index
+        frame = frame.rename(columns={v: k for k, v in PRICE_COLUMNS.items()})
+        if frame["Volume"].notna().all():
+            frame["Volume"] = frame["Volume"].astype("int64")
+        if auto_adjust:
+            frame = frame.drop(columns=["Adj Close"])
+        return frame
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def history(
+        self,
+        ticker: str,
+        start: datetime.date,
+        end: datetime.date,
+        interval: str = "1d",
+        auto_adjust: bool = True,
+    ) -> pd.DataFrame:
+        """Return bars for [start, end), downloading only the ranges not stored yet."""
+        ticker = normalize_ticker(ticker)
+        if interval not in CACHEABLE_INTERVALS:
+            return yf.Ticker(ticker).history(start=start, end=end, interval=interval, auto_adjust=auto_adjust)
+
+        forming = pd.DataFrame()
+        missing = self.missing_ranges(ticker, interval, start, end, auto_adjust)
+        if missing:
+            company = yf.Ticker(ticker)
+            frames = [
+                company.history(start=s, end=e, interval=interval, auto_adjust=auto_adjust)
+                for s, e in missing
+                if _has_weekday(s, e)
+            ]
+            frames = [frame for frame in frames if not frame.empty]
+            frame = pd.concat(frames) if frames else pd.DataFrame()
+            forming = self._store(ticker, interval, auto_adjust, frame, missing)
+        return _with_forming(self._read(ticker, interval, start, end, auto_adjust), forming)
+
+    def history_many(
+        self,
+        tickers: list[str],
+        start: datetime.date,
+        end: datetime.date,
+        interval: str = "1d",
+        auto_adjust: bool = True,
+    ) -> dict[str, pd.DataFrame]:
+        """Return bars for several tickers, fetching every missing range in one download."""
+        tickers = list(dict.fromkeys(normalize_ticker(ticker) for ticker in tickers))
+        if interval not in CACHEABLE_INTERVALS:
+            raw = yf.download(
+                tickers, start=start, end=end, interval=interval, auto_adjust=auto_adjust,
+                actions=True, group_by="ticker", progress=False, threads=True,
+            )
+            return {ticker: _ticker_slice(raw, ticker).dropna(how="all") for ticker in tickers}
+
+        missing = {
+            ticker: self.missing_ranges(ticker, interval, start, end, auto_adjust) for ticker in tickers
+        }
+        stale = [ticker for ticker, ranges in missing.items() if ranges]
+        forming: dict[str, pd.DataFrame] = {}
+        if stale:
+            fetch_start = min(ranges[0][0] for ticker, ranges in missing.items() if ranges)
+            fetch_end = max(ranges[-1][1] for ticker, ranges in missing.items() if ranges)
+            raw = yf.download(
+                stale, start=fetch_start, end=fetch_end, interval=interval, auto_adjust=auto_adjust,
+                actions=True, group_by="ticker", progress=False, threads=True,
+            )
+            for ticker in stale:
+                frame = _ticker_slice(raw, ticker)
+                forming[ticker] = self._store(ticker, interval, auto_adjust, frame, missing[ticker])
+
+        return {
+            ticker: _with_forming(self._read(ticker, interval, start, end, auto_adjust), forming.get(ticker))
+            for ticker in tickers
+        }
+
+
+def _with_forming(stored: pd.DataFrame, forming: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """Append the unpersisted, still-forming bars of a download to the stored bars."""
+    if forming is None or forming.empty:
+        return stored
+    forming = forming.reindex(columns=stored.columns)
+    forming.index = forming.index.rename("Date")
+    if stored.empty:
+        return forming
+    return pd.concat([stored, forming]).sort_index()
+
+
+def _ticker_slice(raw: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    if isinstance(raw.columns, pd.MultiIndex):
+        if ticker not in raw.columns.get_level_values(0):
+            return pd.DataFrame()
+        return raw[ticker]
+    return raw
@@ -1,3 +1,5 @@
+import asyncio
+import datetime
 import json
 import os
 from enum import Enum
@@ -7,6 +9,8 @@ import pandas as pd
 import yfinance as yf
 from mcp.server.fastmcp import FastMCP
 
+from price_store import CACHEABLE_INTERVALS, PriceStore, normalize_ticker
+
 
 def _get_proxy_url() -> Optional[str]:
     """Build proxy URL from environment variables (same as duckduckgo server)."""
@@ -27,6 +31,47 @@ if _proxy:
     os.environ.setdefault("HTTPS_PROXY", _proxy)
 
 
+price_store = PriceStore()
+
+# Tickers that already passed the ISIN existence check in this process
+_known_tickers: set[str] = set()
+
+PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+def _period_start(period: str, end: pd.Timestamp) -> Optional[pd.Timestamp]:
+    """Translate a yfinance period string into a start timestamp relative to end."""
+    if period == "ytd":
+        # Year to date: start from beginning of current year
+        return pd.Timestamp(datetime.datetime(end.year, 1, 1))
+    if period == "max":
+        # Max: use a date far in the past
+        return pd.Timestamp("1900-01-01")
+    if period in PERIOD_OFFSETS:
+        return end - PERIOD_OFFSETS[period]
+    return None
+
+
+async def _ticker_exists(ticker: str) -> bool:
+    if ticker in _known_tickers:
+        return True
+    isin = await asyncio.to_thread(lambda: yf.Ticker(ticker).isin)
+    if isin is None:
+        return False
+    _known_tickers.add(ticker)
+    return True
+
+
 # Define an enum for the type of financial statement
 class FinancialType(str, Enum):
     income_stmt = "income_stmt"
@@ -62,6 +107,7 @@ This server is used to get information about a given ticker symbol from yahoo fi
 Available tools:
 - get_historical_stock_prices: Get historical stock prices for a given ticker symbol from yahoo finance. Include the following information: Date, Open, High, Low, Close, Volume, Adj Close.
 - get_stock_price_by_date: Get stock price for a specific date. More efficient than historical prices when you only need one date. Can find nearest trading day for weekends/holidays.
+- get_historical_stock_prices_batch: Get historical stock prices for several ticker symbols in a single download.
 - get_stock_info: Get stock information for a given ticker symbol from yahoo finance. Include the following information: Stock Price & Trading Info, Company Information, Financial Metrics, Earnings & Revenue, Margins & Returns, Dividends, Balance Sheet, Ownership, Analyst Coverage, Risk Metrics, Other.
 - get_yahoo_finance_news: Get news for a given ticker symbol from yahoo finance.
 - get_stock_actions: Get stock dividends and stock splits for a given ticker symbol from yahoo finance.
@@ -133,79 +179,33 @@ async def get_historical_stock_prices(
             If False, returns raw unadjusted prices and includes 'Adj Close' column
             Default is True
     """
-    import datetime
-
-    company = yf.Ticker(ticker)
     try:
-        if company.isin is None:
+        if not await _ticker_exists(ticker):
             print(f"Company ticker {ticker} not found.")
             return f"Company ticker {ticker} not found."
     except Exception as e:
         print(f"Error: getting historical stock prices for {ticker}: {e}")
         return f"Error: getting historical stock prices for {ticker}: {e}"
 
-    # Calculate the actual start and end dates based on provided parameters
-    actual_start = None
-    actual_end = None
-    use_period = True
-
-    # If start_date or end_date is provided, we don't use period
-    if start_date is not None or end_date is not None:
-        use_period = False
-
-        # Parse and validate dates
-        try:
-            if start_date is not None:
-                actual_start = pd.to_datetime(start_date)
-            if end_date is not None:
-                actual_end = pd.to_datetime(end_date)
-        except Exception as e:
-            return f"Error: Invalid date format. Please use YYYY-MM-DD format, e.g. '2024-01-15'. {e}"
-
-        # Apply date calculation logic
-        if start_date is not None and end_date is not None:
-            # Both provided: use as is
-            pass
-        elif start_date is not None and end_date is None:
-            # Only start_date: end defaults to current date
-            actual_end = pd.Timestamp.now()
-        elif start_date is None and end_date is not None:
-            # Only end_date: start = end - period
-            actual_end_temp = actual_end
-            # Calculate start based on period
-            period_map = {
-                "1d": pd.DateOffset(days=1),
-                "5d": pd.DateOffset(days=5),
-                "1mo": pd.DateOffset(months=1),
-                "3mo": pd.DateOffset(months=3),
-                "6mo": pd.DateOffset(months=6),
-                "1y": pd.DateOffset(years=1),
-                "2y": pd.DateOffset(years=2),
-                "5y": pd.DateOffset(years=5),
-                "10y": pd.DateOffset(years=10),
-                "ytd": None,  # Will be calculated separately
-                "max": None   # Will use a very old date
-            }
-
-            if period == "ytd":
-                # Year to date: start from beginning of current year
-                actual_start = pd.Timestamp(datetime.datetime(actual_end_temp.year, 1, 1))
-            elif period == "max":
-                # Max: use a date far in the past
-                actual_start = pd.Timestamp("1900-01-01")
-            elif period in period_map:
-                actual_start = actual_end_temp - period_map[period]
-            else:
-                return f"Error: Invalid period '{period}'. Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max"
+    try:
+        actual_start, actual_end = _resolve_date_range(period, start_date, end_date)
+    except ValueError as e:
+        return str(e)
 
     # Get historical data with unified logic
     try:
-        if use_period:
-            # Use period parameter (original behavior)
-            hist_data = company.history(period=period, interval=interval, auto_adjust=auto_adjust)
+        if actual_start is None and interval not in CACHEABLE_INTERVALS:
+            # Period requests for uncached intervals go straight to yfinance (original behavior)
+            hist_data = await asyncio.to_thread(
+                yf.Ticker(ticker).history, period=period, interval=interval, auto_adjust=auto_adjust
+            )
         else:
-            # Use start and end dates
-            hist_data = company.history(start=actual_start, end=actual_end, interval=interval, auto_adjust=auto_adjust)
+            if actual_start is None:
+                actual_end = pd.Timestamp.now()
+                actual_start = _period_start(period, actual_end)
+            hist_data = await asyncio.to_thread(
+                price_store.history, ticker, actual_start.date(), _end_day(actual_end), interval, auto_adjust
+            )
 
         hist_data = hist_data.reset_index(names="Date")
         hist_data = hist_data.to_json(orient="records", date_format="iso")
@@ -215,6 +215,49 @@ async def get_historical_stock_prices(
         return f"Error: getting historical stock prices for {ticker}: {e}"
 
 
+def _resolve_date_range(
+    period: str, start_date: str | None, end_date: str | None
+) -> tuple[Optional[pd.Timestamp], Optional[pd.Timestamp]]:
+    """Calculate the actual start and end dates based on provided parameters.
+
+    Returns (None, None) when neither date is given and the period should be used.
+    Raises ValueError with a user-facing message for invalid input.
+    """
+    if start_date is None and end_date is None:
+        if period != "ytd" and period != "max" and period not in PERIOD_OFFSETS:
+            raise ValueError(
+                f"Error: Invalid period '{period}'. Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max"
+            )
+        return None, None
+
+    # Parse and validate dates
+    try:
+        actual_start = pd.to_datetime(start_date) if start_date is not None else None
+        actual_end = pd.to_datetime(end_date) if end_date is not None else None
+    except Exception as e:
+        raise ValueError(f"Error: Invalid date format. Please use YYYY-MM-DD format, e.g. '2024-01-15'. {e}")
+
+    if actual_end is None:
+        # Only start_date: end defaults to current date
+        actual_end = pd.Timestamp.now()
+    elif actual_start is None:
+        # Only end_date: start = end - period
+        actual_start = _period_start(period, actual_end)
+        if actual_start is None:
+            raise ValueError(
+                f"Error: Invalid period '{period}'. Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max"
+            )
+    return actual_start, actual_end
+
+
+def _end_day(actual_end: pd.Timestamp) -> datetime.date:
+    """Exclusive end day for the price store; a timestamp within a day includes that day."""
+    day = actual_end.date()
+    if actual_end != pd.Timestamp(day):
+        day += datetime.timedelta(days=1)
+    return day
+
+
 @yfinance_server.tool(
     name="get_stock_price_by_date",
     description="""Get stock price for a specific date. This tool is more efficient than getting historical prices when you only need data for one specific date.
@@ -242,11 +285,8 @@ async def get_stock_price_by_date(ticker: str, date: str, find_nearest: bool = T
         find_nearest: Whether to find nearest trading day if exact date has no data
         auto_adjust: If True, returns adjusted prices; if False, returns raw prices
     """
-    import datetime
-    
-    company = yf.Ticker(ticker)
     try:
-        if company.isin is None:
+        if not await _ticker_exists(ticker):
             print(f"Company ticker {ticker} not found.")
             return f"Company ticker {ticker} not found."
     except Exception as e:
@@ -268,7 +308,9 @@ async def get_stock_price_by_date(ticker: str, date: str, find_nearest: bool = T
             # Get data for a wider range to find nearest trading day
             start_date = target_date - pd.Timedelta(days=7)
             end_date = target_date + pd.Timedelta(days=7)
-            hist_data = company.history(start=start_date, end=end_date, interval="1d", auto_adjust=auto_adjust)
+            hist_data = await asyncio.to_thread(
+                price_store.history, ticker, start_date.date(), end_date.date(), "1d", auto_adjust
+            )
             
             if hist_data.empty:
                 return f"No trading data found for {ticker} around date {date}"
@@ -301,7 +343,9 @@ async def get_stock_price_by_date(ticker: str, date: str, find_nearest: bool = T
             # Get data for exact date only
             start_date = target_date
             end_date = target_date + pd.Timedelta(days=1)
-            hist_data = company.history(start=start_date, end=end_date, interval="1d", auto_adjust=auto_adjust)
+            hist_data = await asyncio.to_thread(
+                price_store.history, ticker, start_date.date(), end_date.date(), "1d", auto_adjust
+            )
             
             if hist_data.empty:
                 return f"No trading data found for {ticker} on {date}. This might be a weekend or holiday. Use find_nearest=true to get nearest trading day."
@@ -331,6 +375,76 @@ async def get_stock_price_by_date(ticker: str, date: str, find_nearest: bool = T
         return f"Error: getting stock price by date for {ticker}: {e}"
 
 
+@yfinance_server.tool(
+    name="get_historical_stock_prices_batch",
+    description="""Get historical stock prices for several ticker symbols at once. All symbols are fetched in a single download, which is much faster than calling get_historical_stock_prices per symbol.
+
+Args:
+    tickers: list[str]
+        The ticker symbols to get historical prices for, e.g. ["AAPL", "MSFT", "GOOG"]
+    period : str
+        Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
+        Used only when both start_date and end_date are not provided
+        Default is "1mo"
+    interval : str
+        Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
+        Intraday data cannot extend last 60 days
+        Default is "1d"
+    start_date: str (optional)
+        The start date for historical data (format: 'YYYY-MM-DD'), e.g. "2024-01-01"
+    end_date: str (optional)
+        The end date for historical data (format: 'YYYY-MM-DD'), e.g. "2024-12-31"
+    auto_adjust: bool (optional)
+        If True (default), returns prices adjusted for dividends and stock splits
+        If False, returns raw unadjusted prices and includes 'Adj Close' column
+""",
+)
+async def get_historical_stock_prices_batch(
+    tickers: list[str],
+    period: str = "1mo",
+    interval: str = "1d",
+    start_date: str | None = None,
+    end_date: str | None = None,
+    auto_adjust: bool = True
+) -> str:
+    """Get historical stock prices for several ticker symbols in one download
+
+    Args:
+        tickers: The ticker symbols, e.g. ["AAPL", "MSFT"]
+        period: Period used when neither start_date nor end_date is provided
+        interval: Bar interval
+        start_date: Optional start date (format: 'YYYY-MM-DD')
+        end_date: Optional end date (format: 'YYYY-MM-DD')
+        auto_adjust: If True, returns adjusted prices; if False, returns raw prices
+    """
+    if not tickers:
+        return "Error: at least one ticker is required."
+    tickers = list(dict.fromkeys(normalize_ticker(t) for t in tickers))
+
+    try:
+        actual_start, actual_end = _resolve_date_range(period, start_date, end_date)
+    except ValueError as e:
+        return str(e)
+    if actual_start is None:
+        actual_end = pd.Timestamp.now()
+        actual_start = _period_start(period, actual_end)
+
+    try:
+        frames = await asyncio.to_thread(
+            price_store.history_many, tickers, actual_start.date(), _end_day(actual_end), interval, auto_adjust
+        )
+        result = {}
+        for ticker, frame in frames.items():
+            if frame.empty:
+                result[ticker] = f"No price data found for {ticker}."
+                continue
+            result[ticker] = json.loads(frame.reset_index(names="Date").to_json(orient="records", date_format="iso"))
+        return json.dumps(result)
+    except Exception as e:
+        print(f"Error: getting historical stock prices for {tickers}: {e}")
+        return f"Error: getting historical stock prices for {tickers}: {e}"
+
+
 @yfinance_server.tool(
     name="get_stock_info",
     description="""Get stock information for a given ticker symbol from yahoo finance. Include the following information:
@@ -0,0 +1,131 @@
+"""Unit tests for the Yahoo Finance price store."""
+
+import datetime
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from price_store import CACHEABLE_INTERVALS, PriceStore, _merge_ranges, subtract_ranges
+
+D = datetime.date
+
+
+def bars(*days: str) -> pd.DataFrame:
+    index = pd.DatetimeIndex(pd.to_datetime(list(days)), name="Date").tz_localize("America/New_York")
+    return pd.DataFrame(
+        {"Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100, "Dividends": 0.0, "Stock Splits": 0.0},
+        index=index,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return PriceStore(str(tmp_path / "prices.sqlite"))
+
+
+class TestRanges:
+    """Tests for range subtraction and merging."""
+
+    def test_subtract_nothing_covered(self):
+        assert subtract_ranges(D(2024, 1, 1), D(2024, 2, 1), []) == [(D(2024, 1, 1), D(2024, 2, 1))]
+
+    def test_subtract_leaves_gaps_around_covered_ranges(self):
+        covered = [(D(2024, 1, 20), D(2024, 1, 25)), (D(2024, 1, 5), D(2024, 1, 10))]
+        assert subtract_ranges(D(2024, 1, 1), D(2024, 2, 1), covered) == [
+            (D(2024, 1, 1), D(2024, 1, 5)),
+            (D(2024, 1, 10), D(2024, 1, 20)),
+            (D(2024, 1, 25), D(2024, 2, 1)),
+        ]
+
+    def test_subtract_fully_covered(self):
+        covered = [(D(2023, 12, 1), D(2024, 1, 15)), (D(2024, 1, 10), D(2024, 3, 1))]
+        assert subtract_ranges(D(2024, 1, 1), D(2024, 2, 1), covered) == []
+
+    def test_subtract_ignores_ranges_outside(self):
+        covered = [(D(2023, 1, 1), D(2023, 2, 1)), (D(2024, 3, 1), D(2024, 4, 1))]
+        assert subtract_ranges(D(2024, 1, 1), D(2024, 2, 1), covered) == [(D(2024, 1, 1), D(2024, 2, 1))]
+
+    def test_merge_overlapping_and_adjacent(self):
+        ranges = [(D(2024, 1, 10), D(2024, 1, 20)), (D(2024, 1, 1), D(2024, 1, 10)), (D(2024, 1, 15), D(2024, 1, 18))]
+        assert _merge_ranges(ranges) == [(D(2024, 1, 1), D(2024, 1, 20))]
+
+    def test_merge_keeps_gaps(self):
+        ranges = [(D(2024, 1, 1), D(2024, 1, 5)), (D(2024, 1, 6), D(2024, 1, 8))]
+        assert _merge_ranges(ranges) == ranges
+
+
+class TestPriceStore:
+    """Tests for coverage bookkeeping around yfinance downloads."""
+
+    def test_stored_range_is_not_downloaded_again(self, store):
+        company = MagicMock()
+        company.history.return_value = bars("2024-01-02", "2024-01-03", "2024-01-04")
+        with patch("price_store.yf.Ticker", return_value=company):
+            first = store.history("AAPL", D(2024, 1, 1), D(2024, 1, 5))
+            second = store.history("AAPL", D(2024, 1, 2), D(2024, 1, 4))
+
+        assert company.history.call_count == 1
+        assert len(first) == 3
+        assert list(second["Close"]) == [1.5, 1.5]
+
+    def test_empty_download_is_not_cached(self, store):
+        company = MagicMock()
+        company.history.return_value = pd.DataFrame()
+        with patch("price_store.yf.Ticker", return_value=company):
+            assert store.history("AAPL", D(2024, 1, 1), D(2024, 1, 5)).empty
+
+        assert store.missing_ranges("AAPL", "1d", D(2024, 1, 1), D(2024, 1, 5), True) == [
+            (D(2024, 1, 1), D(2024, 1, 5))
+        ]
+        company.history.return_value = bars("2024-01-02")
+        with patch("price_store.yf.Ticker", return_value=company):
+            assert len(store.history("AAPL", D(2024, 1, 1), D(2024, 1, 5))) == 1
+        assert company.history.call_count == 2
+
+    def test_weekend_range_is_covered_without_download(self, store):
+        company = MagicMock()
+        with patch("price_store.yf.Ticker", return_value=company):
+            assert store.history("AAPL", D(2024, 1, 6), D(2024, 1, 8)).empty
+        company.history.assert_not_called()
+        assert store.missing_ranges("AAPL", "1d", D(2024, 1, 6), D(2024, 1, 8), True) == []
+
+    def test_tickers_are_normalized(self, store):
+        company = MagicMock()
+        company.history.return_value = bars("2024-01-02")
+        with patch("price_store.yf.Ticker", return_value=company) as ticker:
+            store.history("aapl", D(2024, 1, 2), D(2024, 1, 3))
+            store.history(" AAPL ", D(2024, 1, 2), D(2024, 1, 3))
+        ticker.assert_called_once_with("AAPL")
+
+    def test_history_many_does_not_cover_failed_ticker(self, store):
+        good = bars("2024-01-02", "2024-01-03")
+        padding = good * float("nan")
+        raw = pd.concat({"AAPL": good, "BAD": padding}, axis=1)
+        with patch("price_store.yf.download", return_value=raw) as download:
+            result = store.history_many(["AAPL", "BAD"], D(2024, 1, 1), D(2024, 1, 4))
+
+        download.assert_called_once()
+        assert len(result["AAPL"]) == 2
+        assert result["BAD"].empty
+        assert store.missing_ranges("AAPL", "1d", D(2024, 1, 1), D(2024, 1, 4), True) == []
+        assert store.missing_ranges("BAD", "1d", D(2024, 1, 1), D(2024, 1, 4), True) == [
+            (D(2024, 1, 1), D(2024, 1, 4))
+        ]
+
+    def test_partial_period_intervals_are_not_cached(self):
+        assert CACHEABLE_INTERVALS == {"1d"}
+
+    def test_forming_bar_is_returned_but_not_stored(self, store):
+        today = D(2024, 1, 3)  # a Wednesday, so yesterday is a trading day too
+        yesterday = today - datetime.timedelta(days=1)
+        company = MagicMock()
+        company.history.return_value = bars(yesterday.isoformat(), today.isoformat())
+        with patch("price_store.yf.Ticker", return_value=company), \
+                patch("price_store.exchange_today", return_value=today):
+            frame = store.history("AAPL", yesterday, today + datetime.timedelta(days=1))
+
+        assert [ts.date() for ts in frame.index] == [yesterday, today]
+        assert store.missing_ranges("AAPL", "1d", yesterday, today + datetime.timedelta(days=1), True) == [
+            (today, today + datetime.timedelta(days=1))
+        ]
@@ -27,6 +27,8 @@ class MCPServerConfig:
     enabled: bool = True
     # Authentication info could be added here later
     auth: str = ""  # "none", "oauth2", etc.
+    # Opt-in result cache for read-only actions, e.g. {"ttl": 60, "max_bytes": 1048576}
+    cache: Dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -57,6 +59,8 @@ class MCPServerConfig:
             result["env"] = self.env
         if self.auth:
             result["auth"] = self.auth
+        if self.cache:
+            result["cache"] = self.cache
 
         return result
 
@@ -74,6 +78,7 @@ class MCPServerConfig:
                 env=data.get("env", {}),
                 enabled=data.get("enabled", True),
                 auth=data.get("auth", ""),
+                cache=data.get("cache", {}),
             )
         else:  # stdio/command
             return cls(
@@ -83,6 +88,7 @@ class MCPServerConfig:
                 args=data.get("args", []),
                 env=data.get("env", {}),
                 enabled=data.get("enabled", True),
+                cache=data.get("cache", {}),
             )
 
 
@@ -125,6 +131,7 @@ class MCPServerList:
                                 "type": config.get("type", "stdio"),
                                 "env": config.get("env", {}),
                                 "enabled": config.get("enabled", True),
+                                "cache": config.get("cache", {}),
                             }
 
                             # Add type-specific fields
@@ -170,6 +177,8 @@ class MCPServerList:
 
                 if server.env:
                     server_config["env"] = server.env
+                if server.cache:
+                    server_config["cache"] = server.cache
                 # Always save enabled field to be explicit
                 server_config["enabled"] = server.enabled
                 servers_dict[name] = server_config
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -9,9 +10,13 @@ from strata.config import MCPServerConfig, MCPServerList
 from strata.mcp_proxy.client import MCPClient
 from strata.mcp_proxy.transport.http import HTTPTransport
 from strata.mcp_proxy.transport.stdio import StdioTransport
+from strata.result_cache import ResultCache
 
 logger = logging.getLogger(__name__)
 
+# Most actions running at the same time against one server, across all callers
+ACTION_CONCURRENCY_PER_SERVER = int(os.getenv("STRATA_ACTION_CONCURRENCY_PER_SERVER", "4"))
+
 
 class MCPClientManager:
     """Manages multiple MCP client connections based on configuration."""
@@ -33,6 +38,18 @@ class MCPClientManager:
         self.cached_configs: List[MCPServerConfig] = []
         # Mutex to prevent concurrent sync operations
         self._sync_lock = asyncio.Lock()
+        # Cached results of read-only actions, for servers that opt in
+        self.result_cache = ResultCache()
+        # server name -> semaphore shared by execute_action and every batch
+        self._action_slots: Dict[str, asyncio.Semaphore] = {}
+
+    def action_slot(self, server_name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding concurrent actions on a server."""
+        slot = self._action_slots.get(server_name)
+        if slot is None:
+            slot = asyncio.Semaphore(ACTION_CONCURRENCY_PER_SERVER)
+            self._action_slots[server_name] = slot
+        return slot
 
     async def initialize_from_config(self) -> Dict[str, bool]:
         """Initialize MCP clients from configuration.
@@ -108,7 +125,7 @@ class MCPClientManager:
             )
 
         # Create client
-        client = MCPClient(transport)
+        client = MCPClient(transport, name=server.name)
 
         # Connect
         await client.connect()
@@ -116,6 +133,7 @@ class MCPClientManager:
         # Store active client and transport
         self.active_clients[server.name] = client
         self.active_transports[server.name] = transport
+        self.result_cache.configure(server.name, server.cache)
 
     async def _disconnect_server(self, server_name: str) -> None:
         """Disconnect from a single MCP server.
@@ -133,6 +151,7 @@ class MCPClientManager:
             finally:
                 # Remove from active clients
                 del self.active_clients[server_name]
+                self.result_cache.remove(server_name)
                 if server_name in self.active_transports:
                     del self.active_transports[server_name]
 
@@ -219,6 +238,17 @@ class MCPClientManager:
         client = self.active_clients.get(server_name)
         return client is not None and client.is_connected()
 
+    def get_health(self) -> Dict[str, Dict]:
+        """Get connection health of all active servers.
+
+        Returns:
+            Dict mapping server names to breaker state, failure and reconnect counts
+        """
+        return {
+            server_name: client.health()
+            for server_name, client in self.active_clients.items()
+        }
+
     async def disconnect_all(self) -> None:
         """Disconnect from all active MCP servers."""
         server_names = list(self.active_clients.keys())
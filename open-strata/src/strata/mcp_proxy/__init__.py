@@ -1,7 +1,9 @@
 """MCP Proxy module for connecting to and interacting with MCP servers."""
 
 from .client import MCPClient
+from .health import CircuitBreaker, CircuitOpenError
 from .transport import HTTPTransport, StdioTransport, Transport
+from .validation import ToolArgumentError
 from .auth_provider import create_oauth_provider
 
-__all__ = ["MCPClient", "StdioTransport", "HTTPTransport", "Transport", "create_oauth_provider"]
+__all__ = ["MCPClient", "CircuitBreaker", "CircuitOpenError", "StdioTransport", "HTTPTransport", "Transport", "ToolArgumentError", "create_oauth_provider"]
@@ -1,18 +1,44 @@
 """MCP Client for connecting to and interacting with MCP servers."""
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from mcp import types
+from mcp.client.session import ClientSession
+from mcp.shared.exceptions import McpError
 
+from .health import CLOSED, CircuitBreaker, backoff_delay
 from .transport import Transport
+from .validation import ToolValidator, compile_validator
 
 logger = logging.getLogger(__name__)
 
+# Deadline in seconds for a single upstream request (list_tools, call_tool)
+CALL_TIMEOUT = float(os.getenv("STRATA_CALL_TIMEOUT", "60"))
+# Seconds between keepalive pings to an upstream; 0 disables them
+PING_INTERVAL = float(os.getenv("STRATA_PING_INTERVAL", "30"))
+PING_TIMEOUT = float(os.getenv("STRATA_PING_TIMEOUT", "10"))
+# Connection attempts made when a dropped upstream is needed again
+RECONNECT_ATTEMPTS = int(os.getenv("STRATA_RECONNECT_ATTEMPTS", "3"))
+
+T = TypeVar("T")
+
 
 class MCPClient:
     """Client for connecting to MCP servers using various transports.
 
+    Once connected, the client keeps the upstream healthy on its own: it pings
+    the server every ping_interval seconds, transparently reconnects (with
+    exponential backoff) when the session has dropped, bounds every request by
+    call_timeout, and fails fast through a circuit breaker while the server keeps
+    failing. health() reports the breaker state and reconnect count.
+
+    Sessions are opened and closed by a single owner task, since the anyio task
+    groups inside a session must be exited by the task that entered them.
+    Requests that find the session dropped ask the owner for a new one.
+
     Usage:
         # With stdio transport
         transport = StdioTransport("docker", ["run", "-i", "my-server"])
@@ -25,14 +51,40 @@ class MCPClient:
         await client.connect()
     """
 
-    def __init__(self, transport: Transport):
+    def __init__(
+        self,
+        transport: Transport,
+        name: Optional[str] = None,
+        call_timeout: float = CALL_TIMEOUT,
+        ping_interval: float = PING_INTERVAL,
+    ):
         """Initialize the MCP client with a transport.
 
         Args:
             transport: Transport instance (StdioTransport or HTTPTransport)
+            name: Server name used in logs and errors
+            call_timeout: Deadline in seconds for each upstream request
+            ping_interval: Seconds between keepalive pings (0 disables them)
         """
         self.transport = transport
+        self.name = name or getattr(transport, "server_name", transport.__class__.__name__)
+        self.call_timeout = call_timeout
+        self.ping_interval = ping_interval
+        self.breaker = CircuitBreaker(self.name)
+        self.reconnect_count = 0
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        # inputSchema validators of the cached tools, by tool name
+        self._validators: Dict[str, ToolValidator] = {}
+        # True between connect() and disconnect(); only then do we reconnect
+        self._should_connect = False
+        # Set when the session is known to be broken; the next request reconnects
+        self._stale = False
+        self._reconnect_lock = asyncio.Lock()
+        self._keepalive_task: Optional[asyncio.Task] = None
+        # The task that owns the transport's session, and requests for a new session
+        self._owner_task: Optional[asyncio.Task] = None
+        self._owner_wakeup = asyncio.Event()
+        self._open_waiters: List[Tuple[asyncio.Future, Optional[float]]] = []
 
     async def initialize(self) -> None:
         """Initialize the MCP client by connecting the transport."""
@@ -40,20 +92,254 @@ class MCPClient:
 
     async def connect(self) -> None:
         """Connect to the MCP server."""
-        await self.transport.connect()
+        self._should_connect = True
+        if not self.transport.is_connected():
+            if self._owner_task is None or self._owner_task.done():
+                self._owner_task = asyncio.create_task(self._own_session())
+            error = await self._open_session(timeout=None)
+            if error is not None:
+                self._should_connect = False
+                await self._stop_owner()
+                raise error
+        self._stale = False
+        self._start_keepalive()
         logger.info(
             f"Connected to MCP server using {self.transport.__class__.__name__}"
         )
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
-        await self.transport.disconnect()
+        self._should_connect = False
+        await self._stop_keepalive()
+        await self._stop_owner()
         self._tools_cache = None
+        self._validators = {}
         logger.info("Disconnected from MCP server")
 
     def is_connected(self) -> bool:
         """Check if connected to an MCP server."""
-        return self.transport.is_connected()
+        return self.transport.is_connected() and not self._stale
+
+    def health(self) -> Dict[str, Any]:
+        """Connection health: breaker state, failures and reconnect count."""
+        return {
+            "connected": self.is_connected(),
+            "reconnects": self.reconnect_count,
+            **self.breaker.stats(),
+        }
+
+    def _start_keepalive(self) -> None:
+        if self.ping_interval <= 0:
+            return
+        if self._keepalive_task is None or self._keepalive_task.done():
+            self._keepalive_task = asyncio.create_task(self._keepalive())
+
+    async def _stop_keepalive(self) -> None:
+        task, self._keepalive_task = self._keepalive_task, None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _keepalive(self) -> None:
+        """Ping the upstream periodically and mark the session stale if it stops answering.
+
+        Reconnecting is left to the next request, which asks _own_session() for
+        a new session; that owner task is the only place the transport is opened
+        and closed, so this task never touches it.
+        """
+        while True:
+            await asyncio.sleep(self.ping_interval)
+            if self._stale or not self.transport.is_connected():
+                continue
+            if self.breaker.state != CLOSED:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self.transport.get_session().send_ping(), PING_TIMEOUT
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Keepalive ping to '{self.name}' failed: {e!r}")
+                self._stale = True
+                self.breaker.record_failure(e)
+
+    async def _own_session(self) -> None:
+        """Owner task: the only task that opens and closes the transport's session.
+
+        Waits for _open_session() requests, replaces the session for each batch
+        of them and reports the outcome, until disconnect() clears _should_connect.
+        """
+        try:
+            while True:
+                await self._owner_wakeup.wait()
+                self._owner_wakeup.clear()
+                if not self._should_connect:
+                    return
+                waiters, self._open_waiters = self._open_waiters, []
+                if not waiters:
+                    continue
+                error = await self._replace_session(waiters[0][1])
+                for future, _ in waiters:
+                    if not future.done():
+                        future.set_result(error)
+        finally:
+            for future, _ in self._open_waiters:
+                if not future.done():
+                    future.set_result(ConnectionError(f"Connection to '{self.name}' was closed"))
+            self._open_waiters = []
+            try:
+                await self.transport.disconnect()
+            except Exception as e:
+                logger.debug(f"Error closing session of '{self.name}': {e!r}")
+
+    async def _replace_session(self, timeout: Optional[float]) -> Optional[Exception]:
+        """Close the current session and open a new one; returns the error if opening failed."""
+        try:
+            await self.transport.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing dropped session of '{self.name}': {e!r}")
+        # The deadline cancels this task directly: asyncio.wait_for would connect in
+        # a child task on Python < 3.12, and an anyio cancel scope cannot be exited
+        # while the session's task groups are still open inside it
+        task = asyncio.current_task()
+        timed_out = False
+
+        def expire() -> None:
+            nonlocal timed_out
+            timed_out = True
+            task.cancel()
+
+        deadline = None
+        if timeout is not None:
+            deadline = asyncio.get_running_loop().call_later(timeout, expire)
+        try:
+            await self.transport.connect()
+        except asyncio.CancelledError:
+            if timed_out:
+                if hasattr(task, "uncancel"):
+                    task.uncancel()
+                return TimeoutError(f"Connecting to '{self.name}' timed out after {timeout:g}s")
+            if getattr(task, "cancelling", lambda: 0)():
+                raise
+            # A dead session's cancel scope can leak a cancellation into the new connect
+            return ConnectionError(f"Connecting to '{self.name}' was cancelled")
+        except Exception as e:
+            return e
+        finally:
+            if deadline is not None:
+                deadline.cancel()
+        return None
+
+    async def _open_session(self, timeout: Optional[float]) -> Optional[Exception]:
+        """Ask the owner task for a fresh session; returns the error if it could not open one."""
+        owner = self._owner_task
+        if owner is None or owner.done():
+            return ConnectionError(f"Not connected to '{self.name}'")
+        future = asyncio.get_running_loop().create_future()
+        self._open_waiters.append((future, timeout))
+        self._owner_wakeup.set()
+        # Wake up if the owner dies before answering
+        done, _ = await asyncio.wait({future, owner}, return_when=asyncio.FIRST_COMPLETED)
+        if future in done:
+            return future.result()
+        future.cancel()
+        return ConnectionError(f"Connection to '{self.name}' was closed")
+
+    async def _stop_owner(self) -> None:
+        """Let the owner task close its session and exit (call with _should_connect cleared)."""
+        owner, self._owner_task = self._owner_task, None
+        if owner is None or owner.done():
+            # e.g. after initialize(), which connects from the calling task
+            await self.transport.disconnect()
+            return
+        self._owner_wakeup.set()
+        await asyncio.gather(owner, return_exceptions=True)
+
+    async def _reconnect(self) -> None:
+        """Replace a dropped session, retrying with exponential backoff."""
+        async with self._reconnect_lock:
+            if not self._stale and self.transport.is_connected():
+                # Another request reconnected while we waited for the lock
+                return
+
+            last_error: Optional[BaseException] = None
+            for attempt in range(RECONNECT_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(backoff_delay(attempt - 1))
+                error = await self._open_session(self.call_timeout)
+                if error is not None:
+                    last_error = error
+                    logger.warning(
+                        f"Reconnect attempt {attempt + 1}/{RECONNECT_ATTEMPTS} "
+                        f"to '{self.name}' failed: {error!r}"
+                    )
+                    continue
+
+                self._stale = False
+                # The server may have restarted with a different tool list
+                self._tools_cache = None
+                self._validators = {}
+                self.reconnect_count += 1
+                logger.info(f"Reconnected to MCP server '{self.name}'")
+                return
+
+            raise ConnectionError(
+                f"Could not reconnect to '{self.name}' after "
+                f"{RECONNECT_ATTEMPTS} attempts: {last_error!r}"
+            )
+
+    async def _request(
+        self, description: str, send: Callable[[ClientSession], Awaitable[T]]
+    ) -> T:
+        """Send one request upstream under the breaker, reconnecting and timing out as needed."""
+        if not self._should_connect:
+            raise RuntimeError("Not connected to any MCP server")
+
+        self.breaker.before_call()
+        try:
+            if self._stale or not self.transport.is_connected():
+                await self._reconnect()
+            result = await asyncio.wait_for(
+                send(self.transport.get_session()), self.call_timeout
+            )
+        except asyncio.TimeoutError as e:
+            # A slow upstream is not necessarily a broken session
+            self._record_failure(e, session_broken=False)
+            raise TimeoutError(
+                f"{description} on '{self.name}' timed out after {self.call_timeout:g}s"
+            ) from e
+        except McpError as e:
+            if e.error.code != types.CONNECTION_CLOSED:
+                # The upstream answered with a protocol-level error
+                self.breaker.record_success()
+                raise
+            self._record_failure(e, session_broken=True)
+            raise
+        except asyncio.CancelledError:
+            self.breaker.record_abandoned()
+            raise
+        except Exception as e:
+            self._record_failure(e, session_broken=True)
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    def _record_failure(self, error: BaseException, session_broken: bool) -> None:
+        opened = self.breaker.record_failure(error)
+        if opened:
+            logger.warning(
+                f"Circuit for '{self.name}' opened after "
+                f"{self.breaker.consecutive_failures} consecutive failures: {error!r}"
+            )
+        if session_broken or opened:
+            # Start from a fresh session on the next request
+            self._stale = True
 
     async def list_tools(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """List available tools from the MCP server.
@@ -64,18 +350,20 @@ class MCPClient:
         Returns:
             List of tool definitions with name, description, and inputSchema
         """
-        if not self.transport.is_connected():
+        if not self._should_connect:
             raise RuntimeError("Not connected to any MCP server")
 
         if use_cache and self._tools_cache is not None:
             return self._tools_cache
 
         # Get tools from server
-        session = self.transport.get_session()
-        response = await session.list_tools()
+        response = await self._request(
+            "list_tools", lambda session: session.list_tools()
+        )
 
         # Convert to dict format
         tools = []
+        validators = {}
         for tool in response.tools:
             tool_dict = {
                 "name": tool.name,
@@ -87,9 +375,16 @@ class MCPClient:
                 tool_dict["title"] = tool.title
             if hasattr(tool, "outputSchema") and tool.outputSchema:
                 tool_dict["outputSchema"] = tool.outputSchema
+            if getattr(tool, "annotations", None):
+                tool_dict["annotations"] = tool.annotations.model_dump(exclude_none=True)
             tools.append(tool_dict)
 
+            validator = compile_validator(tool.name, tool.inputSchema)
+            if validator is not None:
+                validators[tool.name] = validator
+
         self._tools_cache = tools
+        self._validators = validators
         logger.info(f"Retrieved {len(tools)} tools from MCP server")
 
         return tools
@@ -105,15 +400,21 @@ class MCPClient:
 
         Returns:
             Tool execution result from MCP server
+
+        Raises:
+            CircuitOpenError: If the server keeps failing and is being skipped
+            TimeoutError: If the server does not answer within call_timeout
         """
-        if not self.transport.is_connected():
+        if not self._should_connect:
             raise RuntimeError("Not connected to any MCP server")
 
         logger.info(f"Calling tool '{tool_name}' with arguments: {arguments}")
 
         # Call the tool and return result directly
-        session = self.transport.get_session()
-        result = await session.call_tool(tool_name, arguments)
+        result = await self._request(
+            f"Tool '{tool_name}'",
+            lambda session: session.call_tool(tool_name, arguments),
+        )
         if result.isError:
             logger.error(
                 f"Tool '{tool_name}' returned error: {result.structuredContent}"
@@ -121,6 +422,34 @@ class MCPClient:
             raise RuntimeError(f"Tool '{tool_name}' error: {result.structuredContent}")
         return result.content
 
+    async def validate_arguments(
+        self, tool_name: str, arguments: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validate and coerce tool arguments against the tool's inputSchema locally.
+
+        Args:
+            tool_name: Name of the tool
+            arguments: Arguments to pass to the tool
+
+        Returns:
+            The arguments coerced to the schema's types (unchanged if the tool
+            or its schema is unknown)
+
+        Raises:
+            ToolArgumentError: If the arguments do not match the schema
+        """
+        try:
+            await self.list_tools()
+        except Exception as e:
+            # Let the call itself surface the upstream problem
+            logger.debug(f"Cannot validate '{tool_name}' locally: {e!r}")
+            return arguments
+
+        validator = self._validators.get(tool_name)
+        if validator is None:
+            return arguments
+        return validator.validate(arguments)
+
     async def get_tool_schema(self, tool_name: str) -> Optional[Dict[str, Any]]:
         """Get the schema for a specific tool.
 
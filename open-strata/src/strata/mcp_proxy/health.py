@@ -0,0 +1,106 @@
+"""Health tracking for upstream MCP server connections."""
+
+import os
+import random
+import time
+from typing import Any, Dict, Optional
+
+# Consecutive failures that open the circuit
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("STRATA_BREAKER_FAILURE_THRESHOLD", "5"))
+# Seconds an open circuit fails fast before letting a probe call through
+BREAKER_RESET_TIMEOUT = float(os.getenv("STRATA_BREAKER_RESET_TIMEOUT", "30"))
+
+# Reconnect backoff: base * 2**attempt seconds, capped, with jitter
+RECONNECT_BASE_DELAY = float(os.getenv("STRATA_RECONNECT_BASE_DELAY", "0.5"))
+RECONNECT_MAX_DELAY = float(os.getenv("STRATA_RECONNECT_MAX_DELAY", "10"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+    def __init__(self, name: str, retry_after: float):
+        super().__init__(
+            f"Server '{name}' is unavailable after repeated failures; "
+            f"retry in {retry_after:.0f}s"
+        )
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """Circuit breaker for one upstream server.
+
+    closed: calls go through; failure_threshold consecutive failures open it.
+    open: calls fail fast with CircuitOpenError for reset_timeout seconds.
+    half_open: one probe call goes through; success closes the circuit,
+    failure opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str = "upstream",
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.times_opened = 0
+        self.opened_at = 0.0
+        self.last_error: Optional[str] = None
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError if the call must not reach the upstream."""
+        if self.state == OPEN:
+            retry_after = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_after > 0:
+                raise CircuitOpenError(self.name, retry_after)
+            self.state = HALF_OPEN
+
+        if self.state == HALF_OPEN:
+            if self._probe_in_flight:
+                raise CircuitOpenError(self.name, self.reset_timeout)
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self, error: BaseException) -> bool:
+        """Count a failed call. Returns True if this failure opened the circuit."""
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+        self._probe_in_flight = False
+        if self.state == HALF_OPEN or (
+            self.state == CLOSED and self.consecutive_failures >= self.failure_threshold
+        ):
+            self.state = OPEN
+            self.opened_at = time.monotonic()
+            self.times_opened += 1
+            return True
+        return False
+
+    def record_abandoned(self) -> None:
+        """A call was cancelled before the upstream answered; it says nothing about health."""
+        self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened,
+            "last_error": self.last_error,
+        }
+
+
+def backoff_delay(attempt: int) -> float:
+    """Seconds to wait before reconnect attempt number `attempt` (0-based)."""
+    delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2**attempt)
+    return delay * random.uniform(0.8, 1.2)
@@ -48,11 +48,16 @@ class Transport(ABC):
             self._connected = True
             logger.info(f"Successfully connected via {self.__class__.__name__}")
 
-        except Exception as e:
-            logger.error(f"Failed to connect via {self.__class__.__name__}: {e}")
+        except BaseException as e:
+            # Also clean up when a connect deadline cancels us half-way
+            logger.error(f"Failed to connect via {self.__class__.__name__}: {e!r}")
             if self._exit_stack:
-                await self._exit_stack.aclose()
-                self._exit_stack = None
+                exit_stack, self._exit_stack = self._exit_stack, None
+                self._session = None
+                try:
+                    await exit_stack.aclose()
+                except Exception as close_error:
+                    logger.debug(f"Error closing failed connection: {close_error!r}")
             raise
 
     async def connect(self) -> None:
@@ -67,22 +72,23 @@ class Transport(ABC):
         if not self._connected:
             return
 
-        if self._exit_stack:
-            try:
+        try:
+            if self._exit_stack:
                 await self._exit_stack.aclose()
-            except RuntimeError as e:
-                # Handle cross-task cleanup errors from anyio's CancelScope
-                if "cancel scope" in str(e).lower():
-                    logger.warning(
-                        "Cross-task cleanup detected and handled. "
-                        "This typically happens with pytest fixtures."
-                    )
-                else:
-                    raise
-
-        self._session = None
-        self._exit_stack = None
-        self._connected = False
+        except RuntimeError as e:
+            # Handle cross-task cleanup errors from anyio's CancelScope
+            if "cancel scope" in str(e).lower():
+                logger.warning(
+                    "Cross-task cleanup detected and handled. "
+                    "This typically happens with pytest fixtures."
+                )
+            else:
+                raise
+        finally:
+            # Even if closing a dropped session fails, the transport can connect again
+            self._session = None
+            self._exit_stack = None
+            self._connected = False
 
     def is_connected(self) -> bool:
         """Check if connected to an MCP server."""
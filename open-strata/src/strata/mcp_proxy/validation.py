@@ -0,0 +1,149 @@
+"""Local validation of tool arguments against upstream inputSchemas."""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+from jsonschema import exceptions as schema_exceptions
+from jsonschema.validators import Draft202012Validator, validator_for
+
+logger = logging.getLogger(__name__)
+
+# Most schema errors reported for one call
+MAX_REPORTED_ERRORS = 5
+MAX_ERROR_LENGTH = 160
+
+_INTEGER = re.compile(r"[+-]?\d+")
+_NOT_CONVERTED = object()
+
+
+class ToolArgumentError(ValueError):
+    """Raised when arguments do not match the tool's inputSchema."""
+
+    def __init__(self, tool_name: str, errors: List[str]):
+        super().__init__(f"Invalid arguments for '{tool_name}': {'; '.join(errors)}")
+        self.tool_name = tool_name
+        self.errors = errors
+
+
+class ToolValidator:
+    """inputSchema of one tool compiled into a reusable jsonschema validator."""
+
+    def __init__(self, tool_name: str, schema: Dict[str, Any]):
+        self.tool_name = tool_name
+        self.schema = schema
+        validator_cls = validator_for(schema, default=Draft202012Validator)
+        self._validator = validator_cls(schema)
+
+    def validate(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Coerce arguments to the schema's types and validate them.
+
+        Returns:
+            The coerced arguments
+
+        Raises:
+            ToolArgumentError: With compact messages for the first few violations
+        """
+        coerced = coerce(arguments, self.schema)
+        try:
+            errors = sorted(
+                self._validator.iter_errors(coerced), key=schema_exceptions.relevance
+            )
+        except Exception as e:
+            # A schema we cannot evaluate should not block the call; the upstream decides
+            logger.debug(f"Skipping validation of '{self.tool_name}': {e!r}")
+            return coerced
+        if errors:
+            raise ToolArgumentError(
+                self.tool_name, [_describe(error) for error in errors[:MAX_REPORTED_ERRORS]]
+            )
+        return coerced
+
+
+def compile_validator(tool_name: str, schema: Any) -> Optional[ToolValidator]:
+    """Compile a tool's inputSchema, or return None if there is nothing usable to check."""
+    if not isinstance(schema, dict) or not schema:
+        return None
+    try:
+        return ToolValidator(tool_name, schema)
+    except Exception as e:
+        logger.debug(f"Not validating '{tool_name}', unusable inputSchema: {e!r}")
+        return None
+
+
+def coerce(value: Any, schema: Any) -> Any:
+    """Convert string values to the type the schema declares (e.g. "5" -> 5, "true" -> True).
+
+    Agents often send scalars as strings, and arrays or objects as JSON strings.
+    Values that cannot be converted are left as they are for the validator to report.
+    """
+    if not isinstance(schema, dict):
+        return value
+
+    declared = schema.get("type")
+    declared_types = [declared] if isinstance(declared, str) else declared or []
+    if isinstance(value, str) and declared_types and "string" not in declared_types:
+        for declared_type in declared_types:
+            converted = _from_string(value, declared_type)
+            if converted is not _NOT_CONVERTED:
+                value = converted
+                break
+    elif (
+        isinstance(value, float)
+        and "integer" in declared_types
+        and "number" not in declared_types
+        and value.is_integer()
+    ):
+        value = int(value)
+
+    if isinstance(value, dict):
+        properties = schema.get("properties")
+        if isinstance(properties, dict):
+            value = {
+                key: coerce(item, properties[key]) if key in properties else item
+                for key, item in value.items()
+            }
+    elif isinstance(value, list):
+        items = schema.get("items")
+        if isinstance(items, dict):
+            value = [coerce(item, items) for item in value]
+    return value
+
+
+def _from_string(value: str, declared_type: str) -> Any:
+    text = value.strip()
+    if declared_type == "integer":
+        if _INTEGER.fullmatch(text):
+            return int(text)
+    elif declared_type == "number":
+        if _INTEGER.fullmatch(text):
+            return int(text)
+        try:
+            number = float(text)
+        except ValueError:
+            return _NOT_CONVERTED
+        if number == number and number not in (float("inf"), float("-inf")):
+            return number
+    elif declared_type == "boolean":
+        if text.lower() in ("true", "false"):
+            return text.lower() == "true"
+    elif declared_type == "null":
+        if text.lower() in ("null", "none", ""):
+            return None
+    elif declared_type in ("array", "object"):
+        try:
+            parsed = json.loads(text)
+        except ValueError:
+            return _NOT_CONVERTED
+        if isinstance(parsed, list if declared_type == "array" else dict):
+            return parsed
+    return _NOT_CONVERTED
+
+
+def _describe(error: schema_exceptions.ValidationError) -> str:
+    path = ".".join(str(part) for part in error.absolute_path)
+    message = error.message
+    if len(message) > MAX_ERROR_LENGTH:
+        message = message[: MAX_ERROR_LENGTH - 3] + "..."
+    return f"{path}: {message}" if path else message
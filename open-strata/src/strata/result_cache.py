@@ -0,0 +1,185 @@
+"""Opt-in cache of upstream results for read-only actions."""
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+import mcp.types as types
+
+from .mcp_proxy.client import MCPClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_TTL = 60.0
+DEFAULT_CACHE_MAX_BYTES = 1024 * 1024
+
+CacheKey = Tuple[str, str]
+
+
+@dataclass
+class CachePolicy:
+    """Caching settings of one server, from the "cache" entry of its config.
+
+    Example server configuration:
+        "cache": {"ttl": 30, "max_bytes": 524288, "actions": ["get_channel"]}
+
+    Actions annotated readOnlyHint are cached; "actions" allow-lists more.
+    """
+
+    ttl: float = DEFAULT_CACHE_TTL
+    max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    actions: FrozenSet[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "CachePolicy":
+        return cls(
+            ttl=float(config.get("ttl", DEFAULT_CACHE_TTL)),
+            max_bytes=int(config.get("max_bytes", DEFAULT_CACHE_MAX_BYTES)),
+            actions=frozenset(config.get("actions", [])),
+        )
+
+
+class ServerResultCache:
+    """LRU cache of one server's results, bounded by TTL and total bytes."""
+
+    def __init__(self, policy: CachePolicy):
+        self.policy = policy
+        # key -> (expires_at, size in bytes, content)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, List[types.ContentBlock]]]" = OrderedDict()
+        self.bytes = 0
+        # Bumped on every invalidation, so reads started before a write are not stored
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: CacheKey) -> Optional[List[types.ContentBlock]]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, size, content = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return content
+            del self._entries[key]
+            self.bytes -= size
+        self.misses += 1
+        return None
+
+    def put(
+        self, key: CacheKey, content: List[types.ContentBlock], generation: int
+    ) -> None:
+        if generation != self.generation:
+            # A write succeeded while this read was in flight
+            return
+        size = sum(len(block.model_dump_json()) for block in content)
+        if size > self.policy.max_bytes:
+            return
+
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self.bytes -= old[1]
+        self._entries[key] = (time.monotonic() + self.policy.ttl, size, content)
+        self.bytes += size
+        while self.bytes > self.policy.max_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self.bytes -= evicted_size
+            self.evictions += 1
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self.bytes = 0
+        self.generation += 1
+        self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class ResultCache:
+    """Result caches of all servers that opted in with a "cache" config entry.
+
+    Results are keyed by action name and canonicalized parameters. Only
+    read-only actions (readOnlyHint annotation or allow-listed in config) are
+    cached; any other action that succeeds on a server invalidates that
+    server's cache, since it may have changed what the reads return.
+    """
+
+    def __init__(self):
+        self._servers: Dict[str, ServerResultCache] = {}
+
+    def configure(self, server_name: str, config: Optional[Dict[str, Any]]) -> None:
+        """Enable caching for a server with its config, or disable it if config is empty."""
+        if config:
+            self._servers[server_name] = ServerResultCache(CachePolicy.from_config(config))
+        else:
+            self._servers.pop(server_name, None)
+
+    def remove(self, server_name: str) -> None:
+        self._servers.pop(server_name, None)
+
+    def is_enabled(self, server_name: str) -> bool:
+        return server_name in self._servers
+
+    @staticmethod
+    def make_key(action_name: str, params: Dict[str, Any]) -> CacheKey:
+        return (
+            action_name,
+            json.dumps(params, sort_keys=True, separators=(",", ":"), default=str),
+        )
+
+    async def call_tool(
+        self,
+        server_name: str,
+        client: MCPClient,
+        action_name: str,
+        params: Dict[str, Any],
+    ) -> List[types.ContentBlock]:
+        """Call an action on a server, answering read-only actions from the cache when possible."""
+        cache = self._servers.get(server_name)
+        if cache is None:
+            return await client.call_tool(action_name, params)
+
+        if not await self._is_read_only(cache, client, action_name):
+            content = await client.call_tool(action_name, params)
+            cache.invalidate()
+            return content
+
+        key = self.make_key(action_name, params)
+        content = cache.get(key)
+        if content is not None:
+            logger.debug(f"Result cache hit for {server_name}/{action_name}")
+            return content
+
+        generation = cache.generation
+        content = await client.call_tool(action_name, params)
+        cache.put(key, content, generation)
+        return content
+
+    @staticmethod
+    async def _is_read_only(
+        cache: ServerResultCache, client: MCPClient, action_name: str
+    ) -> bool:
+        if action_name in cache.policy.actions:
+            return True
+        try:
+            tool = await client.get_tool_schema(action_name)
+        except Exception:
+            # Unknown actions are treated as writes
+            return False
+        annotations = (tool or {}).get("annotations") or {}
+        return annotations.get("readOnlyHint") is True
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: cache.stats() for name, cache in self._servers.items()}
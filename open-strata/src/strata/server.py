@@ -12,7 +12,7 @@ from mcp.server.sse import SseServerTransport
 from mcp.server.stdio import stdio_server
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
 from starlette.applications import Starlette
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
 from starlette.routing import Mount, Route
 from starlette.types import Receive, Scope, Send
 
@@ -152,6 +152,15 @@ def run_server(port: int, json_response: bool) -> int:
             logger.error(f"SSE connection error: {e}")
         return Response()
 
+    async def handle_health(request):
+        """Report upstream breaker state, reconnect counts and result cache stats."""
+        return JSONResponse(
+            {
+                "servers": client_manager.get_health(),
+                "result_cache": client_manager.result_cache.stats(),
+            }
+        )
+
     # Set up StreamableHTTP transport
     session_manager = StreamableHTTPSessionManager(
         app=app,
@@ -179,6 +188,7 @@ def run_server(port: int, json_response: bool) -> int:
                 logger.info("- discover_server_actions: Discover available actions")
                 logger.info("- get_action_details: Get detailed action parameters")
                 logger.info("- execute_action: Execute server actions")
+                logger.info("- batch_execute_actions: Execute several actions concurrently")
                 logger.info("- search_documentation: Search server documentation")
                 logger.info("- handle_auth_failure: Handle authentication issues")
                 yield
@@ -192,6 +202,8 @@ def run_server(port: int, json_response: bool) -> int:
             Mount("/messages/", app=sse.handle_post_message),
             # StreamableHTTP route
             Mount("/mcp", app=handle_streamable_http),
+            # Upstream health
+            Route("/health", endpoint=handle_health, methods=["GET"]),
         ],
         lifespan=lifespan,
     )
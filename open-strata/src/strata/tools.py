@@ -1,12 +1,16 @@
 """Shared tool implementations for Strata MCP Router."""
 
+import asyncio
 import json
 import logging
-from typing import List
+import os
+import time
+from typing import Any, Dict, List
 
 import mcp.types as types
 
 from .mcp_client_manager import MCPClientManager
+from .mcp_proxy.validation import ToolArgumentError
 from .utils.shared_search import UniversalToolSearcher
 
 logger = logging.getLogger(__name__)
@@ -15,9 +19,13 @@ logger = logging.getLogger(__name__)
 TOOL_DISCOVER_SERVER_ACTIONS = "discover_server_actions"
 TOOL_GET_ACTION_DETAILS = "get_action_details"
 TOOL_EXECUTE_ACTION = "execute_action"
+TOOL_BATCH_EXECUTE_ACTIONS = "batch_execute_actions"
 TOOL_SEARCH_DOCUMENTATION = "search_documentation"
 TOOL_HANDLE_AUTH_FAILURE = "handle_auth_failure"
 
+# Most actions accepted by one batch_execute_actions call
+MAX_BATCH_ACTIONS = int(os.getenv("STRATA_MAX_BATCH_ACTIONS", "20"))
+
 
 def get_tool_definitions(user_available_servers: List[str]) -> List[types.Tool]:
     """Get tool definitions for the available servers."""
@@ -92,6 +100,53 @@ def get_tool_definitions(user_available_servers: List[str]) -> List[types.Tool]:
                 },
             },
         ),
+        types.Tool(
+            name=TOOL_BATCH_EXECUTE_ACTIONS,
+            description=(
+                "Execute several independent actions concurrently in one call. "
+                "Results come back in request order with per-action status and timing."
+            ),
+            inputSchema={
+                "type": "object",
+                "required": ["actions"],
+                "properties": {
+                    "actions": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": MAX_BATCH_ACTIONS,
+                        "description": "Actions to execute; they must not depend on each other",
+                        "items": {
+                            "type": "object",
+                            "required": ["server_name", "action_name"],
+                            "properties": {
+                                "server_name": {
+                                    "type": "string",
+                                    "enum": user_available_servers,
+                                    "description": "The name of the server",
+                                },
+                                "action_name": {
+                                    "type": "string",
+                                    "description": "The name of the action/operation to execute",
+                                },
+                                "path_params": {
+                                    "type": "string",
+                                    "description": "JSON string containing path parameters",
+                                },
+                                "query_params": {
+                                    "type": "string",
+                                    "description": "JSON string containing query parameters",
+                                },
+                                "body_schema": {
+                                    "type": "string",
+                                    "description": "JSON string containing request body",
+                                    "default": "{}",
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        ),
         types.Tool(
             name=TOOL_SEARCH_DOCUMENTATION,
             description="Search for server action documentations by keyword matching.",
@@ -260,37 +315,50 @@ async def execute_tool(
 
             try:
                 client = client_manager.get_client(server_name)
-                action_params = {}
-
-                # Parse parameters if they're JSON strings
-                for param_name, param_value in [
-                    ("path_params", path_params),
-                    ("query_params", query_params),
-                    ("body_schema", body_schema),
-                ]:
-                    if param_value and param_value != "{}":
-                        try:
-                            if isinstance(param_value, str):
-                                action_params.update(json.loads(param_value))
-                            else:
-                                action_params.update(param_value)
-                        except json.JSONDecodeError:
-                            return [
-                                types.TextContent(
-                                    type="text",
-                                    text=f"Error: Invalid JSON in {param_name}",
-                                )
-                            ]
-
-                # Call the tool on the MCP server
-                return await client.call_tool(action_name, action_params)
+                try:
+                    action_params = _parse_action_params(
+                        path_params, query_params, body_schema
+                    )
+                except ValueError as e:
+                    return [types.TextContent(type="text", text=f"Error: {e}")]
+
+                async with client_manager.action_slot(server_name):
+                    # Check the arguments against the action's inputSchema before dispatch
+                    action_params = await client.validate_arguments(action_name, action_params)
+
+                    # Call the tool on the MCP server (or answer from the result cache)
+                    return await client_manager.result_cache.call_tool(
+                        server_name, client, action_name, action_params
+                    )
 
+            except ToolArgumentError as e:
+                result = {"error": str(e)}
             except KeyError:
                 result = {"error": f"Server '{server_name}' not found or not connected"}
             except Exception as e:
                 logger.error(f"Error executing action: {str(e)}")
                 result = {"error": f"Error executing action: {str(e)}"}
 
+        elif name == TOOL_BATCH_EXECUTE_ACTIONS:
+            actions = arguments.get("actions")
+
+            if not isinstance(actions, list) or not actions:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text="Error: actions must be a non-empty list",
+                    )
+                ]
+            if len(actions) > MAX_BATCH_ACTIONS:
+                return [
+                    types.TextContent(
+                        type="text",
+                        text=f"Error: at most {MAX_BATCH_ACTIONS} actions per batch",
+                    )
+                ]
+
+            result = await _execute_batch(actions, client_manager)
+
         elif name == TOOL_SEARCH_DOCUMENTATION:
             query = arguments.get("query")
             server_name = arguments.get("server_name")
@@ -381,3 +449,99 @@ async def execute_tool(
                 type="text", text=f"Error executing tool '{name}': {str(e)}"
             )
         ]
+
+
+def _parse_action_params(path_params, query_params, body_schema) -> Dict[str, Any]:
+    """Merge the path, query and body parameters of an action into one dict.
+
+    Raises:
+        ValueError: If one of the parameters is not a JSON object
+    """
+    action_params = {}
+
+    # Parse parameters if they're JSON strings
+    for param_name, param_value in [
+        ("path_params", path_params),
+        ("query_params", query_params),
+        ("body_schema", body_schema),
+    ]:
+        if param_value and param_value != "{}":
+            if isinstance(param_value, str):
+                try:
+                    param_value = json.loads(param_value)
+                except json.JSONDecodeError:
+                    raise ValueError(f"Invalid JSON in {param_name}")
+            if not isinstance(param_value, dict):
+                raise ValueError(f"{param_name} must be a JSON object")
+            action_params.update(param_value)
+
+    return action_params
+
+
+async def _execute_batch(
+    actions: List[Any], client_manager: MCPClientManager
+) -> Dict[str, Any]:
+    """Execute independent actions concurrently, within each server's action slots.
+
+    One failing action does not affect the others; each gets its own status.
+    """
+
+    async def run(index: int, action: Any) -> Dict[str, Any]:
+        if not isinstance(action, dict):
+            return {"index": index, "status": "error", "error": "action must be an object"}
+
+        server_name = action.get("server_name")
+        action_name = action.get("action_name")
+        item = {"index": index, "server_name": server_name, "action_name": action_name}
+
+        if not server_name or not action_name:
+            return {**item, "status": "error", "error": "server_name and action_name are required"}
+        try:
+            action_params = _parse_action_params(
+                action.get("path_params"),
+                action.get("query_params"),
+                action.get("body_schema", "{}"),
+            )
+            client = client_manager.get_client(server_name)
+        except ValueError as e:
+            return {**item, "status": "error", "error": str(e)}
+        except KeyError:
+            return {
+                **item,
+                "status": "error",
+                "error": f"Server '{server_name}' not found or not connected",
+            }
+        async with client_manager.action_slot(server_name):
+            # Validated inside the slot, so a cold tool cache is not fetched once per action
+            try:
+                action_params = await client.validate_arguments(action_name, action_params)
+            except ToolArgumentError as e:
+                return {**item, "status": "error", "error": str(e)}
+
+            start = time.perf_counter()
+            try:
+                content = await client_manager.result_cache.call_tool(
+                    server_name, client, action_name, action_params
+                )
+                item["status"] = "ok"
+                item["content"] = [
+                    block.model_dump(mode="json", exclude_none=True) for block in content
+                ]
+            except Exception as e:
+                logger.error(f"Error executing batched action {action_name}: {str(e)}")
+                item["status"] = "error"
+                item["error"] = f"Error executing action: {str(e)}"
+            item["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return item
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(run(index, action) for index, action in enumerate(actions))
+    )
+    succeeded = sum(1 for item in results if item["status"] == "ok")
+    return {
+        "results": results,
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
@@ -82,19 +82,49 @@ implementations to customize based on their documentation structure.
 
 import math
 import re
-from typing import List, Tuple
+from bisect import bisect_left
+from typing import Dict, FrozenSet, List, Tuple
+
+# Characters of each suffix kept in the sorted suffix table. Longer query
+# tokens are looked up by this prefix and then checked against the word.
+SUFFIX_KEY_CHARS = 24
+
+# (document index, field index within the document)
+Posting = Tuple[int, int]
 
 
 class FieldSearchEngine:
     """
     Simple field-based search engine with weighted scoring
     Compatible with BM25SearchEngine interface
+
+    Matching is substring-based ("project" matches "project_list"). Query tokens
+    never contain whitespace, so a token can only match inside one whitespace
+    separated word of a field value. build_index therefore indexes the distinct
+    words of all field values:
+
+    - word postings: word -> (doc, field) pairs whose values contain the word
+    - exact postings: whole field value -> (doc, field) pairs
+    - a sorted table of every word suffix, so the words containing a token are
+      one binary search away (a prefix search over suffixes)
+    - the word-boundary positions of every word, so a match found in the suffix
+      table is classified as word-boundary or partial without a regex
+
+    search() only visits the postings of the query tokens and scores them with
+    the three-layer scheme described above.
     """
 
     def __init__(self, **kwargs):
         """Initialize the search engine (kwargs for compatibility with BM25SearchEngine)"""
         self.documents = []
         self.corpus_metadata = None
+        self._word_postings: Dict[str, List[Posting]] = {}
+        self._exact_postings: Dict[str, List[Posting]] = {}
+        self._suffix_keys: List[str] = []
+        self._suffix_refs: List[Tuple[str, int]] = []
+        self._word_boundaries: Dict[str, FrozenSet[int]] = {}
+        # Per document: [(field_type, weight, dampening multiplier)] in field order
+        self._doc_fields: List[List[Tuple[str, float, int]]] = []
 
     def build_index(self, documents: List[Tuple[List[Tuple[str, str, int]], str]]):
         """
@@ -131,6 +161,80 @@ class FieldSearchEngine:
             )
             self.corpus_metadata.append(doc_id)
 
+        self._build_postings()
+
+    def _build_postings(self):
+        """Build the word, exact-value and suffix indexes from self.documents"""
+        word_postings: Dict[str, Dict[Posting, None]] = {}
+        exact_postings: Dict[str, Dict[Posting, None]] = {}
+        self._doc_fields = []
+
+        for doc_index, doc in enumerate(self.documents):
+            doc_field_info = []
+            for field_index, (field_type, field_values) in enumerate(doc["fields"].items()):
+                doc_field_info.append(
+                    (
+                        field_type,
+                        doc["weights"].get(field_type, 1.0),
+                        5 if field_type in ["description", "param_desc"] else 10,
+                    )
+                )
+                posting = (doc_index, field_index)
+                for value in field_values:
+                    exact_postings.setdefault(value, {})[posting] = None
+                    for word in value.split():
+                        word_postings.setdefault(word, {})[posting] = None
+            self._doc_fields.append(doc_field_info)
+
+        self._word_postings = {word: list(p) for word, p in word_postings.items()}
+        self._exact_postings = {value: list(p) for value, p in exact_postings.items()}
+
+        suffixes = sorted(
+            (word[offset:offset + SUFFIX_KEY_CHARS], word, offset)
+            for word in self._word_postings
+            for offset in range(len(word))
+        )
+        self._suffix_keys = [key for key, _, _ in suffixes]
+        self._suffix_refs = [(word, offset) for _, word, offset in suffixes]
+
+        # Positions where \b matches; word edges border whitespace or the value edge
+        self._word_boundaries = {
+            word: frozenset(match.start() for match in re.finditer(r"\b", word))
+            for word in self._word_postings
+        }
+
+    def _token_matches(self, token: str) -> Dict[Posting, float]:
+        """Best match quality (3.0 exact, 2.0 word boundary, 1.0 partial) per (doc, field)"""
+        key = token[:SUFFIX_KEY_CHARS]
+        keys = self._suffix_keys
+        end_offset = len(token)
+
+        # Best quality per indexed word containing the token
+        word_quality: Dict[str, float] = {}
+        index = bisect_left(keys, key)
+        while index < len(keys) and keys[index].startswith(key):
+            word, offset = self._suffix_refs[index]
+            index += 1
+            if word_quality.get(word) == 2.0:
+                continue
+            if len(token) > SUFFIX_KEY_CHARS and not word.startswith(token, offset):
+                continue
+            boundaries = self._word_boundaries[word]
+            if offset in boundaries and offset + end_offset in boundaries:
+                word_quality[word] = 2.0
+            else:
+                word_quality.setdefault(word, 1.0)
+
+        matches: Dict[Posting, float] = {}
+        # Partial matches first, so word-boundary matches overwrite them
+        for word, quality in sorted(word_quality.items(), key=lambda item: item[1]):
+            for posting in self._word_postings[word]:
+                matches[posting] = quality
+
+        for posting in self._exact_postings.get(token, ()):
+            matches[posting] = 3.0
+        return matches
+
     def search(self, query: str, top_k: int = 10) -> List[Tuple[float, str]]:
         """
         Search documents with field-weighted scoring and logarithmic dampening
@@ -145,89 +249,58 @@ class FieldSearchEngine:
         if not self.documents:
             return []
 
-        # Tokenize query into words
-        query_tokens = query.lower().split()
+        # Tokenize query into words; a repeated token only counts once per field
+        query_tokens = list(dict.fromkeys(query.lower().split()))
+
+        # (doc, field) -> match qualities of the query tokens found in that field
+        field_matches: Dict[Posting, List[float]] = {}
+        for token in query_tokens:
+            for posting, quality in self._token_matches(token).items():
+                qualities = field_matches.get(posting)
+                if qualities is None:
+                    field_matches[posting] = [quality]
+                else:
+                    qualities.append(quality)
 
         results = []
+        current_doc = None
+        field_scores: List[float] = []
+        # Postings sort by document, then by field order within the document
+        for doc_index, field_index in sorted(field_matches):
+            if doc_index != current_doc:
+                if field_scores:
+                    results.append(self._final_score(field_scores, current_doc))
+                current_doc, field_scores = doc_index, []
+
+            _, weight, dampening = self._doc_fields[doc_index][field_index]
+            qualities = field_matches[(doc_index, field_index)]
+            if len(qualities) == 1:
+                field_total = weight * qualities[0]
+            else:
+                # Apply diminishing returns for multiple tokens in same field
+                # Sort scores in descending order
+                field_token_scores = sorted((weight * quality for quality in qualities), reverse=True)
 
-        for doc in self.documents:
-            # Track scores by field type to apply per-field dampening
-            field_scores = {}
-            matched_field_types = set()
-
-            # Check each field type
-            for field_type, field_values in doc["fields"].items():
-                # Get weight from document's field weights
-                field_weight = doc["weights"].get(field_type, 1.0)
-
-                # Track tokens matched in this field
-                field_token_scores = []
-                matched_tokens = set()
-
-                # For each query token
-                for token in query_tokens:
-                    # Check if token appears in any value of this field
-                    best_match_score = 0
-
-                    for value in field_values:
-                        if (
-                            self._match_token(token, value)
-                            and token not in matched_tokens
-                        ):
-                            # Calculate match quality
-                            match_score = 0
-
-                            # Exact match gets highest score
-                            if value == token:
-                                match_score = 3.0
-                            # Word boundary match (complete word)
-                            elif re.search(r"\b" + re.escape(token) + r"\b", value):
-                                match_score = 2.0
-                            # Partial match gets base score
-                            else:
-                                match_score = 1.0
-
-                            best_match_score = max(best_match_score, match_score)
-
-                    if best_match_score > 0:
-                        matched_tokens.add(token)
-                        field_token_scores.append(field_weight * best_match_score)
-                        matched_field_types.add(field_type)
+                # Apply decay: 1st token 100%, 2nd 50%, 3rd 33%, etc.
+                field_total = 0
+                for i, token_score in enumerate(field_token_scores):
+                    field_total += token_score / (i + 1)
 
-                # Apply diminishing returns for multiple tokens in same field
-                if field_token_scores:
-                    # Sort scores in descending order
-                    field_token_scores.sort(reverse=True)
-
-                    # Apply decay: 1st token 100%, 2nd 50%, 3rd 33%, etc.
-                    field_total = 0
-                    for i, token_score in enumerate(field_token_scores):
-                        field_total += token_score / (i + 1)
-
-                    # Apply logarithmic dampening per field to prevent single field domination
-                    # This prevents description or other verbose fields from dominating
-                    if field_type in ["description", "param_desc"]:
-                        # Stronger dampening for description fields
-                        field_scores[field_type] = math.log(1 + field_total) * 5
-                    else:
-                        # Lighter dampening for identifier fields
-                        field_scores[field_type] = math.log(1 + field_total) * 10
-
-            # Calculate final score
-            if field_scores:
-                # Sum all field scores (already dampened per field)
-                total_score = sum(field_scores.values())
-
-                # Add diversity bonus for matching multiple field types
-                diversity_bonus = math.sqrt(len(matched_field_types)) * 3
-
-                final_score = total_score + diversity_bonus
-                results.append((final_score, doc["id"]))
+            # Apply logarithmic dampening per field to prevent single field domination
+            # (stronger for description fields, lighter for identifier fields)
+            field_scores.append(math.log(1 + field_total) * dampening)
+        if field_scores:
+            results.append(self._final_score(field_scores, current_doc))
 
         # Sort by score descending and return top k
         results.sort(key=lambda x: x[0], reverse=True)
         return results[:top_k]
 
-    def _match_token(self, token: str, text: str) -> bool:
-        """Check if token matches in text"""
-        return token in text
+    def _final_score(self, field_scores: List[float], doc_index: int) -> Tuple[float, str]:
+        # Sum all field scores (already dampened per field)
+        total_score = sum(field_scores)
+
+        # Add diversity bonus for matching multiple field types
+        diversity_bonus = math.sqrt(len(field_scores)) * 3
+
+        return (total_score + diversity_bonus, self.documents[doc_index]["id"])
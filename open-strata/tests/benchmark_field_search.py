@@ -0,0 +1,82 @@
+"""
+Benchmark: indexed FieldSearchEngine.search vs. the original full scan.
+
+Builds a synthetic tool catalog (N tools with operation, category, description
+and parameter fields) and times the same queries both ways. Not collected by
+pytest; run with
+
+    python tests/benchmark_field_search.py [tools] [queries]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from strata.utils.field_search import FieldSearchEngine
+from test_field_search import reference_search
+
+VERBS = ["get", "list", "create", "update", "delete", "search", "merge", "archive", "sync"]
+NOUNS = ["project", "issue", "user", "channel", "message", "file", "invoice", "contact",
+         "pipeline", "repository", "ticket", "event", "calendar", "deal", "page", "record"]
+FILLER = ["the", "a", "for", "with", "by", "returns", "optional", "filter", "id", "name",
+          "status", "date", "owner", "workspace", "team", "limit", "cursor", "page_size"]
+
+
+def build_catalog(tools: int, seed: int = 1):
+    rng = random.Random(seed)
+    documents = []
+    for i in range(tools):
+        verb, noun = rng.choice(VERBS), rng.choice(NOUNS)
+        service = f"service{i % 40}"
+        description = " ".join(rng.choices(FILLER + NOUNS + VERBS, k=rng.randint(20, 60)))
+        params = [rng.choice(FILLER) for _ in range(rng.randint(1, 6))]
+        fields = [
+            ("category", service, 30),
+            ("operation", f"{verb}_{noun}s_{i}", 30),
+            ("description", description, 20),
+        ]
+        fields += [("param", param, 5) for param in params]
+        fields += [("param_desc", f"the {param} of the {noun}", 2) for param in params]
+        documents.append((fields, f"{service}::{verb}_{noun}s_{i}"))
+    return documents
+
+
+def build_queries(count: int, seed: int = 2):
+    rng = random.Random(seed)
+    vocabulary = VERBS + NOUNS + FILLER + ["proj", "user_", "sync", "service7"]
+    return [" ".join(rng.choices(vocabulary, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+def main(tools: int, query_count: int) -> None:
+    documents = build_catalog(tools)
+    queries = build_queries(query_count)
+    engine = FieldSearchEngine()
+
+    start = time.perf_counter()
+    engine.build_index(documents)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [engine.search(query, top_k=10) for query in queries]
+    indexed_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned = [reference_search(engine, query, top_k=10) for query in queries]
+    scan_seconds = time.perf_counter() - start
+
+    assert indexed == scanned, "indexed search diverged from the full scan"
+    print(f"{tools} tools, {query_count} queries ({len(engine._suffix_keys)} indexed suffixes)")
+    print(f"  build_index: {build_seconds * 1000:8.1f} ms")
+    print(f"  full scan:   {scan_seconds / query_count * 1000:8.2f} ms/query")
+    print(f"  indexed:     {indexed_seconds / query_count * 1000:8.2f} ms/query")
+    print(f"  speedup:     {scan_seconds / indexed_seconds:8.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 2000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
@@ -0,0 +1,126 @@
+"""Tests for the batch_execute_actions tool."""
+
+import asyncio
+import json
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+from mcp import types
+
+from strata.mcp_client_manager import MCPClientManager
+from strata.result_cache import ResultCache
+from strata.tools import TOOL_BATCH_EXECUTE_ACTIONS, TOOL_EXECUTE_ACTION, execute_tool
+
+
+class FakeClient:
+    """Upstream client that echoes its arguments and tracks concurrency."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.running = 0
+        self.max_running = 0
+
+    async def validate_arguments(self, tool_name, arguments):
+        return arguments
+
+    async def call_tool(self, tool_name, arguments):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.delay)
+            if tool_name == "fail":
+                raise RuntimeError(f"Tool '{tool_name}' error: boom")
+            return [types.TextContent(type="text", text=json.dumps(arguments))]
+        finally:
+            self.running -= 1
+
+
+def make_manager(clients):
+    manager = MagicMock()
+    manager.get_client.side_effect = lambda name: clients[name]
+    manager.result_cache = ResultCache()
+    manager.action_slot.side_effect = partial(MCPClientManager.action_slot, manager)
+    manager._action_slots = {}
+    return manager
+
+
+async def run_batch(actions, manager):
+    result = await execute_tool(TOOL_BATCH_EXECUTE_ACTIONS, {"actions": actions}, manager)
+    return json.loads(result[0].text)
+
+
+class TestBatchExecuteActions:
+    """Test batched action execution."""
+
+    @pytest.mark.asyncio
+    async def test_results_in_request_order_with_status(self):
+        manager = make_manager({"a": FakeClient(delay=0.03), "b": FakeClient()})
+        data = await run_batch(
+            [
+                {"server_name": "a", "action_name": "get", "query_params": '{"id": 1}'},
+                {"server_name": "b", "action_name": "fail"},
+                {"server_name": "missing", "action_name": "get"},
+                {"server_name": "b", "action_name": "get", "body_schema": "not json"},
+                {"server_name": "b", "action_name": "get", "path_params": {"id": 2}},
+                {"server_name": "b", "action_name": "get", "query_params": "[1]"},
+            ],
+            manager,
+        )
+
+        results = data["results"]
+        assert [item["index"] for item in results] == [0, 1, 2, 3, 4, 5]
+        assert [item["status"] for item in results] == ["ok", "error", "error", "error", "ok", "error"]
+        assert json.loads(results[0]["content"][0]["text"]) == {"id": 1}
+        assert "boom" in results[1]["error"]
+        assert "not found or not connected" in results[2]["error"]
+        assert results[3]["error"] == "Invalid JSON in body_schema"
+        assert json.loads(results[4]["content"][0]["text"]) == {"id": 2}
+        assert results[5]["error"] == "query_params must be a JSON object"
+        assert results[0]["elapsed_ms"] >= 25
+        assert (data["succeeded"], data["failed"]) == (2, 4)
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_under_per_server_limit(self):
+        slow, other = FakeClient(delay=0.05), FakeClient(delay=0.05)
+        manager = make_manager({"slow": slow, "other": other})
+        actions = [{"server_name": "slow", "action_name": "get"} for _ in range(6)]
+        actions += [{"server_name": "other", "action_name": "get"} for _ in range(2)]
+
+        with patch("strata.mcp_client_manager.ACTION_CONCURRENCY_PER_SERVER", 3):
+            data = await run_batch(actions, manager)
+
+        assert data["succeeded"] == 8
+        assert slow.max_running == 3
+        assert other.max_running == 2
+        # Two rounds of three on "slow", not eight sequential calls
+        assert data["elapsed_ms"] < 8 * 50
+
+    @pytest.mark.asyncio
+    async def test_limit_is_shared_across_batches_and_execute_action(self):
+        client = FakeClient(delay=0.05)
+        manager = make_manager({"a": client})
+        actions = [{"server_name": "a", "action_name": "get"} for _ in range(3)]
+        single = {"server_name": "a", "action_name": "get"}
+
+        with patch("strata.mcp_client_manager.ACTION_CONCURRENCY_PER_SERVER", 2):
+            await asyncio.gather(
+                run_batch(actions, manager),
+                run_batch(actions, manager),
+                execute_tool(TOOL_EXECUTE_ACTION, single, manager),
+            )
+
+        assert client.max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_and_oversized_batches(self):
+        manager = make_manager({})
+        result = await execute_tool(TOOL_BATCH_EXECUTE_ACTIONS, {"actions": []}, manager)
+        assert "non-empty list" in result[0].text
+
+        with patch("strata.tools.MAX_BATCH_ACTIONS", 2):
+            actions = [{"server_name": "a", "action_name": "get"}] * 3
+            result = await execute_tool(
+                TOOL_BATCH_EXECUTE_ACTIONS, {"actions": actions}, manager
+            )
+        assert "at most 2 actions" in result[0].text
@@ -0,0 +1,120 @@
+"""Tests for the indexed FieldSearchEngine."""
+
+import math
+import random
+import re
+
+import pytest
+
+from strata.utils.field_search import SUFFIX_KEY_CHARS, FieldSearchEngine
+
+
+def reference_search(engine: FieldSearchEngine, query: str, top_k: int = 10):
+    """The original full-scan scoring: every document, field, token and value."""
+    query_tokens = query.lower().split()
+    results = []
+    for doc in engine.documents:
+        field_scores = {}
+        matched_field_types = set()
+        for field_type, field_values in doc["fields"].items():
+            field_weight = doc["weights"].get(field_type, 1.0)
+            field_token_scores = []
+            matched_tokens = set()
+            for token in query_tokens:
+                best_match_score = 0
+                for value in field_values:
+                    if token in value and token not in matched_tokens:
+                        if value == token:
+                            match_score = 3.0
+                        elif re.search(r"\b" + re.escape(token) + r"\b", value):
+                            match_score = 2.0
+                        else:
+                            match_score = 1.0
+                        best_match_score = max(best_match_score, match_score)
+                if best_match_score > 0:
+                    matched_tokens.add(token)
+                    field_token_scores.append(field_weight * best_match_score)
+                    matched_field_types.add(field_type)
+            if field_token_scores:
+                field_token_scores.sort(reverse=True)
+                field_total = 0
+                for i, token_score in enumerate(field_token_scores):
+                    field_total += token_score / (i + 1)
+                if field_type in ["description", "param_desc"]:
+                    field_scores[field_type] = math.log(1 + field_total) * 5
+                else:
+                    field_scores[field_type] = math.log(1 + field_total) * 10
+        if field_scores:
+            total_score = sum(field_scores.values())
+            results.append((total_score + math.sqrt(len(matched_field_types)) * 3, doc["id"]))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return results[:top_k]
+
+
+WORDS = [
+    "project", "projects", "list", "list_projects", "get", "user", "users",
+    "create", "pipeline", "issue", "issues", "repo", "repository", "merge",
+    "request", "/projects/{id}", "get-user", "café", "naïve", "a.b", "v2",
+    "x" * (SUFFIX_KEY_CHARS + 6), "x" * (SUFFIX_KEY_CHARS + 2) + "yz",
+]
+
+
+def random_documents(rng: random.Random, count: int):
+    documents = []
+    for doc_index in range(count):
+        fields = []
+        for field_key, weight in [("category", 30), ("operation", 30), ("description", 20),
+                                  ("param", 5), ("param_desc", 2)]:
+            for _ in range(rng.randint(0, 2)):
+                words = rng.choices(WORDS, k=rng.randint(1, 6))
+                separator = rng.choice([" ", "_", "  ", "\t"])
+                fields.append((field_key, separator.join(words).upper() if rng.random() < 0.2
+                               else separator.join(words), weight + rng.randint(0, 3)))
+        documents.append((fields, f"doc_{doc_index}"))
+    return documents
+
+
+def random_queries(rng: random.Random, count: int):
+    pieces = WORDS + ["proj", "ject", "s", "_", "-", "user_", "x" * (SUFFIX_KEY_CHARS + 1), "zzz", "é"]
+    return [" ".join(rng.choices(pieces, k=rng.randint(1, 4))) for _ in range(count)]
+
+
+class TestFieldSearchEngine:
+    """Test the inverted index against the full-scan scoring."""
+
+    def test_match_quality_layers(self):
+        engine = FieldSearchEngine()
+        engine.build_index([
+            ([("operation", "projects", 30)], "exact"),
+            ([("operation", "list projects", 30)], "word"),
+            ([("operation", "list_projects_v2", 30)], "partial"),
+            ([("operation", "users", 30)], "none"),
+        ])
+        results = engine.search("projects")
+        assert [doc_id for _, doc_id in results] == ["exact", "word", "partial"]
+        scores = {doc_id: score for score, doc_id in results}
+        assert scores["exact"] == pytest.approx(math.log(1 + 90) * 10 + 3)
+        assert scores["word"] == pytest.approx(math.log(1 + 60) * 10 + 3)
+        assert scores["partial"] == pytest.approx(math.log(1 + 30) * 10 + 3)
+
+    def test_repeated_and_long_tokens(self):
+        engine = FieldSearchEngine()
+        long_word = "x" * (SUFFIX_KEY_CHARS + 10)
+        engine.build_index([
+            ([("description", f"find {long_word} here", 20)], "long"),
+            ([("description", "x" * SUFFIX_KEY_CHARS + "y", 20)], "prefix_only"),
+        ])
+        assert engine.search("find find") == reference_search(engine, "find find")
+        assert [doc_id for _, doc_id in engine.search(long_word)] == ["long"]
+
+    def test_empty_index(self):
+        assert FieldSearchEngine().search("anything") == []
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_equivalent_to_full_scan(self, seed):
+        rng = random.Random(seed)
+        engine = FieldSearchEngine()
+        engine.build_index(random_documents(rng, 150))
+        for query in random_queries(rng, 60):
+            for top_k in (5, 200):
+                assert engine.search(query, top_k) == reference_search(engine, query, top_k), query
@@ -0,0 +1,250 @@
+"""Tests for MCPClient keepalive, reconnect, deadlines and circuit breaking."""
+
+import asyncio
+import sys
+from contextlib import AsyncExitStack
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp import types
+from mcp.shared.exceptions import McpError
+
+from strata.mcp_proxy import CircuitBreaker, CircuitOpenError, MCPClient
+from strata.mcp_proxy.transport import StdioTransport, Transport
+
+
+class FakeTransport(Transport):
+    """Transport whose sessions are AsyncMocks; counts connects."""
+
+    def __init__(self):
+        super().__init__()
+        self.connects = 0
+        self.fail_connects = 0
+
+    async def _get_streams(self, exit_stack: AsyncExitStack):
+        raise NotImplementedError
+
+    async def initialize(self) -> None:
+        if self.fail_connects:
+            self.fail_connects -= 1
+            raise ConnectionError("upstream down")
+        self.connects += 1
+        session = AsyncMock()
+        session.call_tool.return_value = SimpleNamespace(
+            isError=False, content=[f"session {self.connects}"], structuredContent=None
+        )
+        self._session = session
+        self._connected = True
+
+    async def disconnect(self) -> None:
+        self._session = None
+        self._connected = False
+
+
+def make_client(**kwargs) -> MCPClient:
+    kwargs.setdefault("ping_interval", 0)
+    return MCPClient(FakeTransport(), name="fake", **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff():
+    with patch("strata.mcp_proxy.client.backoff_delay", return_value=0):
+        yield
+
+
+class TestCircuitBreaker:
+    """Test breaker state transitions."""
+
+    def test_opens_after_threshold_and_probes_after_timeout(self):
+        breaker = CircuitBreaker("svc", failure_threshold=2, reset_timeout=30)
+        breaker.before_call()
+        assert breaker.record_failure(RuntimeError("boom")) is False
+        assert breaker.record_failure(RuntimeError("boom")) is True
+        assert breaker.state == "open"
+
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.opened_at -= 31
+        breaker.before_call()  # the probe
+        assert breaker.state == "half_open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # only one probe at a time
+
+        breaker.record_success()
+        assert breaker.stats()["state"] == "closed"
+        assert breaker.stats()["times_opened"] == 1
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker("svc", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure(RuntimeError("boom"))
+        breaker.before_call()
+        assert breaker.state == "half_open"
+        assert breaker.record_failure(RuntimeError("still down")) is True
+        assert breaker.state == "open"
+
+
+class TestMCPClientHealth:
+    """Test MCPClient recovery behaviour with a fake transport."""
+
+    @pytest.mark.asyncio
+    async def test_not_connected_without_connect(self):
+        client = make_client()
+        with pytest.raises(RuntimeError, match="Not connected"):
+            await client.call_tool("echo", {})
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_dropped_session(self):
+        client = make_client()
+        await client.connect()
+        client.transport.get_session().call_tool.side_effect = ConnectionError("EOF")
+
+        with pytest.raises(ConnectionError):
+            await client.call_tool("echo", {})
+        assert not client.is_connected()
+
+        # The next call transparently gets a fresh session
+        assert await client.call_tool("echo", {}) == ["session 2"]
+        assert client.health()["reconnects"] == 1
+        assert client.health()["connected"] is True
+        await client.disconnect()
+
+    @pytest.mark.asyncio
+    async def test_reconnect_retries_with_backoff(self):
+        client = make_client()
+        await client.connect()
+        await client.transport.disconnect()  # the upstream went away
+        client.transport.fail_connects = 2
+
+        assert await client.call_tool("echo", {}) == ["session 2"]
+        assert client.reconnect_count == 1
+
+    @pytest.mark.asyncio
+    async def test_call_deadline(self):
+        client = make_client(call_timeout=0.05)
+        await client.connect()
+
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        client.transport.get_session().call_tool.side_effect = hang
+        with pytest.raises(TimeoutError, match="timed out"):
+            await client.call_tool("slow", {})
+        # A slow upstream keeps its session
+        assert client.is_connected()
+        assert client.breaker.consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_breaker_fails_fast(self):
+        client = make_client()
+        client.breaker = CircuitBreaker("fake", failure_threshold=2, reset_timeout=60)
+        await client.connect()
+        client.transport.fail_connects = 100
+        await client.transport.disconnect()
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await client.call_tool("echo", {})
+        connects_tried = client.transport.fail_connects
+
+        with pytest.raises(CircuitOpenError):
+            await client.call_tool("echo", {})
+        # Failing fast does not touch the upstream
+        assert client.transport.fail_connects == connects_tried
+        assert client.health()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_protocol_errors_do_not_trip_breaker(self):
+        client = make_client()
+        await client.connect()
+        client.transport.get_session().call_tool.side_effect = McpError(
+            types.ErrorData(code=types.INVALID_PARAMS, message="bad params")
+        )
+        with pytest.raises(McpError):
+            await client.call_tool("echo", {})
+        assert client.breaker.consecutive_failures == 0
+        assert client.is_connected()
+
+    @pytest.mark.asyncio
+    async def test_keepalive_marks_dead_session(self):
+        client = make_client(ping_interval=0.01)
+        await client.connect()
+        client.transport.get_session().send_ping.side_effect = ConnectionError("gone")
+
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if not client.is_connected():
+                break
+        assert not client.is_connected()
+
+        assert await client.call_tool("echo", {}) == ["session 2"]
+        await client.disconnect()
+        assert client._keepalive_task is None
+
+
+CRASHING_SERVER = """
+import os
+from mcp.server.fastmcp import FastMCP
+
+mcp = FastMCP("crashing")
+
+
+@mcp.tool()
+def echo(text: str) -> str:
+    return text
+
+
+@mcp.tool()
+def crash() -> str:
+    os._exit(1)
+
+
+mcp.run()
+"""
+
+
+class TestMCPClientStdioRecovery:
+    """Reconnect against a real stdio server process that dies mid-call."""
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_server_process_exits(self, tmp_path):
+        server = tmp_path / "crashing_server.py"
+        server.write_text(CRASHING_SERVER)
+        client = MCPClient(
+            StdioTransport(sys.executable, [str(server)]),
+            name="crashing",
+            ping_interval=0,
+            call_timeout=30,
+        )
+        connected = asyncio.Event()
+        stop = asyncio.Event()
+
+        async def lifespan():
+            # Connect from a task that stays alive, like a server lifespan;
+            # the calls below run in other tasks
+            await client.connect()
+            connected.set()
+            await stop.wait()
+            await client.disconnect()
+
+        owner = asyncio.create_task(lifespan())
+        try:
+            await asyncio.wait_for(connected.wait(), 30)
+            result = await asyncio.create_task(client.call_tool("echo", {"text": "before"}))
+            assert result[0].text == "before"
+
+            with pytest.raises(McpError):
+                await asyncio.create_task(client.call_tool("crash", {}))
+
+            for attempt in range(3):
+                result = await asyncio.create_task(
+                    client.call_tool("echo", {"text": f"after {attempt}"})
+                )
+                assert result[0].text == f"after {attempt}"
+            assert client.health()["reconnects"] == 1
+            assert client.health()["state"] == "closed"
+        finally:
+            stop.set()
+            await asyncio.wait_for(owner, 30)
+        assert not client.transport.is_connected()
@@ -0,0 +1,122 @@
+"""Tests for the read-only result cache."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+from mcp import types
+
+from strata.config import MCPServerConfig
+from strata.result_cache import ResultCache
+
+TOOLS = {
+    "list_channels": {"name": "list_channels", "annotations": {"readOnlyHint": True}},
+    "get_record": {"name": "get_record"},
+    "post_message": {"name": "post_message", "annotations": {"readOnlyHint": False}},
+}
+
+
+class FakeClient:
+    """Upstream client that counts calls and returns a fresh result each time."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_tool_schema(self, tool_name):
+        return TOOLS.get(tool_name)
+
+    async def call_tool(self, tool_name, arguments):
+        self.calls += 1
+        return [types.TextContent(type="text", text=json.dumps({"call": self.calls, **arguments}))]
+
+
+@pytest.fixture
+def cache():
+    cache = ResultCache()
+    cache.configure("slack", {"ttl": 60, "max_bytes": 10_000, "actions": ["get_record"]})
+    return cache
+
+
+class TestResultCache:
+    """Test caching, invalidation and limits."""
+
+    @pytest.mark.asyncio
+    async def test_read_only_actions_are_cached_by_canonical_params(self, cache):
+        client = FakeClient()
+        first = await cache.call_tool("slack", client, "list_channels", {"a": 1, "b": [2]})
+        second = await cache.call_tool("slack", client, "list_channels", {"b": [2], "a": 1})
+        assert second == first
+        assert client.calls == 1
+
+        await cache.call_tool("slack", client, "list_channels", {"a": 2})
+        assert client.calls == 2
+        assert cache.stats()["slack"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_allow_listed_action_is_cached(self, cache):
+        client = FakeClient()
+        await cache.call_tool("slack", client, "get_record", {"id": 1})
+        await cache.call_tool("slack", client, "get_record", {"id": 1})
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_successful_write_invalidates_server(self, cache):
+        client = FakeClient()
+        await cache.call_tool("slack", client, "list_channels", {})
+        await cache.call_tool("slack", client, "post_message", {"text": "hi"})
+        await cache.call_tool("slack", client, "post_message", {"text": "hi"})
+        assert client.calls == 3  # writes are never cached
+
+        await cache.call_tool("slack", client, "list_channels", {})
+        assert client.calls == 4
+        assert cache.stats()["slack"]["invalidations"] == 2
+
+    @pytest.mark.asyncio
+    async def test_servers_without_cache_config_are_not_cached(self, cache):
+        client = FakeClient()
+        await cache.call_tool("github", client, "list_channels", {})
+        await cache.call_tool("github", client, "list_channels", {})
+        assert client.calls == 2
+        assert not cache.is_enabled("github")
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self, cache):
+        client = FakeClient()
+        with patch("strata.result_cache.time.monotonic", return_value=1000.0):
+            await cache.call_tool("slack", client, "list_channels", {})
+        with patch("strata.result_cache.time.monotonic", return_value=1059.0):
+            await cache.call_tool("slack", client, "list_channels", {})
+        assert client.calls == 1
+        with patch("strata.result_cache.time.monotonic", return_value=1061.0):
+            await cache.call_tool("slack", client, "list_channels", {})
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_byte_cap_evicts_least_recently_used(self):
+        cache = ResultCache()
+        cache.configure("slack", {"max_bytes": 200})
+        client = FakeClient()
+        for page in range(5):
+            await cache.call_tool("slack", client, "list_channels", {"page": page})
+
+        stats = cache.stats()["slack"]
+        assert stats["bytes"] <= 200
+        assert stats["evictions"] > 0
+        # The most recent page is still cached
+        await cache.call_tool("slack", client, "list_channels", {"page": 4})
+        assert client.calls == 5
+
+    @pytest.mark.asyncio
+    async def test_read_racing_a_write_is_not_stored(self, cache):
+        client = FakeClient()
+        server_cache = cache._servers["slack"]
+        generation = server_cache.generation
+        content = await client.call_tool("list_channels", {})
+        server_cache.invalidate()  # a write finished meanwhile
+        server_cache.put(cache.make_key("list_channels", {}), content, generation)
+        assert server_cache.stats()["entries"] == 0
+
+    def test_cache_config_round_trip(self):
+        config = MCPServerConfig(name="slack", command="slack-mcp", cache={"ttl": 5})
+        assert MCPServerConfig.from_dict(config.to_dict()) == config
+        assert "cache" not in MCPServerConfig(name="x", command="y").to_dict()
@@ -0,0 +1,152 @@
+"""Tests for local validation of action arguments."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from mcp import types
+
+from strata.mcp_proxy import MCPClient, ToolArgumentError
+from strata.mcp_proxy.transport import Transport
+from strata.mcp_proxy.validation import coerce, compile_validator
+from strata.result_cache import ResultCache
+from strata.tools import TOOL_EXECUTE_ACTION, execute_tool
+
+ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "owner": {"type": "string"},
+        "number": {"type": "integer"},
+        "draft": {"type": "boolean"},
+        "labels": {"type": "array", "items": {"type": "string"}},
+        "limits": {
+            "type": "object",
+            "properties": {"per_page": {"type": "integer", "maximum": 100}},
+        },
+    },
+    "required": ["owner", "number"],
+}
+
+
+class FakeTransport(Transport):
+    """Transport with an AsyncMock session serving one tool."""
+
+    def __init__(self):
+        super().__init__()
+        self.session = AsyncMock()
+        self.session.list_tools.return_value = types.ListToolsResult(
+            tools=[types.Tool(name="get_issue", inputSchema=ISSUE_SCHEMA)]
+        )
+        self.session.call_tool.return_value = types.CallToolResult(
+            content=[types.TextContent(type="text", text="ok")]
+        )
+
+    async def _get_streams(self, exit_stack):
+        raise NotImplementedError
+
+    async def initialize(self) -> None:
+        self._session = self.session
+        self._connected = True
+
+
+class TestCoercion:
+    """Test schema-driven coercion of string values."""
+
+    def test_coerces_declared_types(self):
+        arguments = {
+            "owner": "octo",
+            "number": "42",
+            "draft": "False",
+            "labels": '["bug"]',
+            "limits": {"per_page": "50"},
+            "extra": "7",
+        }
+        assert coerce(arguments, ISSUE_SCHEMA) == {
+            "owner": "octo",
+            "number": 42,
+            "draft": False,
+            "labels": ["bug"],
+            "limits": {"per_page": 50},
+            "extra": "7",
+        }
+
+    def test_leaves_unconvertible_values(self):
+        assert coerce({"number": "forty"}, ISSUE_SCHEMA) == {"number": "forty"}
+        assert coerce({"number": 3.0}, ISSUE_SCHEMA) == {"number": 3}
+        assert coerce({"owner": 5}, ISSUE_SCHEMA) == {"owner": 5}
+
+
+class TestToolValidator:
+    """Test compiled validators and their error messages."""
+
+    def test_compact_errors(self):
+        validator = compile_validator("get_issue", ISSUE_SCHEMA)
+        with pytest.raises(ToolArgumentError) as exc_info:
+            validator.validate({"number": "forty", "limits": {"per_page": 500}})
+
+        message = str(exc_info.value)
+        assert message.startswith("Invalid arguments for 'get_issue': ")
+        assert "'owner' is a required property" in message
+        assert "number: 'forty' is not of type 'integer'" in message
+        assert "limits.per_page: 500 is greater than the maximum of 100" in message
+
+    def test_unusable_schemas_are_skipped(self):
+        assert compile_validator("t", None) is None
+        assert compile_validator("t", {}) is None
+
+
+class TestClientValidation:
+    """Test validators cached alongside the tool list."""
+
+    @pytest.mark.asyncio
+    async def test_validators_follow_tool_cache(self):
+        client = MCPClient(FakeTransport(), name="github", ping_interval=0)
+        await client.connect()
+
+        assert await client.validate_arguments("get_issue", {"owner": "o", "number": "1"}) == {
+            "owner": "o",
+            "number": 1,
+        }
+        # Unknown tools are left to the upstream
+        assert await client.validate_arguments("other", {"x": 1}) == {"x": 1}
+        assert client.transport.session.list_tools.await_count == 1
+
+        await client.disconnect()
+        assert client._validators == {}
+
+        await client.connect()
+        await client.validate_arguments("get_issue", {"owner": "o", "number": 1})
+        assert client.transport.session.list_tools.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_action_rejects_invalid_arguments_locally(self):
+        client = MCPClient(FakeTransport(), name="github", ping_interval=0)
+        await client.connect()
+        manager = MagicMock()
+        manager.get_client.return_value = client
+        manager.result_cache = ResultCache()
+        manager.action_slot.return_value = asyncio.Semaphore(4)
+
+        result = await execute_tool(
+            TOOL_EXECUTE_ACTION,
+            {"server_name": "github", "action_name": "get_issue", "query_params": '{"number": 1}'},
+            manager,
+        )
+        assert "'owner' is a required property" in json.loads(result[0].text)["error"]
+        client.transport.session.call_tool.assert_not_awaited()
+
+        await execute_tool(
+            TOOL_EXECUTE_ACTION,
+            {
+                "server_name": "github",
+                "action_name": "get_issue",
+                "path_params": '{"owner": "octo"}',
+                "query_params": '{"number": "7"}',
+            },
+            manager,
+        )
+        client.transport.session.call_tool.assert_awaited_once_with(
+            "get_issue", {"owner": "octo", "number": 7}
+        )
+        await client.disconnect()